@@ -0,0 +1,176 @@
+"""Partition trading_data and predictions by month
+
+Revision ID: 743f7f7cb0e6
+Revises: 7b4567f37040
+Create Date: 2026-10-17 21:40:00.000000
+
+Both tables become range partitioned on target_date with one partition per month,
+named {table}_pYYYY_MM. Existing rows are copied into the partitioned tables and
+partitions are created up to MONTHS_AHEAD months after the latest date. After
+that, PartitionService creates missing months on write and in the cleanup job.
+
+The partition key has to be part of every unique constraint, so the primary keys
+become (id, target_date) and predictions.trading_data_id loses its FK to
+trading_data.id, which is no longer unique on its own.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '743f7f7cb0e6'
+down_revision: Union[str, None] = '7b4567f37040'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+TRADING_DATA_COLUMNS = [
+    'id', 'stock_ticker', 'target_date', 'close', 'open', 'high', 'low', 'volumes'
+]
+PREDICTION_COLUMNS = [
+    'id', 'model_id', 'stock_ticker', 'target_date', 'period', 'closing_price',
+    'trading_data_id', 'predicted_price', 'rank', 'top_prediction_id',
+    'created_at', 'modified_at',
+]
+
+
+def _next_month(d: date) -> date:
+    if d.month == 12:
+        return date(d.year + 1, 1, 1)
+    return date(d.year, d.month + 1, 1)
+
+
+def _create_trading_data_table(table_name: str, partitioned: bool) -> None:
+    kwargs = {'postgresql_partition_by': 'RANGE (target_date)'} if partitioned else {}
+    op.create_table(table_name,
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('trading_data_id_seq'::regclass)"), autoincrement=False, nullable=False),
+    sa.Column('stock_ticker', sa.String(length=20), nullable=False),
+    sa.Column('target_date', sa.Date(), nullable=False),
+    sa.Column('close', sa.Float(), nullable=False),
+    sa.Column('open', sa.Float(), nullable=False),
+    sa.Column('high', sa.Float(), nullable=False),
+    sa.Column('low', sa.Float(), nullable=False),
+    sa.Column('volumes', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['stock_ticker'], ['stocks.ticker'], name='fk_trading_data_stock', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint(*(['id', 'target_date'] if partitioned else ['id']), name='trading_data_pkey'),
+    sa.UniqueConstraint('stock_ticker', 'target_date', name='uq_trading_data'),
+    **kwargs
+    )
+    op.create_index('ix_trading_data_lookup', table_name, ['stock_ticker', 'target_date'], unique=False)
+
+
+def _create_predictions_table(table_name: str, partitioned: bool) -> None:
+    kwargs = {'postgresql_partition_by': 'RANGE (target_date)'} if partitioned else {}
+    foreign_keys = [] if partitioned else [
+        sa.ForeignKeyConstraint(['trading_data_id'], ['trading_data.id'], name='fk_predictions_trading_data', ondelete='CASCADE'),
+    ]
+    op.create_table(table_name,
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('predictions_id_seq'::regclass)"), autoincrement=False, nullable=False),
+    sa.Column('model_id', sa.Integer(), nullable=False),
+    sa.Column('stock_ticker', sa.String(length=20), nullable=False),
+    sa.Column('target_date', sa.Date(), nullable=False),
+    sa.Column('period', sa.Integer(), nullable=False),
+    sa.Column('closing_price', sa.Float(), nullable=True),
+    sa.Column('trading_data_id', sa.Integer(), nullable=True),
+    sa.Column('predicted_price', sa.Float(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=True),
+    sa.Column('top_prediction_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['model_id'], ['stock_models.id'], name='fk_predictions_model', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['stock_ticker'], ['stocks.ticker'], name='fk_predictions_stock', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['top_prediction_id'], ['top_predictions.id'], name='fk_predictions_top'),
+    *foreign_keys,
+    sa.PrimaryKeyConstraint(*(['id', 'target_date'] if partitioned else ['id']), name='predictions_pkey'),
+    sa.UniqueConstraint('stock_ticker', 'model_id', 'target_date', 'period', name='uq_prediction'),
+    **kwargs
+    )
+    op.create_index('ix_predictions_lookup', table_name, ['stock_ticker', 'target_date', 'period'], unique=False)
+
+
+def _rename_table(table_name: str, suffix: str, constraints: list[str], index: str) -> None:
+    """Move a table, and the constraint and index names the new table reuses, aside."""
+    op.execute(f'ALTER TABLE {table_name} RENAME TO {table_name}_{suffix}')
+    for constraint in constraints:
+        op.execute(f'ALTER TABLE {table_name}_{suffix} RENAME CONSTRAINT {constraint} TO {constraint}_{suffix}')
+    op.execute(f'ALTER INDEX {index} RENAME TO {index}_{suffix}')
+
+
+def _create_monthly_partitions(table_name: str, source_table: str) -> None:
+    bind = op.get_bind()
+    first_date, last_date = bind.execute(
+        sa.text(f'SELECT min(target_date), max(target_date) FROM {source_table}')
+    ).one()
+    today = date.today()
+    month = (first_date or today).replace(day=1)
+    last_month = max(last_date or today, today).replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last_month = _next_month(last_month)
+
+    while month <= last_month:
+        op.execute(
+            f'CREATE TABLE {table_name}_p{month:%Y_%m} PARTITION OF {table_name} '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+        month = _next_month(month)
+
+
+def _copy_rows(table_name: str, source_table: str, columns: list[str]) -> None:
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    op.execute(f'INSERT INTO {table_name} ({column_list}) SELECT {column_list} FROM {source_table}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('fk_predictions_trading_data', 'predictions', type_='foreignkey')
+
+    # the id sequences move over to the new tables
+    op.execute('ALTER SEQUENCE trading_data_id_seq OWNED BY NONE')
+    op.execute('ALTER SEQUENCE predictions_id_seq OWNED BY NONE')
+    _rename_table('trading_data', 'unpartitioned', ['trading_data_pkey', 'uq_trading_data'], 'ix_trading_data_lookup')
+    _rename_table('predictions', 'unpartitioned', ['predictions_pkey', 'uq_prediction'], 'ix_predictions_lookup')
+
+    _create_trading_data_table('trading_data', partitioned=True)
+    _create_monthly_partitions('trading_data', 'trading_data_unpartitioned')
+    _copy_rows('trading_data', 'trading_data_unpartitioned', TRADING_DATA_COLUMNS)
+
+    _create_predictions_table('predictions', partitioned=True)
+    _create_monthly_partitions('predictions', 'predictions_unpartitioned')
+    _copy_rows('predictions', 'predictions_unpartitioned', PREDICTION_COLUMNS)
+
+    op.drop_table('predictions_unpartitioned')
+    op.drop_table('trading_data_unpartitioned')
+    op.execute('ALTER SEQUENCE trading_data_id_seq OWNED BY trading_data.id')
+    op.execute('ALTER SEQUENCE predictions_id_seq OWNED BY predictions.id')
+    op.execute('ANALYZE trading_data')
+    op.execute('ANALYZE predictions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER SEQUENCE trading_data_id_seq OWNED BY NONE')
+    op.execute('ALTER SEQUENCE predictions_id_seq OWNED BY NONE')
+    _rename_table('trading_data', 'partitioned', ['trading_data_pkey', 'uq_trading_data'], 'ix_trading_data_lookup')
+    _rename_table('predictions', 'partitioned', ['predictions_pkey', 'uq_prediction'], 'ix_predictions_lookup')
+
+    _create_trading_data_table('trading_data', partitioned=False)
+    _copy_rows('trading_data', 'trading_data_partitioned', TRADING_DATA_COLUMNS)
+
+    # trading data may have been dropped by retention without its predictions
+    op.execute(
+        'UPDATE predictions_partitioned SET trading_data_id = NULL '
+        'WHERE trading_data_id IS NOT NULL AND NOT EXISTS '
+        '(SELECT 1 FROM trading_data WHERE trading_data.id = predictions_partitioned.trading_data_id)'
+    )
+    _create_predictions_table('predictions', partitioned=False)
+    _copy_rows('predictions', 'predictions_partitioned', PREDICTION_COLUMNS)
+
+    # dropping the parents drops their partitions
+    op.drop_table('predictions_partitioned')
+    op.drop_table('trading_data_partitioned')
+    op.execute('ALTER SEQUENCE trading_data_id_seq OWNED BY trading_data.id')
+    op.execute('ALTER SEQUENCE predictions_id_seq OWNED BY predictions.id')
@@ -0,0 +1,48 @@
+"""Add prediction_evaluations
+
+Revision ID: a3c91e5b7d42
+Revises: ee44d6af6d20
+Create Date: 2026-10-17 23:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5b7d42'
+down_revision: Union[str, None] = 'ee44d6af6d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('prediction_evaluations',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('model_id', sa.Integer(), nullable=False),
+    sa.Column('stock_ticker', sa.String(length=20), nullable=False),
+    sa.Column('industry_code', sa.String(length=32), nullable=True),
+    sa.Column('period', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('sample_count', sa.Integer(), nullable=False),
+    sa.Column('mae', sa.Float(), nullable=False),
+    sa.Column('mape', sa.Float(), nullable=False),
+    sa.Column('rmse', sa.Float(), nullable=False),
+    sa.Column('hit_rate', sa.Float(), nullable=True),
+    sa.Column('evaluated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['model_id'], ['stock_models.id'], name='fk_prediction_evaluations_model', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['stock_ticker'], ['stocks.ticker'], name='fk_prediction_evaluations_stock', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('model_id', 'period', 'start_date', 'end_date', name='uq_prediction_evaluation')
+    )
+    op.create_index('ix_prediction_evaluations_lookup', 'prediction_evaluations', ['stock_ticker', 'end_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_prediction_evaluations_lookup', table_name='prediction_evaluations')
+    op.drop_table('prediction_evaluations')
@@ -0,0 +1,68 @@
+"""Add trading_data_windows
+
+Revision ID: ee44d6af6d20
+Revises: 743f7f7cb0e6
+Create Date: 2026-10-17 22:30:00.000000
+
+One row per ticker with its latest TRADING_DATA_WINDOW_SIZE trading data rows as
+arrays, filled from trading_data here and kept up to date by the application.
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee44d6af6d20'
+down_revision: Union[str, None] = '743f7f7cb0e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('trading_data_windows',
+    sa.Column('stock_ticker', sa.String(length=20), nullable=False),
+    sa.Column('last_date', sa.Date(), nullable=False),
+    sa.Column('target_dates', postgresql.ARRAY(sa.Date()), nullable=False),
+    sa.Column('trading_data_ids', postgresql.ARRAY(sa.Integer()), nullable=False),
+    sa.Column('close', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('open', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('high', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('low', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('volumes', postgresql.ARRAY(sa.Integer()), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['stock_ticker'], ['stocks.ticker'], name='fk_trading_data_windows_stock', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('stock_ticker')
+    )
+
+    window_size = int(os.getenv('TRADING_DATA_WINDOW_SIZE', '120'))
+    op.execute(f"""
+        INSERT INTO trading_data_windows
+            (stock_ticker, last_date, target_dates, trading_data_ids,
+             close, open, high, low, volumes)
+        SELECT stock_ticker, max(target_date),
+               array_agg(target_date ORDER BY target_date),
+               array_agg(id ORDER BY target_date),
+               array_agg(close ORDER BY target_date),
+               array_agg(open ORDER BY target_date),
+               array_agg(high ORDER BY target_date),
+               array_agg(low ORDER BY target_date),
+               array_agg(volumes ORDER BY target_date)
+        FROM (
+            SELECT *, row_number() OVER (
+                PARTITION BY stock_ticker ORDER BY target_date DESC
+            ) AS rnum
+            FROM trading_data
+        ) latest
+        WHERE rnum <= {window_size}
+        GROUP BY stock_ticker
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('trading_data_windows')
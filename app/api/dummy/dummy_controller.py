@@ -4,6 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dummy.dummy_service import DummyService, get_dummy_service
+from app.core.dependencies.container import app_scoped
 
 
 class DummyController:
@@ -26,6 +27,13 @@ class DummyController:
         serialized_data = jsonable_encoder(response)
         return serialized_data
 
+    async def generate_dataset_controller(
+        self, db: AsyncSession, scale: float, end_date: date, seed: int
+    ):
+        return await self.dummy_service.generate_dataset(
+            db=db, scale=scale, end_date=end_date, seed=seed
+        )
+
     async def generate_dummy_inference_results_all_controller(
         self,
         db: AsyncSession,
@@ -59,5 +67,6 @@ class DummyController:
         return [res.model_dump(mode="json") for res in response]
 
 
+@app_scoped
 def get_dummy_controller() -> DummyController:
     return DummyController(service=get_dummy_service())
@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterator
+
+import numpy as np
+
+from app.core.enums.industry_code_enum import IndustryCodeEnum
+
+SYNTHETIC_TICKER_PREFIX = "SYN"
+# tickers per unit of scale; with 5 years of market days scale 1 is ~0.6M rows
+STOCKS_PER_SCALE = 500
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Size and shape of a synthetic dataset, see `DatasetSpec.from_scale`."""
+
+    stock_count: int
+    end_date: date
+    years: int = 5
+    # market days up to `end_date` with predictions for every period
+    prediction_days: int = 60
+    periods: tuple[int, ...] = (1, 5, 10, 15)
+    seed: int = 0
+    # tickers generated and loaded at a time, bounds memory at any scale
+    chunk_size: int = 200
+
+    @classmethod
+    def from_scale(
+        cls, scale: float, end_date: date, seed: int = 0, years: int = 5
+    ) -> "DatasetSpec":
+        return cls(
+            stock_count=max(int(round(STOCKS_PER_SCALE * scale)), 1),
+            end_date=end_date,
+            years=years,
+            seed=seed,
+        )
+
+    @property
+    def start_date(self) -> date:
+        return self.end_date - timedelta(days=365 * self.years)
+
+    def stock_tickers(self) -> list[str]:
+        return [f"{SYNTHETIC_TICKER_PREFIX}{i:05d}" for i in range(self.stock_count)]
+
+    def industry_codes(self) -> list[str]:
+        industries = [industry.value for industry in IndustryCodeEnum]
+        return [industries[i % len(industries)] for i in range(self.stock_count)]
+
+
+@dataclass
+class SyntheticChunk:
+    """
+    Trading data and predictions of a run of tickers, as one list per column in
+    the order `BulkWriteRepository.copy_columns` loads them.
+    """
+
+    stock_tickers: list[str]
+    trading_data: dict[str, list]
+    predictions: dict[str, list]
+
+
+def generate_prices(
+    rng: np.random.Generator, stock_count: int, day_count: int
+) -> dict[str, np.ndarray]:
+    """
+    `(stocks, days)` OHLCV matrices of independent geometric random walks, each
+    ticker with its own starting price, drift and volatility.
+    """
+    start = rng.uniform(5, 300, size=(stock_count, 1))
+    drift = rng.normal(0.0002, 0.0005, size=(stock_count, 1))
+    volatility = rng.uniform(0.008, 0.03, size=(stock_count, 1))
+
+    log_returns = rng.normal(drift, volatility, size=(stock_count, day_count))
+    close = start * np.exp(np.cumsum(log_returns, axis=1))
+
+    previous_close = np.concatenate([start, close[:, :-1]], axis=1)
+    open_ = previous_close * np.exp(
+        rng.normal(0, volatility / 3, size=(stock_count, day_count))
+    )
+    high = np.maximum(open_, close) * np.exp(
+        np.abs(rng.normal(0, volatility / 2, size=(stock_count, day_count)))
+    )
+    low = np.minimum(open_, close) * np.exp(
+        -np.abs(rng.normal(0, volatility / 2, size=(stock_count, day_count)))
+    )
+    volumes = np.minimum(
+        rng.lognormal(11, 1, size=(stock_count, day_count)), np.iinfo(np.int32).max
+    ).astype(np.int64)
+
+    return {
+        "close": close.round(2),
+        "open": open_.round(2),
+        "high": high.round(2),
+        "low": low.round(2),
+        "volumes": volumes,
+    }
+
+
+def generate_predicted_prices(
+    rng: np.random.Generator, closes: np.ndarray, periods: tuple[int, ...]
+) -> np.ndarray:
+    """
+    `(stocks, days, periods)` predicted prices around `closes`, with an error that
+    grows with the square root of the period like the random walk itself.
+    """
+    scale = 0.015 * np.sqrt(np.asarray(periods, dtype=np.float64))
+    noise = rng.normal(0, 1, size=(*closes.shape, len(periods))) * scale
+    return (closes[:, :, np.newaxis] * np.exp(noise)).round(2)
+
+
+def generate_chunks(
+    spec: DatasetSpec, open_days: list[date], model_ids: dict[str, int]
+) -> Iterator[SyntheticChunk]:
+    """
+    Generate the dataset `spec.chunk_size` tickers at a time. Rows are ordered by
+    ticker and then date, the order of the `(stock_ticker, target_date)` indexes.
+    """
+    rng = np.random.default_rng(spec.seed)
+    stock_tickers = spec.stock_tickers()
+    day_count = len(open_days)
+    prediction_days = open_days[-spec.prediction_days :]  # noqa: E203
+    periods = list(spec.periods)
+
+    for i in range(0, len(stock_tickers), spec.chunk_size):
+        tickers = stock_tickers[i : i + spec.chunk_size]  # noqa: E203
+        prices = generate_prices(rng, len(tickers), day_count)
+
+        closes = prices["close"][:, -len(prediction_days) :]  # noqa: E203
+        predicted = generate_predicted_prices(rng, closes, spec.periods)
+        per_ticker = len(prediction_days) * len(periods)
+
+        yield SyntheticChunk(
+            stock_tickers=tickers,
+            trading_data={
+                "stock_ticker": [t for t in tickers for _ in range(day_count)],
+                "target_date": open_days * len(tickers),
+                **{field: values.ravel().tolist() for field, values in prices.items()},
+            },
+            predictions={
+                "model_id": [model_ids[t] for t in tickers for _ in range(per_ticker)],
+                "stock_ticker": [t for t in tickers for _ in range(per_ticker)],
+                "target_date": [d for d in prediction_days for _ in periods]
+                * len(tickers),
+                "period": periods * (len(prediction_days) * len(tickers)),
+                "closing_price": np.repeat(closes.ravel(), len(periods)).tolist(),
+                "predicted_price": predicted.ravel().tolist(),
+            },
+        )
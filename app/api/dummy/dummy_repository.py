@@ -0,0 +1,117 @@
+import logging
+
+import asyncpg
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
+from app.core.common.exceptions.custom_exceptions import DBError
+from app.models import Industry, Prediction, Stock, StockModel, TradingData
+
+logger = logging.getLogger(__name__)
+
+
+class DummyRepository:
+    """Bulk writes of synthetic datasets, see `DummyService.generate_dataset`."""
+
+    @staticmethod
+    async def delete_stocks_by_prefix(db: AsyncSession, ticker_prefix: str) -> int:
+        """Delete the stocks of a previous dataset, with everything that cascades."""
+        try:
+            result = await db.execute(
+                delete(Stock).where(Stock.ticker.startswith(ticker_prefix))
+            )
+            await db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to delete synthetic stocks: {e}")
+            raise DBError("Failed to delete synthetic stocks") from e
+
+    @staticmethod
+    async def create_stocks_with_models(
+        db: AsyncSession, stock_tickers: list[str], industry_codes: list[str]
+    ) -> dict[str, int]:
+        """Create the stocks with one active model each, returning the model ids."""
+        try:
+            await db.execute(
+                insert(Industry)
+                .values(
+                    [
+                        {"industry_code": code, "name_en": code, "name_th": code}
+                        for code in sorted(set(industry_codes))
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+            await BulkWriteRepository.insert_many(
+                db=db,
+                model=Stock,
+                rows=[
+                    {
+                        "ticker": stock_ticker,
+                        "name": f"Synthetic {stock_ticker}",
+                        "industry_code": industry_code,
+                    }
+                    for stock_ticker, industry_code in zip(
+                        stock_tickers, industry_codes
+                    )
+                ],
+                returning=(),
+            )
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=StockModel,
+                rows=[
+                    {
+                        "stock_ticker": stock_ticker,
+                        "version": "synthetic",
+                        "model_path": "synthetic",
+                        "scaler_path": "synthetic",
+                        "features_used": ["close", "open", "high", "low", "volumes"],
+                    }
+                    for stock_ticker in stock_tickers
+                ],
+                returning=("id", "stock_ticker"),
+            )
+            await db.commit()
+            return {stock_ticker: model_id for model_id, stock_ticker in rows}
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to create synthetic stocks: {e}")
+            raise DBError("Failed to create synthetic stocks") from e
+
+    @staticmethod
+    async def copy_trading_data_and_predictions(
+        db: AsyncSession, trading_data: dict[str, list], predictions: dict[str, list]
+    ) -> tuple[int, int]:
+        """COPY one chunk of both tables in one transaction."""
+        try:
+            trading_data_count = await BulkWriteRepository.copy_columns(
+                db=db, model=TradingData, columns=trading_data
+            )
+            prediction_count = await BulkWriteRepository.copy_columns(
+                db=db, model=Prediction, columns=predictions
+            )
+            await db.commit()
+            return trading_data_count, prediction_count
+        except (SQLAlchemyError, asyncpg.PostgresError) as e:
+            await db.rollback()
+            logger.error(f"Failed to copy synthetic trading data and predictions: {e}")
+            raise DBError(
+                "Failed to copy synthetic trading data and predictions"
+            ) from e
+
+    @staticmethod
+    async def analyze(db: AsyncSession, table_names: list[str]) -> None:
+        """Refresh planner statistics, so query plans see the new volumes."""
+        try:
+            for table_name in table_names:
+                await db.execute(text(f"ANALYZE {table_name}"))
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to analyze {table_names}: {e}")
+            raise DBError("Failed to analyze tables") from e
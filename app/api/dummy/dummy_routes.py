@@ -8,6 +8,7 @@ from app.core.common.utils.response_handlers import (
     success_response,
 )
 from app.core.dependencies.api_key_auth import verify_role
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 
 router = APIRouter(
@@ -23,7 +24,7 @@ async def dummy_trading_data(
     target_date: date = Query(...),
     days_back: int = Query(...),
     db: AsyncSession = Depends(get_db),
-    controller: DummyController = Depends(get_dummy_controller),
+    controller: DummyController = Depends(provide(get_dummy_controller)),
 ):
     response = await controller.generate_dummy_trading_data_controller(
         db=db,
@@ -34,10 +35,28 @@ async def dummy_trading_data(
     return success_response(data=response)
 
 
+@router.post("/dataset")
+async def dummy_dataset(
+    scale: float = Query(default=1.0, gt=0),
+    end_date: date = Query(...),
+    seed: int = Query(default=0),
+    db: AsyncSession = Depends(get_db),
+    controller: DummyController = Depends(provide(get_dummy_controller)),
+):
+    """
+    Replace the synthetic `SYN*` stocks with a generated dataset of about
+    500 stocks and 0.6M trading data rows per unit of `scale`.
+    """
+    response = await controller.generate_dataset_controller(
+        db=db, scale=scale, end_date=end_date, seed=seed
+    )
+    return success_response(data=response)
+
+
 @router.post("/inference-results/all")
 async def dummy_inference_results_all(
     db: AsyncSession = Depends(get_db),
-    controller: DummyController = Depends(get_dummy_controller),
+    controller: DummyController = Depends(provide(get_dummy_controller)),
     stock_tickers: list[str] = Query(...),
     target_date: date = Query(...),
     days_back: int = Query(...),
@@ -55,7 +74,7 @@ async def dummy_inference_results_all(
 @router.get("/inference-results")
 async def dummy_inference_results(
     db: AsyncSession = Depends(get_db),
-    controller: DummyController = Depends(get_dummy_controller),
+    controller: DummyController = Depends(provide(get_dummy_controller)),
     stock_tickers: list[str] = Query(...),
     target_date: date = Query(...),
     days_back: int = Query(...),
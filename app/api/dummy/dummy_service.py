@@ -1,9 +1,17 @@
+import logging
 import random
+import time
 from collections import defaultdict
 from datetime import date, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dummy.dummy_dataset import (
+    SYNTHETIC_TICKER_PREFIX,
+    DatasetSpec,
+    generate_chunks,
+)
+from app.api.dummy.dummy_repository import DummyRepository
 from app.api.general.services.stock_model_service import (
     StockModelService,
     get_stock_model_service,
@@ -14,11 +22,15 @@ from app.api.general.services.trading_data_service import (
     get_trading_data_service,
 )
 from app.api.ml_ops.schemas.inference_schema import InferenceResultSchema
+from app.core.common.utils.trading_calendar import get_trading_calendar
 from app.core.common.utils.validators import (
     normalize_stock_tickers,
     validate_required,
 )
-from app.models import TradingData
+from app.core.dependencies.container import app_scoped
+from app.models import Prediction, TradingData
+
+logger = logging.getLogger(__name__)
 
 
 class DummyService:
@@ -27,13 +39,15 @@ class DummyService:
         stock_service: StockService,
         stock_model_service: StockModelService,
         trading_data_service: TradingDataService,
+        dummy_repository: DummyRepository,
     ):
         self.stock_service = stock_service
         self.stock_model_service = stock_model_service
         self.trading_data_service = trading_data_service
+        self.dummy_repo = dummy_repository
 
-    @staticmethod
     async def generate_dummy_trading_data(
+        self,
         db: AsyncSession,
         stock_tickers: list[str],
         end_date: date,
@@ -61,11 +75,95 @@ class DummyService:
                         volumes=volumes,
                     )
                 )
+        await self.trading_data_service.partition_service.ensure_partitions(
+            db=db,
+            model=TradingData,
+            start_date=end_date - timedelta(days=days_back - 1),
+            end_date=end_date,
+        )
         db.add_all(data_to_insert)
         await db.commit()
+        await self.trading_data_service.trading_data_window_service.apply_rows(
+            db=db,
+            rows=[
+                {
+                    field: getattr(trading_data, field)
+                    for field in self.trading_data_service.trading_data_repo.WRITE_RETURNING
+                }
+                for trading_data in data_to_insert
+            ],
+        )
 
         return data_to_insert
 
+    async def generate_dataset(
+        self, db: AsyncSession, scale: float, end_date: date, seed: int = 0
+    ) -> dict:
+        """
+        Replace the synthetic dataset with one of `STOCKS_PER_SCALE * scale`
+        stocks, each with an active model, years of market day OHLCV and
+        predictions for every period over the last market days.
+
+        Prices are random walks generated with NumPy and loaded with COPY a chunk
+        of tickers at a time, then the trading data windows of the new stocks are
+        rebuilt and the tables analyzed so query plans see the new volumes.
+        """
+        validate_required(scale, "scale")
+        validate_required(end_date, "end_date")
+        spec = DatasetSpec.from_scale(scale=scale, end_date=end_date, seed=seed)
+        started = time.perf_counter()
+
+        deleted = await self.dummy_repo.delete_stocks_by_prefix(
+            db=db, ticker_prefix=SYNTHETIC_TICKER_PREFIX
+        )
+        stock_tickers = spec.stock_tickers()
+        model_ids = await self.dummy_repo.create_stocks_with_models(
+            db=db, stock_tickers=stock_tickers, industry_codes=spec.industry_codes()
+        )
+
+        open_days = get_trading_calendar().open_days(spec.start_date, spec.end_date)
+        partition_service = self.trading_data_service.partition_service
+        for model in (TradingData, Prediction):
+            await partition_service.ensure_partitions(
+                db=db, model=model, start_date=open_days[0], end_date=open_days[-1]
+            )
+
+        trading_data_count = prediction_count = 0
+        for chunk in generate_chunks(spec, open_days, model_ids):
+            copied = await self.dummy_repo.copy_trading_data_and_predictions(
+                db=db, trading_data=chunk.trading_data, predictions=chunk.predictions
+            )
+            trading_data_count += copied[0]
+            prediction_count += copied[1]
+        loaded = time.perf_counter()
+
+        window_service = self.trading_data_service.trading_data_window_service
+        await window_service.window_repo.rebuild_by_stock_tickers(
+            db=db, stock_tickers=stock_tickers, window_size=window_service.window_size
+        )
+        await self.dummy_repo.analyze(
+            db=db,
+            table_names=[
+                TradingData.__tablename__,
+                Prediction.__tablename__,
+                "trading_data_windows",
+            ],
+        )
+
+        summary = {
+            "scale": scale,
+            "deleted_stocks": deleted,
+            "stocks": len(stock_tickers),
+            "trading_data": trading_data_count,
+            "predictions": prediction_count,
+            "start_date": open_days[0].isoformat(),
+            "end_date": open_days[-1].isoformat(),
+            "load_seconds": round(loaded - started, 2),
+            "total_seconds": round(time.perf_counter() - started, 2),
+        }
+        logger.info(f"Generated synthetic dataset: {summary}")
+        return summary
+
     async def generate_dummy_inference_results_all(
         self,
         db: AsyncSession,
@@ -153,9 +251,11 @@ class DummyService:
         return inference_results
 
 
+@app_scoped
 def get_dummy_service() -> DummyService:
     return DummyService(
         stock_service=get_stock_service(),
         stock_model_service=get_stock_model_service(),
         trading_data_service=get_trading_data_service(),
+        dummy_repository=DummyRepository(),
     )
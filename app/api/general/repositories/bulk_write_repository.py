@@ -0,0 +1,162 @@
+import logging
+from typing import Optional, Sequence
+
+from sqlalchemy import Row, bindparam, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Base
+
+logger = logging.getLogger(__name__)
+
+
+class BulkWriteRepository:
+    """
+    Shared multi-row write path for repositories.
+
+    Rows are written with one `INSERT ... ON CONFLICT ... RETURNING` per batch, or
+    with asyncpg `COPY` for very large batches that need neither conflict handling
+    nor returned columns. Only the requested columns come back, as `Row` tuples,
+    instead of refreshed ORM instances.
+    """
+
+    # asyncpg allows at most 32767 bind parameters per statement
+    MAX_BIND_PARAMS = 32767
+    COPY_THRESHOLD = 5000
+
+    @staticmethod
+    async def insert_many(
+        db: AsyncSession,
+        model: type[Base],
+        rows: list[dict],
+        returning: Sequence[str] = ("id",),
+        conflict_constraint: Optional[str] = None,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> list[Row]:
+        """
+        Insert `rows` without committing.
+
+        With `conflict_constraint`, conflicting rows are skipped, or updated with
+        `update_fields` when given. Skipped rows are not part of the result.
+        """
+        if not rows:
+            return []
+
+        if (
+            not returning
+            and conflict_constraint is None
+            and len(rows) >= BulkWriteRepository.COPY_THRESHOLD
+        ):
+            await BulkWriteRepository.copy_records(db=db, model=model, rows=rows)
+            return []
+
+        table = model.__table__
+        columns = set(rows[0].keys())
+        # python-side column defaults are bound as parameters as well
+        params_per_row = len(columns) + sum(
+            1
+            for column in table.columns
+            if column.default is not None and column.name not in columns
+        )
+        batch_size = max(BulkWriteRepository.MAX_BIND_PARAMS // params_per_row, 1)
+
+        returned_rows: list[Row] = []
+        for i in range(0, len(rows), batch_size):
+            stmt = insert(table).values(rows[i : i + batch_size])  # noqa: E203
+            if conflict_constraint and update_fields:
+                stmt = stmt.on_conflict_do_update(
+                    constraint=conflict_constraint,
+                    set_={field: stmt.excluded[field] for field in update_fields},
+                )
+            elif conflict_constraint:
+                stmt = stmt.on_conflict_do_nothing(constraint=conflict_constraint)
+
+            if returning:
+                stmt = stmt.returning(*(table.c[column] for column in returning))
+                result = await db.execute(stmt)
+                returned_rows.extend(result.all())
+            else:
+                await db.execute(stmt)
+
+        return returned_rows
+
+    @staticmethod
+    async def update_many(
+        db: AsyncSession,
+        model: type[Base],
+        rows: list[dict],
+        key_fields: Sequence[str],
+        update_fields: Sequence[str],
+    ) -> int:
+        """
+        Update `rows` matched on `key_fields` with one executemany, without
+        committing. On a partitioned table, include the partition key in
+        `key_fields` so the UPDATE of every row is pruned to its own partition.
+        """
+        if not rows:
+            return 0
+
+        table = model.__table__
+        # bind names must differ from the column names of an UPDATE
+        stmt = (
+            update(table)
+            .where(
+                *(table.c[field] == bindparam(f"key_{field}") for field in key_fields)
+            )
+            .values({field: bindparam(f"set_{field}") for field in update_fields})
+        )
+        params = [
+            {
+                **{f"key_{field}": row[field] for field in key_fields},
+                **{f"set_{field}": row[field] for field in update_fields},
+            }
+            for row in rows
+        ]
+        connection = await db.connection()
+        await connection.execute(stmt, params)
+        return len(params)
+
+    @staticmethod
+    async def copy_records(
+        db: AsyncSession,
+        model: type[Base],
+        rows: list[dict],
+        columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Load `rows` with asyncpg `copy_records_to_table`. Columns that are not
+        given fall back to their server defaults.
+        """
+        if not rows:
+            return 0
+
+        columns = list(columns or rows[0].keys())
+        records = [tuple(row[column] for column in columns) for row in rows]
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            model.__tablename__, records=records, columns=columns
+        )
+        logger.debug(f"Copied {len(records)} rows into {model.__tablename__}")
+        return len(records)
+
+    @staticmethod
+    async def copy_columns(
+        db: AsyncSession, model: type[Base], columns: dict[str, Sequence]
+    ) -> int:
+        """
+        Load rows given as one equally long sequence per column with asyncpg
+        `copy_records_to_table`, without building a dict per row.
+        """
+        row_count = len(next(iter(columns.values()), ()))
+        if not row_count:
+            return 0
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            model.__tablename__, records=zip(*columns.values()), columns=list(columns)
+        )
+        logger.debug(f"Copied {row_count} rows into {model.__tablename__}")
+        return row_count
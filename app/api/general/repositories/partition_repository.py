@@ -0,0 +1,78 @@
+import logging
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.exceptions.custom_exceptions import DBError
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionRepository:
+    """
+    DDL for range partitions. Table and partition names are built by
+    `PartitionService` from model table names, never from user input.
+    """
+
+    @staticmethod
+    async def fetch_partition_names(db: AsyncSession, table_name: str) -> list[str]:
+        stmt = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = :table_name"
+        )
+        try:
+            result = await db.execute(stmt, {"table_name": table_name})
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to fetch partitions of {table_name}: {e}")
+            raise DBError(f"Failed to fetch partitions of {table_name}") from e
+
+    @staticmethod
+    async def create_partition(
+        db: AsyncSession,
+        table_name: str,
+        partition_name: str,
+        start_date: date,
+        end_date: date,
+    ) -> None:
+        stmt = text(
+            f'CREATE TABLE IF NOT EXISTS "{partition_name}" '
+            f'PARTITION OF "{table_name}" '
+            f"FOR VALUES FROM ('{start_date.isoformat()}') "
+            f"TO ('{end_date.isoformat()}')"
+        )
+        try:
+            await db.execute(stmt)
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to create partition {partition_name}: {e}")
+            raise DBError(f"Failed to create partition {partition_name}") from e
+
+    @staticmethod
+    async def count_rows(db: AsyncSession, partition_name: str) -> int:
+        try:
+            result = await db.execute(text(f'SELECT count(*) FROM "{partition_name}"'))
+            return result.scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to count rows of partition {partition_name}: {e}")
+            raise DBError(f"Failed to count rows of {partition_name}") from e
+
+    @staticmethod
+    async def drop_partition(
+        db: AsyncSession, table_name: str, partition_name: str
+    ) -> None:
+        try:
+            await db.execute(
+                text(f'ALTER TABLE "{table_name}" DETACH PARTITION "{partition_name}"')
+            )
+            await db.execute(text(f'DROP TABLE "{partition_name}"'))
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to drop partition {partition_name}: {e}")
+            raise DBError(f"Failed to drop partition {partition_name}") from e
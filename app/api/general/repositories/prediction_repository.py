@@ -2,10 +2,11 @@ import logging
 from datetime import date
 from typing import Set
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, delete, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
 from app.core.common.exceptions.custom_exceptions import DBError
 from app.core.common.utils.validators import sanitize_batch
 from app.models import Prediction, Stock
@@ -149,24 +150,43 @@ class PredictionRepository:
             logger.error(f"Failed to create prediction: {e}")
             raise DBError("Failed to create prediction") from e
 
+    @staticmethod
+    async def fetch_existing_keys(
+        db: AsyncSession,
+        stock_tickers: list[str],
+        target_date: date,
+        periods: list[int],
+    ) -> set[tuple[str, int, int]]:
+        """`(stock_ticker, model_id, period)` already predicted for `target_date`."""
+        stmt = select(
+            Prediction.stock_ticker, Prediction.model_id, Prediction.period
+        ).where(
+            Prediction.stock_ticker.in_(stock_tickers),
+            Prediction.target_date == target_date,
+            Prediction.period.in_(periods),
+        )
+        result = await db.execute(stmt)
+        return {tuple(row) for row in result.all()}
+
     @staticmethod
     async def create_multiple(
         db: AsyncSession,
         prediction_data_list: list[dict],
-        refresh: bool = True,
-    ) -> list[Prediction]:
+        skip_existing: bool = False,
+    ) -> list[Row]:
         sanitized_data_list = sanitize_batch(
             prediction_data_list, allowed_fields=PredictionRepository.ALLOWED_FIELDS
         )
         try:
-            predictions = [Prediction(**data) for data in sanitized_data_list]
-            db.add_all(predictions)
-            await db.flush()
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=Prediction,
+                rows=sanitized_data_list,
+                returning=("id", "stock_ticker", "model_id", "target_date", "period"),
+                conflict_constraint="uq_prediction" if skip_existing else None,
+            )
             await db.commit()
-            if refresh:
-                for p in predictions:
-                    await db.refresh(p)
-            return predictions
+            return rows
         except SQLAlchemyError as e:
             await db.rollback()
             logger.error(f"Failed to create multiple predictions: {e}")
@@ -1,10 +1,11 @@
 import logging
 from typing import List, Optional, Set
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import Row, delete, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
 from app.core.common.exceptions.custom_exceptions import DBError
 from app.core.common.utils.validators import sanitize_batch
 from app.core.enums.industry_code_enum import IndustryCodeEnum
@@ -130,19 +131,20 @@ class StockModelRepository:
     @staticmethod
     async def create_multiple(
         db: AsyncSession, model_data_list: List[dict]
-    ) -> List[StockModel]:
+    ) -> List[Row]:
         sanitized_data_list = sanitize_batch(
             model_data_list, allowed_fields=StockModelRepository.ALLOWED_FIELDS
         )
 
         try:
-            model_objects = [StockModel(**data) for data in sanitized_data_list]
-            db.add_all(model_objects)
-            await db.flush()
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=StockModel,
+                rows=sanitized_data_list,
+                returning=("id", "stock_ticker", "version"),
+            )
             await db.commit()
-            for obj in model_objects:
-                await db.refresh(obj)
-            return model_objects
+            return rows
         except SQLAlchemyError as e:
             await db.rollback()
             logger.error(f"Failed to create multiple stock models: {e}")
@@ -1,12 +1,15 @@
 import logging
-from datetime import date
+from datetime import date, timedelta
+from typing import AsyncIterator, Sequence
 
-from sqlalchemy import delete, func, over, select
+from sqlalchemy import Row, delete, func, over, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
 from app.core.common.exceptions.custom_exceptions import DBError
+from app.core.common.utils.trading_calendar import get_trading_calendar
 from app.core.common.utils.validators import sanitize_batch
 from app.models import TradingData
 
@@ -24,6 +27,31 @@ class TradingDataRepository:
         "volumes",
     }
 
+    # columns returned by writes, enough to merge the rows into the rolling windows
+    WRITE_RETURNING = (
+        "id",
+        "stock_ticker",
+        "target_date",
+        "close",
+        "open",
+        "high",
+        "low",
+        "volumes",
+    )
+
+    # calendar days read before the first expected day of a window, so tickers with
+    # a few missing days still get `days_back` rows
+    LOOKBACK_SLACK_DAYS = 14
+
+    @staticmethod
+    def _get_window_start_date(last_date: date, days_back: int) -> date:
+        """
+        Lower bound on `target_date` for the last `days_back` rows up to `last_date`,
+        which lets Postgres prune the monthly partitions outside of the window.
+        """
+        first_date = get_trading_calendar().n_open_days_behind(last_date, days_back)
+        return first_date - timedelta(days=TradingDataRepository.LOOKBACK_SLACK_DAYS)
+
     @staticmethod
     async def fetch_by_stock_ticker_and_date_range(
         db: AsyncSession,
@@ -52,6 +80,7 @@ class TradingDataRepository:
         last_date: date,
         days_back: int,
     ) -> list[TradingData]:
+        start_date = TradingDataRepository._get_window_start_date(last_date, days_back)
         SubTrading = aliased(TradingData)
         subquery = (
             select(
@@ -64,6 +93,7 @@ class TradingDataRepository:
             )
             .where(
                 SubTrading.stock_ticker.in_(stock_tickers),
+                SubTrading.target_date >= start_date,
                 SubTrading.target_date <= last_date,
             )
             .subquery()
@@ -72,7 +102,11 @@ class TradingDataRepository:
         stmt = (
             select(TradingData)
             .join(subquery, TradingData.id == subquery.c.id)
-            .where(subquery.c.rnum <= days_back)
+            .where(
+                subquery.c.rnum <= days_back,
+                TradingData.target_date >= start_date,
+                TradingData.target_date <= last_date,
+            )
             .order_by(TradingData.stock_ticker, TradingData.target_date.asc())
         )
 
@@ -93,6 +127,59 @@ class TradingDataRepository:
         # trading_data_list: list[TradingData] = list(result.scalars().all())
         # return trading_data_list[::-1]
 
+    @staticmethod
+    async def stream_columns_by_stock_tickers_and_date_range(
+        db: AsyncSession,
+        stock_tickers: list[str],
+        last_date: date,
+        days_back: int,
+        columns: Sequence[str],
+        yield_per: int = 1000,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Stream `(stock_ticker, id, *columns)` for the last `days_back` rows of every
+        ticker in batches of `yield_per`, ordered by ticker and ascending date,
+        without loading ORM objects.
+        """
+        start_date = TradingDataRepository._get_window_start_date(last_date, days_back)
+        SubTrading = aliased(TradingData)
+        subquery = (
+            select(
+                SubTrading.id,
+                over(
+                    func.row_number(),
+                    partition_by=SubTrading.stock_ticker,
+                    order_by=SubTrading.target_date.desc(),
+                ).label("rnum"),
+            )
+            .where(
+                SubTrading.stock_ticker.in_(stock_tickers),
+                SubTrading.target_date >= start_date,
+                SubTrading.target_date <= last_date,
+            )
+            .subquery()
+        )
+
+        stmt = (
+            select(
+                TradingData.stock_ticker,
+                TradingData.id,
+                *(getattr(TradingData, column) for column in columns),
+            )
+            .join(subquery, TradingData.id == subquery.c.id)
+            .where(
+                subquery.c.rnum <= days_back,
+                TradingData.target_date >= start_date,
+                TradingData.target_date <= last_date,
+            )
+            .order_by(TradingData.stock_ticker, TradingData.target_date.asc())
+            .execution_options(yield_per=yield_per)
+        )
+
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
     @staticmethod
     async def fetch_closing_price_values_by_stock_ticker_and_date_range(
         db: AsyncSession,
@@ -114,6 +201,21 @@ class TradingDataRepository:
         closing_prices_list: list[float] = list(result.scalars().all())
         return closing_prices_list[::-1]
 
+    @staticmethod
+    async def fetch_existing_keys_by_stock_tickers_and_date_range(
+        db: AsyncSession,
+        stock_tickers: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> set[tuple[str, date]]:
+        stmt = select(TradingData.stock_ticker, TradingData.target_date).where(
+            TradingData.stock_ticker.in_(stock_tickers),
+            TradingData.target_date >= start_date,
+            TradingData.target_date <= end_date,
+        )
+        result = await db.execute(stmt)
+        return {(row.stock_ticker, row.target_date) for row in result.all()}
+
     @staticmethod
     async def create_one(db: AsyncSession, trading_data: dict) -> TradingData:
         sanitized_data = sanitize_batch(
@@ -134,23 +236,47 @@ class TradingDataRepository:
     @staticmethod
     async def create_multiple(
         db: AsyncSession, trading_data_list: list[dict]
-    ) -> list[TradingData]:
+    ) -> list[Row]:
         sanitized_data_list = sanitize_batch(
             trading_data_list, allowed_fields=TradingDataRepository.ALLOWED_FIELDS
         )
         try:
-            trading_data_list = [TradingData(**data) for data in sanitized_data_list]
-            db.add_all(trading_data_list)
-            await db.flush()
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=TradingData,
+                rows=sanitized_data_list,
+                returning=TradingDataRepository.WRITE_RETURNING,
+            )
             await db.commit()
-            for cp in trading_data_list:
-                await db.refresh(cp)
-            return trading_data_list
+            return rows
         except SQLAlchemyError as e:
             await db.rollback()
             logger.error(f"Failed to create multiple trading data: {e}")
             raise DBError("Failed to create trading data") from e
 
+    @staticmethod
+    async def upsert_multiple(
+        db: AsyncSession, trading_data_list: list[dict]
+    ) -> list[Row]:
+        sanitized_data_list = sanitize_batch(
+            trading_data_list, allowed_fields=TradingDataRepository.ALLOWED_FIELDS
+        )
+        try:
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=TradingData,
+                rows=sanitized_data_list,
+                returning=TradingDataRepository.WRITE_RETURNING,
+                conflict_constraint="uq_trading_data",
+                update_fields=("close", "open", "high", "low", "volumes"),
+            )
+            await db.commit()
+            return rows
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to upsert multiple trading data: {e}")
+            raise DBError("Failed to upsert trading data") from e
+
     # TODO: fix warning?
     @staticmethod
     async def delete_older_than(db: AsyncSession, cutoff_date: date) -> int:
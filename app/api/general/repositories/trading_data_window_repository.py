@@ -0,0 +1,138 @@
+import logging
+
+from sqlalchemy import Row, Select, delete, func, over, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
+from app.core.common.exceptions.custom_exceptions import DBError
+from app.models import TradingData, TradingDataWindow
+
+logger = logging.getLogger(__name__)
+
+WINDOW_COLUMNS = ("close", "open", "high", "low", "volumes")
+WINDOW_FIELDS = ("last_date", "target_dates", "trading_data_ids", *WINDOW_COLUMNS)
+
+
+class TradingDataWindowRepository:
+    @staticmethod
+    async def fetch_by_stock_tickers(
+        db: AsyncSession, stock_tickers: list[str], for_update: bool = False
+    ) -> list[TradingDataWindow]:
+        stmt = select(TradingDataWindow).where(
+            TradingDataWindow.stock_ticker.in_(stock_tickers)
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _build_windows_from_trading_data(
+        stock_tickers: list[str], window_size: int
+    ) -> Select:
+        """The windows as they follow from `trading_data`, one row per ticker."""
+        latest = (
+            select(
+                TradingData.stock_ticker,
+                TradingData.target_date,
+                TradingData.id,
+                *(getattr(TradingData, column) for column in WINDOW_COLUMNS),
+                over(
+                    func.row_number(),
+                    partition_by=TradingData.stock_ticker,
+                    order_by=TradingData.target_date.desc(),
+                ).label("rnum"),
+            )
+            .where(TradingData.stock_ticker.in_(stock_tickers))
+            .subquery()
+        )
+
+        def ordered(column):
+            return func.array_agg(aggregate_order_by(column, latest.c.target_date))
+
+        return (
+            select(
+                latest.c.stock_ticker,
+                func.max(latest.c.target_date).label("last_date"),
+                ordered(latest.c.target_date).label("target_dates"),
+                ordered(latest.c.id).label("trading_data_ids"),
+                *(ordered(latest.c[column]).label(column) for column in WINDOW_COLUMNS),
+            )
+            .where(latest.c.rnum <= window_size)
+            .group_by(latest.c.stock_ticker)
+        )
+
+    @staticmethod
+    async def fetch_from_trading_data(
+        db: AsyncSession, stock_tickers: list[str], window_size: int
+    ) -> list[Row]:
+        stmt = TradingDataWindowRepository._build_windows_from_trading_data(
+            stock_tickers=stock_tickers, window_size=window_size
+        )
+        result = await db.execute(stmt)
+        return list(result.all())
+
+    @staticmethod
+    async def upsert_many(db: AsyncSession, windows: list[dict]) -> int:
+        try:
+            # stamped like `rebuild_by_stock_tickers`, for staleness checks
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=TradingDataWindow,
+                rows=[{**window, "updated_at": func.now()} for window in windows],
+                returning=("stock_ticker",),
+                conflict_constraint="trading_data_windows_pkey",
+                update_fields=(*WINDOW_FIELDS, "updated_at"),
+            )
+            await db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to upsert {len(windows)} trading data windows: {e}")
+            raise DBError("Failed to upsert trading data windows") from e
+
+    @staticmethod
+    async def rebuild_by_stock_tickers(
+        db: AsyncSession, stock_tickers: list[str], window_size: int
+    ) -> int:
+        """Rebuild the windows of `stock_tickers` from `trading_data` in one statement."""
+        windows = TradingDataWindowRepository._build_windows_from_trading_data(
+            stock_tickers=stock_tickers, window_size=window_size
+        )
+        stmt = insert(TradingDataWindow).from_select(
+            ["stock_ticker", *WINDOW_FIELDS], windows
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="trading_data_windows_pkey",
+            set_={
+                **{field: stmt.excluded[field] for field in WINDOW_FIELDS},
+                "updated_at": func.now(),
+            },
+        )
+        try:
+            result = await db.execute(stmt)
+            await db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to rebuild trading data windows: {e}")
+            raise DBError("Failed to rebuild trading data windows") from e
+
+    @staticmethod
+    async def delete_by_stock_tickers(
+        db: AsyncSession, stock_tickers: list[str]
+    ) -> int:
+        try:
+            result = await db.execute(
+                delete(TradingDataWindow).where(
+                    TradingDataWindow.stock_ticker.in_(stock_tickers)
+                )
+            )
+            await db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to delete trading data windows: {e}")
+            raise DBError("Failed to delete trading data windows") from e
@@ -10,6 +10,7 @@ from app.core.common.utils.validators import (
     validate_exact_length,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.models import Industry
 
@@ -76,5 +77,6 @@ class IndustryService:
         return industries
 
 
+@app_scoped
 def get_industry_service() -> IndustryService:
     return IndustryService(industry_repository=IndustryRepository())
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import re
+from datetime import date, datetime
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.general.repositories.partition_repository import PartitionRepository
+from app.core.dependencies.container import app_scoped
+from app.core.settings.config import get_config
+from app.models import Prediction, TradingData
+
+logger = logging.getLogger(__name__)
+
+PartitionedModel = type[TradingData] | type[Prediction]
+
+PARTITIONED_MODELS: tuple[PartitionedModel, ...] = (TradingData, Prediction)
+
+T = TypeVar("T")
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def next_month(d: date) -> date:
+    if d.month == 12:
+        return date(d.year + 1, 1, 1)
+    return date(d.year, d.month + 1, 1)
+
+
+def months_between(start_date: date, end_date: date) -> list[date]:
+    """First days of the months from `start_date` to `end_date`, both included."""
+    months, month = [], month_start(start_date)
+    while month <= end_date:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+def to_date(value: date | datetime | str) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def is_missing_partition_error(error: BaseException) -> bool:
+    """Whether `error`, or an error it was raised from, is a write to no partition."""
+    while error is not None:
+        if "no partition of relation" in str(error):
+            return True
+        error = error.__cause__
+    return False
+
+
+def get_partition_name(table_name: str, month: date) -> str:
+    return f"{table_name}_p{month:%Y_%m}"
+
+
+def parse_partition_month(table_name: str, partition_name: str) -> Optional[date]:
+    match = re.fullmatch(rf"{table_name}_p(\d{{4}})_(\d{{2}})", partition_name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+class PartitionService:
+    """
+    Monthly range partitions on `target_date` of `trading_data` and `predictions`.
+
+    Partitions are named `{table}_pYYYY_MM` and cover `[month, next month)`. The
+    months that exist are cached per table after the first lookup, so writers can
+    call `ensure_partitions` before every insert and only pay for it when a month
+    is actually missing.
+    """
+
+    def __init__(self, partition_repository: PartitionRepository, months_ahead: int):
+        self.partition_repo = partition_repository
+        self.months_ahead = months_ahead
+        self._months: dict[str, set[date]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_partition_months(
+        self, db: AsyncSession, model: PartitionedModel, refresh: bool = False
+    ) -> set[date]:
+        table_name = model.__tablename__
+        if refresh or table_name not in self._months:
+            names = await self.partition_repo.fetch_partition_names(
+                db=db, table_name=table_name
+            )
+            self._months[table_name] = {
+                month
+                for name in names
+                if (month := parse_partition_month(table_name, name)) is not None
+            }
+        return self._months[table_name]
+
+    async def ensure_partitions(
+        self,
+        db: AsyncSession,
+        model: PartitionedModel,
+        start_date: date,
+        end_date: date,
+    ) -> list[str]:
+        """Create the missing partitions for `start_date..end_date`."""
+        table_name = model.__tablename__
+        needed = months_between(start_date, end_date)
+        existing = self._months.get(table_name)
+        if existing is not None and existing.issuperset(needed):
+            return []
+
+        created = []
+        async with self._lock:
+            existing = await self.get_partition_months(db=db, model=model)
+            for month in needed:
+                if month in existing:
+                    continue
+                partition_name = get_partition_name(table_name, month)
+                await self.partition_repo.create_partition(
+                    db=db,
+                    table_name=table_name,
+                    partition_name=partition_name,
+                    start_date=month,
+                    end_date=next_month(month),
+                )
+                existing.add(month)
+                created.append(partition_name)
+
+        if created:
+            logger.info(f"Created partitions {created}")
+        return created
+
+    async def ensure_partitions_for_rows(
+        self, db: AsyncSession, model: PartitionedModel, rows: list[dict]
+    ) -> list[str]:
+        target_dates = [to_date(row["target_date"]) for row in rows]
+        if not target_dates:
+            return []
+        return await self.ensure_partitions(
+            db=db,
+            model=model,
+            start_date=min(target_dates),
+            end_date=max(target_dates),
+        )
+
+    async def write_with_partitions(
+        self,
+        db: AsyncSession,
+        model: PartitionedModel,
+        rows: list[dict],
+        write: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Run `write` after `ensure_partitions_for_rows`. The cached months belong to
+        this process, so a partition dropped by another instance makes the write
+        fail with "no partition of relation ... found for row"; the months are
+        then reloaded and the write retried once. Writers roll back on failure.
+        """
+        await self.ensure_partitions_for_rows(db=db, model=model, rows=rows)
+        try:
+            return await write()
+        except Exception as e:
+            if not is_missing_partition_error(e):
+                raise
+            logger.warning(
+                f"Cached partitions of {model.__tablename__} are stale, reloading"
+            )
+            async with self._lock:
+                await self.get_partition_months(db=db, model=model, refresh=True)
+            await self.ensure_partitions_for_rows(db=db, model=model, rows=rows)
+            return await write()
+
+    async def ensure_future_partitions(
+        self, db: AsyncSession, today: date
+    ) -> list[str]:
+        """Create the partitions up to `months_ahead` months after `today`."""
+        end_date = today
+        for _ in range(self.months_ahead):
+            end_date = next_month(end_date)
+
+        created = []
+        for model in PARTITIONED_MODELS:
+            created += await self.ensure_partitions(
+                db=db, model=model, start_date=today, end_date=end_date
+            )
+        return created
+
+    async def drop_partitions_before(
+        self,
+        db: AsyncSession,
+        model: PartitionedModel,
+        cutoff_date: date,
+        dry_run: bool = False,
+    ) -> tuple[list[str], int]:
+        """
+        Drop the partitions whose whole month is before `cutoff_date`. Returns the
+        partition names and the number of rows they held, which is not counted
+        with `dry_run`.
+        """
+        table_name = model.__tablename__
+        async with self._lock:
+            months = await self.get_partition_months(db=db, model=model, refresh=True)
+            expired = sorted(m for m in months if next_month(m) <= cutoff_date)
+
+            dropped, rows = [], 0
+            for month in expired:
+                partition_name = get_partition_name(table_name, month)
+                if not dry_run:
+                    rows += await self.partition_repo.count_rows(
+                        db=db, partition_name=partition_name
+                    )
+                    await self.partition_repo.drop_partition(
+                        db=db, table_name=table_name, partition_name=partition_name
+                    )
+                    months.discard(month)
+                dropped.append(partition_name)
+
+        return dropped, rows
+
+
+@app_scoped
+def get_partition_service() -> PartitionService:
+    return PartitionService(
+        partition_repository=PartitionRepository(),
+        months_ahead=get_config().PARTITION_MONTHS_AHEAD,
+    )
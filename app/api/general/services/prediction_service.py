@@ -1,9 +1,14 @@
 import logging
 from datetime import date, timedelta
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.general.repositories.prediction_repository import PredictionRepository
+from app.api.general.services.partition_service import (
+    PartitionService,
+    get_partition_service,
+)
 from app.api.general.services.trading_data_service import (
     TradingDataService,
     get_trading_data_service,
@@ -18,6 +23,7 @@ from app.core.common.utils.validators import (
     validate_exact_length,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.models import Prediction
 
@@ -29,9 +35,11 @@ class PredictionService:
         self,
         prediction_repository: PredictionRepository,
         trading_data_service: TradingDataService,
+        partition_service: PartitionService,
     ):
         self.prediction_repo = prediction_repository
         self.trading_data_service = trading_data_service
+        self.partition_service = partition_service
 
     async def get_by_id(self, db: AsyncSession, prediction_id: int) -> Prediction:
         validate_required(prediction_id, "prediction ID")
@@ -221,32 +229,59 @@ class PredictionService:
         validate_exact_length(predictions, 5 * len(industry_codes), "predictions")
         return predictions
 
+    async def get_existing_keys(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        target_date: date,
+        periods: list[int],
+    ) -> set[tuple[str, int, int]]:
+        validate_required(stock_tickers, "stock tickers")
+        validate_required(target_date, "target date")
+        validate_required(periods, "periods")
+
+        try:
+            return await self.prediction_repo.fetch_existing_keys(
+                db=db,
+                stock_tickers=normalize_stock_tickers(stock_tickers),
+                target_date=target_date,
+                periods=periods,
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch existing predictions: {e}")
+            raise DBError("Failed to fetch existing predictions") from e
+
     async def create_by_list(
         self,
         db: AsyncSession,
         prediction_data_list: list[dict],
-        refresh: bool = True,
-    ) -> list[Prediction]:
+        skip_existing: bool = False,
+    ) -> list[Row]:
+        """
+        With `skip_existing`, rows that hit `uq_prediction` are skipped and left
+        out of the result instead of failing the whole batch.
+        """
         validate_required(prediction_data_list, "prediction data")
-        prediction_data_list = normalize_stock_tickers_in_data(prediction_data_list)
 
         try:
             prediction_data_list = normalize_stock_tickers_in_data(prediction_data_list)
-            if len(prediction_data_list) == 1:
-                prediction = await self.prediction_repo.create_one(
-                    db=db, prediction_data=prediction_data_list[0], refresh=refresh
-                )
-                predictions = [prediction] if prediction else []
-                logger.warning(f"prediction: {prediction}")
-            else:
-                predictions = await self.prediction_repo.create_multiple(
-                    db=db, prediction_data_list=prediction_data_list, refresh=refresh
-                )
-                logger.warning(f"predictions: {predictions}")
+            predictions = await self.partition_service.write_with_partitions(
+                db=db,
+                model=Prediction,
+                rows=prediction_data_list,
+                write=lambda: self.prediction_repo.create_multiple(
+                    db=db,
+                    prediction_data_list=prediction_data_list,
+                    skip_existing=skip_existing,
+                ),
+            )
         except Exception as e:
             logger.error(f"Failed to create predictions: {e}")
             raise DBError("Failed to create predictions") from e
 
+        if skip_existing:
+            return predictions
+
         validate_entity_exists(predictions, "Predictions")
         validate_exact_length(predictions, len(prediction_data_list), "predictions")
         return predictions
@@ -274,8 +309,10 @@ class PredictionService:
         return deleted_count
 
 
+@app_scoped
 def get_prediction_service() -> PredictionService:
     return PredictionService(
         prediction_repository=PredictionRepository(),
         trading_data_service=get_trading_data_service(),
+        partition_service=get_partition_service(),
     )
@@ -1,6 +1,7 @@
 import logging
 from typing import List
 
+from sqlalchemy import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,11 +10,13 @@ from app.core.common.exceptions.custom_exceptions import DBError
 from app.core.common.utils.validators import (
     normalize_stock_ticker,
     normalize_stock_tickers,
+    normalize_stock_tickers_in_data,
     validate_entity_exists,
     validate_enum_input,
     validate_exact_length,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 
 # from app.core.enums.features_enum import validate_features
 from app.core.enums.industry_code_enum import IndustryCodeEnum
@@ -194,22 +197,21 @@ class StockModelService:
             logger.error(f"Unexpected DB error during create_one: {e}")
             raise DBError("Unexpected error while creating stock model") from e
 
-    # async def create_multiple(
-    #     self, db: AsyncSession, model_data_list: list[dict]
-    # ) -> List[StockModel]:
-    #     validate_required(model_data_list, "stock model data list")
-    #
-    #     try:
-    #         model_data_list = normalize_stock_tickers_in_data(model_data_list)
-    #         normalize_stock_tickers(model_data_list)
-    #         return await self.stock_model_repo.create_multiple(
-    #             db=db, model_data_list=model_data_list
-    #         )
-    #     except DBError:
-    #         raise
-    #     except SQLAlchemyError as e:
-    #         logger.error(f"Unexpected DB error during create_multiple: {e}")
-    #         raise DBError("Unexpected error while creating stock models") from e
+    async def create_multiple(
+        self, db: AsyncSession, model_data_list: list[dict]
+    ) -> List[Row]:
+        validate_required(model_data_list, "stock model data list")
+
+        try:
+            model_data_list = normalize_stock_tickers_in_data(model_data_list)
+            return await self.stock_model_repo.create_multiple(
+                db=db, model_data_list=model_data_list
+            )
+        except DBError:
+            raise
+        except SQLAlchemyError as e:
+            logger.error(f"Unexpected DB error during create_multiple: {e}")
+            raise DBError("Unexpected error while creating stock models") from e
 
     # TODO
     async def deactivate(
@@ -273,5 +275,6 @@ class StockModelService:
         # return updated_count
 
 
+@app_scoped
 def get_stock_model_service() -> StockModelService:
     return StockModelService(stock_model_repository=StockModelRepository())
@@ -13,6 +13,7 @@ from app.core.common.utils.validators import (
     validate_exact_length,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.models import Stock
 
@@ -210,5 +211,6 @@ class StockService:
         return stock
 
 
+@app_scoped
 def get_stock_service() -> StockService:
     return StockService(stock_repository=StockRepository())
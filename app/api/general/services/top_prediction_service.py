@@ -12,6 +12,7 @@ from app.core.common.utils.validators import (
     validate_enum_input,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.models import TopPrediction
 
@@ -121,5 +122,6 @@ class TopPredictionService:
         return deleted_count
 
 
+@app_scoped
 def get_top_prediction_service() -> TopPredictionService:
     return TopPredictionService(top_prediction_repository=TopPredictionRepository())
@@ -1,12 +1,22 @@
 import logging
 from collections import defaultdict
 from datetime import date, timedelta
+from typing import AsyncIterator, Sequence
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.general.repositories.trading_data_repository import (
     TradingDataRepository,
 )
+from app.api.general.services.partition_service import (
+    PartitionService,
+    get_partition_service,
+)
+from app.api.general.services.trading_data_window_service import (
+    TradingDataWindowService,
+    get_trading_data_window_service,
+)
 from app.core.common.exceptions.custom_exceptions import DBError
 from app.core.common.utils.validators import (
     normalize_stock_ticker,
@@ -16,6 +26,7 @@ from app.core.common.utils.validators import (
     validate_exact_length,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.models import TradingData
 
 logger = logging.getLogger(__name__)
@@ -25,8 +36,12 @@ class TradingDataService:
     def __init__(
         self,
         trading_data_repository: TradingDataRepository,
+        partition_service: PartitionService,
+        trading_data_window_service: TradingDataWindowService,
     ):
         self.trading_data_repo = trading_data_repository
+        self.partition_service = partition_service
+        self.trading_data_window_service = trading_data_window_service
 
     async def get_by_stock_ticker_and_date_range(
         self,
@@ -106,6 +121,38 @@ class TradingDataService:
 
         return trading_data_list
 
+    async def stream_by_stock_tickers_and_date_range(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        last_date: date,
+        days_back: int,
+        columns: Sequence[str],
+    ) -> AsyncIterator[list[Row]]:
+        validate_required(stock_tickers, "stock tickers")
+        validate_required(last_date, "last date")
+        validate_required(days_back, "days back")
+        stock_tickers = normalize_stock_tickers(stock_tickers)
+
+        partitions = (
+            self.trading_data_repo.stream_columns_by_stock_tickers_and_date_range(
+                db=db,
+                stock_tickers=stock_tickers,
+                last_date=last_date,
+                days_back=days_back,
+                columns=columns,
+            )
+        )
+        try:
+            async for partition in partitions:
+                yield partition
+        except Exception as e:
+            logger.error(
+                f"Failed to stream trading data for tickers '{stock_tickers}', "
+                f"last date '{last_date}', days back '{days_back}': {e}"
+            )
+            raise DBError("Failed to fetch trading data") from e
+
     async def get_closing_price_value_by_stock_ticker_and_date_range(
         self,
         db: AsyncSession,
@@ -185,6 +232,32 @@ class TradingDataService:
 
         return dict(grouped)
 
+    async def get_existing_keys_by_stock_tickers_and_date_range(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> set[tuple[str, date]]:
+        validate_required(stock_tickers, "stock tickers")
+        validate_required(start_date, "start date")
+        validate_required(end_date, "end date")
+        stock_tickers = normalize_stock_tickers(stock_tickers)
+
+        try:
+            return await self.trading_data_repo.fetch_existing_keys_by_stock_tickers_and_date_range(
+                db=db,
+                stock_tickers=stock_tickers,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch existing trading data for tickers '{stock_tickers}', "
+                f"from '{start_date}' to '{end_date}': {e}"
+            )
+            raise DBError("Failed to fetch existing trading data") from e
+
     async def create_one(self, db: AsyncSession, trading_data: dict) -> TradingData:
         validate_required(trading_data, "trading data")
 
@@ -192,8 +265,13 @@ class TradingDataService:
             trading_data["stock_ticker"] = normalize_stock_ticker(
                 trading_data["stock_ticker"]
             )
-            trading = await self.trading_data_repo.create_one(
-                db=db, trading_data=trading_data
+            trading = await self.partition_service.write_with_partitions(
+                db=db,
+                model=TradingData,
+                rows=[trading_data],
+                write=lambda: self.trading_data_repo.create_one(
+                    db=db, trading_data=trading_data
+                ),
             )
         except DBError:
             raise
@@ -201,6 +279,16 @@ class TradingDataService:
             logger.error(f"Unexpected DB error during create_one: {e}")
             raise DBError("Unexpected error while creating trading data") from e
 
+        await self.trading_data_window_service.apply_rows(
+            db=db,
+            rows=[
+                {
+                    field: getattr(trading, field)
+                    for field in self.trading_data_repo.WRITE_RETURNING
+                }
+            ],
+        )
+
         logger.info(
             f"Inserted trading data for {trading.stock_ticker} on {trading.target_date}."
         )
@@ -208,14 +296,19 @@ class TradingDataService:
 
     async def create_multiple(
         self, db: AsyncSession, trading_data_dict_list: list[dict]
-    ) -> list[TradingData]:
+    ) -> list[Row]:
         validate_required(trading_data_dict_list, "trading data list")
         try:
             trading_data_dict_list = normalize_stock_tickers_in_data(
                 trading_data_dict_list
             )
-            trading_data_list = await self.trading_data_repo.create_multiple(
-                db=db, trading_data_list=trading_data_dict_list
+            trading_data_list = await self.partition_service.write_with_partitions(
+                db=db,
+                model=TradingData,
+                rows=trading_data_dict_list,
+                write=lambda: self.trading_data_repo.create_multiple(
+                    db=db, trading_data_list=trading_data_dict_list
+                ),
             )
         except DBError:
             raise
@@ -223,9 +316,42 @@ class TradingDataService:
             logger.error(f"Unexpected DB error during create_multiple: {e}")
             raise DBError("Unexpected error while creating trading data") from e
 
+        await self.trading_data_window_service.apply_rows(
+            db=db, rows=[row._mapping for row in trading_data_list]
+        )
+
         logger.info(f"Inserted {len(trading_data_dict_list)} trading data.")
         return trading_data_list
 
+    async def upsert_multiple(
+        self, db: AsyncSession, trading_data_dict_list: list[dict]
+    ) -> int:
+        validate_required(trading_data_dict_list, "trading data list")
+        try:
+            trading_data_dict_list = normalize_stock_tickers_in_data(
+                trading_data_dict_list
+            )
+            upserted_rows = await self.partition_service.write_with_partitions(
+                db=db,
+                model=TradingData,
+                rows=trading_data_dict_list,
+                write=lambda: self.trading_data_repo.upsert_multiple(
+                    db=db, trading_data_list=trading_data_dict_list
+                ),
+            )
+        except DBError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected DB error during upsert_multiple: {e}")
+            raise DBError("Unexpected error while upserting trading data") from e
+
+        await self.trading_data_window_service.apply_rows(
+            db=db, rows=[row._mapping for row in upserted_rows]
+        )
+
+        logger.info(f"Upserted {len(upserted_rows)} trading data.")
+        return len(upserted_rows)
+
     # TODO : FIX
     async def delete_older_than(
         self,
@@ -252,5 +378,10 @@ class TradingDataService:
         return deleted_count
 
 
+@app_scoped
 def get_trading_data_service() -> TradingDataService:
-    return TradingDataService(trading_data_repository=TradingDataRepository())
+    return TradingDataService(
+        trading_data_repository=TradingDataRepository(),
+        partition_service=get_partition_service(),
+        trading_data_window_service=get_trading_data_window_service(),
+    )
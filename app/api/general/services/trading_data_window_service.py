@@ -0,0 +1,259 @@
+import bisect
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.general.repositories.trading_data_window_repository import (
+    WINDOW_COLUMNS,
+    WINDOW_FIELDS,
+    TradingDataWindowRepository,
+)
+from app.core.common.exceptions.custom_exceptions import DBError
+from app.core.common.utils.validators import normalize_stock_tickers, validate_required
+from app.core.dependencies.container import app_scoped
+from app.core.settings.config import get_config
+from app.models import TradingDataWindow
+
+logger = logging.getLogger(__name__)
+
+
+def merge_window(
+    stock_ticker: str,
+    window: TradingDataWindow,
+    rows: Sequence[Mapping[str, Any]],
+    window_size: int,
+) -> dict:
+    """
+    Merge freshly written trading data rows into a stored window, replacing rows of
+    the same date, and keep the latest `window_size` dates.
+    """
+    entries = {
+        target_date: (
+            window.trading_data_ids[i],
+            *(getattr(window, column)[i] for column in WINDOW_COLUMNS),
+        )
+        for i, target_date in enumerate(window.target_dates)
+    }
+    for row in rows:
+        entries[row["target_date"]] = (
+            row["id"],
+            *(row[column] for column in WINDOW_COLUMNS),
+        )
+
+    target_dates = sorted(entries)[-window_size:]
+    values = list(zip(*(entries[target_date] for target_date in target_dates)))
+    return {
+        "stock_ticker": stock_ticker,
+        "last_date": target_dates[-1],
+        "target_dates": target_dates,
+        "trading_data_ids": list(values[0]),
+        **{column: list(values[i]) for i, column in enumerate(WINDOW_COLUMNS, 1)},
+    }
+
+
+class TradingDataWindowService:
+    """
+    Keeps the latest `window_size` trading data rows of every ticker in
+    `trading_data_windows`, so inference inputs are one primary key lookup instead
+    of a window function over the whole history.
+
+    A stored window always holds every trading data row from its first date on.
+    Writes are merged into existing windows under a row lock; a ticker without a
+    window is rebuilt from `trading_data` instead, since the rows before the write
+    are unknown. When an update fails the affected windows are deleted, so readers
+    fall back to `trading_data` until the next write or repair rebuilds them.
+    """
+
+    def __init__(
+        self,
+        trading_data_window_repository: TradingDataWindowRepository,
+        window_size: int,
+    ):
+        self.window_repo = trading_data_window_repository
+        self.window_size = window_size
+
+    async def get_window_rows(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        last_date: date,
+        days_back: int,
+        columns: Sequence[str],
+    ) -> tuple[list[tuple], list[str]]:
+        """
+        Return `(stock_ticker, trading_data_id, *columns)` rows of the last
+        `days_back` days up to `last_date`, ordered by ticker and ascending date,
+        in the same shape as `TradingDataService.stream_by_stock_tickers_and_date_range`.
+        Tickers whose window cannot answer are returned separately, to be read
+        from `trading_data`.
+        """
+        validate_required(stock_tickers, "stock tickers")
+        stock_tickers = normalize_stock_tickers(stock_tickers)
+        if days_back > self.window_size:
+            return [], stock_tickers
+
+        try:
+            windows = await self.window_repo.fetch_by_stock_tickers(
+                db=db, stock_tickers=stock_tickers
+            )
+        except Exception as e:
+            logger.warning(f"Failed to fetch trading data windows: {e}")
+            return [], stock_tickers
+
+        windows_by_ticker = {window.stock_ticker: window for window in windows}
+        rows, missing_tickers = [], []
+        for stock_ticker in stock_tickers:
+            window = windows_by_ticker.get(stock_ticker)
+            # a window behind `last_date` may miss rows that were not merged yet
+            if window is None or window.last_date < last_date:
+                missing_tickers.append(stock_ticker)
+                continue
+
+            end = bisect.bisect_right(window.target_dates, last_date)
+            start = end - days_back
+            if start < 0:
+                missing_tickers.append(stock_ticker)
+                continue
+
+            ids = window.trading_data_ids
+            values = [getattr(window, column) for column in columns]
+            rows.extend(
+                (stock_ticker, ids[i], *(column[i] for column in values))
+                for i in range(start, end)
+            )
+
+        return rows, missing_tickers
+
+    async def apply_rows(
+        self, db: AsyncSession, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """Bring the windows up to date with trading data rows that were just written."""
+        if not rows:
+            return
+
+        rows_by_ticker = defaultdict(list)
+        for row in rows:
+            rows_by_ticker[row["stock_ticker"]].append(row)
+        stock_tickers = list(rows_by_ticker)
+
+        try:
+            windows = await self.window_repo.fetch_by_stock_tickers(
+                db=db, stock_tickers=stock_tickers, for_update=True
+            )
+            windows_by_ticker = {window.stock_ticker: window for window in windows}
+            merged = [
+                merge_window(
+                    stock_ticker,
+                    windows_by_ticker[stock_ticker],
+                    ticker_rows,
+                    self.window_size,
+                )
+                for stock_ticker, ticker_rows in rows_by_ticker.items()
+                if stock_ticker in windows_by_ticker
+            ]
+            if merged:
+                await self.window_repo.upsert_many(db=db, windows=merged)
+            else:
+                await db.commit()
+
+            new_tickers = [t for t in stock_tickers if t not in windows_by_ticker]
+            if new_tickers:
+                await self.window_repo.rebuild_by_stock_tickers(
+                    db=db, stock_tickers=new_tickers, window_size=self.window_size
+                )
+        except Exception as e:
+            logger.error(
+                f"Failed to update trading data windows of {stock_tickers}: {e}"
+            )
+            await self._invalidate(db=db, stock_tickers=stock_tickers)
+
+    async def check_consistency(
+        self, db: AsyncSession, stock_tickers: list[str], repair: bool = False
+    ) -> dict[str, Any]:
+        """
+        Compare the stored windows with the ones that follow from `trading_data`.
+        With `repair`, missing and mismatched windows are rebuilt and orphaned
+        ones deleted.
+        """
+        validate_required(stock_tickers, "stock tickers")
+        stock_tickers = normalize_stock_tickers(stock_tickers)
+
+        try:
+            expected = {
+                row.stock_ticker: row
+                for row in await self.window_repo.fetch_from_trading_data(
+                    db=db, stock_tickers=stock_tickers, window_size=self.window_size
+                )
+            }
+            stored = {
+                window.stock_ticker: window
+                for window in await self.window_repo.fetch_by_stock_tickers(
+                    db=db, stock_tickers=stock_tickers
+                )
+            }
+        except DBError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to check trading data windows: {e}")
+            raise DBError("Failed to check trading data windows") from e
+
+        missing = sorted(t for t in expected if t not in stored)
+        orphaned = sorted(t for t in stored if t not in expected)
+        mismatched = sorted(
+            t
+            for t in expected
+            if t in stored and not self._is_same_window(stored[t], expected[t])
+        )
+
+        if repair:
+            if missing or mismatched:
+                await self.window_repo.rebuild_by_stock_tickers(
+                    db=db,
+                    stock_tickers=missing + mismatched,
+                    window_size=self.window_size,
+                )
+            if orphaned:
+                await self.window_repo.delete_by_stock_tickers(
+                    db=db, stock_tickers=orphaned
+                )
+
+        report = {
+            "checked": len(stock_tickers),
+            "window_size": self.window_size,
+            "missing": missing,
+            "mismatched": mismatched,
+            "orphaned": orphaned,
+            "repaired": repair and bool(missing or mismatched or orphaned),
+        }
+        if missing or mismatched or orphaned:
+            logger.warning(f"Inconsistent trading data windows: {report}")
+        return report
+
+    @staticmethod
+    def _is_same_window(window: TradingDataWindow, expected: Any) -> bool:
+        return all(
+            getattr(window, field) == getattr(expected, field)
+            for field in WINDOW_FIELDS
+        )
+
+    async def _invalidate(self, db: AsyncSession, stock_tickers: list[str]) -> None:
+        try:
+            await db.rollback()
+            await self.window_repo.delete_by_stock_tickers(
+                db=db, stock_tickers=stock_tickers
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to invalidate trading data windows of {stock_tickers}: {e}"
+            )
+
+
+@app_scoped
+def get_trading_data_window_service() -> TradingDataWindowService:
+    return TradingDataWindowService(
+        trading_data_window_repository=TradingDataWindowRepository(),
+        window_size=get_config().TRADING_DATA_WINDOW_SIZE,
+    )
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -6,6 +7,7 @@ from app.api.internal.services.cleanup_data_service import (
     CleanupDataService,
     get_cleanup_data_service,
 )
+from app.core.dependencies.container import app_scoped
 
 
 class CleanupDataController:
@@ -18,39 +20,54 @@ class CleanupDataController:
         target_date: date,
         trading_data_days_back: int,
         predictions_days_back: int,
-    ) -> None:
-        await self.service.clean_data(
+        dry_run: bool = False,
+    ) -> list[dict[str, Any]]:
+        results = await self.service.clean_data(
             db=db,
             target_date=target_date,
             trading_data_days_back=trading_data_days_back,
             predictions_days_back=predictions_days_back,
+            dry_run=dry_run,
         )
-        return None
+        return [result.to_dict() for result in results]
 
     async def clean_trading_data_controller(
-        self, db: AsyncSession, target_date: date, days_back: int
-    ) -> None:
-        await self.service.clean_trading_data(
-            db=db, target_date=target_date, days_back=days_back
+        self,
+        db: AsyncSession,
+        target_date: date,
+        days_back: int,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        result = await self.service.clean_trading_data(
+            db=db, target_date=target_date, days_back=days_back, dry_run=dry_run
         )
-        return None
+        return result.to_dict()
 
     async def clean_predictions_controller(
-        self, db: AsyncSession, target_date: date, days_back: int
-    ) -> None:
-        await self.service.clean_predictions(
-            db=db, target_date=target_date, days_back=days_back
+        self,
+        db: AsyncSession,
+        target_date: date,
+        days_back: int,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        result = await self.service.clean_predictions(
+            db=db, target_date=target_date, days_back=days_back, dry_run=dry_run
         )
-        return None
+        return result.to_dict()
 
     async def clean_top_predictions_controller(
-        self, db: AsyncSession, target_date: date, days_back: int
-    ) -> None:
-        await self.service.clean_top_predictions(
-            db=db, target_date=target_date, days_back=days_back
+        self,
+        db: AsyncSession,
+        target_date: date,
+        days_back: int,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        result = await self.service.clean_top_predictions(
+            db=db, target_date=target_date, days_back=days_back, dry_run=dry_run
         )
-        return None
+        return result.to_dict()
 
 
+@app_scoped
 def get_cleanup_data_controller() -> CleanupDataController:
     return CleanupDataController(service=get_cleanup_data_service())
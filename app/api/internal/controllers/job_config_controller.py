@@ -7,6 +7,7 @@ from app.api.internal.services.job_config_service import (
     JobConfigService,
     get_job_config_service,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.job_enum import JobConfigEnum
 
 
@@ -38,14 +39,15 @@ class JobConfigController:
             db=db, key=request.key, value=request.value
         )
 
-    # async def invalidate_job_config_cache_controller(self, key: JobConfigEnum) -> None:
-    #     await self.service.invalidate_job_config_cache(key=key)
-    #     return None
-    #
-    # async def invalidate_all_job_config_caches_controller(self) -> None:
-    #     await self.service.invalidate_all_job_config_caches()
-    #     return None
+    async def invalidate_job_config_cache_controller(self, key: JobConfigEnum) -> None:
+        await self.service.invalidate_job_config_cache(key=key)
+        return None
 
+    async def invalidate_all_job_config_caches_controller(self) -> None:
+        await self.service.invalidate_all_job_config_caches()
+        return None
 
+
+@app_scoped
 def get_job_config_controller() -> JobConfigController:
     return JobConfigController(service=get_job_config_service())
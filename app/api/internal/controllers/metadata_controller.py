@@ -11,6 +11,7 @@ from app.api.internal.services.metadata_service import (
     MetadataService,
     get_metadata_service,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.models import Stock
 
@@ -95,5 +96,6 @@ class MetadataController:
             raise e
 
 
+@app_scoped
 def get_metadata_controller() -> MetadataController:
     return MetadataController(service=get_metadata_service())
@@ -0,0 +1,53 @@
+from typing import Any
+
+from app.core.clients.http_client_pool import get_http_client_stats
+from app.core.common.exceptions.custom_exceptions import ResourceNotFoundError
+from app.core.common.utils.latency_histogram import get_latency_histogram
+from app.core.common.utils.measurement import get_metrics_buffer
+from app.core.common.utils.request_profiler import RequestProfile, get_profile_store
+from app.core.common.utils.statement_stats import get_statement_stats
+from app.core.dependencies.container import app_scoped
+
+
+class MetricsController:
+    @staticmethod
+    async def get_http_client_stats_controller() -> dict[str, dict[str, Any]]:
+        return get_http_client_stats()
+
+    @staticmethod
+    async def get_metrics_buffer_stats_controller() -> dict[str, Any]:
+        return get_metrics_buffer().get_stats()
+
+    @staticmethod
+    async def get_latency_histogram_controller(reset: bool) -> list[dict[str, Any]]:
+        histogram = get_latency_histogram()
+        snapshot = histogram.snapshot()
+        if reset:
+            histogram.reset()
+        return snapshot
+
+    @staticmethod
+    async def get_statement_stats_controller(
+        limit: int, reset: bool
+    ) -> list[dict[str, Any]]:
+        stats = get_statement_stats()
+        snapshot = stats.snapshot(limit=limit)
+        if reset:
+            stats.reset()
+        return snapshot
+
+    @staticmethod
+    async def get_profiles_controller() -> list[dict[str, Any]]:
+        return get_profile_store().list()
+
+    @staticmethod
+    async def get_profile_controller(profile_id: str) -> RequestProfile:
+        profile = get_profile_store().get(profile_id)
+        if profile is None:
+            raise ResourceNotFoundError(resource=f"Profile {profile_id}")
+        return profile
+
+
+@app_scoped
+def get_metrics_controller() -> MetricsController:
+    return MetricsController()
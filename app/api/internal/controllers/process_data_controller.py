@@ -5,6 +5,7 @@ from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.internal.schemas.process_data_schema import (
+    BackfillTradingDataRequestSchema,
     PullTradingDataRequestSchema,
     RankPredictionsRequestSchema,
 )
@@ -12,6 +13,7 @@ from app.api.internal.services.process_data_service import (
     ProcessDataService,
     get_process_data_service,
 )
+from app.core.dependencies.container import app_scoped
 
 
 class ProcessDataController:
@@ -35,6 +37,7 @@ class ProcessDataController:
                 industry_codes=request.industries,
                 periods=request.periods,
                 target_dates=request.target_dates,
+                set_based=request.set_based,
                 db=db,
             )
         )
@@ -50,16 +53,37 @@ class ProcessDataController:
         )
         return response
 
+    async def backfill_trading_data_controller(
+        self, request: BackfillTradingDataRequestSchema, db: AsyncSession
+    ) -> dict[str, any]:
+        response = await self.service.backfill_trading_data(
+            stock_tickers=request.stock_tickers,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            chunk_days=request.chunk_days,
+            resume=request.resume,
+            db=db,
+        )
+        return jsonable_encoder(response)
+
+    async def check_trading_data_windows_controller(
+        self, stock_tickers: Optional[list[str]], repair: bool, db: AsyncSession
+    ) -> dict[str, any]:
+        response = await self.service.check_trading_data_windows(
+            stock_tickers=stock_tickers, repair=repair, db=db
+        )
+        return response
+
     async def accuracy_all_controller(
         self,
         target_date: date,
         days_back: int,
         db: AsyncSession,
-    ):
-        response = await self.service.accuracy_all(
+    ) -> dict[str, any]:
+        result = await self.service.accuracy_all(
             target_date=target_date, days_back=days_back, db=db
         )
-        return response
+        return result.to_dict()
 
     async def accuracy_controller(
         self,
@@ -67,14 +91,14 @@ class ProcessDataController:
         target_date: date,
         days_back: int,
         db: AsyncSession,
-    ):
-        response = await self.service.accuracy(
+    ) -> dict[str, any]:
+        result = await self.service.accuracy(
             stock_tickers=stock_tickers,
             target_date=target_date,
             days_back=days_back,
             db=db,
         )
-        return response
+        return result.to_dict()
 
     def get_market_open_date_controller(
         self, target_date: date, next_n_market_days: Optional[int]
@@ -85,5 +109,6 @@ class ProcessDataController:
         return jsonable_encoder(response)
 
 
+@app_scoped
 def get_process_data_controller() -> ProcessDataController:
     return ProcessDataController(service=get_process_data_service())
@@ -0,0 +1,131 @@
+import logging
+from datetime import date
+from typing import AsyncIterator
+
+from sqlalchemy import Date, Row, cast, func, literal, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
+from app.core.common.exceptions.custom_exceptions import DBError
+from app.models import Prediction, PredictionEvaluation, Stock, StockModel, TradingData
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_FIELDS = (
+    "stock_ticker",
+    "industry_code",
+    "sample_count",
+    "mae",
+    "mape",
+    "rmse",
+    "hit_rate",
+    "evaluated_at",
+)
+
+
+class EvaluationRepository:
+    @staticmethod
+    def _ordinal(column):
+        """A date column as `date.toordinal()`, computed by Postgres."""
+        return column - cast(literal(date(1, 1, 1)), Date) + 1
+
+    @staticmethod
+    async def stream_predictions(
+        db: AsyncSession,
+        stock_tickers: list[str],
+        start_date: date,
+        end_date: date,
+        yield_per: int = 100,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Stream the predictions made from `start_date` to `end_date` as one
+        `(model_id, stock_ticker, industry_code, period, target_date ordinals,
+        predicted prices, closing prices)` row per model and period.
+        """
+        # the aggregates of one group all read its rows in the same order, so
+        # the arrays stay aligned without sorting each of them
+        stmt = (
+            select(
+                Prediction.model_id,
+                Prediction.stock_ticker,
+                Stock.industry_code,
+                Prediction.period,
+                func.array_agg(EvaluationRepository._ordinal(Prediction.target_date)),
+                func.array_agg(Prediction.predicted_price),
+                func.array_agg(Prediction.closing_price),
+            )
+            .join(Stock, Stock.ticker == Prediction.stock_ticker)
+            .where(
+                Prediction.stock_ticker.in_(stock_tickers),
+                Prediction.target_date >= start_date,
+                Prediction.target_date <= end_date,
+            )
+            .group_by(
+                Prediction.model_id,
+                Prediction.stock_ticker,
+                Stock.industry_code,
+                Prediction.period,
+            )
+            .execution_options(yield_per=yield_per)
+        )
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    async def stream_closes(
+        db: AsyncSession,
+        stock_tickers: list[str],
+        start_date: date,
+        end_date: date,
+        yield_per: int = 100,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Stream the closes from `start_date` to `end_date` as one
+        `(stock_ticker, target_date ordinals, closes)` row per ticker.
+        """
+        stmt = (
+            select(
+                TradingData.stock_ticker,
+                func.array_agg(EvaluationRepository._ordinal(TradingData.target_date)),
+                func.array_agg(TradingData.close),
+            )
+            .where(
+                TradingData.stock_ticker.in_(stock_tickers),
+                TradingData.target_date >= start_date,
+                TradingData.target_date <= end_date,
+            )
+            .group_by(TradingData.stock_ticker)
+            .execution_options(yield_per=yield_per)
+        )
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    async def save_evaluations(
+        db: AsyncSession, evaluations: list[dict], model_accuracies: list[dict]
+    ) -> int:
+        """
+        Upsert the evaluations of one window and set `StockModel.accuracy` from
+        `{"id", "accuracy"}` rows, in one transaction.
+        """
+        try:
+            rows = await BulkWriteRepository.insert_many(
+                db=db,
+                model=PredictionEvaluation,
+                rows=evaluations,
+                conflict_constraint="uq_prediction_evaluation",
+                update_fields=EVALUATION_FIELDS,
+            )
+            if model_accuracies:
+                await db.execute(update(StockModel), model_accuracies)
+            await db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(
+                f"Failed to save {len(evaluations)} prediction evaluations: {e}"
+            )
+            raise DBError("Failed to save prediction evaluations") from e
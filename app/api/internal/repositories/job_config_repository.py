@@ -1,4 +1,7 @@
-from sqlalchemy import select, update
+from datetime import timedelta
+
+from sqlalchemy import Row, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.job_config import JobConfig
@@ -13,18 +16,47 @@ class JobConfigRepository:
         result = await db.execute(select(JobConfig).where(JobConfig.key.in_(keys)))
         return list(result.scalars().all())
 
-    async def upsert(self, db: AsyncSession, key: str, value: str) -> JobConfig:
-        existing = await self.fetch_by_key(db, key=key)
-        if existing:
-            stmt = (
-                update(JobConfig)
-                .where(JobConfig.key == key)
-                .values(value=value)
-                .execution_options(synchronize_session=False)
+    async def upsert(self, db: AsyncSession, key: str, value: str) -> Row:
+        stmt = (
+            insert(JobConfig)
+            .values(key=key, value=value, updated_at=func.now())
+            .on_conflict_do_update(
+                index_elements=[JobConfig.key],
+                set_={"value": value, "updated_at": func.now()},
             )
-            await db.execute(stmt)
-        else:
-            new_config = JobConfig(key=key, value=value)
-            db.add(new_config)
+            .returning(JobConfig.key, JobConfig.value)
+        )
+        result = await db.execute(stmt)
+        config = result.first()
+        await db.commit()
+        return config
+
+    async def try_acquire_lease(
+        self, db: AsyncSession, key: str, owner: str, ttl_seconds: int
+    ) -> bool:
+        """
+        Take the lease in `key` for `owner`, or renew it if `owner` holds it. A
+        lease held by another owner is only taken over once it is `ttl_seconds`
+        old. The upsert is atomic, so two callers never both get it.
+        """
+        stmt = insert(JobConfig).values(key=key, value=owner, updated_at=func.now())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobConfig.key],
+            set_={"value": owner, "updated_at": func.now()},
+            where=or_(
+                JobConfig.value.in_([owner, ""]),
+                JobConfig.updated_at < func.now() - timedelta(seconds=ttl_seconds),
+            ),
+        ).returning(JobConfig.key)
+        result = await db.execute(stmt)
+        acquired = result.first() is not None
+        await db.commit()
+        return acquired
+
+    async def release_lease(self, db: AsyncSession, key: str, owner: str) -> None:
+        await db.execute(
+            update(JobConfig)
+            .where(JobConfig.key == key, JobConfig.value == owner)
+            .values(value="", updated_at=func.now())
+        )
         await db.commit()
-        return await self.fetch_by_key(db, key)
@@ -1,16 +1,22 @@
 import logging
 from datetime import date
 
-from sqlalchemy import update
+from sqlalchemy import Row, case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.general.repositories.bulk_write_repository import BulkWriteRepository
 from app.core.common.exceptions.custom_exceptions import DBError
 from app.core.common.utils.validators import sanitize_batch
 from app.core.enums.industry_code_enum import IndustryCodeEnum
-from app.models import Prediction, TopPrediction
+from app.models import Prediction, Stock, TopPrediction
 
 logger = logging.getLogger(__name__)
 
+# `target_date` is the partition key, so every row's UPDATE hits one partition
+RANK_KEY_FIELDS = ("id", "target_date")
+RANK_UPDATE_FIELDS = ("rank", "top_prediction_id")
+
 
 class ProcessDataRepository:
     @staticmethod
@@ -37,18 +43,143 @@ class ProcessDataRepository:
             bound_data = [
                 {
                     "id": item["prediction_id"],
+                    "target_date": target_date,
                     "rank": item["rank"],
                     "top_prediction_id": top_prediction.id,
                 }
                 for item in sanitized
             ]
 
-            stmt = update(Prediction)
-            await db.execute(stmt, bound_data)
+            updated = await BulkWriteRepository.update_many(
+                db=db,
+                model=Prediction,
+                rows=bound_data,
+                key_fields=RANK_KEY_FIELDS,
+                update_fields=RANK_UPDATE_FIELDS,
+            )
             await db.commit()
-            return len(bound_data)
+            return updated
 
         except Exception as e:
             logger.error(f"Failed to batch update predictions: {e}")
             await db.rollback()
             raise DBError("Batch update failed") from e
+
+    @staticmethod
+    async def rank_and_save_top_predictions(
+        db: AsyncSession,
+        industry_codes: list[str],
+        periods: list[int],
+        target_dates: list[date],
+        top_n: int = 5,
+    ) -> list[Row]:
+        """
+        Rank every (industry, period, date) at once: one window query for the top
+        `top_n` predictions of each group, one insert of all top predictions, one
+        update clearing the previous ranks of those groups and one bulk update of
+        the ranked predictions, in a single transaction.
+
+        The order matches `ProcessDataService.rank_predictions`: by
+        `predicted_price / closing_price` descending (0 without a closing price),
+        ties by stock ticker. Returns the ranked rows.
+        """
+        try:
+            ratio = case(
+                (
+                    or_(
+                        Prediction.closing_price.is_(None),
+                        Prediction.closing_price == 0,
+                    ),
+                    0.0,
+                ),
+                else_=Prediction.predicted_price / Prediction.closing_price,
+            )
+            ranked = (
+                select(
+                    Prediction.id.label("prediction_id"),
+                    Stock.industry_code,
+                    Prediction.period,
+                    Prediction.target_date,
+                    func.row_number()
+                    .over(
+                        partition_by=(
+                            Stock.industry_code,
+                            Prediction.period,
+                            Prediction.target_date,
+                        ),
+                        order_by=(ratio.desc(), Prediction.stock_ticker, Prediction.id),
+                    )
+                    .label("rank"),
+                )
+                .join(Stock, Stock.ticker == Prediction.stock_ticker)
+                .where(
+                    Stock.industry_code.in_(industry_codes),
+                    Prediction.period.in_(periods),
+                    Prediction.target_date.in_(target_dates),
+                )
+                .subquery()
+            )
+            result = await db.execute(select(ranked).where(ranked.c.rank <= top_n))
+            ranked_rows = list(result.all())
+            if not ranked_rows:
+                return []
+
+            groups = sorted(
+                {(r.industry_code, r.period, r.target_date) for r in ranked_rows}
+            )
+            stmt = insert(TopPrediction).values(
+                [
+                    {"industry_code": i, "period": p, "target_date": d}
+                    for i, p, d in groups
+                ]
+            )
+            # re-ranking a group reuses its top prediction
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_top_prediction",
+                set_={"period": stmt.excluded.period},
+            ).returning(
+                TopPrediction.id,
+                TopPrediction.industry_code,
+                TopPrediction.period,
+                TopPrediction.target_date,
+            )
+            result = await db.execute(stmt)
+            top_prediction_ids = {
+                (r.industry_code, r.period, r.target_date): r.id for r in result.all()
+            }
+
+            bound_data = [
+                {
+                    "id": r.prediction_id,
+                    "target_date": r.target_date,
+                    "rank": r.rank,
+                    "top_prediction_id": top_prediction_ids[
+                        (r.industry_code, r.period, r.target_date)
+                    ],
+                }
+                for r in ranked_rows
+            ]
+            # unrank the previous top of a reused group, which may lose its place
+            await db.execute(
+                update(Prediction)
+                .where(
+                    Prediction.top_prediction_id.in_(list(top_prediction_ids.values())),
+                    Prediction.target_date.in_(target_dates),
+                )
+                .values(rank=None, top_prediction_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            await BulkWriteRepository.update_many(
+                db=db,
+                model=Prediction,
+                rows=bound_data,
+                key_fields=RANK_KEY_FIELDS,
+                update_fields=RANK_UPDATE_FIELDS,
+            )
+            await db.commit()
+            return ranked_rows
+
+        except Exception as e:
+            logger.error(f"Failed to rank predictions: {e}")
+            await db.rollback()
+            raise DBError("Set-based ranking failed") from e
@@ -0,0 +1,108 @@
+import logging
+from datetime import date
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.exceptions.custom_exceptions import DBError
+from app.models import Prediction, TopPrediction, TradingData
+
+logger = logging.getLogger(__name__)
+
+RetentionModel = type[TradingData] | type[Prediction] | type[TopPrediction]
+
+
+class RetentionRepository:
+    """
+    Keyset-paged deletes of rows older than a cutoff date.
+
+    Every batch reads the next `batch_size` ids after `after_id`, deletes them and
+    commits, so no statement holds locks on more than one batch of rows.
+    """
+
+    @staticmethod
+    async def count_older_than(
+        db: AsyncSession, model: RetentionModel, cutoff_date: date
+    ) -> int:
+        try:
+            stmt = select(func.count()).where(model.target_date < cutoff_date)
+            result = await db.execute(stmt)
+            return result.scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Failed to count {model.__tablename__} older than {cutoff_date}: {e}"
+            )
+            raise DBError(f"Failed to count old {model.__tablename__}") from e
+
+    @staticmethod
+    async def fetch_ids_older_than(
+        db: AsyncSession,
+        model: RetentionModel,
+        cutoff_date: date,
+        after_id: int,
+        batch_size: int,
+    ) -> list[int]:
+        try:
+            stmt = (
+                select(model.id)
+                .where(model.target_date < cutoff_date, model.id > after_id)
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            result = await db.execute(stmt)
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Failed to fetch {model.__tablename__} ids older than {cutoff_date}: {e}"
+            )
+            raise DBError(f"Failed to fetch old {model.__tablename__}") from e
+
+    @staticmethod
+    async def delete_predictions_by_ids(db: AsyncSession, ids: list[int]) -> int:
+        try:
+            result = await db.execute(
+                delete(Prediction)
+                .where(Prediction.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to delete a batch of {len(ids)} predictions: {e}")
+            raise DBError("Failed to delete old predictions") from e
+
+    @staticmethod
+    async def delete_top_predictions_by_ids(db: AsyncSession, ids: list[int]) -> int:
+        try:
+            # top predictions still referenced by a prediction are kept
+            result = await db.execute(
+                delete(TopPrediction)
+                .where(
+                    TopPrediction.id.in_(ids),
+                    ~exists().where(Prediction.top_prediction_id == TopPrediction.id),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to delete a batch of {len(ids)} top predictions: {e}")
+            raise DBError("Failed to delete old top predictions") from e
+
+    @staticmethod
+    async def delete_trading_data_by_ids(db: AsyncSession, ids: list[int]) -> int:
+        try:
+            result = await db.execute(
+                delete(TradingData)
+                .where(TradingData.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Failed to delete a batch of {len(ids)} trading data: {e}")
+            raise DBError("Failed to delete old trading data") from e
@@ -8,6 +8,7 @@ from app.api.internal.controllers.cleanup_data_controller import (
     get_cleanup_data_controller,
 )
 from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 
 router = APIRouter(
@@ -19,54 +20,59 @@ router = APIRouter(
 @router.delete("/all")
 async def clean_data_route(
     db: AsyncSession = Depends(get_db),
-    controller: CleanupDataController = Depends(get_cleanup_data_controller),
+    controller: CleanupDataController = Depends(provide(get_cleanup_data_controller)),
     target_date: date = Query(...),
     trading_days_back: int = Query(),
     predictions_days_back: int = Query(),
+    dry_run: bool = Query(False, description="Only count the rows to delete"),
 ):
-    await controller.clean_data_controller(
+    response = await controller.clean_data_controller(
         db=db,
         target_date=target_date,
         trading_data_days_back=trading_days_back,
         predictions_days_back=predictions_days_back,
+        dry_run=dry_run,
     )
-    return success_response()
+    return success_response(data=response)
 
 
 @router.delete("/trading_data")
 async def clean_trading_data_route(
     db: AsyncSession = Depends(get_db),
-    controller: CleanupDataController = Depends(get_cleanup_data_controller),
+    controller: CleanupDataController = Depends(provide(get_cleanup_data_controller)),
     target_date: date = Query(...),
     days_back: int = Query(),
+    dry_run: bool = Query(False, description="Only count the rows to delete"),
 ):
-    await controller.clean_trading_data_controller(
-        target_date=target_date, days_back=days_back, db=db
+    response = await controller.clean_trading_data_controller(
+        target_date=target_date, days_back=days_back, db=db, dry_run=dry_run
     )
-    return success_response()
+    return success_response(data=response)
 
 
 @router.delete("/predictions")
 async def clean_predictions_route(
     db: AsyncSession = Depends(get_db),
-    controller: CleanupDataController = Depends(get_cleanup_data_controller),
+    controller: CleanupDataController = Depends(provide(get_cleanup_data_controller)),
     target_date: date = Query(...),
     days_back: int = Query(),
+    dry_run: bool = Query(False, description="Only count the rows to delete"),
 ):
-    await controller.clean_predictions_controller(
-        target_date=target_date, days_back=days_back, db=db
+    response = await controller.clean_predictions_controller(
+        target_date=target_date, days_back=days_back, db=db, dry_run=dry_run
     )
-    return success_response()
+    return success_response(data=response)
 
 
 @router.delete("/top-predictions")
 async def clean_top_predictions_route(
     db: AsyncSession = Depends(get_db),
-    controller: CleanupDataController = Depends(get_cleanup_data_controller),
+    controller: CleanupDataController = Depends(provide(get_cleanup_data_controller)),
     target_date: date = Query(...),
     days_back: int = Query(30, ge=1),
+    dry_run: bool = Query(False, description="Only count the rows to delete"),
 ):
-    await controller.clean_top_predictions_controller(
-        target_date=target_date, days_back=days_back, db=db
+    response = await controller.clean_top_predictions_controller(
+        target_date=target_date, days_back=days_back, db=db, dry_run=dry_run
     )
-    return success_response()
+    return success_response(data=response)
@@ -4,6 +4,7 @@ from app.api.internal.routes import (
     cleanup_data_routes,
     job_config_routes,
     metadata_routes,
+    metrics_routes,
     process_data_routes,
 )
 from app.core.dependencies.api_key_auth import verify_role
@@ -17,3 +18,4 @@ router.include_router(metadata_routes.router)
 router.include_router(job_config_routes.router)
 router.include_router(process_data_routes.router)
 router.include_router(cleanup_data_routes.router)
+router.include_router(metrics_routes.router)
@@ -13,6 +13,7 @@ from app.core.common.utils.response_handlers import (
     BaseSuccessResponse,
     success_response,
 )
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
@@ -28,7 +29,7 @@ async def insert_stock_route(
     industry_code: IndustryCodeEnum,
     stock_name: str,
     stock_description: str | None = None,
-    controller: MetadataController = Depends(get_metadata_controller),
+    controller: MetadataController = Depends(provide(get_metadata_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.insert_stock_controller(
@@ -48,7 +49,7 @@ async def update_stock_route(
     stock_name: str | None = None,
     is_active: bool | None = None,
     stock_description: str | None = None,
-    controller: MetadataController = Depends(get_metadata_controller),
+    controller: MetadataController = Depends(provide(get_metadata_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.update_stock_controller(
@@ -67,7 +68,7 @@ async def update_stock_route(
 )
 async def get_model_metadata_route(
     stock_tickers: list[str] = Query(...),
-    controller: MetadataController = Depends(get_metadata_controller),
+    controller: MetadataController = Depends(provide(get_metadata_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response: list[ModelMetadataResponseSchema] = await controller.get_model_controller(
@@ -79,7 +80,7 @@ async def get_model_metadata_route(
 @router.post("/ml-model")
 async def insert_model_metadata_route(
     request: SaveModelMetadataRequestSchema,
-    controller: MetadataController = Depends(get_metadata_controller),
+    controller: MetadataController = Depends(provide(get_metadata_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.save_model_controller(
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from app.api.internal.controllers.metrics_controller import (
+    MetricsController,
+    get_metrics_controller,
+)
+from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.container import provide
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["[Internal] Metrics"],
+)
+
+
+@router.get("/http-clients")
+async def get_http_client_stats_route(
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    response = await controller.get_http_client_stats_controller()
+    return success_response(data=response)
+
+
+@router.get("/buffer")
+async def get_metrics_buffer_stats_route(
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    response = await controller.get_metrics_buffer_stats_controller()
+    return success_response(data=response)
+
+
+@router.get("/latency")
+async def get_latency_histogram_route(
+    reset: bool = Query(default=False),
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    """
+    Latency and status counts per route since start up or the last reset.
+    """
+    response = await controller.get_latency_histogram_controller(reset=reset)
+    return success_response(data=response)
+
+
+@router.get("/db-statements")
+async def get_statement_stats_route(
+    limit: int = Query(default=50),
+    reset: bool = Query(default=False),
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    """
+    Latency and row counts per SQL statement fingerprint, slowest total first.
+    """
+    response = await controller.get_statement_stats_controller(limit=limit, reset=reset)
+    return success_response(data=response)
+
+
+@router.get("/profiles")
+async def get_profiles_route(
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    """
+    Requests profiled on this instance, newest first. A request is profiled when
+    it is sent with an `X-Profile` header and the backend API key.
+    """
+    response = await controller.get_profiles_controller()
+    return success_response(data=response)
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile_route(
+    profile_id: str,
+    top_stacks: int = Query(default=30),
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    """
+    SQL statements, downstream client calls, timers and hottest stacks of one
+    profiled request.
+    """
+    profile = await controller.get_profile_controller(profile_id=profile_id)
+    return success_response(data=profile.to_dict(top_stacks=top_stacks))
+
+
+@router.get("/profiles/{profile_id}/collapsed", response_class=PlainTextResponse)
+async def get_profile_collapsed_route(
+    profile_id: str,
+    controller: MetricsController = Depends(provide(get_metrics_controller)),
+):
+    """
+    Stack samples of one profiled request in the collapsed format, to open in
+    speedscope or render with flamegraph.pl.
+    """
+    profile = await controller.get_profile_controller(profile_id=profile_id)
+    return PlainTextResponse(profile.collapsed())
@@ -9,6 +9,7 @@ from app.api.internal.controllers.process_data_controller import (
     get_process_data_controller,
 )
 from app.api.internal.schemas.process_data_schema import (
+    BackfillTradingDataRequestSchema,
     PullTradingDataRequestSchema,
     RankPredictionsRequestSchema,
 )
@@ -17,6 +18,7 @@ from app.core.common.utils.response_handlers import (
     success_response,
 )
 from app.core.dependencies.api_key_auth import verify_role
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 
 router = APIRouter(
@@ -29,7 +31,7 @@ router = APIRouter(
 @router.post("/rank-predictions/all")
 async def rank_predictions_all_route(
     target_date: date = Query(default=get_today_bangkok_date()),
-    controller: ProcessDataController = Depends(get_process_data_controller),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.rank_and_save_top_predictions_all_controller(
@@ -41,7 +43,7 @@ async def rank_predictions_all_route(
 @router.post("/rank-predictions")
 async def rank_predictions_route(
     request: RankPredictionsRequestSchema,
-    controller: ProcessDataController = Depends(get_process_data_controller),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.rank_and_save_top_predictions_controller(
@@ -53,18 +55,41 @@ async def rank_predictions_route(
 @router.post("/pull-trading-data")
 async def pull_trading_data_route(
     request: PullTradingDataRequestSchema,
-    controller: ProcessDataController = Depends(get_process_data_controller),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.pull_trading_data_controller(request=request, db=db)
     return success_response(data=response)
 
 
+@router.post("/backfill-trading-data")
+async def backfill_trading_data_route(
+    request: BackfillTradingDataRequestSchema,
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
+    db: AsyncSession = Depends(get_db),
+):
+    response = await controller.backfill_trading_data_controller(request=request, db=db)
+    return success_response(data=response)
+
+
+@router.post("/trading-data-windows/check")
+async def check_trading_data_windows_route(
+    stock_tickers: Optional[list[str]] = Query(default=None),
+    repair: bool = Query(default=False),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
+    db: AsyncSession = Depends(get_db),
+):
+    response = await controller.check_trading_data_windows_controller(
+        stock_tickers=stock_tickers, repair=repair, db=db
+    )
+    return success_response(data=response)
+
+
 @router.get("/evaluate-accuracy/all")
 async def accuracy_all_route(
     target_date: date = Query(default=get_today_bangkok_date()),
     days_back: int = Query(default=15),
-    controller: ProcessDataController = Depends(get_process_data_controller),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.accuracy_all_controller(
@@ -78,7 +103,7 @@ async def accuracy_route(
     stock_tickers: list[str] = Query(...),
     target_date: date = Query(default=get_today_bangkok_date()),
     days_back: int = Query(default=15),
-    controller: ProcessDataController = Depends(get_process_data_controller),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response = await controller.accuracy_controller(
@@ -91,7 +116,7 @@ async def accuracy_route(
 def market_open_date_route(
     target_date: date = Query(get_today_bangkok_date()),
     next_n_market_days: Optional[int] = Query(default=None),
-    controller: ProcessDataController = Depends(get_process_data_controller),
+    controller: ProcessDataController = Depends(provide(get_process_data_controller)),
 ):
     response: dict[str, bool | date] = controller.get_market_open_date_controller(
         target_date=target_date, next_n_market_days=next_n_market_days
@@ -1,6 +1,6 @@
 from datetime import date
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
@@ -9,8 +9,17 @@ class RankPredictionsRequestSchema(BaseModel):
     industries: list[IndustryCodeEnum]
     periods: list[int]
     target_dates: list[date]
+    set_based: bool = True
 
 
 class PullTradingDataRequestSchema(BaseModel):
     stock_tickers: list[str]
     target_dates: date
+
+
+class BackfillTradingDataRequestSchema(BaseModel):
+    stock_tickers: list[str]
+    start_date: date
+    end_date: date
+    chunk_days: int = Field(default=30, ge=1)
+    resume: bool = True
@@ -0,0 +1,322 @@
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from app.core.common.utils.trading_calendar import TradingCalendar
+
+logger = logging.getLogger(__name__)
+
+# key combinations grouped with a dense `bincount` instead of a sort
+MAX_DENSE_GROUPS = 1 << 22
+
+
+def to_ordinals(dates: Sequence[date]) -> np.ndarray:
+    # far cheaper than converting dates to datetime64 one by one
+    return np.fromiter(map(date.toordinal, dates), dtype=np.int64, count=len(dates))
+
+
+def group_codes(*keys: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Group rows by the combination of integer `keys`.
+
+    Returns the index of one row of every group, the group of every row and the
+    number of groups, in the sort order of the keys. Small non-negative keys,
+    like the ticker codes and periods here, are grouped with a `bincount` over
+    all key combinations instead of sorting the rows.
+    """
+    codes, dims = [], []
+    for key in keys:
+        if len(key) and key.min() >= 0 and key.max() < MAX_DENSE_GROUPS:
+            codes.append(key)
+            dims.append(int(key.max()) + 1)
+        else:
+            uniques, inverse = np.unique(key, return_inverse=True)
+            codes.append(inverse.reshape(-1))
+            dims.append(max(len(uniques), 1))
+
+    size = math.prod(dims)
+    if size > MAX_DENSE_GROUPS:
+        _, first_index, inverse = np.unique(
+            np.stack(codes, axis=1), axis=0, return_index=True, return_inverse=True
+        )
+        return first_index, inverse.reshape(-1), len(first_index)
+
+    combined = np.ravel_multi_index(codes, dims)
+    present = np.bincount(combined, minlength=size) > 0
+    group_of = np.cumsum(present) - 1
+    # every row of a group has the same keys, so any row can represent it
+    representative = np.zeros(size, dtype=np.int64)
+    representative[combined] = np.arange(len(combined))
+    return representative[present], group_of[combined], int(present.sum())
+
+
+@dataclass
+class EvaluationResult:
+    start_date: date
+    end_date: date
+    predictions: int = 0
+    scored: int = 0
+    # predictions without a realized close in trading data, usually not due yet
+    pending: int = 0
+    by_model_period: list[dict] = field(default_factory=list)
+    by_ticker_period: list[dict] = field(default_factory=list)
+    by_industry_period: list[dict] = field(default_factory=list)
+    by_model: list[dict] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "predictions": self.predictions,
+            "scored": self.scored,
+            "pending": self.pending,
+            "by_model_period": self.by_model_period,
+            "by_ticker_period": self.by_ticker_period,
+            "by_industry_period": self.by_industry_period,
+            "by_model": self.by_model,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+    def summary(self) -> str:
+        summary = (
+            f"Evaluated {self.scored} of {self.predictions} predictions made "
+            f"{self.start_date} to {self.end_date} ({self.pending} pending) "
+            f"in {self.elapsed_seconds:.1f}s"
+        )
+        for row in self.by_industry_period:
+            hit_rate = (
+                f"{row['hit_rate']:.0%}" if row["hit_rate"] is not None else "n/a"
+            )
+            summary += (
+                f"\n{row['industry_code']} period {row['period']}: "
+                f"MAPE {row['mape']:.2f}%, hit rate {hit_rate} (n={row['sample_count']})"
+            )
+        return summary
+
+
+class AccuracyEvaluator:
+    """
+    Scores predictions against the close `period + 1` market days after their
+    target date, the date the predicted price is shown for, without a Python loop
+    over rows.
+
+    Rows arrive already grouped by the database, with dates as ordinals and the
+    values of a group as arrays, so turning them into columns costs one array
+    conversion per group instead of Python work per prediction. `evaluate`
+    scatters the closes into one dense `(tickers, market days)` matrix indexed by
+    the trading calendar, so finding every realized close is a single
+    fancy-indexing lookup, and aggregates each grouping with `np.bincount`.
+
+    MAPE is in percent; the hit rate is the share of predictions that moved in
+    the same direction as the market from the close they were made on.
+    """
+
+    def __init__(self, calendar: TradingCalendar):
+        self.calendar = calendar
+        # tickers and industry codes are kept as integer codes into these lists
+        self.stock_tickers: list[str] = []
+        self.industry_codes: list[Optional[str]] = []
+        self._ticker_codes: dict[str, int] = {}
+        self._industry_codes: dict[Optional[str], int] = {}
+        self._predictions: list[tuple[np.ndarray, ...]] = []
+        self._closes: list[tuple[np.ndarray, ...]] = []
+
+    @staticmethod
+    def _encode(values: Sequence, codes: dict, names: list) -> list[int]:
+        for value in values:
+            if value not in codes:
+                codes[value] = len(names)
+                names.append(value)
+        return [codes[value] for value in values]
+
+    def add_predictions(self, rows: Sequence[Sequence]) -> None:
+        """
+        Add `(model_id, stock_ticker, industry_code, period, target_date ordinals,
+        predicted prices, closing prices)` rows, one per model and period with the
+        per-prediction values as parallel arrays.
+        """
+        if not rows:
+            return
+        model_ids, tickers, industries, periods, dates, predicted, closing = zip(*rows)
+        lengths = np.fromiter(map(len, dates), dtype=np.int64, count=len(rows))
+        self._predictions.append(
+            (
+                np.repeat(np.asarray(model_ids, dtype=np.int64), lengths),
+                np.repeat(
+                    self._encode(tickers, self._ticker_codes, self.stock_tickers),
+                    lengths,
+                ),
+                np.repeat(
+                    self._encode(industries, self._industry_codes, self.industry_codes),
+                    lengths,
+                ),
+                np.concatenate([np.asarray(d, dtype=np.int64) for d in dates]),
+                np.repeat(np.asarray(periods, dtype=np.int64), lengths),
+                np.concatenate([np.asarray(p, dtype=np.float64) for p in predicted]),
+                # a missing closing price becomes nan
+                np.concatenate([np.asarray(c, dtype=np.float64) for c in closing]),
+            )
+        )
+
+    def add_closes(self, rows: Sequence[Sequence]) -> None:
+        """Add `(stock_ticker, target_date ordinals, closes)` rows, one per ticker."""
+        if not rows:
+            return
+        tickers, dates, closes = zip(*rows)
+        lengths = np.fromiter(map(len, dates), dtype=np.int64, count=len(rows))
+        self._closes.append(
+            (
+                np.repeat(
+                    self._encode(tickers, self._ticker_codes, self.stock_tickers),
+                    lengths,
+                ),
+                np.concatenate([np.asarray(d, dtype=np.int64) for d in dates]),
+                np.concatenate([np.asarray(c, dtype=np.float64) for c in closes]),
+            )
+        )
+
+    def get_close_date_range(self) -> Optional[tuple[date, date]]:
+        """Dates of the closes `evaluate` needs, from the predictions added so far."""
+        if not self._predictions:
+            return None
+        first_day = min(int(chunk[3].min()) for chunk in self._predictions)
+        last_day = max(int(chunk[3].max()) for chunk in self._predictions)
+        max_period = max(int(chunk[4].max()) for chunk in self._predictions)
+        return (
+            # the open day a prediction on a closed day was made from
+            self.calendar.n_open_days_behind(date.fromordinal(first_day), 1),
+            self.calendar.n_open_days_ahead(date.fromordinal(last_day), max_period + 1),
+        )
+
+    def evaluate(self, start_date: date, end_date: date) -> EvaluationResult:
+        result = EvaluationResult(start_date=start_date, end_date=end_date)
+        if not self._predictions:
+            return result
+
+        model_ids, tickers, industries, days, periods, predicted, closing = (
+            np.concatenate(column) for column in zip(*self._predictions)
+        )
+        result.predictions = len(model_ids)
+
+        first_date, last_date = self.get_close_date_range()
+        open_days = to_ordinals(self.calendar.open_days(first_date, last_date))
+
+        # closes on open days only, one matrix cell per (ticker, market day)
+        matrix = np.full((len(self.stock_tickers), len(open_days)), np.nan)
+        if self._closes:
+            close_tickers, close_days, closes = (
+                np.concatenate(column) for column in zip(*self._closes)
+            )
+            positions = np.searchsorted(open_days, close_days)
+            on_open_day = positions < len(open_days)
+            on_open_day[on_open_day] = (
+                open_days[positions[on_open_day]] == close_days[on_open_day]
+            )
+            matrix[close_tickers[on_open_day], positions[on_open_day]] = closes[
+                on_open_day
+            ]
+
+        # the last open day up to the target date, as `n_open_days_ahead` counts
+        base_positions = np.searchsorted(open_days, days, side="right") - 1
+        # period p is realized p + 1 market days after the target date
+        actual = matrix[tickers, base_positions + periods + 1]
+        base = np.where(np.isnan(closing), matrix[tickers, base_positions], closing)
+
+        scored = ~np.isnan(actual) & (actual != 0)
+        result.scored = int(scored.sum())
+        result.pending = int(np.isnan(actual).sum())
+        if not result.scored:
+            return result
+
+        predicted, actual, base = predicted[scored], actual[scored], base[scored]
+        errors = predicted - actual
+        has_direction = ~np.isnan(base)
+        hits = has_direction & (np.sign(predicted - base) == np.sign(actual - base))
+        metrics = (errors, np.abs(errors) / np.abs(actual), has_direction, hits)
+
+        model_ids, tickers, industries, periods = (
+            model_ids[scored],
+            tickers[scored],
+            industries[scored],
+            periods[scored],
+        )
+        columns = {
+            "model_id": model_ids,
+            "stock_ticker": np.asarray(self.stock_tickers, dtype=object)[tickers],
+            "industry_code": np.asarray(self.industry_codes, dtype=object)[industries],
+            "period": periods,
+        }
+        result.by_model_period = self._aggregate(
+            (model_ids, periods),
+            columns,
+            ("model_id", "stock_ticker", "industry_code", "period"),
+            *metrics,
+        )
+        result.by_ticker_period = self._aggregate(
+            (tickers, periods),
+            columns,
+            ("stock_ticker", "industry_code", "period"),
+            *metrics,
+        )
+        result.by_industry_period = self._aggregate(
+            (industries, periods), columns, ("industry_code", "period"), *metrics
+        )
+        result.by_model = self._aggregate(
+            (model_ids,),
+            columns,
+            ("model_id", "stock_ticker", "industry_code"),
+            *metrics,
+        )
+        return result
+
+    @staticmethod
+    def _aggregate(
+        keys: tuple[np.ndarray, ...],
+        columns: dict[str, np.ndarray],
+        labels: Sequence[str],
+        errors: np.ndarray,
+        relative_errors: np.ndarray,
+        has_direction: np.ndarray,
+        hits: np.ndarray,
+    ) -> list[dict]:
+        first_index, groups, n_groups = group_codes(*keys)
+
+        def total(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(groups, weights=weights, minlength=n_groups)
+
+        counts = np.bincount(groups, minlength=n_groups)
+        mae = total(np.abs(errors)) / counts
+        mape = total(relative_errors) / counts * 100
+        rmse = np.sqrt(total(errors**2) / counts)
+        direction_counts = total(has_direction)
+        hit_rate = np.divide(
+            total(hits),
+            direction_counts,
+            out=np.full(n_groups, np.nan),
+            where=direction_counts > 0,
+        )
+
+        label_values = [columns[label][first_index].tolist() for label in labels]
+        return [
+            {
+                **dict(zip(labels, values)),
+                "sample_count": int(count),
+                "mae": float(group_mae),
+                "mape": float(group_mape),
+                "rmse": float(group_rmse),
+                "hit_rate": None if np.isnan(group_hit) else float(group_hit),
+            }
+            for values, count, group_mae, group_mape, group_rmse, group_hit in zip(
+                zip(*label_values),
+                counts.tolist(),
+                mae.tolist(),
+                mape.tolist(),
+                rmse.tolist(),
+                hit_rate.tolist(),
+            )
+        ]
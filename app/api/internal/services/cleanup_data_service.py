@@ -1,31 +1,92 @@
-from datetime import date
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.general.services.prediction_service import (
-    PredictionService,
-    get_prediction_service,
+from app.api.general.services.partition_service import (
+    PartitionService,
+    get_partition_service,
 )
-from app.api.general.services.top_prediction_service import (
-    TopPredictionService,
-    get_top_prediction_service,
-)
-from app.api.general.services.trading_data_service import (
-    TradingDataService,
-    get_trading_data_service,
+from app.api.internal.repositories.retention_repository import (
+    RetentionModel,
+    RetentionRepository,
 )
+from app.core.common.utils.validators import validate_required
+from app.core.dependencies.container import app_scoped
+from app.core.settings.config import get_config
+from app.models import Prediction, TopPrediction, TradingData
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionResult:
+    table: str
+    cutoff_date: date
+    dry_run: bool
+    rows: int = 0
+    batches: int = 0
+    # whole monthly partitions dropped instead of deleting their rows
+    partitions: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "table": self.table,
+            "cutoff_date": self.cutoff_date.isoformat(),
+            "dry_run": self.dry_run,
+            "rows": self.rows,
+            "batches": self.batches,
+            "partitions": self.partitions,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+    def summary(self) -> str:
+        verb = "would delete" if self.dry_run else "deleted"
+        summary = f"{self.table}: {verb} {self.rows} rows before {self.cutoff_date}"
+        if self.partitions:
+            summary += f" ({len(self.partitions)} partitions dropped)"
+        if not self.dry_run:
+            summary += (
+                f" in {self.batches} batches, {self.elapsed_seconds:.1f}s "
+                f"({self.rows_per_second:.0f} rows/s)"
+            )
+        return summary
 
 
 class CleanupDataService:
+    """
+    Deletes rows older than `target_date - days_back`.
+
+    Monthly partitions that are entirely before the cutoff are dropped whole. The
+    rest is deleted in keyset-ordered batches, each its own transaction of at most
+    `batch_size` rows followed by a `batch_sleep_seconds` pause, so the cleanup
+    never holds long locks or bloats the WAL while the API is serving. With
+    `dry_run` nothing is dropped or deleted, the rows are only counted.
+    """
+
     def __init__(
         self,
-        trading_data_service: TradingDataService,
-        prediction_service: PredictionService,
-        top_prediction_service: TopPredictionService,
+        retention_repository: RetentionRepository,
+        partition_service: PartitionService,
+        batch_size: int = 5000,
+        batch_sleep_seconds: float = 0.1,
     ):
-        self.trading_data_service = trading_data_service
-        self.prediction_service = prediction_service
-        self.top_prediction_service = top_prediction_service
+        self.retention_repository = retention_repository
+        self.partition_service = partition_service
+        self.batch_size = batch_size
+        self.batch_sleep_seconds = batch_sleep_seconds
 
     async def clean_data(
         self,
@@ -33,39 +94,157 @@ class CleanupDataService:
         target_date: date,
         trading_data_days_back: int,
         predictions_days_back: int,
-    ) -> None:
-        await self.clean_trading_data(
-            db=db, target_date=target_date, days_back=trading_data_days_back
-        )
-        await self.clean_predictions(
-            db=db, target_date=target_date, days_back=predictions_days_back
-        )
-        await self.clean_top_predictions(
-            db=db, target_date=target_date, days_back=predictions_days_back
-        )
+        dry_run: bool = False,
+    ) -> list[RetentionResult]:
+        # predictions go first, they reference top predictions
+        return [
+            await self.clean_predictions(
+                db=db,
+                target_date=target_date,
+                days_back=predictions_days_back,
+                dry_run=dry_run,
+            ),
+            await self.clean_top_predictions(
+                db=db,
+                target_date=target_date,
+                days_back=predictions_days_back,
+                dry_run=dry_run,
+            ),
+            await self.clean_trading_data(
+                db=db,
+                target_date=target_date,
+                days_back=trading_data_days_back,
+                dry_run=dry_run,
+            ),
+        ]
 
-    # TODO
     async def clean_trading_data(
-        self, db: AsyncSession, target_date: date, days_back: int
-    ) -> None:
-        pass
+        self,
+        db: AsyncSession,
+        target_date: date,
+        days_back: int,
+        dry_run: bool = False,
+    ) -> RetentionResult:
+        return await self._apply_retention(
+            db=db,
+            model=TradingData,
+            cutoff_date=self._get_cutoff_date(target_date, days_back),
+            delete_batch=self.retention_repository.delete_trading_data_by_ids,
+            dry_run=dry_run,
+            partitioned=True,
+        )
 
-    # TODO
     async def clean_predictions(
-        self, db: AsyncSession, target_date: date, days_back: int
-    ) -> None:
-        pass
+        self,
+        db: AsyncSession,
+        target_date: date,
+        days_back: int,
+        dry_run: bool = False,
+    ) -> RetentionResult:
+        return await self._apply_retention(
+            db=db,
+            model=Prediction,
+            cutoff_date=self._get_cutoff_date(target_date, days_back),
+            delete_batch=self.retention_repository.delete_predictions_by_ids,
+            dry_run=dry_run,
+            partitioned=True,
+        )
 
-    # TODO
     async def clean_top_predictions(
-        self, db: AsyncSession, target_date: date, days_back: int
-    ) -> None:
-        pass
+        self,
+        db: AsyncSession,
+        target_date: date,
+        days_back: int,
+        dry_run: bool = False,
+    ) -> RetentionResult:
+        return await self._apply_retention(
+            db=db,
+            model=TopPrediction,
+            cutoff_date=self._get_cutoff_date(target_date, days_back),
+            delete_batch=self.retention_repository.delete_top_predictions_by_ids,
+            dry_run=dry_run,
+        )
+
+    @staticmethod
+    def _get_cutoff_date(target_date: date, days_back: int) -> date:
+        validate_required(target_date, "target date")
+        validate_required(days_back, "days back")
+        return target_date - timedelta(days=days_back)
+
+    async def _apply_retention(
+        self,
+        db: AsyncSession,
+        model: RetentionModel,
+        cutoff_date: date,
+        delete_batch: Callable[[AsyncSession, list[int]], Awaitable[int]],
+        dry_run: bool,
+        partitioned: bool = False,
+    ) -> RetentionResult:
+        result = RetentionResult(
+            table=model.__tablename__, cutoff_date=cutoff_date, dry_run=dry_run
+        )
+        start = time.perf_counter()
+
+        result.partitions, result.rows = await self._drop_partitions(
+            db=db,
+            model=model,
+            cutoff_date=cutoff_date,
+            dry_run=dry_run,
+            partitioned=partitioned,
+        )
+        if dry_run:
+            # also counts the rows of the partitions that would be dropped
+            result.rows = await self.retention_repository.count_older_than(
+                db=db, model=model, cutoff_date=cutoff_date
+            )
+        else:
+            after_id = 0
+            while True:
+                ids = await self.retention_repository.fetch_ids_older_than(
+                    db=db,
+                    model=model,
+                    cutoff_date=cutoff_date,
+                    after_id=after_id,
+                    batch_size=self.batch_size,
+                )
+                if not ids:
+                    break
+
+                result.rows += await delete_batch(db, ids)
+                result.batches += 1
+                # rows skipped by the delete are not read again
+                after_id = ids[-1]
+
+                if len(ids) < self.batch_size:
+                    break
+                if self.batch_sleep_seconds > 0:
+                    await asyncio.sleep(self.batch_sleep_seconds)
+
+        result.elapsed_seconds = time.perf_counter() - start
+        logger.info(f"[CLEANUP] {result.summary()}")
+        return result
+
+    async def _drop_partitions(
+        self,
+        db: AsyncSession,
+        model: RetentionModel,
+        cutoff_date: date,
+        dry_run: bool,
+        partitioned: bool,
+    ) -> tuple[list[str], int]:
+        if not partitioned:
+            return [], 0
+        return await self.partition_service.drop_partitions_before(
+            db=db, model=model, cutoff_date=cutoff_date, dry_run=dry_run
+        )
 
 
+@app_scoped
 def get_cleanup_data_service() -> CleanupDataService:
+    config = get_config()
     return CleanupDataService(
-        trading_data_service=get_trading_data_service(),
-        prediction_service=get_prediction_service(),
-        top_prediction_service=get_top_prediction_service(),
+        retention_repository=RetentionRepository(),
+        partition_service=get_partition_service(),
+        batch_size=config.CLEANUP_BATCH_SIZE,
+        batch_sleep_seconds=config.CLEANUP_BATCH_SLEEP_SECONDS,
     )
@@ -0,0 +1,183 @@
+import asyncio
+import copy
+import json
+import logging
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "config:invalidate"
+INVALIDATE_ALL = "*"
+
+
+class JobConfigCache:
+    """
+    Two-tier cache for job configs.
+
+    Tier 1 is an in-process dict of already cast values that expire after
+    `local_ttl_seconds`. Tier 2 is Redis, holding the raw string values under
+    `config:{key}` for `redis_ttl_seconds`. Writes go through both tiers and are
+    published on `config:invalidate`, so other instances drop their local copy.
+    Every Redis error degrades to a miss, which the caller serves from Postgres.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        cast: Callable[[str, str], Any],
+        local_ttl_seconds: float = 30,
+        redis_ttl_seconds: int = 300,
+    ):
+        self.redis = redis_client
+        self.cast = cast
+        self.local_ttl_seconds = local_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.instance_id = uuid.uuid4().hex
+        self._local: dict[str, tuple[float, Any]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"config:{key}"
+
+    def _get_local(self, key: str) -> tuple[bool, Any]:
+        entry = self._local.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._local.pop(key, None)
+            return False, None
+        # list values are shared between callers
+        return True, copy.copy(value)
+
+    def _set_local(self, key: str, raw_value: str) -> Any:
+        value = self.cast(key, raw_value)
+        self._local[key] = (time.monotonic() + self.local_ttl_seconds, value)
+        return copy.copy(value)
+
+    async def get_many(self, keys: list[str]) -> tuple[dict[str, Any], list[str]]:
+        """Return the cached `{key: cast value}` and the keys that missed both tiers."""
+        found, remote_keys = {}, []
+        for key in keys:
+            hit, value = self._get_local(key)
+            if hit:
+                found[key] = value
+            else:
+                remote_keys.append(key)
+
+        if not remote_keys:
+            return found, []
+
+        try:
+            raw_values = await self.redis.mget(
+                [self._redis_key(key) for key in remote_keys]
+            )
+        except Exception as e:
+            logger.warning(f"Redis mget failed for configs {remote_keys}: {e}")
+            return found, remote_keys
+
+        missing = []
+        for key, raw_value in zip(remote_keys, raw_values):
+            if raw_value is None:
+                missing.append(key)
+            else:
+                found[key] = self._set_local(key, raw_value)
+        return found, missing
+
+    async def fill(self, raw_values: dict[str, str]) -> dict[str, Any]:
+        """Cache values read from the database and return them cast."""
+        if not raw_values:
+            return {}
+
+        cast_values = {
+            key: self._set_local(key, raw_value)
+            for key, raw_value in raw_values.items()
+        }
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, raw_value in raw_values.items():
+                    pipe.set(self._redis_key(key), raw_value, ex=self.redis_ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis set failed for configs {list(raw_values)}: {e}")
+        return cast_values
+
+    async def write_through(self, key: str, raw_value: str) -> None:
+        """Store a value that was just written, and tell the other instances."""
+        await self.fill({key: raw_value})
+        await self._publish([key])
+
+    async def invalidate(self, keys: list[str]) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+        try:
+            await self.redis.delete(*(self._redis_key(key) for key in keys))
+        except Exception as e:
+            logger.warning(f"Redis delete failed for configs {keys}: {e}")
+        await self._publish(keys)
+
+    async def invalidate_all(self) -> int:
+        self._local.clear()
+        deleted = 0
+        try:
+            keys = [key async for key in self.redis.scan_iter(match="config:*")]
+            if keys:
+                deleted = await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis delete failed for all configs: {e}")
+        await self._publish([INVALIDATE_ALL])
+        return deleted
+
+    async def _publish(self, keys: list[str]) -> None:
+        message = json.dumps({"instance_id": self.instance_id, "keys": keys})
+        try:
+            await self.redis.publish(INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish config invalidation for {keys}: {e}")
+
+    def handle_invalidation(self, message: str) -> None:
+        payload = json.loads(message)
+        if payload.get("instance_id") == self.instance_id:
+            return
+
+        keys = payload.get("keys", [])
+        if INVALIDATE_ALL in keys:
+            self._local.clear()
+            return
+        for key in keys:
+            self._local.pop(key, None)
+
+    async def start_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self, retry_seconds: float = 5) -> None:
+        while True:
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                try:
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.handle_invalidation(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # without the channel, local copies only live for the local TTL
+                logger.warning(f"Config invalidation listener failed: {e}")
+                self._local.clear()
+                await asyncio.sleep(retry_seconds)
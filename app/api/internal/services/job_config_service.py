@@ -1,20 +1,22 @@
 import logging
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.internal.repositories.job_config_repository import JobConfigRepository
+from app.api.internal.services.job_config_cache import JobConfigCache
 from app.core.clients.discord_client import DiscordOperations, get_discord_operations
-
-# from app.core.clients.redis_client import redis_client
 from app.core.common.utils.validators import (
     validate_entity_exists,
     validate_exact_length,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.job_enum import JobConfigEnum
 
 REDIS_TTL_SECONDS = 60 * 5
+LOCAL_TTL_SECONDS = 30
 
 logger = logging.getLogger(__name__)
 
@@ -26,87 +28,90 @@ class JobConfigService:
         self,
         job_config_repository: JobConfigRepository,
         discord: DiscordOperations,
-        # redis_client_instance=redis_client,
+        cache: JobConfigCache,
     ):
         self.job_config_repository = job_config_repository
         self.discord = discord
-        # self.redis_client = redis_client_instance
+        self.cache = cache
 
     async def get_job_config(
         self, db: AsyncSession, key: JobConfigEnum
     ) -> str | int | bool | list[int] | datetime:
         validate_required(key, "key")
-        # cache_key = f"config:{key}"
-        # cached = await self.redis_client.get(cache_key)
-        #
-        # if cached is not None:
-        #     logger.debug(f"Cache hit for key {key}")
-        #     return self._smart_cast(key=key, value=cached)
+        key = JobConfigEnum(key)
+
+        cached, _ = await self.cache.get_many([key.value])
+        if key.value in cached:
+            logger.debug(f"Cache hit for key {key}")
+            return cached[key.value]
 
         config = await self.job_config_repository.fetch_by_key(db=db, key=key)
         validate_entity_exists(config, "config")
-        return self._smart_cast(key=config.key, value=config.value)
+        values = await self.cache.fill({config.key: config.value})
+        return values[config.key]
 
     async def get_job_configs(
         self, db: AsyncSession, keys: list[JobConfigEnum]
     ) -> dict[JobConfigEnum, str | int | bool | list[int] | datetime]:
         validate_required(keys, "keys")
+        keys = [JobConfigEnum(key) for key in keys]
 
-        if len(keys) == 1:
-            config = await self.job_config_repository.fetch_by_key(db=db, key=keys[0])
-            configs_dict = (
-                [
-                    {
-                        JobConfigEnum(config.key): self._smart_cast(
-                            key=config.key, value=config.value
-                        )
-                    }
-                ]
-                if config
-                else []
+        cached, missing = await self.cache.get_many([key.value for key in keys])
+        if missing:
+            configs = await self.job_config_repository.fetch_by_keys(
+                db=db, keys=missing
+            )
+            cached.update(
+                await self.cache.fill({config.key: config.value for config in configs})
             )
-        else:
-            configs = await self.job_config_repository.fetch_by_keys(db=db, keys=keys)
-            configs_dict = {
-                JobConfigEnum(config.key): self._smart_cast(
-                    key=config.key, value=config.value
-                )
-                for config in configs
-            }
 
+        configs_dict = {JobConfigEnum(key): value for key, value in cached.items()}
         validate_entity_exists(configs_dict, "configs_dict")
-        validate_exact_length(configs_dict, len(keys), "configs_dict")
+        validate_exact_length(configs_dict, len(set(keys)), "configs_dict")
         return configs_dict
 
     async def set_job_config(
-        self, db: AsyncSession, key: JobConfigEnum, value: str
+        self, db: AsyncSession, key: JobConfigEnum, value: str, notify: bool = True
     ) -> str | int | bool | list[int] | datetime:
         validate_required(key, "key")
         validate_required(value, "value")
+        key = JobConfigEnum(key)
         result = await self.job_config_repository.upsert(db, key, value)
         validate_entity_exists(result, "result")
+        await self.cache.write_through(key=result.key, raw_value=result.value)
 
-        await self.discord.send_discord_message(
-            message=f"🔧 Job config `{key}` updated to `{value}`",
-            job_name="Config Update",
-            # mention_everyone=True,
-        )
+        if notify:
+            await self.discord.send_discord_message(
+                message=f"🔧 Job config `{key}` updated to `{value}`",
+                job_name="Config Update",
+                # mention_everyone=True,
+            )
 
-        # await self.invalidate_job_config_cache(key)
         return result.value
 
-    # async def invalidate_job_config_cache(self, key: JobConfigEnum):
-    #     await self.redis_client.delete(f"config:{key}")
-    #     pass
-    #
-    # async def invalidate_all_job_config_caches(self):
-    #     keys = [key async for key in redis_client.scan_iter(match="config:*")]
-    #     if keys:
-    #         await self.redis_client.delete(*keys)
-    #         logger.info(f"✅ Invalidated {len(keys)} config cache keys.")
-    #     else:
-    #         logger.info("ℹ️ No config cache keys found to invalidate.")
-    #     pass
+    async def acquire_lease(
+        self, db: AsyncSession, key: JobConfigEnum, owner: str, ttl_seconds: int
+    ) -> bool:
+        """Take or renew a lease; leases bypass the cache, they are never read."""
+        validate_required(owner, "owner")
+        return await self.job_config_repository.try_acquire_lease(
+            db=db, key=JobConfigEnum(key), owner=owner, ttl_seconds=ttl_seconds
+        )
+
+    async def release_lease(
+        self, db: AsyncSession, key: JobConfigEnum, owner: str
+    ) -> None:
+        await self.job_config_repository.release_lease(
+            db=db, key=JobConfigEnum(key), owner=owner
+        )
+
+    async def invalidate_job_config_cache(self, key: JobConfigEnum):
+        validate_required(key, "key")
+        await self.cache.invalidate([JobConfigEnum(key).value])
+
+    async def invalidate_all_job_config_caches(self):
+        deleted = await self.cache.invalidate_all()
+        logger.info(f"✅ Invalidated {deleted} config cache keys.")
 
     @staticmethod
     def _smart_cast(key: str, value: str) -> str | int | bool | list[int] | datetime:
@@ -122,7 +127,28 @@ class JobConfigService:
         return value
 
 
+_job_config_cache: Optional[JobConfigCache] = None
+
+
+def get_job_config_cache() -> JobConfigCache:
+    global _job_config_cache
+    if _job_config_cache is None:
+        # redis_client reads the config when it is imported
+        from app.core.clients.redis_client import redis_client
+
+        _job_config_cache = JobConfigCache(
+            redis_client=redis_client,
+            cast=JobConfigService._smart_cast,
+            local_ttl_seconds=LOCAL_TTL_SECONDS,
+            redis_ttl_seconds=REDIS_TTL_SECONDS,
+        )
+    return _job_config_cache
+
+
+@app_scoped
 def get_job_config_service() -> JobConfigService:
     return JobConfigService(
-        job_config_repository=JobConfigRepository(), discord=get_discord_operations()
+        job_config_repository=JobConfigRepository(),
+        discord=get_discord_operations(),
+        cache=get_job_config_cache(),
     )
@@ -14,11 +14,17 @@ from app.api.internal.repositories.metadata_repository import (
 from app.api.internal.schemas.metadata_schema import (
     ModelMetadataResponseSchema,
 )
+from app.api.public.services.info_service import InfoService
+from app.core.common.utils.read_through_cache import (
+    ReadThroughCache,
+    get_read_through_cache,
+)
 from app.core.common.utils.validators import (
     normalize_stock_ticker,
     validate_entity_exists,
     validate_required,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.core.enums.trading_data_enum import TradingDataEnum
 from app.models import Stock, StockModel
@@ -32,10 +38,12 @@ class MetadataService:
         metadata_repository: MetadataRepository,
         stock_model_service: StockModelService,
         stock_service: StockService,
+        cache: ReadThroughCache,
     ):
         self.metadata_repo = metadata_repository
         self.stock_model_service = stock_model_service
         self.stock_service = stock_service
+        self.cache = cache
 
     async def insert_stock(
         self,
@@ -57,6 +65,7 @@ class MetadataService:
                 logger.error(f"Failed to create stock: {stock_ticker}")
                 return None
 
+            await self.cache.invalidate(InfoService.INFO_CACHE_KEY)
             return stock
         except Exception as e:
             logger.error(f"Failed to insert stock: {e}")
@@ -87,6 +96,7 @@ class MetadataService:
                 logger.error(f"Failed to update stock: {stock_ticker}")
                 return None
 
+            await self.cache.invalidate(InfoService.INFO_CACHE_KEY)
         except Exception as e:
             logger.error(f"Failed to update stock: {e}")
             raise e
@@ -156,9 +166,11 @@ class MetadataService:
         return model
 
 
+@app_scoped
 def get_metadata_service() -> MetadataService:
     return MetadataService(
         metadata_repository=MetadataRepository(),
         stock_model_service=get_stock_model_service(),
         stock_service=get_stock_service(),
+        cache=get_read_through_cache(),
     )
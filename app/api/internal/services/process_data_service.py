@@ -1,7 +1,9 @@
+import hashlib
 import logging
+import time
 from datetime import date, timedelta
+from typing import Optional
 
-import yfinance as yf
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.general.services.prediction_service import (
@@ -17,25 +19,49 @@ from app.api.general.services.trading_data_service import (
     TradingDataService,
     get_trading_data_service,
 )
+from app.api.internal.repositories.evaluation_repository import (
+    EvaluationRepository,
+)
 from app.api.internal.repositories.process_data_repository import (
     ProcessDataRepository,
 )
+from app.api.internal.services.accuracy_evaluator import (
+    AccuracyEvaluator,
+    EvaluationResult,
+)
 from app.api.internal.services.job_config_service import (
     JobConfigService,
     get_job_config_service,
 )
-from app.core.common.exceptions.custom_exceptions import DBError
+from app.core.clients.market_data_client import (
+    MarketDataClient,
+    get_market_data_client,
+)
+from app.core.common.exceptions.custom_exceptions import (
+    DBError,
+    ResourceNotFoundError,
+)
 from app.core.common.utils.datetime_utils import (
     get_last_market_open_date,
+    get_market_open_dates,
     get_n_market_days_ahead,
     get_next_market_open_date,
+    get_now_bangkok_datetime,
     is_market_closed,
 )
-from app.core.common.utils.validators import validate_required
+from app.core.common.utils.trading_calendar import get_trading_calendar
+from app.core.common.utils.validators import (
+    normalize_stock_tickers,
+    validate_required,
+)
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.core.enums.job_enum import JobConfigEnum
 from app.models import Prediction
 
+# never matches a run key, so the next backfill starts from its start date
+BACKFILL_CHECKPOINT_CLEARED = "none"
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,18 +69,22 @@ class ProcessDataService:
     def __init__(
         self,
         process_data_repository: ProcessDataRepository,
+        evaluation_repository: EvaluationRepository,
         stock_service: StockService,
         prediction_service: PredictionService,
         top_prediction_service: TopPredictionService,
         trading_data_service: TradingDataService,
         job_config_service: JobConfigService,
+        market_data_client: MarketDataClient,
     ):
         self.process_data_repository = process_data_repository
+        self.evaluation_repository = evaluation_repository
         self.stock_service = stock_service
         self.prediction_service = prediction_service
         self.top_prediction_service = top_prediction_service
         self.trading_data_service = trading_data_service
         self.job_config_service = job_config_service
+        self.market_data_client = market_data_client
 
     async def rank_and_save_top_predictions_all(
         self,
@@ -83,9 +113,18 @@ class ProcessDataService:
         periods: list[int],
         target_dates: list[date],
         db: AsyncSession,
+        set_based: bool = True,
     ) -> dict[str, list[any]]:
         validate_required(target_dates, "target date")
 
+        if set_based:
+            return await self._rank_and_save_top_predictions_set_based(
+                industry_codes=industry_codes,
+                periods=periods,
+                target_dates=target_dates,
+                db=db,
+            )
+
         results = {
             "succeeded": [],
             "failed": [],
@@ -110,6 +149,50 @@ class ProcessDataService:
 
         return results
 
+    async def _rank_and_save_top_predictions_set_based(
+        self,
+        industry_codes: list[IndustryCodeEnum],
+        periods: list[int],
+        target_dates: list[date],
+        db: AsyncSession,
+    ) -> dict[str, list[any]]:
+        groups = [
+            (IndustryCodeEnum(i).value, p, d)
+            for i in industry_codes
+            for p in periods
+            for d in target_dates
+        ]
+        results = {
+            "succeeded": [],
+            "failed": [],
+        }
+
+        try:
+            ranked_rows = (
+                await self.process_data_repository.rank_and_save_top_predictions(
+                    db=db,
+                    industry_codes=[i for i, _, _ in groups],
+                    periods=periods,
+                    target_dates=target_dates,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Set-based ranking failed: {e}")
+            results["failed"] = [(i, p, str(d), str(e)) for i, p, d in groups]
+            return results
+
+        ranked_groups = {
+            (r.industry_code, r.period, r.target_date) for r in ranked_rows
+        }
+        for i, p, d in groups:
+            if (i, p, d) in ranked_groups:
+                results["succeeded"].append((i, p, str(d)))
+            else:
+                logger.error(f"Ranking failed for {i}, period={p}, date={d}")
+                results["failed"].append((i, p, str(d), "No predictions to rank"))
+
+        return results
+
     async def rank_and_save_top_prediction_one(
         self,
         industry_code: IndustryCodeEnum,
@@ -167,42 +250,23 @@ class ProcessDataService:
         validate_required(stock_tickers, "stock tickers")
         validate_required(target_date, "target date")
 
-        trading_data_list = []
-        failed_tickers = []
-        for stock_ticker in stock_tickers:
-            try:
-                ticker = stock_ticker + str(".BK")
-                data = yf.download(
-                    ticker,
-                    start=target_date,
-                    end=target_date + timedelta(days=1),
-                    auto_adjust=True,
-                )
-                data.columns = data.columns.droplevel(1)
-                if not data.empty and len(data) >= 1:
-                    row = data.iloc[0]
-                    trading_data_list.append(
-                        {
-                            "stock_ticker": stock_ticker,
-                            "target_date": target_date,
-                            "close": float(row["Close"]),
-                            "open": float(row["Open"]),
-                            "high": float(row["High"]),
-                            "low": float(row["Low"]),
-                            "volumes": int(row["Volume"]),
-                        }
-                    )
-            except Exception as e:
-                logger.error(f"Failed to fetch data for {stock_ticker}: {e}")
-                failed_tickers.append(stock_ticker)
-                continue
+        result = await self.market_data_client.fetch(
+            stock_tickers=stock_tickers,
+            start_date=target_date,
+            end_date=target_date + timedelta(days=1),
+        )
+        trading_data_list = [
+            row for row in result.rows if row["target_date"] == target_date
+        ]
+        failed_tickers = result.failed_tickers
 
         if not trading_data_list:
             logger.warning("No trading data to save.")
             return failed_tickers
 
         try:
-            await self.trading_data_service.create_multiple(
+            # upsert so a resumed nightly pipeline can pull the same day again
+            await self.trading_data_service.upsert_multiple(
                 db=db,
                 trading_data_dict_list=trading_data_list,
             )
@@ -211,63 +275,260 @@ class ProcessDataService:
             logger.error(f"Failed to pull trading data: {e}")
             raise DBError("Failed to pull trading data") from e
 
+    async def backfill_trading_data(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        start_date: date,
+        end_date: date,
+        chunk_days: int = 30,
+        resume: bool = True,
+    ) -> dict[str, any]:
+        validate_required(stock_tickers, "stock tickers")
+        validate_required(start_date, "start date")
+        validate_required(end_date, "end date")
+        if start_date > end_date:
+            raise ValueError("Start date must not be after end date")
+        if chunk_days < 1:
+            raise ValueError("Chunk days must be at least 1")
+
+        stock_tickers = sorted(set(normalize_stock_tickers(stock_tickers)))
+        run_key = self._get_backfill_run_key(stock_tickers, start_date, end_date)
+
+        resumed_from = None
+        if resume:
+            last_completed = await self._get_backfill_checkpoint(db, run_key)
+            if last_completed:
+                resumed_from = last_completed + timedelta(days=1)
+
+        results = {
+            "upserted": 0,
+            "skipped_chunks": 0,
+            "chunks": 0,
+            "failed_tickers": set(),
+            "resumed_from": resumed_from,
+        }
+
+        chunk_start = resumed_from or start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            results["chunks"] += 1
+
+            upserted, failed_tickers = await self._backfill_trading_data_chunk(
+                db=db,
+                stock_tickers=stock_tickers,
+                start_date=chunk_start,
+                end_date=chunk_end,
+            )
+            if upserted is None:
+                results["skipped_chunks"] += 1
+            else:
+                results["upserted"] += upserted
+            results["failed_tickers"].update(failed_tickers)
+
+            # only checkpoint chunks without failures so far, so a resume retries
+            # every ticker that failed
+            if not results["failed_tickers"]:
+                await self._set_backfill_checkpoint(
+                    db, f"{run_key}:{chunk_end.isoformat()}"
+                )
+            chunk_start = chunk_end + timedelta(days=1)
+
+        if not results["failed_tickers"]:
+            # a completed run starts from scratch when it is run again
+            await self._set_backfill_checkpoint(db, BACKFILL_CHECKPOINT_CLEARED)
+
+        results["failed_tickers"] = sorted(results["failed_tickers"])
+        logger.info(
+            f"Backfilled trading data from {start_date} to {end_date}: "
+            f"{results['upserted']} rows upserted in {results['chunks']} chunks "
+            f"({results['skipped_chunks']} skipped)"
+        )
+        return results
+
+    async def _backfill_trading_data_chunk(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> tuple[int | None, list[str]]:
+        existing_keys = await self.trading_data_service.get_existing_keys_by_stock_tickers_and_date_range(
+            db=db,
+            stock_tickers=stock_tickers,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        open_dates = get_market_open_dates(start_date, end_date)
+        missing_tickers = [
+            stock_ticker
+            for stock_ticker in stock_tickers
+            if any((stock_ticker, d) not in existing_keys for d in open_dates)
+        ]
+        if not missing_tickers:
+            return None, []
+
+        result = await self.market_data_client.fetch(
+            stock_tickers=missing_tickers,
+            start_date=start_date,
+            end_date=end_date + timedelta(days=1),
+        )
+        trading_data_list = [
+            row
+            for row in result.rows
+            if (row["stock_ticker"], row["target_date"]) not in existing_keys
+        ]
+        if not trading_data_list:
+            return 0, result.failed_tickers
+
+        try:
+            upserted = await self.trading_data_service.upsert_multiple(
+                db=db, trading_data_dict_list=trading_data_list
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to backfill trading data from {start_date} to {end_date}: {e}"
+            )
+            raise DBError("Failed to backfill trading data") from e
+
+        return upserted, result.failed_tickers
+
+    async def _get_backfill_checkpoint(
+        self, db: AsyncSession, run_key: str
+    ) -> date | None:
+        try:
+            checkpoint = await self.job_config_service.get_job_config(
+                db=db, key=JobConfigEnum.BACKFILL_TRADING_DATA_CHECKPOINT
+            )
+        except ResourceNotFoundError:
+            return None
+
+        checkpoint_run_key, _, last_completed = str(checkpoint).partition(":")
+        if checkpoint_run_key != run_key or not last_completed:
+            return None
+        return date.fromisoformat(last_completed)
+
+    async def _set_backfill_checkpoint(self, db: AsyncSession, value: str) -> None:
+        await self.job_config_service.set_job_config(
+            db=db,
+            key=JobConfigEnum.BACKFILL_TRADING_DATA_CHECKPOINT,
+            value=value,
+            notify=False,
+        )
+
+    @staticmethod
+    def _get_backfill_run_key(
+        stock_tickers: list[str], start_date: date, end_date: date
+    ) -> str:
+        raw_key = f"{','.join(stock_tickers)}|{start_date}|{end_date}"
+        return hashlib.sha1(raw_key.encode()).hexdigest()[:12]
+
+    async def check_trading_data_windows(
+        self,
+        db: AsyncSession,
+        stock_tickers: Optional[list[str]] = None,
+        repair: bool = False,
+    ) -> dict[str, any]:
+        """Compare the rolling windows with trading data, for all stocks by default."""
+        if not stock_tickers:
+            stock_tickers = [
+                stock.ticker for stock in await self.stock_service.get_all(db=db)
+            ]
+        return await self.trading_data_service.trading_data_window_service.check_consistency(
+            db=db, stock_tickers=stock_tickers, repair=repair
+        )
+
     async def accuracy_all(
         self,
         db: AsyncSession,
         target_date: date,
         days_back: int,
-    ):
+    ) -> EvaluationResult:
         try:
             all_stocks = await self.stock_service.get_active(db=db)
             stock_tickers = [stock.ticker for stock in all_stocks]
-            await self.accuracy(
+            return await self.accuracy(
                 stock_tickers=stock_tickers,
                 target_date=target_date,
                 days_back=days_back,
                 db=db,
             )
-            return
         except Exception as e:
             logger.error(f"Error in accuracy_all: {e}")
             raise e
 
-    # TODO: find closing prices n days back -> average -> compare with the prediction
-    # ** compare with what day?
     async def accuracy(
         self,
         db: AsyncSession,
         stock_tickers: list[str],
         target_date: date,
         days_back: int,
-    ):
-        # actual closing prices
-        # all_closing_prices = await self.closing_price_service.get_closing_price_value_by_stock_tickers_and_date_range(
-        #     db=db,
-        #     stock_tickers=stock_tickers,
-        #     target_date=target_date,
-        #     days_back=days_back,
-        # )
-        # avg_closing_prices = [
-        #     {
-        #         "stock_ticker": stock_ticker,
-        #         "avg_closing_price": sum(float(p) for p in closing_prices)
-        #         / len(closing_prices),
-        #     }
-        #     for stock_ticker, closing_prices in all_closing_prices.items()
-        # ]
-        #
-        # # predicted closing prices
-        # all_predictions = (
-        #     await self.prediction_service.get_by_date_and_period_and_stock_tickers(
-        #         db=db, stock_tickers=stock_tickers, target_date=target_date, period=1
-        #     )
-        # )
-        # response = await self.discord.send_discord_message(
-        #     message="Accuracy Evaluation started",
-        #     job_name="Accuracy Evaluation",
-        # )
-        # return response
-        pass
+    ) -> EvaluationResult:
+        """
+        Evaluate the predictions made in the last `days_back` market days up to
+        `target_date` against their realized closes, save the metrics per model
+        and period, and set each model's accuracy to its directional hit rate.
+        Predictions whose realized close is not in trading data yet are skipped.
+        """
+        validate_required(stock_tickers, "stock tickers")
+        validate_required(target_date, "target date")
+        validate_required(days_back, "days back")
+        stock_tickers = normalize_stock_tickers(stock_tickers)
+
+        start = time.perf_counter()
+        calendar = get_trading_calendar()
+        start_date = calendar.n_open_days_behind(target_date, days_back)
+        evaluator = AccuracyEvaluator(calendar=calendar)
+
+        try:
+            async for partition in self.evaluation_repository.stream_predictions(
+                db=db,
+                stock_tickers=stock_tickers,
+                start_date=start_date,
+                end_date=target_date,
+            ):
+                evaluator.add_predictions(partition)
+
+            close_date_range = evaluator.get_close_date_range()
+            if close_date_range:
+                async for partition in self.evaluation_repository.stream_closes(
+                    db=db,
+                    stock_tickers=stock_tickers,
+                    start_date=close_date_range[0],
+                    end_date=close_date_range[1],
+                ):
+                    evaluator.add_closes(partition)
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch predictions to evaluate from {start_date} "
+                f"to {target_date}: {e}"
+            )
+            raise DBError("Failed to fetch predictions to evaluate") from e
+
+        result = evaluator.evaluate(start_date=start_date, end_date=target_date)
+        if result.by_model_period:
+            evaluated_at = get_now_bangkok_datetime()
+            await self.evaluation_repository.save_evaluations(
+                db=db,
+                evaluations=[
+                    {
+                        **row,
+                        "start_date": start_date,
+                        "end_date": target_date,
+                        "evaluated_at": evaluated_at,
+                    }
+                    for row in result.by_model_period
+                ],
+                model_accuracies=[
+                    {"id": row["model_id"], "accuracy": row["hit_rate"]}
+                    for row in result.by_model
+                    if row["hit_rate"] is not None
+                ],
+            )
+
+        result.elapsed_seconds = time.perf_counter() - start
+        logger.info(result.summary())
+        return result
 
     @staticmethod
     def get_market_open_date(
@@ -293,12 +554,15 @@ class ProcessDataService:
         return response
 
 
+@app_scoped
 def get_process_data_service() -> ProcessDataService:
     return ProcessDataService(
         process_data_repository=ProcessDataRepository(),
+        evaluation_repository=EvaluationRepository(),
         stock_service=get_stock_service(),
         prediction_service=get_prediction_service(),
         top_prediction_service=get_top_prediction_service(),
         trading_data_service=get_trading_data_service(),
         job_config_service=get_job_config_service(),
+        market_data_client=get_market_data_client(),
     )
@@ -13,6 +13,7 @@ from app.api.ml_ops.services.inference_service import (
     InferenceService,
     get_inference_service,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
 
@@ -31,6 +32,7 @@ class InferenceController:
             days_back=request.days_back,
             days_forward=request.days_forward,
             periods=request.periods,
+            incremental=request.incremental,
             db=db,
         )
         return response
@@ -46,6 +48,7 @@ class InferenceController:
             days_back=request.days_back,
             days_forward=request.days_forward,
             periods=request.periods,
+            incremental=request.incremental,
             db=db,
         )
         return response
@@ -113,5 +116,6 @@ class InferenceController:
         return response
 
 
+@app_scoped
 def get_inference_controller() -> InferenceController:
     return InferenceController(service=get_inference_service())
@@ -18,6 +18,7 @@ from app.core.common.utils.response_handlers import (
     BaseSuccessResponse,
     success_response,
 )
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
@@ -30,7 +31,7 @@ router = APIRouter(
 @router.post("/trigger-infer-and-save/industry")
 async def trigger_infer_and_save_industry_route(
     request: TriggerAllInferenceRequestSchema,
-    controller: InferenceController = Depends(get_inference_controller),
+    controller: InferenceController = Depends(provide(get_inference_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.infer_and_save_industry_controller(request=request, db=db)
@@ -40,7 +41,7 @@ async def trigger_infer_and_save_industry_route(
 @router.post("/trigger-infer-and-save/stocks")
 async def trigger_infer_and_save_route(
     request: TriggerInferenceRequestSchema,
-    controller: InferenceController = Depends(get_inference_controller),
+    controller: InferenceController = Depends(provide(get_inference_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.infer_and_save(request=request, db=db)
@@ -53,7 +54,7 @@ async def trigger_infer_and_save_route(
 )
 async def trigger_infer_only_industry_route(
     request: TriggerAllInferenceRequestSchema,
-    controller: InferenceController = Depends(get_inference_controller),
+    controller: InferenceController = Depends(provide(get_inference_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response: InferenceResultSummarySchema = (
@@ -68,7 +69,7 @@ async def trigger_infer_only_industry_route(
 )
 async def trigger_infer_only_route(
     request: TriggerInferenceRequestSchema,
-    controller: InferenceController = Depends(get_inference_controller),
+    controller: InferenceController = Depends(provide(get_inference_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response: InferenceResultSummarySchema = await controller.infer_only_controller(
@@ -85,7 +86,7 @@ async def get_inference_data_industry_route(
     industry: IndustryCodeEnum = Query(...),
     target_date: date = Query(default=get_today_bangkok_date()),
     days_back: int = Query(default=60, ge=1),
-    controller: InferenceController = Depends(get_inference_controller),
+    controller: InferenceController = Depends(provide(get_inference_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response: list[StockToPredictRequestSchema] = (
@@ -107,7 +108,7 @@ async def get_inference_data_route(
     stock_tickers: list[str] = Query(...),
     target_date: date = Query(...),
     days_back: int = Query(default=60, ge=1),
-    controller: InferenceController = Depends(get_inference_controller),
+    controller: InferenceController = Depends(provide(get_inference_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     response: list[StockToPredictRequestSchema] = (
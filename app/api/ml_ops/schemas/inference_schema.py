@@ -12,6 +12,8 @@ class TriggerAllInferenceRequestSchema(BaseModel):
     days_back: int = 60
     days_forward: int = 15
     periods: list[int] = [1, 5, 10, 15]
+    # only infer and save predictions that do not exist yet
+    incremental: bool = False
 
 
 class TriggerInferenceRequestSchema(BaseModel):
@@ -20,6 +22,8 @@ class TriggerInferenceRequestSchema(BaseModel):
     days_back: int = 60
     days_forward: int = 15
     periods: list[int] = [1, 5, 10, 15]
+    # only infer and save predictions that do not exist yet
+    incremental: bool = False
 
 
 class StockToPredictRequestSchema(BaseModel):
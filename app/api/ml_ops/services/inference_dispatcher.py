@@ -0,0 +1,136 @@
+import asyncio
+import logging
+
+from app.api.ml_ops.schemas.inference_schema import (
+    InferenceResultSchema,
+    InferenceResultSummarySchema,
+    StockToPredictRequestSchema,
+)
+from app.core.clients.ml_server_operations import (
+    MLServerOperations,
+    get_ml_server_operations,
+)
+from app.core.dependencies.container import app_scoped
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceDispatcher:
+    """
+    Fans `/predict` requests out to the ML server in chunks of `chunk_size` stocks,
+    at most `max_concurrency` at a time.
+
+    Chunks whose request fails are retried as a whole with exponential backoff, up
+    to `max_retries` times. Stocks of chunks that never succeed, and stocks missing
+    from a chunk's response, come back as failed results, so one bad chunk no
+    longer fails the rest.
+    """
+
+    def __init__(
+        self,
+        ml_operations: MLServerOperations,
+        chunk_size: int = 20,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        retry_backoff_seconds: float = 1.0,
+    ):
+        self.ml = ml_operations
+        self.chunk_size = max(chunk_size, 1)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.max_retries = max(max_retries, 0)
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+    async def dispatch(
+        self, inference_data: list[StockToPredictRequestSchema], days_ahead: int
+    ) -> InferenceResultSummarySchema:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = [
+            inference_data[i : i + self.chunk_size]  # noqa: E203
+            for i in range(0, len(inference_data), self.chunk_size)
+        ]
+        success: list[InferenceResultSchema] = []
+        failed: list[InferenceResultSchema] = []
+        errors: dict[int, BaseException] = {}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                delay = self.retry_backoff_seconds * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Retrying {len(pending)} failed inference chunks in {delay}s "
+                    f"(attempt {attempt}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+            chunk_results = await asyncio.gather(
+                *(self._run_chunk(semaphore, chunk, days_ahead) for chunk in pending),
+                return_exceptions=True,
+            )
+
+            retry = []
+            for chunk, chunk_result in zip(pending, chunk_results):
+                if isinstance(chunk_result, BaseException):
+                    errors[id(chunk)] = chunk_result
+                    retry.append(chunk)
+                    continue
+                chunk_success, chunk_failed = chunk_result
+                success.extend(chunk_success)
+                failed.extend(chunk_failed)
+
+            pending = retry
+            if not pending:
+                break
+
+        for chunk in pending:
+            error = errors[id(chunk)]
+            tickers = [stock.stock_ticker for stock in chunk]
+            logger.error(f"Inference chunk {tickers} failed: {error}")
+            failed.extend(
+                InferenceResultSchema(
+                    stock_ticker=ticker, success=False, error_message=str(error)
+                )
+                for ticker in tickers
+            )
+
+        return InferenceResultSummarySchema(success=success, failed=failed)
+
+    async def _run_chunk(
+        self,
+        semaphore: asyncio.Semaphore,
+        chunk: list[StockToPredictRequestSchema],
+        days_ahead: int,
+    ) -> tuple[list[InferenceResultSchema], list[InferenceResultSchema]]:
+        async with semaphore:
+            raw_response = await self.ml.run_inference(
+                stocks=chunk, days_ahead=days_ahead
+            )
+
+        success, failed = [], []
+        returned_tickers = set()
+        for r in raw_response or []:
+            res = InferenceResultSchema(**r)
+            returned_tickers.add(res.stock_ticker)
+            (success if res.success else failed).append(res)
+
+        for stock in chunk:
+            if stock.stock_ticker not in returned_tickers:
+                failed.append(
+                    InferenceResultSchema(
+                        stock_ticker=stock.stock_ticker,
+                        success=False,
+                        error_message="No result returned by the ML server",
+                    )
+                )
+        return success, failed
+
+
+@app_scoped
+def get_inference_dispatcher() -> InferenceDispatcher:
+    config = get_config()
+    return InferenceDispatcher(
+        ml_operations=get_ml_server_operations(),
+        chunk_size=config.ML_INFERENCE_CHUNK_SIZE,
+        max_concurrency=config.ML_INFERENCE_MAX_CONCURRENCY,
+        max_retries=config.ML_INFERENCE_MAX_RETRIES,
+        retry_backoff_seconds=config.ML_INFERENCE_RETRY_BACKOFF_SECONDS,
+    )
@@ -0,0 +1,142 @@
+import logging
+from typing import AsyncIterable, Iterable, Sequence
+
+import numpy as np
+
+from app.api.ml_ops.schemas.inference_schema import StockToPredictRequestSchema
+from app.core.common.exceptions.custom_exceptions import ResourceNotFoundError
+from app.core.enums.trading_data_enum import TradingDataEnum
+from app.models import StockModel
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceFeatureBuilder:
+    """
+    Collects the last `days_back` trading data rows of every ticker into pre-sized
+    NumPy arrays, one `(tickers, days_back)` matrix per feature column.
+
+    Rows are expected in batches of `(stock_ticker, trading_data_id, *features)`,
+    ordered by ticker and ascending date, which is what
+    `TradingDataService.stream_by_stock_tickers_and_date_range` yields. Each batch
+    is scattered with one vectorized assignment per column.
+    """
+
+    INTEGER_FEATURES = {TradingDataEnum.VOLUMES}
+
+    def __init__(
+        self,
+        stock_tickers: list[str],
+        days_back: int,
+        features: Iterable[TradingDataEnum],
+    ):
+        self.stock_tickers = list(dict.fromkeys(stock_tickers))
+        self.days_back = days_back
+        self.features = list(dict.fromkeys(TradingDataEnum(f) for f in features))
+
+        self._ticker_index = {t: i for i, t in enumerate(self.stock_tickers)}
+        shape = (len(self.stock_tickers), days_back)
+        self.trading_data_ids = np.zeros(shape, dtype=np.int64)
+        self.matrices = {
+            feature: np.zeros(
+                shape,
+                dtype=np.int64 if feature in self.INTEGER_FEATURES else np.float64,
+            )
+            for feature in self.features
+        }
+        self.counts = np.zeros(len(self.stock_tickers), dtype=np.int64)
+
+    def add_rows(self, rows: Sequence[Sequence]) -> None:
+        """Scatter one ordered batch of rows into the matrices."""
+        if not rows:
+            return
+
+        columns = list(zip(*rows))
+        ticker_indices = np.fromiter(
+            (self._ticker_index.get(t, -1) for t in columns[0]),
+            dtype=np.int64,
+            count=len(rows),
+        )
+        known = ticker_indices >= 0
+        ticker_indices = ticker_indices[known]
+        if ticker_indices.size == 0:
+            return
+
+        # rows are grouped by ticker, so each row's day is its offset in the run
+        # of its ticker plus whatever earlier batches already filled in
+        run_starts = np.flatnonzero(np.diff(ticker_indices, prepend=-1))
+        run_lengths = np.diff(np.append(run_starts, ticker_indices.size))
+        offsets = np.arange(ticker_indices.size) - np.repeat(run_starts, run_lengths)
+        day_indices = self.counts[ticker_indices] + offsets
+        in_window = day_indices < self.days_back
+        ticker_indices = ticker_indices[in_window]
+        day_indices = day_indices[in_window]
+
+        self.trading_data_ids[ticker_indices, day_indices] = np.asarray(
+            columns[1], dtype=np.int64
+        )[known][in_window]
+        for offset, feature in enumerate(self.features, start=2):
+            matrix = self.matrices[feature]
+            matrix[ticker_indices, day_indices] = np.asarray(
+                columns[offset], dtype=matrix.dtype
+            )[known][in_window]
+        np.maximum.at(self.counts, ticker_indices, day_indices + 1)
+
+    async def consume(
+        self, partitions: AsyncIterable[Sequence[Sequence]]
+    ) -> "InferenceFeatureBuilder":
+        async for rows in partitions:
+            self.add_rows(rows)
+        return self
+
+    def validate(self) -> None:
+        found = int(self.counts.sum())
+        expected = len(self.stock_tickers) * self.days_back
+        if found == 0:
+            logger.error("Trading data not found.")
+            raise ResourceNotFoundError("Trading data not found.")
+        if found != expected:
+            short_tickers = [
+                self.stock_tickers[i]
+                for i in np.flatnonzero(self.counts != self.days_back)
+            ]
+            logger.error(
+                f"Expected {expected} trading data, found {found}. "
+                f"Incomplete tickers: {short_tickers}"
+            )
+            raise ResourceNotFoundError(
+                f"Expected {expected} trading data, found {found}."
+            )
+
+    def to_request_schemas(
+        self, active_models: list[StockModel]
+    ) -> list[StockToPredictRequestSchema]:
+        inference_data = []
+        for model in active_models:
+            ticker_index = self._ticker_index.get(model.stock_ticker)
+            if ticker_index is None:
+                continue
+
+            features = {
+                feature.value: (
+                    self.matrices[feature][ticker_index].tolist()
+                    if feature in self.matrices and feature in model.features_used
+                    else []
+                )
+                for feature in TradingDataEnum
+            }
+            inference_data.append(
+                StockToPredictRequestSchema.model_construct(
+                    stock_ticker=model.stock_ticker,
+                    trading_data_id=(
+                        int(self.trading_data_ids[ticker_index, -1])
+                        if self.days_back > 1
+                        else None
+                    ),
+                    model_id=model.id,
+                    model_path=model.model_path,
+                    scaler_path=model.scaler_path,
+                    **features,
+                )
+            )
+        return inference_data
@@ -1,8 +1,9 @@
 import logging
 import time
-from collections import defaultdict
 from datetime import date
+from typing import Optional
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dummy.dummy_service import DummyService, get_dummy_service
@@ -19,19 +20,28 @@ from app.api.general.services.trading_data_service import (
     TradingDataService,
     get_trading_data_service,
 )
+from app.api.general.services.trading_data_window_service import (
+    TradingDataWindowService,
+    get_trading_data_window_service,
+)
 from app.api.ml_ops.schemas.inference_schema import (
     InferenceResultSchema,
     InferenceResultSummarySchema,
     StockToPredictRequestSchema,
 )
-from app.core.clients.discord_client import DiscordOperations, get_discord_operations
-from app.core.clients.ml_server_operations import (
-    MLServerOperations,
-    get_ml_server_operations,
+from app.api.ml_ops.services.inference_dispatcher import (
+    InferenceDispatcher,
+    get_inference_dispatcher,
 )
+from app.api.ml_ops.services.inference_feature_builder import InferenceFeatureBuilder
+from app.core.clients.discord_client import DiscordOperations, get_discord_operations
 from app.core.common.exceptions.custom_exceptions import MLServerError
 from app.core.common.utils.measurement import send_metric
-from app.core.common.utils.validators import validate_required
+from app.core.common.utils.validators import (
+    normalize_stock_tickers,
+    validate_required,
+)
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.core.enums.job_enum import JobTypeEnum
 from app.core.enums.measurement_enum import (
@@ -39,7 +49,7 @@ from app.core.enums.measurement_enum import (
     MeasurementTag,
 )
 from app.core.enums.trading_data_enum import TradingDataEnum
-from app.models import Prediction, TradingData
+from app.models import StockModel
 
 logger = logging.getLogger(__name__)
 
@@ -51,16 +61,18 @@ class InferenceService:
         stock_model_service: StockModelService,
         prediction_service: PredictionService,
         trading_data_service: TradingDataService,
+        trading_data_window_service: TradingDataWindowService,
         dummy_service: DummyService,
-        ml_operations: MLServerOperations,
+        inference_dispatcher: InferenceDispatcher,
         discord_operations: DiscordOperations,
     ):
         self.stock_service = stock_service
         self.stock_model_service = stock_model_service
         self.prediction_service = prediction_service
         self.trading_data_service = trading_data_service
+        self.trading_data_window_service = trading_data_window_service
         self.dummy_service = dummy_service
-        self.ml = ml_operations
+        self.inference_dispatcher = inference_dispatcher
         self.discord = discord_operations
 
     # DONE
@@ -72,7 +84,8 @@ class InferenceService:
         days_back: int,
         days_forward: int,
         periods: list[int],
-    ) -> list[Prediction] | None:
+        incremental: bool = False,
+    ) -> list[Row] | None:
         validate_required(industry_code, "Industry Code")
         validate_required(target_date, "Target Date")
         validate_required(days_back, "Days back")
@@ -89,6 +102,7 @@ class InferenceService:
             days_back=days_back,
             days_forward=days_forward,
             periods=periods,
+            incremental=incremental,
             db=db,
         )
         return saved_predictions
@@ -102,18 +116,42 @@ class InferenceService:
         days_back: int,
         days_forward: int,
         periods: list[int],
-    ) -> list[Prediction] | None:
+        incremental: bool = False,
+    ) -> list[Row] | None:
+        """
+        With `incremental`, only stocks whose active model still misses a
+        prediction for `target_date` and one of `periods` are sent to the ML
+        server, and rows that already exist are skipped on insert. A rerun then
+        costs only the missing work.
+        """
         validate_required(stock_tickers, "Stock tickers")
         validate_required(target_date, "Target date")
         validate_required(days_back, "Days back")
 
         start = time.perf_counter()
 
+        active_models = None
+        if incremental:
+            active_models = await self._get_models_missing_predictions(
+                db=db,
+                stock_tickers=stock_tickers,
+                target_date=target_date,
+                periods=periods,
+            )
+            if not active_models:
+                logger.info(
+                    f"All predictions of {target_date} already exist "
+                    f"for {len(stock_tickers)} stocks, skipping inference"
+                )
+                return []
+            stock_tickers = [model.stock_ticker for model in active_models]
+
         inference_data: list[StockToPredictRequestSchema] = (
             await self.get_inference_data_by_stock_tickers(
                 stock_tickers=stock_tickers,
                 target_date=target_date,
                 days_back=days_back,
+                active_models=active_models,
                 db=db,
             )
         )
@@ -128,10 +166,26 @@ class InferenceService:
         success_results = inference_results.success
         failed_results = inference_results.failed
 
+        # save what succeeded before reporting failures, so a few failed chunks
+        # do not throw away the rest of the industry
+        saved_predictions: list[Row] = []
+        if success_results:
+            saved_predictions = await self._save_success_inference_results(
+                target_date=target_date,
+                inference_data=inference_data,
+                success_results=success_results,
+                periods=periods,
+                skip_existing=incremental,
+                db=db,
+            )
+
         if failed_results:
             failed_tickers = [res.stock_ticker for res in failed_results]
             await self.discord.send_discord_message(
-                message=f"ML inference failed for: {failed_tickers}",
+                message=(
+                    f"ML inference failed for: {failed_tickers} "
+                    f"({len(success_results)} succeeded and were saved)"
+                ),
                 job_name=JobTypeEnum.INFERENCE.value,
                 is_critical=True,
                 mention_everyone=True,
@@ -139,16 +193,6 @@ class InferenceService:
             logger.error(f"ML inference failed for: {failed_tickers}")
             raise MLServerError(f"ML inference failed for: {failed_tickers}")
 
-        saved_predictions: list[Prediction] = (
-            await self._save_success_inference_results(
-                target_date=target_date,
-                inference_data=inference_data,
-                success_results=success_results,
-                periods=periods,
-                db=db,
-            )
-        )
-
         elapsed = time.perf_counter() - start
         send_metric(
             metric=MeasurementMetric.total_predict_time,
@@ -234,6 +278,32 @@ class InferenceService:
 
         return response
 
+    async def _get_models_missing_predictions(
+        self,
+        db: AsyncSession,
+        stock_tickers: list[str],
+        target_date: date,
+        periods: list[int],
+    ) -> list[StockModel]:
+        """Active models that miss a prediction for `target_date` and any period."""
+        active_models = await self.stock_model_service.get_active_by_stock_tickers(
+            db=db, stock_tickers=stock_tickers
+        )
+        existing_keys = await self.prediction_service.get_existing_keys(
+            db=db,
+            stock_tickers=stock_tickers,
+            target_date=target_date,
+            periods=periods,
+        )
+        return [
+            model
+            for model in active_models
+            if any(
+                (model.stock_ticker, model.id, period) not in existing_keys
+                for period in periods
+            )
+        ]
+
     # DONE
     async def get_inference_data_by_stock_tickers(
         self,
@@ -241,6 +311,7 @@ class InferenceService:
         stock_tickers: list[str],
         target_date: date,
         days_back: int,
+        active_models: Optional[list[StockModel]] = None,
     ) -> list[StockToPredictRequestSchema]:
         validate_required(stock_tickers, "Stock tickers")
         validate_required(target_date, "Target date")
@@ -248,99 +319,51 @@ class InferenceService:
 
         start = time.perf_counter()
 
-        active_models = await self.stock_model_service.get_active_by_stock_tickers(
-            db=db, stock_tickers=stock_tickers
+        if active_models is None:
+            active_models = await self.stock_model_service.get_active_by_stock_tickers(
+                db=db, stock_tickers=stock_tickers
+            )
+
+        features_used = [
+            feature
+            for feature in TradingDataEnum
+            if any(feature in model.features_used for model in active_models)
+        ]
+        columns = [feature.value for feature in features_used]
+        feature_builder = InferenceFeatureBuilder(
+            stock_tickers=normalize_stock_tickers(stock_tickers),
+            days_back=days_back,
+            features=features_used,
         )
 
-        trading_data_list: list[TradingData] = (
-            await self.trading_data_service.get_by_stock_tickers_and_date_range(
+        # one primary key lookup on the rolling windows, trading_data only for
+        # tickers whose window is missing or does not reach back far enough
+        window_rows, fallback_tickers = (
+            await self.trading_data_window_service.get_window_rows(
                 db=db,
                 stock_tickers=stock_tickers,
                 last_date=target_date,
                 days_back=days_back,
+                columns=columns,
             )
         )
-        trading_data_map = defaultdict(
-            lambda: {
-                "trading_data_id": [],
-                TradingDataEnum.CLOSE: [],
-                TradingDataEnum.VOLUMES: [],
-                TradingDataEnum.HIGH: [],
-                TradingDataEnum.LOW: [],
-                TradingDataEnum.OPEN: [],
-            }
-        )
-        for trading_data in trading_data_list:
-            # id of the day before the target date
-            # closing prices and volumes up until the target date (includes the target date)
-            trading_data_map[trading_data.stock_ticker]["trading_data_id"].append(
-                trading_data.id
-            )
-            trading_data_map[trading_data.stock_ticker][TradingDataEnum.CLOSE].append(
-                trading_data.close
-            )
-            trading_data_map[trading_data.stock_ticker][TradingDataEnum.VOLUMES].append(
-                trading_data.volumes
-            )
-            trading_data_map[trading_data.stock_ticker][TradingDataEnum.HIGH].append(
-                trading_data.high
+        feature_builder.add_rows(window_rows)
+        if fallback_tickers:
+            logger.info(
+                f"Reading {len(fallback_tickers)} tickers from trading data "
+                f"instead of their windows: {fallback_tickers}"
             )
-            trading_data_map[trading_data.stock_ticker][TradingDataEnum.LOW].append(
-                trading_data.low
-            )
-            trading_data_map[trading_data.stock_ticker][TradingDataEnum.OPEN].append(
-                trading_data.open
-            )
-
-        inference_data = [
-            StockToPredictRequestSchema(
-                stock_ticker=model.stock_ticker,
-                trading_data_id=(
-                    trading_data_map[model.stock_ticker]["trading_data_id"][-1]
-                    if len(trading_data_map[model.stock_ticker]["trading_data_id"]) > 1
-                    else None
-                ),
-                close=(
-                    trading_data_map[model.stock_ticker][TradingDataEnum.CLOSE][
-                        :days_back
-                    ]
-                    if TradingDataEnum.CLOSE in model.features_used
-                    else []
-                ),
-                volumes=(
-                    trading_data_map[model.stock_ticker][TradingDataEnum.VOLUMES][
-                        :days_back
-                    ]
-                    if TradingDataEnum.VOLUMES in model.features_used
-                    else []
-                ),
-                high=(
-                    trading_data_map[model.stock_ticker][TradingDataEnum.HIGH][
-                        :days_back
-                    ]
-                    if TradingDataEnum.HIGH in model.features_used
-                    else []
-                ),
-                low=(
-                    trading_data_map[model.stock_ticker][TradingDataEnum.LOW][
-                        :days_back
-                    ]
-                    if TradingDataEnum.LOW in model.features_used
-                    else []
-                ),
-                open=(
-                    trading_data_map[model.stock_ticker][TradingDataEnum.OPEN][
-                        :days_back
-                    ]
-                    if TradingDataEnum.OPEN in model.features_used
-                    else []
-                ),
-                model_id=model.id,
-                model_path=model.model_path,
-                scaler_path=model.scaler_path,
+            await feature_builder.consume(
+                self.trading_data_service.stream_by_stock_tickers_and_date_range(
+                    db=db,
+                    stock_tickers=fallback_tickers,
+                    last_date=target_date,
+                    days_back=days_back,
+                    columns=columns,
+                )
             )
-            for model in active_models
-        ]
+        feature_builder.validate()
+        inference_data = feature_builder.to_request_schemas(active_models)
 
         elapsed = time.perf_counter() - start
         send_metric(
@@ -361,16 +384,12 @@ class InferenceService:
 
         start = time.perf_counter()
 
-        raw_response = await self.ml.run_inference(
-            stocks=inference_data,
+        response = await self.inference_dispatcher.dispatch(
+            inference_data=inference_data,
             days_ahead=days_forward + 1,  # day 0 is the target date
         )
-        success, failed = [], []
-        for r in raw_response:
-            res = InferenceResultSchema(**r)
-            (success if res.success else failed).append(res)
+        success, failed = response.success, response.failed
 
-        response = InferenceResultSummarySchema(success=success, failed=failed)
         elapsed = time.perf_counter() - start
         send_metric(
             metric=MeasurementMetric.ml_time,
@@ -391,7 +410,8 @@ class InferenceService:
         inference_data: list[StockToPredictRequestSchema],
         success_results: list[InferenceResultSchema],
         periods: list[int],
-    ) -> list[Prediction] | None:
+        skip_existing: bool = False,
+    ) -> list[Row] | None:
 
         start = time.perf_counter()
 
@@ -402,7 +422,7 @@ class InferenceService:
             periods=periods,
         )
         saved_predictions = await self.prediction_service.create_by_list(
-            db=db, prediction_data_list=predictions
+            db=db, prediction_data_list=predictions, skip_existing=skip_existing
         )
 
         elapsed = time.perf_counter() - start
@@ -448,13 +468,15 @@ class InferenceService:
         return predictions
 
 
+@app_scoped
 def get_inference_service() -> InferenceService:
     return InferenceService(
         stock_service=get_stock_service(),
         stock_model_service=get_stock_model_service(),
         prediction_service=get_prediction_service(),
         trading_data_service=get_trading_data_service(),
+        trading_data_window_service=get_trading_data_window_service(),
         dummy_service=get_dummy_service(),
-        ml_operations=get_ml_server_operations(),
+        inference_dispatcher=get_inference_dispatcher(),
         discord_operations=get_discord_operations(),
     )
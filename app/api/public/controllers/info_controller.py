@@ -1,19 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.public.schema.info_schema import InitialInfoResponseSchema
 from app.api.public.services.info_service import InfoService, get_info_service
+from app.core.dependencies.container import app_scoped
 
 
 class InfoController:
     def __init__(self, service: InfoService):
         self.service = service
 
-    async def initialize_info_controller(
-        self, db: AsyncSession
-    ) -> InitialInfoResponseSchema:
-        response = await self.service.initialize_info(db=db)
+    async def initialize_info_controller(self, db: AsyncSession) -> str:
+        response = await self.service.initialize_info_json(db=db)
         return response
 
 
+@app_scoped
 def get_info_controller() -> InfoController:
     return InfoController(service=get_info_service())
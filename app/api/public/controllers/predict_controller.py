@@ -1,14 +1,11 @@
 from fastapi import Depends
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.public.schema.predict_schema import (
-    GetTopPredictionResponseSchema,
-)
 from app.api.public.services.predict_service import (
     PredictService,
     get_predict_service,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
 
@@ -21,12 +18,13 @@ class PredictController:
         industry: IndustryCodeEnum,
         period: int,
         db: AsyncSession,
-    ) -> GetTopPredictionResponseSchema:
-        response = await self.service.get_top_prediction(
+    ) -> str:
+        response = await self.service.get_top_prediction_json(
             industry=industry, period=period, db=db
         )
-        return jsonable_encoder(response)
+        return response
 
 
+@app_scoped
 def get_predict_controller() -> PredictController:
     return PredictController(service=get_predict_service())
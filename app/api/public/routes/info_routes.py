@@ -8,8 +8,9 @@ from app.api.public.controllers.info_controller import (
 from app.api.public.schema.info_schema import InitialInfoResponseSchema
 from app.core.common.utils.response_handlers import (
     BaseSuccessResponse,
-    success_response,
+    success_json_response,
 )
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 
 router = APIRouter(
@@ -19,10 +20,8 @@ router = APIRouter(
 
 @router.get("", response_model=BaseSuccessResponse[InitialInfoResponseSchema])
 async def get_initial_info(
-    controller: InfoController = Depends(get_info_controller),
+    controller: InfoController = Depends(provide(get_info_controller)),
     db: AsyncSession = Depends(get_db),
 ):
-    response: InitialInfoResponseSchema = await controller.initialize_info_controller(
-        db=db
-    )
-    return success_response(data=response)
+    response = await controller.initialize_info_controller(db=db)
+    return success_json_response(data_json=response)
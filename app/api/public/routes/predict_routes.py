@@ -9,8 +9,10 @@ from app.api.public.schema.predict_schema import (
     GetTopPredictionResponseSchema,
 )
 from app.core.common.utils.response_handlers import (
-    success_response,
+    BaseSuccessResponse,
+    success_json_response,
 )
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
@@ -19,19 +21,17 @@ router = APIRouter(
 )
 
 
-@router.get("")
+@router.get("", response_model=BaseSuccessResponse[GetTopPredictionResponseSchema])
 async def get_top_prediction_route(
     industry: IndustryCodeEnum = Query(...),
     period: int = Query(...),
-    controller: PredictController = Depends(get_predict_controller),
+    controller: PredictController = Depends(provide(get_predict_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     """
     fetch the calculated result from db
     """
-    response: GetTopPredictionResponseSchema = (
-        await controller.get_top_prediction_controller(
-            industry=industry, period=period, db=db
-        )
+    response = await controller.get_top_prediction_controller(
+        industry=industry, period=period, db=db
     )
-    return success_response(data=response)
+    return success_json_response(data_json=response)
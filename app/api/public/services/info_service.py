@@ -14,6 +14,11 @@ from app.api.public.schema.info_schema import (
     PeriodResponseSchema,
     StockInfoSchema,
 )
+from app.core.common.utils.read_through_cache import (
+    ReadThroughCache,
+    get_read_through_cache,
+)
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
 logger = logging.getLogger(__name__)
@@ -24,11 +29,29 @@ class InfoService:
         self,
         industry_service: IndustryService,
         stock_service: StockService,
+        cache: ReadThroughCache,
     ):
         self.industry_service = industry_service
         self.stock_service = stock_service
+        self.cache = cache
+
+    INFO_CACHE_KEY = "info:all"
 
     async def initialize_info(self, db: AsyncSession) -> InitialInfoResponseSchema:
+        cached = await self.initialize_info_json(db=db)
+        return InitialInfoResponseSchema.model_validate_json(cached)
+
+    async def initialize_info_json(self, db: AsyncSession) -> str:
+        """The cached info response as JSON, for routes that return it as is."""
+        return await self.cache.get_or_load(
+            key=self.INFO_CACHE_KEY,
+            loader=lambda: self._load_info_json(db=db),
+        )
+
+    async def invalidate_info_cache(self) -> None:
+        await self.cache.invalidate(self.INFO_CACHE_KEY)
+
+    async def _load_info_json(self, db: AsyncSession) -> str:
         period_values = [1, 5, 10, 15]
         all_periods: list[PeriodResponseSchema] = [
             PeriodResponseSchema(value=val, label=f"{val} day{'s' if val > 1 else ''}")
@@ -41,7 +64,7 @@ class InfoService:
             all_periods=all_periods,
             all_industries=all_industries,
         )
-        return response
+        return response.model_dump_json()
 
     async def _get_all_industries(
         self, db: AsyncSession
@@ -69,8 +92,10 @@ class InfoService:
         return list(industry_dict.values())
 
 
+@app_scoped
 def get_info_service() -> InfoService:
     return InfoService(
         industry_service=get_industry_service(),
         stock_service=get_stock_service(),
+        cache=get_read_through_cache(),
     )
@@ -28,7 +28,12 @@ from app.core.common.utils.datetime_utils import (
     get_yesterday_bangkok_date,
     is_market_closed,
 )
+from app.core.common.utils.read_through_cache import (
+    ReadThroughCache,
+    get_read_through_cache,
+)
 from app.core.common.utils.validators import validate_required
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 
 logger = logging.getLogger(__name__)
@@ -41,15 +46,26 @@ class PredictService:
         industry_service: IndustryService,
         prediction_service: PredictionService,
         top_prediction_service: TopPredictionService,
+        cache: ReadThroughCache,
     ):
         self.predict_repo = predict_repo
         self.industry_service = industry_service
         self.prediction_service = prediction_service
         self.top_prediction_service = top_prediction_service
+        self.cache = cache
 
     async def get_top_prediction(
         self, industry: IndustryCodeEnum, period: int, db: AsyncSession
     ) -> GetTopPredictionResponseSchema:
+        cached = await self.get_top_prediction_json(
+            industry=industry, period=period, db=db
+        )
+        return GetTopPredictionResponseSchema.model_validate_json(cached)
+
+    async def get_top_prediction_json(
+        self, industry: IndustryCodeEnum, period: int, db: AsyncSession
+    ) -> str:
+        """The cached top prediction as JSON, for routes that return it as is."""
         yesterday: date = get_yesterday_bangkok_date()
         validate_required(industry, "industry")
         validate_required(period, "period")
@@ -59,6 +75,64 @@ class PredictService:
             if is_market_closed(yesterday)
             else yesterday
         )
+
+        return await self.cache.get_or_load(
+            key=self.get_top_prediction_cache_key(
+                industry=industry, period=period, closing_price_date=closing_price_date
+            ),
+            loader=lambda: self._load_top_prediction_json(
+                industry=industry,
+                period=period,
+                closing_price_date=closing_price_date,
+                db=db,
+            ),
+        )
+
+    async def refresh_top_prediction_cache(
+        self,
+        db: AsyncSession,
+        industries: list[IndustryCodeEnum],
+        periods: list[int],
+        closing_price_date: date,
+    ) -> None:
+        """
+        Replace the cached top predictions of `closing_price_date` with freshly
+        ranked ones. Pairs without a top prediction are only invalidated.
+        """
+        for industry in industries:
+            for period in periods:
+                key = self.get_top_prediction_cache_key(
+                    industry=industry,
+                    period=period,
+                    closing_price_date=closing_price_date,
+                )
+                await self.cache.invalidate(key)
+                try:
+                    value = await self._load_top_prediction_json(
+                        industry=industry,
+                        period=period,
+                        closing_price_date=closing_price_date,
+                        db=db,
+                    )
+                except DBError as e:
+                    logger.warning(f"Skip warming cache for '{key}': {e}")
+                    continue
+                await self.cache.set(key, value)
+
+    @staticmethod
+    def get_top_prediction_cache_key(
+        industry: IndustryCodeEnum, period: int, closing_price_date: date
+    ) -> str:
+        industry_code = IndustryCodeEnum(industry).value
+        return f"predict:{industry_code}:{period}:{closing_price_date.isoformat()}"
+
+    async def _load_top_prediction_json(
+        self,
+        industry: IndustryCodeEnum,
+        period: int,
+        closing_price_date: date,
+        db: AsyncSession,
+    ) -> str:
         predicted_price_date = get_n_market_days_ahead(
             start_date=closing_price_date, n=period + 1
         )
@@ -79,17 +153,19 @@ class PredictService:
                 ranked_predictions=top_prediction,
                 closing_price_date=closing_price_date,
                 predicted_price_date=predicted_price_date,
-            )
+            ).model_dump_json()
 
         except Exception as e:
             logger.error(f"Failed to get top prediction from database: {e}")
             raise DBError("Failed to get top prediction from database") from e
 
 
+@app_scoped
 def get_predict_service() -> PredictService:
     return PredictService(
         predict_repo=PredictRepository(),
         industry_service=get_industry_service(),
         prediction_service=get_prediction_service(),
         top_prediction_service=get_top_prediction_service(),
+        cache=get_read_through_cache(),
     )
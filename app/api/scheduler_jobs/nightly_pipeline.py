@@ -0,0 +1,140 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable, Optional
+
+from app.core.enums.job_enum import PipelineStageStatusEnum
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineStage:
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class NightlyPipelineState:
+    run_date: date
+    stages: dict[str, PipelineStageStatusEnum] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "run_date": self.run_date.isoformat(),
+                "stages": {name: status.value for name, status in self.stages.items()},
+                "errors": self.errors,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, value: str) -> "NightlyPipelineState":
+        data = json.loads(value)
+        return cls(
+            run_date=date.fromisoformat(data["run_date"]),
+            stages={
+                name: PipelineStageStatusEnum(status)
+                for name, status in data.get("stages", {}).items()
+            },
+            errors=data.get("errors", {}),
+        )
+
+    def succeeded(self, name: str) -> bool:
+        return self.stages.get(name) == PipelineStageStatusEnum.SUCCESS
+
+
+class NightlyPipeline:
+    """
+    Runs `PipelineStage`s as a dependency graph.
+
+    Every stage starts as soon as all of its dependencies succeeded, so independent
+    branches (one per industry) overlap. Stages whose dependency did not succeed are
+    skipped. The state is saved after every transition through `save_state`; a run
+    for the same date resumes from it and only re-runs stages that did not succeed.
+    """
+
+    def __init__(
+        self,
+        load_state: Callable[[], Awaitable[Optional[str]]],
+        save_state: Callable[[str], Awaitable[None]],
+    ):
+        self.load_state = load_state
+        self.save_state = save_state
+        self._save_lock = asyncio.Lock()
+
+    async def run(
+        self, run_date: date, stages: list[PipelineStage]
+    ) -> NightlyPipelineState:
+        state = await self._load(run_date)
+        finished = {stage.name: asyncio.Event() for stage in stages}
+
+        async def run_stage(stage: PipelineStage) -> None:
+            try:
+                for dependency in stage.depends_on:
+                    await finished[dependency].wait()
+
+                if state.succeeded(stage.name):
+                    logger.info(f"Stage '{stage.name}' already succeeded, skipping")
+                    return
+
+                blocked_by = [d for d in stage.depends_on if not state.succeeded(d)]
+                if blocked_by:
+                    state.errors[stage.name] = f"Blocked by {blocked_by}"
+                    await self._set_status(
+                        state, stage.name, PipelineStageStatusEnum.SKIPPED
+                    )
+                    return
+
+                await self._set_status(
+                    state, stage.name, PipelineStageStatusEnum.RUNNING
+                )
+                try:
+                    await stage.run()
+                except Exception as e:
+                    logger.error(f"Stage '{stage.name}' failed: {e}")
+                    state.errors[stage.name] = str(e)
+                    await self._set_status(
+                        state, stage.name, PipelineStageStatusEnum.FAILED
+                    )
+                    return
+
+                state.errors.pop(stage.name, None)
+                await self._set_status(
+                    state, stage.name, PipelineStageStatusEnum.SUCCESS
+                )
+            finally:
+                finished[stage.name].set()
+
+        await asyncio.gather(*(run_stage(stage) for stage in stages))
+        return state
+
+    async def _load(self, run_date: date) -> NightlyPipelineState:
+        try:
+            saved = await self.load_state()
+            if saved:
+                state = NightlyPipelineState.from_json(saved)
+                if state.run_date == run_date:
+                    logger.info(f"Resuming nightly pipeline of {run_date}")
+                    return state
+        except Exception as e:
+            logger.warning(f"Failed to load nightly pipeline state: {e}")
+        return NightlyPipelineState(run_date=run_date)
+
+    async def _set_status(
+        self,
+        state: NightlyPipelineState,
+        name: str,
+        status: PipelineStageStatusEnum,
+    ) -> None:
+        state.stages[name] = status
+        async with self._save_lock:
+            try:
+                await self.save_state(state.to_json())
+            except Exception as e:
+                # the run goes on; a crash now only re-runs a few stages
+                logger.warning(f"Failed to save nightly pipeline state: {e}")
@@ -4,6 +4,7 @@ from app.api.scheduler_jobs.scheduler_job_service import (
     SchedulerJobService,
     get_scheduler_job_service,
 )
+from app.core.dependencies.container import app_scoped
 
 
 class SchedulerJobController:
@@ -37,6 +38,15 @@ class SchedulerJobController:
         )
         return None
 
+    async def scheduled_nightly_pipeline_controller(
+        self,
+        db: AsyncSession,
+    ) -> None:
+        await self.service.scheduled_nightly_pipeline(
+            db=db,
+        )
+        return None
+
     async def scheduled_evaluate_accuracy_controller(self, db: AsyncSession) -> None:
         await self.service.scheduled_evaluate_accuracy(
             db=db,
@@ -53,5 +63,6 @@ class SchedulerJobController:
         return None
 
 
+@app_scoped
 def get_scheduler_job_controller() -> SchedulerJobController:
     return SchedulerJobController(service=get_scheduler_job_service())
@@ -6,6 +6,7 @@ from app.api.scheduler_jobs.scheduler_job_controller import (
     get_scheduler_job_controller,
 )
 from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.container import provide
 from app.core.dependencies.db_session import get_db
 
 router = APIRouter(
@@ -16,7 +17,7 @@ router = APIRouter(
 
 @router.post("/pull-trading-data")
 async def scheduled_pull_trading_data_route(
-    controller: SchedulerJobController = Depends(get_scheduler_job_controller),
+    controller: SchedulerJobController = Depends(provide(get_scheduler_job_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.scheduled_pull_trading_data_controller(db=db)
@@ -25,7 +26,7 @@ async def scheduled_pull_trading_data_route(
 
 @router.post("/trigger-infer-and-save")
 async def scheduled_infer_and_save_route(
-    controller: SchedulerJobController = Depends(get_scheduler_job_controller),
+    controller: SchedulerJobController = Depends(provide(get_scheduler_job_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.scheduled_infer_and_save_controller(db=db)
@@ -34,16 +35,29 @@ async def scheduled_infer_and_save_route(
 
 @router.post("/rank-predictions")
 async def scheduled_rank_predictions_route(
-    controller: SchedulerJobController = Depends(get_scheduler_job_controller),
+    controller: SchedulerJobController = Depends(provide(get_scheduler_job_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.scheduled_rank_predictions_controller(db=db)
     return success_response()
 
 
+@router.post("/nightly-pipeline")
+async def scheduled_nightly_pipeline_route(
+    controller: SchedulerJobController = Depends(provide(get_scheduler_job_controller)),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Pull, infer and rank in one run. Calling it again on the same day resumes
+    the stages that did not succeed.
+    """
+    await controller.scheduled_nightly_pipeline_controller(db=db)
+    return success_response()
+
+
 @router.get("/evaluate-accuracy")
 async def scheduled_evaluate_accuracy_route(
-    controller: SchedulerJobController = Depends(get_scheduler_job_controller),
+    controller: SchedulerJobController = Depends(provide(get_scheduler_job_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     await controller.scheduled_evaluate_accuracy_controller(db=db)
@@ -52,7 +66,7 @@ async def scheduled_evaluate_accuracy_route(
 
 @router.delete("/cleanup")
 async def scheduled_cleanup_job_route(
-    controller: SchedulerJobController = Depends(get_scheduler_job_controller),
+    controller: SchedulerJobController = Depends(provide(get_scheduler_job_controller)),
     db: AsyncSession = Depends(get_db),
 ):
     """
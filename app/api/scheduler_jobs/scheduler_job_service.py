@@ -1,9 +1,15 @@
+import functools
 import logging
-from asyncio import gather
+import uuid
+from asyncio import create_task, gather, sleep
 from typing import Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.api.general.services.partition_service import (
+    PartitionService,
+    get_partition_service,
+)
 from app.api.general.services.stock_service import StockService, get_stock_service
 from app.api.internal.services.cleanup_data_service import (
     CleanupDataService,
@@ -21,13 +27,28 @@ from app.api.ml_ops.services.inference_service import (
     InferenceService,
     get_inference_service,
 )
+from app.api.public.services.predict_service import (
+    PredictService,
+    get_predict_service,
+)
+from app.api.scheduler_jobs.nightly_pipeline import (
+    NightlyPipeline,
+    NightlyPipelineState,
+    PipelineStage,
+)
 from app.core.clients.discord_client import DiscordOperations, get_discord_operations
+from app.core.common.exceptions.custom_exceptions import ResourceNotFoundError
 from app.core.common.utils.datetime_utils import (
     get_today_bangkok_date,
     is_market_closed,
 )
+from app.core.dependencies.container import app_scoped
 from app.core.enums.industry_code_enum import IndustryCodeEnum
 from app.core.enums.job_enum import JobConfigEnum, JobStatusEnum, JobTypeEnum
+from app.core.settings.database import AsyncSessionLocal
+
+# renewed every third of it while a nightly run is going
+NIGHTLY_PIPELINE_LEASE_SECONDS = 60 * 5
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +62,9 @@ class SchedulerJobService:
         inference_service: InferenceService,
         cleanup_data_service: CleanupDataService,
         stock_service: StockService,
+        predict_service: PredictService,
+        partition_service: PartitionService,
+        session_factory: async_sessionmaker[AsyncSession],
     ):
         self.job_config_service = job_config_service
         self.discord = discord_operations
@@ -48,6 +72,9 @@ class SchedulerJobService:
         self.inference_service = inference_service
         self.cleanup_data_service = cleanup_data_service
         self.stock_service = stock_service
+        self.predict_service = predict_service
+        self.partition_service = partition_service
+        self.session_factory = session_factory
 
     async def _handle_job_executed(
         self,
@@ -213,6 +240,7 @@ class SchedulerJobService:
                     days_back=days_back,
                     days_forward=days_forward,
                     periods=periods,
+                    incremental=True,
                 )
                 for industry_code in all_industry_codes
             ]
@@ -325,6 +353,16 @@ class SchedulerJobService:
                 )
                 raise Exception("Ranking job failed for some industries/periods.")
 
+            try:
+                await self.predict_service.refresh_top_prediction_cache(
+                    db=db,
+                    industries=industry_codes,
+                    periods=periods,
+                    closing_price_date=today,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to refresh top prediction cache: {e}")
+
             await self._handle_job_executed(
                 db=db,
                 job_type=JobTypeEnum.RANK,
@@ -344,6 +382,253 @@ class SchedulerJobService:
             )
             raise e
 
+    async def scheduled_nightly_pipeline(self, db: AsyncSession) -> None:
+        """
+        Pull, infer and rank in one run: each industry is inferred as soon as the
+        pull is done and ranked as soon as its own inference is done. Every stage
+        gets its own session, and stage state is kept in `NIGHTLY_PIPELINE_STATE`,
+        so calling this again on the same day only re-runs unfinished stages.
+
+        A run holds the `NIGHTLY_PIPELINE_LEASE`, renewed while it runs, so a
+        scheduler retry that starts while a slow run is still going skips instead
+        of re-running its stages alongside it.
+        """
+        owner = uuid.uuid4().hex
+        async with self.session_factory() as session:
+            acquired = await self.job_config_service.acquire_lease(
+                db=session,
+                key=JobConfigEnum.NIGHTLY_PIPELINE_LEASE,
+                owner=owner,
+                ttl_seconds=NIGHTLY_PIPELINE_LEASE_SECONDS,
+            )
+        if not acquired:
+            logger.warning("Nightly pipeline is already running, skipping this run")
+            return
+
+        heartbeat = create_task(self._renew_nightly_pipeline_lease(owner))
+        try:
+            await self._run_nightly_pipeline(db=db)
+        finally:
+            heartbeat.cancel()
+            async with self.session_factory() as session:
+                await self.job_config_service.release_lease(
+                    db=session, key=JobConfigEnum.NIGHTLY_PIPELINE_LEASE, owner=owner
+                )
+
+    async def _renew_nightly_pipeline_lease(self, owner: str) -> None:
+        while True:
+            await sleep(NIGHTLY_PIPELINE_LEASE_SECONDS / 3)
+            try:
+                async with self.session_factory() as session:
+                    renewed = await self.job_config_service.acquire_lease(
+                        db=session,
+                        key=JobConfigEnum.NIGHTLY_PIPELINE_LEASE,
+                        owner=owner,
+                        ttl_seconds=NIGHTLY_PIPELINE_LEASE_SECONDS,
+                    )
+                if not renewed:
+                    logger.error("Nightly pipeline lease was taken over")
+            except Exception as e:
+                logger.warning(f"Failed to renew nightly pipeline lease: {e}")
+
+    async def _run_nightly_pipeline(self, db: AsyncSession) -> None:
+        keys = [
+            JobConfigEnum.PULL_TRADING_DATA_CIRCUIT_BREAKER,
+            JobConfigEnum.RUN_INFERENCE_CIRCUIT_BREAKER,
+            JobConfigEnum.SAVE_INFERENCE_PERIODS,
+            JobConfigEnum.RUN_INFERENCE_DAYS_BACK,
+            JobConfigEnum.RUN_INFERENCE_DAYS_FORWARD,
+        ]
+        job_configs = await self.job_config_service.get_job_configs(db=db, keys=keys)
+        periods: list[int] = job_configs[JobConfigEnum.SAVE_INFERENCE_PERIODS]
+        days_back: int = job_configs[JobConfigEnum.RUN_INFERENCE_DAYS_BACK]
+        days_forward: int = job_configs[JobConfigEnum.RUN_INFERENCE_DAYS_FORWARD]
+
+        # the pull breaker stops the whole run, since inference needs today's
+        # pull; the inference breaker only drops the infer and rank stages
+        if job_configs[JobConfigEnum.PULL_TRADING_DATA_CIRCUIT_BREAKER]:
+            await self._handle_job_executed(
+                db=db,
+                job_type=JobTypeEnum.PULL_TRADING_DATA,
+                job_status=JobStatusEnum.SKIPPED,
+                additional_message="Skip reason: circuit breaker flag.",
+                is_critical=False,
+                mention_everyone=False,
+                tags=["nightly"],
+            )
+            return
+        run_inference = not job_configs[JobConfigEnum.RUN_INFERENCE_CIRCUIT_BREAKER]
+
+        today = get_today_bangkok_date()
+        if is_market_closed(today):
+            await self._handle_job_executed(
+                db=db,
+                job_type=JobTypeEnum.PULL_TRADING_DATA,
+                job_status=JobStatusEnum.SKIPPED,
+                additional_message="Skip reason: market close date.",
+                is_critical=False,
+                mention_everyone=False,
+                tags=["nightly"],
+            )
+            return
+
+        all_stocks = await self.stock_service.get_active_ticker_values(db=db)
+        industry_codes = [item for item in IndustryCodeEnum] if run_inference else []
+        failed_tickers: list[str] = []
+
+        async def pull() -> None:
+            async with self.session_factory() as session:
+                failed_tickers.extend(
+                    await self.process_data_service.pull_trading_data(
+                        db=session, stock_tickers=all_stocks, target_date=today
+                    )
+                )
+
+        async def infer(industry_code: IndustryCodeEnum) -> None:
+            async with self.session_factory() as session:
+                await self.inference_service.run_and_save_inference_by_industry_code(
+                    db=session,
+                    industry_code=industry_code,
+                    target_date=today,
+                    days_back=days_back,
+                    days_forward=days_forward,
+                    periods=periods,
+                    incremental=True,
+                )
+
+        async def rank(industry_code: IndustryCodeEnum) -> None:
+            async with self.session_factory() as session:
+                result = await self.process_data_service.rank_and_save_top_predictions(
+                    db=session,
+                    industry_codes=[industry_code],
+                    periods=periods,
+                    target_dates=[today],
+                )
+                if result["failed"]:
+                    raise Exception(f"Ranking failed for periods: {result['failed']}")
+
+                try:
+                    await self.predict_service.refresh_top_prediction_cache(
+                        db=session,
+                        industries=[industry_code],
+                        periods=periods,
+                        closing_price_date=today,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to refresh top prediction cache: {e}")
+
+        stages = [PipelineStage(name="pull", run=pull)]
+        for industry_code in industry_codes:
+            infer_stage = f"infer:{industry_code.value}"
+            stages.append(
+                PipelineStage(
+                    name=infer_stage,
+                    run=functools.partial(infer, industry_code),
+                    depends_on=("pull",),
+                )
+            )
+            stages.append(
+                PipelineStage(
+                    name=f"rank:{industry_code.value}",
+                    run=functools.partial(rank, industry_code),
+                    depends_on=(infer_stage,),
+                )
+            )
+
+        pipeline = NightlyPipeline(
+            load_state=self._load_nightly_pipeline_state,
+            save_state=self._save_nightly_pipeline_state,
+        )
+        state = await pipeline.run(run_date=today, stages=stages)
+
+        await self._report_nightly_stage(
+            db=db,
+            job_type=JobTypeEnum.PULL_TRADING_DATA,
+            state=state,
+            stage_names=["pull"],
+            success_message=f"Failed tickers: {failed_tickers}",
+        )
+        if not run_inference:
+            await self._handle_job_executed(
+                db=db,
+                job_type=JobTypeEnum.INFERENCE,
+                job_status=JobStatusEnum.SKIPPED,
+                additional_message="Skip reason: circuit breaker flag.",
+                is_critical=False,
+                mention_everyone=False,
+                tags=["nightly"],
+            )
+            return
+        await self._report_nightly_stage(
+            db=db,
+            job_type=JobTypeEnum.INFERENCE,
+            state=state,
+            stage_names=[f"infer:{code.value}" for code in industry_codes],
+        )
+        await self._report_nightly_stage(
+            db=db,
+            job_type=JobTypeEnum.RANK,
+            state=state,
+            stage_names=[f"rank:{code.value}" for code in industry_codes],
+        )
+
+        failed_stages = [name for name in state.stages if not state.succeeded(name)]
+        if failed_stages:
+            raise Exception(f"Nightly pipeline failed for stages: {failed_stages}")
+
+    async def _report_nightly_stage(
+        self,
+        db: AsyncSession,
+        job_type: JobTypeEnum,
+        state: NightlyPipelineState,
+        stage_names: list[str],
+        success_message: Optional[str] = None,
+    ) -> None:
+        failed = [name for name in stage_names if not state.succeeded(name)]
+        if failed:
+            error_msg = "\n".join(
+                f"{name}: {state.errors.get(name, state.stages.get(name))}"
+                for name in failed
+            )
+            await self._handle_job_executed(
+                db=db,
+                job_type=job_type,
+                job_status=JobStatusEnum.FAILED,
+                additional_message=f"Some stages failed:\n{error_msg}",
+                is_critical=True,
+                mention_everyone=True,
+                tags=["nightly"],
+            )
+            return
+
+        await self._handle_job_executed(
+            db=db,
+            job_type=job_type,
+            job_status=JobStatusEnum.SUCCESS,
+            additional_message=success_message,
+            is_critical=False,
+            mention_everyone=False,
+            tags=["nightly"],
+        )
+
+    async def _load_nightly_pipeline_state(self) -> Optional[str]:
+        async with self.session_factory() as session:
+            try:
+                return await self.job_config_service.get_job_config(
+                    db=session, key=JobConfigEnum.NIGHTLY_PIPELINE_STATE
+                )
+            except ResourceNotFoundError:
+                return None
+
+    async def _save_nightly_pipeline_state(self, value: str) -> None:
+        async with self.session_factory() as session:
+            await self.job_config_service.set_job_config(
+                db=session,
+                key=JobConfigEnum.NIGHTLY_PIPELINE_STATE,
+                value=value,
+                notify=False,
+            )
+
     async def scheduled_evaluate_accuracy(self, db: AsyncSession) -> None:
         keys = [
             JobConfigEnum.EVALUATE_CIRCUIT_BREAKER,
@@ -368,7 +653,7 @@ class SchedulerJobService:
         today = get_today_bangkok_date()
 
         try:
-            await self.process_data_service.accuracy(
+            result = await self.process_data_service.accuracy(
                 db=db,
                 target_date=today,
                 days_back=days_back,
@@ -379,6 +664,7 @@ class SchedulerJobService:
                 db=db,
                 job_type=JobTypeEnum.EVALUATION,
                 job_status=JobStatusEnum.SUCCESS,
+                additional_message=result.summary(),
                 is_critical=False,
                 mention_everyone=False,
             )
@@ -408,6 +694,14 @@ class SchedulerJobService:
         predictions_days_back: int = job_configs[
             JobConfigEnum.CLEANUP_PREDICTIONS_DAYS_BACK
         ]
+        today = get_today_bangkok_date()
+
+        # writers create missing partitions themselves, this keeps it off their path
+        try:
+            await self.partition_service.ensure_future_partitions(db=db, today=today)
+        except Exception as e:
+            logger.warning(f"Failed to create future partitions: {e}")
+
         if circuit_breaker:
             await self._handle_job_executed(
                 db=db,
@@ -419,10 +713,8 @@ class SchedulerJobService:
             )
             return
 
-        today = get_today_bangkok_date()
-
         try:
-            await self.cleanup_data_service.clean_data(
+            results = await self.cleanup_data_service.clean_data(
                 db=db,
                 target_date=today,
                 trading_data_days_back=trading_data_days_back,
@@ -433,6 +725,7 @@ class SchedulerJobService:
                 db=db,
                 job_type=JobTypeEnum.CLEANUP,
                 job_status=JobStatusEnum.SUCCESS,
+                additional_message="\n".join(result.summary() for result in results),
                 is_critical=False,
                 mention_everyone=False,
             )
@@ -450,6 +743,7 @@ class SchedulerJobService:
             raise e
 
 
+@app_scoped
 def get_scheduler_job_service() -> SchedulerJobService:
     return SchedulerJobService(
         job_config_service=get_job_config_service(),
@@ -458,4 +752,7 @@ def get_scheduler_job_service() -> SchedulerJobService:
         inference_service=get_inference_service(),
         cleanup_data_service=get_cleanup_data_service(),
         stock_service=get_stock_service(),
+        predict_service=get_predict_service(),
+        partition_service=get_partition_service(),
+        session_factory=AsyncSessionLocal,
     )
@@ -3,14 +3,20 @@ from typing import Any, Optional
 
 import httpx
 
+from app.core.clients.http_client_pool import (
+    PooledHttpClient,
+    get_discord_http_client,
+)
+from app.core.dependencies.container import app_scoped
 from app.core.settings.config import get_config
 
 logger = logging.getLogger(__name__)
 
 
 class DiscordClient:
-    def __init__(self):
+    def __init__(self, http_client: Optional[PooledHttpClient] = None):
         self.base_url = get_config().DISCORD_WEBHOOK_URL
+        self.http = http_client or get_discord_http_client()
 
     async def post(self, data: Optional[dict[str, Any]] = None) -> Any:
         return await self._request("POST", json=data)
@@ -20,19 +26,14 @@ class DiscordClient:
         method: str,
         json: Optional[dict[str, Any]] = None,
     ) -> Any:
-        httpx_logger = logging.getLogger("httpx")
-        original_level = httpx_logger.level
-        httpx_logger.setLevel(logging.WARNING)
-
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.request(
-                    method=method,
-                    url=self.base_url,
-                    json=json,
-                )
-                response.raise_for_status()
-                return response.status_code in (200, 204)
+            response = await self.http.request(
+                method=method,
+                url=self.base_url,
+                json=json,
+            )
+            response.raise_for_status()
+            return response.status_code in (200, 204)
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"HTTP error {e.response.status_code}: {e.response.text}")
@@ -41,9 +42,6 @@ class DiscordClient:
         except Exception as e:
             logger.warning(f"Unhandled DiscordClient error: {str(e)}")
 
-        finally:
-            httpx_logger.setLevel(original_level)
-
         return False
 
 
@@ -66,5 +64,6 @@ class DiscordOperations:
         return await self.client.post(data=payload)
 
 
+@app_scoped
 def get_discord_operations() -> DiscordOperations:
     return DiscordOperations()
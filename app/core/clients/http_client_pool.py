@@ -0,0 +1,203 @@
+import importlib.util
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+import httpx
+
+from app.core.common.utils.request_profiler import record_client_call
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+def is_http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HttpClientStats:
+    requests: int = 0
+    failed_requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    # requests that started while every pooled connection was already busy
+    saturated_requests: int = 0
+    pool_timeouts: int = 0
+
+
+class PooledHttpClient:
+    """
+    One long-lived `httpx.AsyncClient` with a bounded, keep-alive connection pool.
+
+    The client is opened with `start()` from the application lifespan and closed
+    with `aclose()`. Outside of the lifespan (scripts, jobs, tests) it is opened
+    lazily on first use. Connection reuse and pool saturation are counted in
+    `stats` so the pool limits can be sized from real traffic.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str = "",
+        headers: Optional[dict[str, str]] = None,
+        timeout: float = 30,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.name = name
+        self.base_url = base_url
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = is_http2_available() if http2 is None else http2
+        self.transport = transport
+        self.stats = HttpClientStats()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self.start()
+        return self._client
+
+    def start(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            return
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=self.transport,
+        )
+        logger.info(
+            f"Started HTTP client '{self.name}' "
+            f"(max connections: {self.limits.max_connections}, http2: {self.http2})"
+        )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info(f"Closed HTTP client '{self.name}'")
+
+    async def request(
+        self, method: str, url: str, timeout: Optional[float] = None, **kwargs
+    ) -> httpx.Response:
+        stats = self.stats
+        stats.requests += 1
+        if stats.in_flight >= self.limits.max_connections:
+            stats.saturated_requests += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+
+        opened = False
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+
+        extensions = {"trace": trace}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = await self.client.request(
+                method, url, extensions=extensions, **kwargs
+            )
+            failed = False
+        except httpx.PoolTimeout:
+            stats.pool_timeouts += 1
+            stats.failed_requests += 1
+            raise
+        except Exception:
+            stats.failed_requests += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            record_client_call(self.name, time.perf_counter() - start, failed)
+            if opened:
+                stats.connections_opened += 1
+
+        if not opened:
+            stats.connections_reused += 1
+        return response
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **asdict(self.stats),
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "http2": self.http2,
+        }
+
+
+_ml_server_http_client: Optional[PooledHttpClient] = None
+_discord_http_client: Optional[PooledHttpClient] = None
+
+
+def get_ml_server_http_client() -> PooledHttpClient:
+    global _ml_server_http_client
+    if _ml_server_http_client is None:
+        config = get_config()
+        _ml_server_http_client = PooledHttpClient(
+            name="ml_server",
+            base_url=config.ML_SERVER_URL,
+            headers={
+                "X-API-Key": config.ML_SERVER_API_KEY,
+                "Content-Type": "application/json",
+            },
+            timeout=config.ML_SERVER_TIMEOUT_SECONDS,
+            max_connections=config.ML_SERVER_MAX_CONNECTIONS,
+            max_keepalive_connections=config.ML_SERVER_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+    return _ml_server_http_client
+
+
+def get_discord_http_client() -> PooledHttpClient:
+    global _discord_http_client
+    if _discord_http_client is None:
+        config = get_config()
+        _discord_http_client = PooledHttpClient(
+            name="discord",
+            timeout=config.DISCORD_TIMEOUT_SECONDS,
+            max_connections=config.DISCORD_MAX_CONNECTIONS,
+            max_keepalive_connections=config.DISCORD_MAX_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+    return _discord_http_client
+
+
+def start_http_clients() -> None:
+    get_ml_server_http_client().start()
+    get_discord_http_client().start()
+
+
+async def close_http_clients() -> None:
+    for client in (_ml_server_http_client, _discord_http_client):
+        if client is not None:
+            await client.aclose()
+
+
+def get_http_client_stats() -> dict[str, dict[str, Any]]:
+    return {
+        client.name: client.get_stats()
+        for client in (_ml_server_http_client, _discord_http_client)
+        if client is not None
+    }
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from app.core.common.utils.request_profiler import record_client_call
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+TICKER_SUFFIX = ".BK"
+
+
+@dataclass
+class MarketDataResult:
+    rows: list[dict] = field(default_factory=list)
+    failed_tickers: list[str] = field(default_factory=list)
+
+
+class MarketDataClient:
+    """
+    Downloads daily OHLCV from yfinance in batches of tickers per request.
+
+    `yf.download` keeps its results in module-level state, so two downloads must
+    never run at the same time. The batches run one after another on a single
+    worker thread, which keeps the event loop free, and each download fetches its
+    tickers with `threads` threads of yfinance itself. Every requested ticker ends
+    up either in `rows` or in `failed_tickers`.
+    """
+
+    def __init__(
+        self,
+        downloader: Callable[..., Optional[pd.DataFrame]] = yf.download,
+        batch_size: int = 50,
+        threads: int = 4,
+    ):
+        self.downloader = downloader
+        self.batch_size = max(batch_size, 1)
+        self.threads = max(threads, 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="market-data"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def fetch(
+        self, stock_tickers: list[str], start_date: date, end_date: date
+    ) -> MarketDataResult:
+        """
+        Fetch rows for every ticker between `start_date` (inclusive) and `end_date`
+        (exclusive), as yfinance does.
+        """
+        batches = [
+            stock_tickers[i : i + self.batch_size]  # noqa: E203
+            for i in range(0, len(stock_tickers), self.batch_size)
+        ]
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        batch_results = []
+        for batch in batches:
+            try:
+                batch_results.append(
+                    await loop.run_in_executor(
+                        self.executor, self._download_batch, batch, start_date, end_date
+                    )
+                )
+            except Exception as e:
+                batch_results.append(e)
+        record_client_call(
+            "market_data",
+            time.perf_counter() - start,
+            failed=any(isinstance(r, BaseException) for r in batch_results),
+        )
+
+        result = MarketDataResult()
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                logger.error(f"Failed to fetch data for batch {batch}: {batch_result}")
+                result.failed_tickers.extend(batch)
+                continue
+            rows, failed = batch_result
+            result.rows.extend(rows)
+            result.failed_tickers.extend(failed)
+
+        return result
+
+    def _download_batch(
+        self, batch: list[str], start_date: date, end_date: date
+    ) -> tuple[list[dict], list[str]]:
+        data = self.downloader(
+            [stock_ticker + TICKER_SUFFIX for stock_ticker in batch],
+            start=start_date,
+            end=end_date,
+            auto_adjust=True,
+            group_by="ticker",
+            threads=self.threads,
+            progress=False,
+        )
+
+        rows, failed = [], []
+        for stock_ticker in batch:
+            try:
+                ticker_rows = self._extract_rows(data, stock_ticker, len(batch))
+            except Exception as e:
+                logger.error(f"Failed to parse data for {stock_ticker}: {e}")
+                ticker_rows = []
+
+            if ticker_rows:
+                rows.extend(ticker_rows)
+            else:
+                logger.error(f"No trading data returned for {stock_ticker}")
+                failed.append(stock_ticker)
+
+        return rows, failed
+
+    @staticmethod
+    def _extract_rows(
+        data: Optional[pd.DataFrame], stock_ticker: str, batch_size: int
+    ) -> list[dict]:
+        if data is None or data.empty:
+            return []
+
+        ticker = stock_ticker + TICKER_SUFFIX
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                return []
+            frame = data[ticker]
+        elif batch_size == 1:
+            frame = data
+        else:
+            return []
+
+        rows = []
+        for index, row in frame.iterrows():
+            if pd.isna(row["Close"]) or pd.isna(row["Volume"]):
+                continue
+            rows.append(
+                {
+                    "stock_ticker": stock_ticker,
+                    "target_date": pd.Timestamp(index).date(),
+                    "close": float(row["Close"]),
+                    "open": float(row["Open"]),
+                    "high": float(row["High"]),
+                    "low": float(row["Low"]),
+                    "volumes": int(row["Volume"]),
+                }
+            )
+        return rows
+
+
+_market_data_client: Optional[MarketDataClient] = None
+
+
+def get_market_data_client() -> MarketDataClient:
+    global _market_data_client
+    if _market_data_client is None:
+        config = get_config()
+        _market_data_client = MarketDataClient(
+            batch_size=config.MARKET_DATA_BATCH_SIZE,
+            threads=config.MARKET_DATA_DOWNLOAD_THREADS,
+        )
+    return _market_data_client
+
+
+def shutdown_market_data_client() -> None:
+    if _market_data_client is not None:
+        _market_data_client.shutdown()
@@ -3,16 +3,23 @@ from typing import Any, Optional
 
 import httpx
 
+from app.core.clients.http_client_pool import (
+    PooledHttpClient,
+    get_ml_server_http_client,
+)
 from app.core.settings.config import get_config
 
 logger = logging.getLogger(__name__)
 
 
 class MLServerClient:
-    def __init__(self):
-        self.base_url = get_config().ML_SERVER_URL
-        self.api_key = get_config().ML_SERVER_API_KEY
-        self.headers = {"X-API-Key": self.api_key, "Content-Type": "application/json"}
+    def __init__(self, http_client: Optional[PooledHttpClient] = None):
+        self.http = http_client or get_ml_server_http_client()
+        self.base_url = self.http.base_url
+        # endpoints that need more (or less) than the client-wide timeout
+        self.endpoint_timeouts = {
+            "/predict": get_config().ML_SERVER_PREDICT_TIMEOUT_SECONDS,
+        }
 
     async def get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> Any:
         return await self._request("GET", endpoint, params=params)
@@ -29,22 +36,21 @@ class MLServerClient:
     ) -> Any:
         url = f"{self.base_url}{endpoint}"
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    params=params,
-                    json=json,
-                )
-                response.raise_for_status()
-                json_data = response.json()
-
-                if json_data.get("status") == "success":
-                    return json_data.get("data")
-
-                logger.error(f"ML server error @ {url}: {json_data.get('message')}")
-                raise Exception(f"ML server error: {json_data.get('message')}")
+            response = await self.http.request(
+                method=method,
+                url=endpoint,
+                params=params,
+                json=json,
+                timeout=self.endpoint_timeouts.get(endpoint),
+            )
+            response.raise_for_status()
+            json_data = response.json()
+
+            if json_data.get("status") == "success":
+                return json_data.get("data")
+
+            logger.error(f"ML server error @ {url}: {json_data.get('message')}")
+            raise Exception(f"ML server error: {json_data.get('message')}")
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -4,6 +4,7 @@ from typing import Any, Awaitable, Callable
 from app.api.ml_ops.schemas.inference_schema import StockToPredictRequestSchema
 from app.core.clients.ml_server_client import MLServerClient
 from app.core.common.exceptions.custom_exceptions import MLServerError
+from app.core.dependencies.container import app_scoped
 
 logger = logging.getLogger(__name__)
 
@@ -40,5 +41,6 @@ class MLServerOperations:
         )
 
 
+@app_scoped
 def get_ml_server_operations() -> MLServerOperations:
     return MLServerOperations(client=MLServerClient())
@@ -1,26 +1,92 @@
 import logging
+import random
+import time
+from typing import Optional
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.common.utils.latency_histogram import (
+    LatencyHistogram,
+    get_latency_histogram,
+)
+from app.core.settings.config import get_config
 
 logger = logging.getLogger(__name__)
 
+UNMATCHED_ROUTE = "<unmatched>"
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all incoming API requests and execution time."""
 
-    async def dispatch(self, request: Request, call_next):
-        try:
-            request_data = await request.body()
-            request_body = (
-                request_data.decode("utf-8", "ignore") if request_data else "No Body"
-            )
-        except Exception:
-            request_body = "Unreadable Body"
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware that logs every request with its status and execution
+    time, and records the latency per route template.
+
+    Bodies are streamed to the app untouched. For a `body_sample_rate` share of
+    requests, only the first `max_body_bytes` of the body are kept for the log.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        body_sample_rate: Optional[float] = None,
+        max_body_bytes: Optional[int] = None,
+        histogram: Optional[LatencyHistogram] = None,
+    ):
+        self.app = app
+        if body_sample_rate is None or max_body_bytes is None:
+            config = get_config()
+            if body_sample_rate is None:
+                body_sample_rate = config.LOG_REQUEST_BODY_SAMPLE_RATE
+            if max_body_bytes is None:
+                max_body_bytes = config.LOG_REQUEST_BODY_MAX_BYTES
+        self.body_sample_rate = body_sample_rate
+        self.max_body_bytes = max_body_bytes
+        self.histogram = histogram or get_latency_histogram()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        logger.info(f"Request | {request.method} {request.url} | Body: {request_body}")
+        start = time.perf_counter()
+        sampled = self.max_body_bytes > 0 and random.random() < self.body_sample_rate
+        body_prefix = bytearray()
+        body_size = 0
+        status_code = 500
 
-        return await call_next(request)
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                if sampled and len(body_prefix) < self.max_body_bytes:
+                    body_prefix.extend(chunk[: self.max_body_bytes - len(body_prefix)])
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            self.histogram.observe(scope["method"], route_path, status_code, elapsed)
+
+            message = (
+                f"Request | {scope['method']} {scope['path']} | {status_code} "
+                f"| {elapsed * 1000:.1f}ms"
+            )
+            if sampled and body_size:
+                body = body_prefix.decode("utf-8", "ignore")
+                truncated = "..." if body_size > len(body_prefix) else ""
+                message += f" | Body ({body_size} bytes): {body}{truncated}"
+            logger.info(message)
 
 
 def logging_middleware_factory():
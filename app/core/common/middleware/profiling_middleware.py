@@ -0,0 +1,123 @@
+import hmac
+import logging
+import threading
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.common.utils.request_profiler import (
+    ProfileStore,
+    RequestProfile,
+    SamplingProfiler,
+    get_profile_store,
+    reset_current_profile,
+    set_current_profile,
+)
+from app.core.enums.roles_enum import RoleEnum
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+API_KEY_HEADER = b"x-api-key"
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that profiles single requests on demand.
+
+    A request with an `X-Profile` header and the backend API key runs with a
+    sampling profiler on the event loop thread, and with its SQL statements,
+    downstream client calls and measurement timers recorded. The profile is kept
+    in a `ProfileStore` and its id returned in an `X-Profile-Id` header, to be
+    read from `/internal/metrics/profiles`. Only one request is profiled at a
+    time; any other request, with or without the header, is passed through
+    untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend_api_key: Optional[str] = None,
+        sample_interval_seconds: Optional[float] = None,
+        store: Optional[ProfileStore] = None,
+    ):
+        self.app = app
+        if backend_api_key is None or sample_interval_seconds is None:
+            config = get_config()
+            if backend_api_key is None:
+                backend_api_key = config.ALLOWED_API_KEYS[RoleEnum.BACKEND.value]
+            if sample_interval_seconds is None:
+                sample_interval_seconds = config.PROFILE_SAMPLE_INTERVAL_MS / 1000
+        self.backend_api_key = backend_api_key.encode()
+        self.sample_interval_seconds = sample_interval_seconds
+        self.store = store or get_profile_store()
+        self._busy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        profile = RequestProfile(
+            method=scope["method"],
+            path=scope["path"],
+            sample_interval_seconds=self.sample_interval_seconds,
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_ID_HEADER, profile.id.encode()),
+                ]
+            await send(message)
+
+        token = set_current_profile(profile)
+        profiler = SamplingProfiler(
+            thread_id=threading.get_ident(),
+            interval_seconds=self.sample_interval_seconds,
+        )
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.stacks = profiler.stop()
+            profile.elapsed_seconds = time.perf_counter() - start
+            reset_current_profile(token)
+            self.store.add(profile)
+            self._busy = False
+            logger.info(
+                f"Profiled {profile.method} {profile.path} as {profile.id} "
+                f"({profile.elapsed_seconds * 1000:.1f}ms, "
+                f"{sum(profile.stacks.values())} samples)"
+            )
+
+    def _should_profile(self, scope: Scope) -> bool:
+        headers = scope["headers"]
+        if not any(name == PROFILE_HEADER for name, _ in headers):
+            return False
+
+        api_key = next(
+            (value for name, value in headers if name == API_KEY_HEADER), b""
+        )
+        if not hmac.compare_digest(api_key, self.backend_api_key):
+            logger.warning(
+                f"Ignored profiling request without the backend key: {scope['path']}"
+            )
+            return False
+        if self._busy:
+            logger.warning(
+                f"Another request is being profiled, skipped: {scope['path']}"
+            )
+            return False
+        return True
+
+
+def profiling_middleware_factory():
+    return ProfilingMiddleware
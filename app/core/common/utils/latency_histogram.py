@@ -0,0 +1,101 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# upper bounds in milliseconds, the last bucket catches everything slower
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+@dataclass
+class RouteLatency:
+    bucket_counts: list[int]
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram per `(method, route template)`.
+
+    Routes are keyed by their template (`/public/predict/{industry}`), not the
+    concrete path, so the number of series stays bounded. Percentiles are read
+    from the bucket bounds, which is accurate to one bucket.
+    """
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._routes: dict[tuple[str, str], RouteLatency] = {}
+
+    def observe(self, method: str, route: str, status: int | str, seconds: float):
+        key = (method, route)
+        latency = self._routes.get(key)
+        if latency is None:
+            latency = self._routes[key] = RouteLatency(
+                bucket_counts=[0] * (len(self.buckets_ms) + 1)
+            )
+
+        elapsed_ms = seconds * 1000
+        latency.bucket_counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        latency.count += 1
+        latency.total_ms += elapsed_ms
+        latency.max_ms = max(latency.max_ms, elapsed_ms)
+        # HTTP codes are counted per class, other statuses (e.g. "error") as given
+        if isinstance(status, int):
+            status = f"{status // 100}xx"
+        latency.statuses[status] = latency.statuses.get(status, 0) + 1
+
+    def _percentile(self, latency: RouteLatency, q: float) -> Optional[float]:
+        if latency.count == 0:
+            return None
+        rank = q * latency.count
+        seen = 0
+        for i, bucket_count in enumerate(latency.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                # the overflow bucket has no bound, report the slowest seen
+                if i < len(self.buckets_ms):
+                    return min(self.buckets_ms[i], latency.max_ms)
+                return latency.max_ms
+        return latency.max_ms
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        rows = []
+        for (method, route), latency in sorted(self._routes.items()):
+            rows.append(
+                {
+                    "method": method,
+                    "route": route,
+                    "count": latency.count,
+                    "mean_ms": round(latency.total_ms / latency.count, 3),
+                    "p50_ms": self._percentile(latency, 0.5),
+                    "p95_ms": self._percentile(latency, 0.95),
+                    "p99_ms": self._percentile(latency, 0.99),
+                    "max_ms": round(latency.max_ms, 3),
+                    "statuses": dict(latency.statuses),
+                    "buckets": {
+                        **{
+                            f"le_{bound}": count
+                            for bound, count in zip(
+                                self.buckets_ms, latency.bucket_counts
+                            )
+                        },
+                        "inf": latency.bucket_counts[-1],
+                    },
+                }
+            )
+        return rows
+
+    def reset(self) -> None:
+        self._routes.clear()
+
+
+_latency_histogram: Optional[LatencyHistogram] = None
+
+
+def get_latency_histogram() -> LatencyHistogram:
+    global _latency_histogram
+    if _latency_histogram is None:
+        _latency_histogram = LatencyHistogram()
+    return _latency_histogram
@@ -1,11 +1,14 @@
+import asyncio
 import enum
+import json
 import logging
+import os
 import time
-from typing import Optional
-
-from google.auth import default
-from google.cloud import monitoring_v3
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
 
+from app.core.common.utils.request_profiler import get_current_profile
 from app.core.enums.measurement_enum import (
     MeasurementMetric,
     MeasurementTag,
@@ -15,14 +18,239 @@ from app.core.settings.config import get_config
 
 logger = logging.getLogger(__name__)
 
-try:
-    credentials, project_id = default()
-    client = monitoring_v3.MetricServiceClient(credentials=credentials)
-    project_name = f"projects/{project_id}"
-except Exception as e:
-    logging.warning(f"[METRICS] Failed to init monitoring client: {e}")
-    client = None
-    project_name = None
+# Cloud Monitoring accepts at most 200 time series per create_time_series call
+GCP_MAX_SERIES_PER_REQUEST = 200
+
+
+@dataclass
+class MetricSeries:
+    """All points of one (metric, labels) series recorded since the last flush."""
+
+    metric: str
+    labels: dict[str, str]
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+    last: float = 0.0
+    start_time: float = field(default_factory=time.time)
+    end_time: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+        self.end_time = time.time()
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricSink(ABC):
+    """Destination of flushed series. `write` is blocking and runs in a thread."""
+
+    @abstractmethod
+    def write(self, series: list[MetricSeries]) -> None:
+        pass
+
+
+class GcpMetricSink(MetricSink):
+    """Writes the mean of every series as one point to Cloud Monitoring."""
+
+    def __init__(self, client: Any, project_name: str):
+        self.client = client
+        self.project_name = project_name
+
+    @classmethod
+    def from_default_credentials(cls) -> Optional["GcpMetricSink"]:
+        try:
+            from google.auth import default
+            from google.cloud import monitoring_v3
+
+            credentials, project_id = default()
+            client = monitoring_v3.MetricServiceClient(credentials=credentials)
+            return cls(client=client, project_name=f"projects/{project_id}")
+        except Exception as e:
+            logger.warning(f"[METRICS] Failed to init monitoring client: {e}")
+            return None
+
+    def write(self, series: list[MetricSeries]) -> None:
+        from google.cloud import monitoring_v3
+
+        time_series = []
+        for s in series:
+            ts = monitoring_v3.TimeSeries()
+            ts.metric.type = f"custom.googleapis.com/stockie-service/{s.metric}"
+            ts.resource.type = "global"
+            for key, value in s.labels.items():
+                ts.metric.labels[key] = value
+            ts.points = [
+                monitoring_v3.Point(
+                    {
+                        "interval": {"end_time": {"seconds": int(s.end_time)}},
+                        "value": {"double_value": s.mean},
+                    }
+                )
+            ]
+            time_series.append(ts)
+
+        for i in range(0, len(time_series), GCP_MAX_SERIES_PER_REQUEST):
+            self.client.create_time_series(
+                name=self.project_name,
+                time_series=time_series[
+                    i : i + GCP_MAX_SERIES_PER_REQUEST  # noqa: E203
+                ],
+            )
+
+
+class FileMetricSink(MetricSink):
+    """Appends every series as one JSON line, for local runs."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, series: list[MetricSeries]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a") as f:
+            for s in series:
+                f.write(json.dumps({**asdict(s), "mean": s.mean}) + "\n")
+
+
+class InMemoryMetricSink(MetricSink):
+    def __init__(self):
+        self.series: list[MetricSeries] = []
+
+    def write(self, series: list[MetricSeries]) -> None:
+        self.series.extend(series)
+
+
+class MetricsBuffer:
+    """
+    In-process buffer between `send_metric` and a `MetricSink`.
+
+    Recording only aggregates the value into its series, so it never blocks the
+    event loop. A background task flushes every `flush_interval_seconds`, or early
+    once `flush_threshold` series are buffered, and writes to the sink in a thread.
+    When `max_series` series are already waiting, points of new series are dropped
+    and counted instead of growing the buffer.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[MetricSink],
+        flush_interval_seconds: float = 60,
+        flush_threshold: int = 200,
+        max_series: int = 1000,
+    ):
+        self.sink = sink
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_threshold = flush_threshold
+        self.max_series = max_series
+        self.dropped_points = 0
+        self.failed_flushes = 0
+        self.flushed_series = 0
+        self._series: dict[tuple, MetricSeries] = {}
+        self._flush_requested = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, metric: str, value: float, labels: dict[str, str]) -> None:
+        if self.sink is None:
+            return
+
+        key = (metric, tuple(sorted(labels.items())))
+        series = self._series.get(key)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                self.dropped_points += 1
+                return
+            series = self._series[key] = MetricSeries(metric=metric, labels=labels)
+        series.add(value)
+
+        if len(self._series) >= self.flush_threshold:
+            self._flush_requested.set()
+
+    async def flush(self) -> int:
+        if not self._series or self.sink is None:
+            return 0
+
+        batch = list(self._series.values())
+        self._series = {}
+        try:
+            await asyncio.to_thread(self.sink.write, batch)
+        except Exception as e:
+            # the points are dropped; retrying would let a dead sink grow the buffer
+            self.failed_flushes += 1
+            self.dropped_points += sum(s.count for s in batch)
+            logger.error(f"[METRICS] Failed to flush {len(batch)} series: {e}")
+            return 0
+        self.flushed_series += len(batch)
+        return len(batch)
+
+    async def start(self) -> None:
+        if self.sink is not None and (self._task is None or self._task.done()):
+            self._flush_requested = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "sink": type(self.sink).__name__ if self.sink else None,
+            "buffered_series": len(self._series),
+            "flushed_series": self.flushed_series,
+            "dropped_points": self.dropped_points,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+_metrics_buffer: Optional[MetricsBuffer] = None
+
+
+def create_metric_sink(sink_name: str, file_path: str) -> Optional[MetricSink]:
+    if sink_name == "gcp":
+        return GcpMetricSink.from_default_credentials()
+    if sink_name == "file":
+        return FileMetricSink(file_path)
+    if sink_name == "memory":
+        return InMemoryMetricSink()
+    return None
+
+
+def get_metrics_buffer() -> MetricsBuffer:
+    global _metrics_buffer
+    if _metrics_buffer is None:
+        config = get_config()
+        _metrics_buffer = MetricsBuffer(
+            sink=create_metric_sink(config.METRICS_SINK, config.METRICS_FILE_PATH),
+            flush_interval_seconds=config.METRICS_FLUSH_INTERVAL_SECONDS,
+            flush_threshold=config.METRICS_FLUSH_THRESHOLD,
+            max_series=config.METRICS_MAX_SERIES,
+        )
+    return _metrics_buffer
 
 
 def send_metric(
@@ -30,37 +258,25 @@ def send_metric(
     value: str | float,
     tags: Optional[dict[MeasurementTag, MeasurementValue | str | float | int]] = None,
 ) -> None:
-    if client is None or project_name is None:
-        return
-
     try:
-        series = monitoring_v3.TimeSeries()
-        series.metric.type = f"custom.googleapis.com/stockie-service/{metric.value}"
-        series.resource.type = "global"
-
         env_str = get_config().ENVIRONMENT.lower()
         env = (
             MeasurementValue.prod.value
             if env_str == "prod"
             else MeasurementValue.local.value
         )
-        series.metric.labels[MeasurementTag.env.value] = env
+        labels = {MeasurementTag.env.value: env}
 
         if tags:
             for key, val in tags.items():
                 if isinstance(val, enum.Enum):
                     val = val.value
-                series.metric.labels[key.value] = str(val)
-
-        now = int(time.time())
-        point = monitoring_v3.Point(
-            {
-                "interval": {"end_time": {"seconds": now}},
-                "value": {"double_value": float(value)},
-            }
-        )
-        series.points = [point]
+                labels[key.value] = str(val)
+
+        get_metrics_buffer().record(metric.value, float(value), labels)
 
-        client.create_time_series(name=project_name, time_series=[series])
+        profile = get_current_profile()
+        if profile is not None:
+            profile.record_timer(metric.value, float(value))
     except Exception as e:
-        logging.error(f"[METRICS] Failed to send metric {metric}: {e}")
+        logger.error(f"[METRICS] Failed to record metric {metric}: {e}")
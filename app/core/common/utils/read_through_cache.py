@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from cachetools import TTLCache
+
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class ReadThroughCache:
+    """
+    Read-through cache for serialized (JSON string) responses.
+
+    Values live in Redis under `{namespace}:{key}`. Concurrent misses on the same
+    key share one loader call (single-flight), so a cold key costs one database
+    round trip no matter how many requests arrive at once. When Redis errors, reads
+    and writes fall back to an in-process LRU with a short TTL until it recovers.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        namespace: str = "stockie",
+        ttl_seconds: int = 86400,
+        local_maxsize: int = 1024,
+        local_ttl_seconds: int = 300,
+    ):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.local = TTLCache(maxsize=local_maxsize, ttl=local_ttl_seconds)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self.redis.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis get failed for '{key}', using local cache: {e}")
+            return self.local.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None):
+        try:
+            await self.redis.set(
+                self._key(key), value, ex=ttl_seconds or self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Redis set failed for '{key}', using local cache: {e}")
+            self.local[key] = value
+
+    async def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self.local.pop(key, None)
+        try:
+            await self.redis.delete(*(self._key(key) for key in keys))
+        except Exception as e:
+            logger.warning(f"Redis delete failed for {list(keys)}: {e}")
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        for key in [key for key in self.local if key.startswith(prefix)]:
+            self.local.pop(key, None)
+        try:
+            keys = [
+                key async for key in self.redis.scan_iter(match=self._key(f"{prefix}*"))
+            ]
+            if keys:
+                await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis delete failed for prefix '{prefix}': {e}")
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        ttl_seconds: Optional[int] = None,
+    ) -> str:
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            await self.set(key, value, ttl_seconds=ttl_seconds)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # waiters re-raise it; mark it retrieved in case there are none
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+
+_read_through_cache: Optional[ReadThroughCache] = None
+
+
+def get_read_through_cache() -> ReadThroughCache:
+    global _read_through_cache
+    if _read_through_cache is None:
+        # redis_client reads the config when it is imported
+        from app.core.clients.redis_client import redis_client
+
+        config = get_config()
+        _read_through_cache = ReadThroughCache(
+            redis_client=redis_client,
+            ttl_seconds=config.CACHE_TTL_SECONDS,
+            local_maxsize=config.CACHE_LOCAL_MAXSIZE,
+            local_ttl_seconds=config.CACHE_LOCAL_TTL_SECONDS,
+        )
+    return _read_through_cache
@@ -0,0 +1,207 @@
+import os
+import sys
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from app.core.common.utils.datetime_utils import get_now_bangkok_datetime
+from app.core.common.utils.statement_stats import fingerprint_id, fingerprint_statement
+from app.core.settings.config import get_config
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    failed: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float, failed: bool = False) -> None:
+        self.count += 1
+        self.failed += int(failed)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+@dataclass
+class RequestProfile:
+    """Everything recorded for one profiled request."""
+
+    method: str
+    path: str
+    sample_interval_seconds: float
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started_at: datetime = field(default_factory=get_now_bangkok_datetime)
+    status_code: Optional[int] = None
+    elapsed_seconds: float = 0.0
+    # "outer;inner;innermost" -> samples, the collapsed stack format
+    stacks: Counter = field(default_factory=Counter)
+    statements: dict[str, TimingStats] = field(default_factory=dict)
+    clients: dict[str, TimingStats] = field(default_factory=dict)
+    timers: dict[str, TimingStats] = field(default_factory=dict)
+
+    def record_statement(
+        self, statement: str, seconds: float, error: bool = False
+    ) -> None:
+        fingerprint = fingerprint_statement(statement)
+        self.statements.setdefault(fingerprint, TimingStats()).add(seconds, error)
+
+    def record_client_call(
+        self, client: str, seconds: float, failed: bool = False
+    ) -> None:
+        self.clients.setdefault(client, TimingStats()).add(seconds, failed)
+
+    def record_timer(self, name: str, seconds: float) -> None:
+        self.timers.setdefault(name, TimingStats()).add(seconds)
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed stack format read by flamegraph.pl and speedscope."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "started_at": self.started_at.isoformat(),
+            "elapsed_ms": round(self.elapsed_seconds * 1000, 3),
+            "samples": sum(self.stacks.values()),
+            "statements": sum(s.count for s in self.statements.values()),
+        }
+
+    def to_dict(self, top_stacks: int = 30) -> dict[str, Any]:
+        statements = sorted(
+            self.statements.items(), key=lambda s: s[1].total_seconds, reverse=True
+        )
+        return {
+            **self.summary(),
+            "sample_interval_ms": self.sample_interval_seconds * 1000,
+            "statements": [
+                {
+                    "id": fingerprint_id(fingerprint),
+                    "statement": fingerprint,
+                    **stats.to_dict(),
+                }
+                for fingerprint, stats in statements
+            ],
+            "clients": {name: s.to_dict() for name, s in self.clients.items()},
+            "timers": {name: s.to_dict() for name, s in self.timers.items()},
+            "top_stacks": [
+                {"stack": stack, "samples": count}
+                for stack, count in self.stacks.most_common(top_stacks)
+            ],
+        }
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    return _current_profile.get()
+
+
+def set_current_profile(profile: Optional[RequestProfile]):
+    return _current_profile.set(profile)
+
+
+def reset_current_profile(token) -> None:
+    _current_profile.reset(token)
+
+
+def record_client_call(client: str, seconds: float, failed: bool = False) -> None:
+    """Time of one downstream call, kept only while a request is profiled."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record_client_call(client, seconds, failed)
+
+
+class SamplingProfiler:
+    """
+    Samples the Python stack of one thread from a daemon thread.
+
+    For the event loop thread this shows whatever coroutine is running at each
+    sample, including other requests served at the same time, and the selector
+    while the loop waits for I/O.
+    """
+
+    def __init__(self, thread_id: int, interval_seconds: float, max_depth: int = 64):
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._format_stack(frame)] += 1
+
+    def _format_stack(self, frame) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(
+                f"{code.co_qualname} "
+                f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+class ProfileStore:
+    """The last `max_profiles` request profiles of this instance, in memory."""
+
+    def __init__(self, max_profiles: int = 20):
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> list[dict[str, Any]]:
+        return [profile.summary() for profile in reversed(self._profiles.values())]
+
+
+_profile_store: Optional[ProfileStore] = None
+
+
+def get_profile_store() -> ProfileStore:
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore(max_profiles=get_config().PROFILE_MAX_STORED)
+    return _profile_store
@@ -1,8 +1,9 @@
 import logging
 from typing import Generic, Optional, TypeVar
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from app.core.enums.error_codes_enum import ErrorCodes
 
@@ -16,25 +17,62 @@ class BaseSuccessResponse(BaseModel, Generic[T]):
     data: Optional[T] = None
 
 
+class JSONBytesResponse(Response):
+    """JSON response whose body is already serialized."""
+
+    media_type = "application/json"
+
+
+def describe_payload(data) -> str:
+    """Type and size of a payload, for logs that must not dump it."""
+    if isinstance(data, (list, tuple)):
+        item_type = type(data[0]).__name__ if data else "empty"
+        return f"list[{item_type}] x{len(data)}"
+    if isinstance(data, dict):
+        return f"dict with {len(data)} keys"
+    if isinstance(data, (str, bytes)):
+        return f"{type(data).__name__} of {len(data)} chars"
+    return type(data).__name__
+
+
 def success_response(data=None, message="Success", status_code=ErrorCodes.SUCCESS):
-    if isinstance(data, BaseModel):
-        data = data.model_dump()
-    elif isinstance(data, list) and all(isinstance(item, BaseModel) for item in data):
-        data = [item.model_dump() for item in data]
+    # Pydantic models, dates and enums are serialized in one pass, straight to bytes
+    body = to_json({"status": "success", "message": message, "data": data})
 
     logger.info(
-        f"Success | Status: {status_code.value} | Message: {message} | Data: {data}"
+        f"Success | Status: {status_code.value} | Message: {message} "
+        f"| Data: {describe_payload(data)} | {len(body)} bytes"
     )
 
-    return JSONResponse(
-        status_code=status_code.value,
-        content={
-            "status": "success",
-            "message": message,
-            "data": data,
-        },
+    return JSONBytesResponse(content=body, status_code=status_code.value)
+
+
+def success_json_response(
+    data_json: str | bytes, message="Success", status_code=ErrorCodes.SUCCESS
+):
+    """
+    `success_response` for a payload that is already JSON (e.g. read from the
+    cache). The payload is embedded as is, without being parsed.
+    """
+    if isinstance(data_json, str):
+        data_json = data_json.encode()
+    body = b"".join(
+        (
+            b'{"status":"success","message":',
+            to_json(message),
+            b',"data":',
+            data_json,
+            b"}",
+        )
+    )
+
+    logger.info(
+        f"Success | Status: {status_code.value} | Message: {message} "
+        f"| Data: pre-serialized JSON | {len(body)} bytes"
     )
 
+    return JSONBytesResponse(content=body, status_code=status_code.value)
+
 
 def error_response(
     error_code: ErrorCodes, message="An error occurred", status_code=None
@@ -52,11 +90,13 @@ def error_response(
         f"Error | Code: {error_code.value} | Status: {status_code} | Message: {message}"
     )
 
-    return JSONResponse(
+    return JSONBytesResponse(
+        content=to_json(
+            {
+                "status": "error",
+                "message": message,
+                "error_code": error_code.value,
+            }
+        ),
         status_code=status_code,
-        content={
-            "status": "error",
-            "message": message,
-            "error_code": error_code.value,
-        },
     )
@@ -0,0 +1,92 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+from app.core.common.utils.latency_histogram import LatencyHistogram
+
+OTHER_FINGERPRINT = "<other>"
+
+_WHITESPACE = re.compile(r"\s+")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s")
+# bind parameter lists of any length: IN (?, ?, ...) and VALUES (...), (...)
+_PARAM_LIST = re.compile(r"\((?:\s*\?\s*,?)+\)")
+_REPEATED_ROWS = re.compile(r"(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint_statement(statement: str) -> str:
+    """SQL with whitespace collapsed and bind parameter lists folded to `(...)`."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _PARAM_LIST.sub("(...)", normalized)
+    return _REPEATED_ROWS.sub(r"\1", normalized)
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:12]
+
+
+class StatementStats:
+    """
+    Latency histogram and row counts per statement fingerprint.
+
+    Statements that only differ in their bind parameters, including the length
+    of `IN (...)` lists, share one fingerprint. After `max_fingerprints`
+    distinct ones, new statements are counted under `<other>`.
+    """
+
+    def __init__(self, max_fingerprints: int = 500):
+        self.max_fingerprints = max_fingerprints
+        self.latency = LatencyHistogram()
+        self._rows: dict[str, int] = {}
+
+    def observe(
+        self,
+        statement: str,
+        seconds: float,
+        rows: Optional[int] = None,
+        error: bool = False,
+    ) -> str:
+        fingerprint = fingerprint_statement(statement)
+        if fingerprint not in self._rows and len(self._rows) >= self.max_fingerprints:
+            fingerprint = OTHER_FINGERPRINT
+
+        verb = fingerprint.split(" ", 1)[0].upper()
+        self.latency.observe(verb, fingerprint, "error" if error else "ok", seconds)
+        self._rows[fingerprint] = self._rows.get(fingerprint, 0) + max(rows or 0, 0)
+        return fingerprint
+
+    def snapshot(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Fingerprints ordered by total time spent, slowest first."""
+        rows = []
+        for row in self.latency.snapshot():
+            fingerprint = row.pop("route")
+            total_rows = self._rows.get(fingerprint, 0)
+            rows.append(
+                {
+                    "id": fingerprint_id(fingerprint),
+                    "statement": fingerprint,
+                    "verb": row.pop("method"),
+                    **row,
+                    "total_ms": round(row["mean_ms"] * row["count"], 3),
+                    "rows": total_rows,
+                    "mean_rows": round(total_rows / row["count"], 3),
+                }
+            )
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def reset(self) -> None:
+        self.latency.reset()
+        self._rows.clear()
+
+
+_statement_stats: Optional[StatementStats] = None
+
+
+def get_statement_stats() -> StatementStats:
+    global _statement_stats
+    if _statement_stats is None:
+        _statement_stats = StatementStats()
+    return _statement_stats
@@ -0,0 +1,122 @@
+import bisect
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional
+
+MARKET_HOLIDAYS_FILE = Path(__file__).parent.parent / "data" / "market_holidays.txt"
+
+# years kept around the known holidays, grown on demand for dates outside them
+CALENDAR_YEARS_BEFORE = 10
+CALENDAR_YEARS_AFTER = 10
+
+
+class TradingCalendar:
+    """
+    Sorted index of market open days.
+
+    Open days are every weekday between `start` and `end` that is not a holiday,
+    stored as date ordinals so every lookup is a bisect instead of a day-by-day
+    walk. A date outside the range grows it by whole years first.
+    """
+
+    def __init__(self, holidays: Iterable[date], start: date, end: date):
+        self.holidays = frozenset(holidays)
+        self.start = start
+        self.end = end
+        self._open_ordinals: list[int] = []
+        self._open_set: frozenset[int] = frozenset()
+        self._build()
+
+    @classmethod
+    def from_file(
+        cls, path: Path = MARKET_HOLIDAYS_FILE, today: Optional[date] = None
+    ) -> "TradingCalendar":
+        """Load holidays from a text file of ISO dates (`#` starts a comment)."""
+        holidays = []
+        with open(path) as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    holidays.append(date.fromisoformat(line))
+
+        years = [d.year for d in holidays] + [(today or date.today()).year]
+        return cls(
+            holidays=holidays,
+            start=date(min(years) - CALENDAR_YEARS_BEFORE, 1, 1),
+            end=date(max(years) + CALENDAR_YEARS_AFTER, 12, 31),
+        )
+
+    def _build(self) -> None:
+        holiday_ordinals = {d.toordinal() for d in self.holidays}
+        # date.weekday() is (ordinal + 6) % 7, so weekdays are the values below 5
+        self._open_ordinals = [
+            o
+            for o in range(self.start.toordinal(), self.end.toordinal() + 1)
+            if (o + 6) % 7 < 5 and o not in holiday_ordinals
+        ]
+        self._open_set = frozenset(self._open_ordinals)
+
+    def _cover(self, d: date) -> None:
+        if self.start.year < d.year < self.end.year:
+            return
+        start = min(self.start, date(d.year - 1, 1, 1))
+        end = max(self.end, date(d.year + 1, 12, 31))
+        if (start, end) != (self.start, self.end):
+            self.start, self.end = start, end
+            self._build()
+
+    def is_open(self, d: date) -> bool:
+        self._cover(d)
+        return d.toordinal() in self._open_set
+
+    def n_open_days_ahead(self, d: date, n: int) -> date:
+        """The n-th open day after `d`; `d` itself when n <= 0."""
+        if n <= 0:
+            return d
+        self._cover(d)
+        i = bisect.bisect_right(self._open_ordinals, d.toordinal()) + n - 1
+        while i >= len(self._open_ordinals):
+            self._cover(date(self.end.year + 1, 1, 1))
+        return date.fromordinal(self._open_ordinals[i])
+
+    def n_open_days_behind(self, d: date, n: int) -> date:
+        """The n-th open day before `d`; `d` itself when n <= 0."""
+        if n <= 0:
+            return d
+        self._cover(d)
+        i = bisect.bisect_left(self._open_ordinals, d.toordinal()) - n
+        while i < 0:
+            before = len(self._open_ordinals)
+            self._cover(date(self.start.year - 1, 1, 1))
+            i += len(self._open_ordinals) - before
+        return date.fromordinal(self._open_ordinals[i])
+
+    def open_days_between(self, start: date, end: date) -> int:
+        """Number of open days in `(start, end]`."""
+        if end <= start:
+            return 0
+        self._cover(start)
+        self._cover(end)
+        return bisect.bisect_right(
+            self._open_ordinals, end.toordinal()
+        ) - bisect.bisect_right(self._open_ordinals, start.toordinal())
+
+    def open_days(self, start: date, end: date) -> list[date]:
+        """Open days in `[start, end]`."""
+        if end < start:
+            return []
+        self._cover(start)
+        self._cover(end)
+        lo = bisect.bisect_left(self._open_ordinals, start.toordinal())
+        hi = bisect.bisect_right(self._open_ordinals, end.toordinal())
+        return [date.fromordinal(o) for o in self._open_ordinals[lo:hi]]
+
+
+_trading_calendar: Optional[TradingCalendar] = None
+
+
+def get_trading_calendar() -> TradingCalendar:
+    global _trading_calendar
+    if _trading_calendar is None:
+        _trading_calendar = TradingCalendar.from_file()
+    return _trading_calendar
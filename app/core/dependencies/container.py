@@ -0,0 +1,85 @@
+import functools
+import logging
+import threading
+from typing import Any, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AppContainer:
+    """
+    Services, controllers and clients shared by every request of the application.
+
+    Factories decorated with `app_scoped` build their instance once and return it
+    from then on, so a request no longer rebuilds the whole service graph. Only
+    stateless objects belong here; per-request objects such as the DB session stay
+    regular dependencies. `start()` builds every registered factory from the
+    application lifespan and `clear()` drops the instances again.
+    """
+
+    def __init__(self):
+        self.factories: list[Callable[[], Any]] = []
+        self._instances: dict[Callable[[], Any], Any] = {}
+        # factories call each other, so the lock has to be reentrant
+        self._lock = threading.RLock()
+
+    def register(self, factory: Callable[[], T]) -> None:
+        self.factories.append(factory)
+
+    def resolve(self, factory: Callable[[], T]) -> T:
+        try:
+            return self._instances[factory]
+        except KeyError:
+            pass
+        with self._lock:
+            if factory not in self._instances:
+                self._instances[factory] = factory()
+            return self._instances[factory]
+
+    def start(self) -> None:
+        for factory in self.factories:
+            self.resolve(factory)
+        logger.info(f"Built {len(self._instances)} app-scoped dependencies")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+
+_container = AppContainer()
+_providers: dict[Callable[[], Any], Callable[[], Any]] = {}
+
+
+def get_container() -> AppContainer:
+    return _container
+
+
+def app_scoped(factory: Callable[[], T]) -> Callable[[], T]:
+    """Build the instance of `factory` once per application, see `AppContainer`."""
+
+    @functools.wraps(factory)
+    def wrapper() -> T:
+        return _container.resolve(factory)
+
+    _container.register(factory)
+    return wrapper
+
+
+def provide(factory: Callable[[], T]) -> Callable[[], Any]:
+    """
+    The FastAPI dependency of an `app_scoped` factory, `Depends(provide(...))`.
+
+    FastAPI runs sync dependencies in its thread pool; the async wrapper returns
+    the shared instance on the event loop. The same wrapper is returned for a
+    factory every time, so `app.dependency_overrides` keyed on it still works.
+    """
+    if factory not in _providers:
+
+        async def dependency() -> T:
+            return factory()
+
+        dependency.__name__ = factory.__name__
+        _providers[factory] = dependency
+    return _providers[factory]
@@ -9,6 +9,13 @@ class JobStatusEnum(str, Enum):
     WARNING = "⚠️ Job warning"
 
 
+class PipelineStageStatusEnum(str, Enum):
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
 class JobTypeEnum(str, Enum):
     INFERENCE = "Run Inference"
     RANK = "Rank Predictions"
@@ -35,6 +42,13 @@ class JobConfigEnum(str, Enum):
     CLEANUP_TRADING_DATA_DAYS_BACK = "CLEANUP_TRADING_DATA_DAYS_BACK"
     CLEANUP_PREDICTIONS_DAYS_BACK = "CLEANUP_PREDICTIONS_DAYS_BACK"
 
+    # backfill variables
+    BACKFILL_TRADING_DATA_CHECKPOINT = "BACKFILL_TRADING_DATA_CHECKPOINT"
+
+    # nightly pipeline variables
+    NIGHTLY_PIPELINE_STATE = "NIGHTLY_PIPELINE_STATE"
+    NIGHTLY_PIPELINE_LEASE = "NIGHTLY_PIPELINE_LEASE"
+
     LAST_SUCCESS_INFERENCE = "LAST_SUCCESS_INFERENCE"
     LAST_SUCCESS_EVALUATION = "LAST_SUCCESS_EVALUATION"
     LAST_SUCCESS_RANK = "LAST_SUCCESS_RANK"
@@ -6,12 +6,14 @@ class MeasurementMetric(str, Enum):
     get_data_time = "get_data"
     ml_time = "ml"
     save_time = "save"
+    db_statement_time = "db_statement"
 
 
 class MeasurementTag(str, Enum):
     env = "env"
     batch_size = "batch_size"
     status = "status"
+    statement = "statement"
 
     fail_count = "fail_count"
     success_count = "success_count"
@@ -20,10 +20,122 @@ class Config:
         self.ML_SERVER_URL = self._require_env("ML_SERVER_URL")
         self.DISCORD_WEBHOOK_URL = self._require_env("DISCORD_WEBHOOK_URL")
 
+        self.DB_POOL_SIZE = int(self._optional_env("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW = int(self._optional_env("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT_SECONDS = float(
+            self._optional_env("DB_POOL_TIMEOUT_SECONDS", "30")
+        )
+        self.DB_POOL_PRE_PING = (
+            self._optional_env("DB_POOL_PRE_PING", "true").lower() == "true"
+        )
+        self.DB_POOL_RECYCLE_SECONDS = int(
+            self._optional_env("DB_POOL_RECYCLE_SECONDS", "1800")
+        )
+        self.DB_STATEMENT_TIMEOUT_MS = int(
+            self._optional_env("DB_STATEMENT_TIMEOUT_MS", "0")
+        )
+        self.DB_PREPARED_STATEMENT_CACHE_SIZE = int(
+            self._optional_env("DB_PREPARED_STATEMENT_CACHE_SIZE", "100")
+        )
+        self.DB_SSL = self._optional_env("DB_SSL", "true").lower() == "true"
+        self.DB_SLOW_STATEMENT_MS = float(
+            self._optional_env("DB_SLOW_STATEMENT_MS", "500")
+        )
+
         self.REDIS_HOST = self._optional_env("REDIS_HOST", "localhost")
         self.REDIS_PORT = int(self._optional_env("REDIS_PORT", "6379"))
         self.REDIS_DB = int(self._optional_env("REDIS_DB", "0"))
 
+        self.CACHE_TTL_SECONDS = int(self._optional_env("CACHE_TTL_SECONDS", "86400"))
+        self.CACHE_LOCAL_MAXSIZE = int(
+            self._optional_env("CACHE_LOCAL_MAXSIZE", "1024")
+        )
+        self.CACHE_LOCAL_TTL_SECONDS = int(
+            self._optional_env("CACHE_LOCAL_TTL_SECONDS", "300")
+        )
+
+        self.MARKET_DATA_BATCH_SIZE = int(
+            self._optional_env("MARKET_DATA_BATCH_SIZE", "50")
+        )
+        self.MARKET_DATA_DOWNLOAD_THREADS = int(
+            self._optional_env("MARKET_DATA_DOWNLOAD_THREADS", "4")
+        )
+
+        self.HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+            self._optional_env("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")
+        )
+        self.ML_SERVER_TIMEOUT_SECONDS = float(
+            self._optional_env("ML_SERVER_TIMEOUT_SECONDS", "30")
+        )
+        self.ML_SERVER_PREDICT_TIMEOUT_SECONDS = float(
+            self._optional_env("ML_SERVER_PREDICT_TIMEOUT_SECONDS", "60")
+        )
+        self.ML_SERVER_MAX_CONNECTIONS = int(
+            self._optional_env("ML_SERVER_MAX_CONNECTIONS", "10")
+        )
+        self.ML_SERVER_MAX_KEEPALIVE_CONNECTIONS = int(
+            self._optional_env("ML_SERVER_MAX_KEEPALIVE_CONNECTIONS", "5")
+        )
+        self.DISCORD_TIMEOUT_SECONDS = float(
+            self._optional_env("DISCORD_TIMEOUT_SECONDS", "10")
+        )
+        self.DISCORD_MAX_CONNECTIONS = int(
+            self._optional_env("DISCORD_MAX_CONNECTIONS", "2")
+        )
+
+        self.ML_INFERENCE_CHUNK_SIZE = int(
+            self._optional_env("ML_INFERENCE_CHUNK_SIZE", "20")
+        )
+        self.ML_INFERENCE_MAX_CONCURRENCY = int(
+            self._optional_env("ML_INFERENCE_MAX_CONCURRENCY", "4")
+        )
+        self.ML_INFERENCE_MAX_RETRIES = int(
+            self._optional_env("ML_INFERENCE_MAX_RETRIES", "2")
+        )
+        self.ML_INFERENCE_RETRY_BACKOFF_SECONDS = float(
+            self._optional_env("ML_INFERENCE_RETRY_BACKOFF_SECONDS", "1.0")
+        )
+
+        self.LOG_REQUEST_BODY_SAMPLE_RATE = float(
+            self._optional_env("LOG_REQUEST_BODY_SAMPLE_RATE", "0.01")
+        )
+        self.LOG_REQUEST_BODY_MAX_BYTES = int(
+            self._optional_env("LOG_REQUEST_BODY_MAX_BYTES", "1024")
+        )
+
+        # gcp, file, memory or none
+        self.METRICS_SINK = self._optional_env("METRICS_SINK", "gcp").lower()
+        self.METRICS_FILE_PATH = self._optional_env(
+            "METRICS_FILE_PATH", "logs/metrics.jsonl"
+        )
+        self.METRICS_FLUSH_INTERVAL_SECONDS = float(
+            self._optional_env("METRICS_FLUSH_INTERVAL_SECONDS", "60")
+        )
+        self.METRICS_FLUSH_THRESHOLD = int(
+            self._optional_env("METRICS_FLUSH_THRESHOLD", "200")
+        )
+        self.METRICS_MAX_SERIES = int(self._optional_env("METRICS_MAX_SERIES", "1000"))
+
+        self.CLEANUP_BATCH_SIZE = int(self._optional_env("CLEANUP_BATCH_SIZE", "5000"))
+        self.CLEANUP_BATCH_SLEEP_SECONDS = float(
+            self._optional_env("CLEANUP_BATCH_SLEEP_SECONDS", "0.1")
+        )
+
+        self.PARTITION_MONTHS_AHEAD = int(
+            self._optional_env("PARTITION_MONTHS_AHEAD", "3")
+        )
+
+        # trading data rows kept per ticker in trading_data_windows
+        self.TRADING_DATA_WINDOW_SIZE = int(
+            self._optional_env("TRADING_DATA_WINDOW_SIZE", "120")
+        )
+
+        # requests sent with an X-Profile header and the backend key are profiled
+        self.PROFILE_SAMPLE_INTERVAL_MS = float(
+            self._optional_env("PROFILE_SAMPLE_INTERVAL_MS", "5")
+        )
+        self.PROFILE_MAX_STORED = int(self._optional_env("PROFILE_MAX_STORED", "20"))
+
         self.CLIENT_API_KEY = self._require_env("CLIENT_API_KEY")
         self.BACKEND_API_KEY = self._require_env("BACKEND_API_KEY")
         self.ML_SERVER_API_KEY = self._require_env("ML_SERVER_API_KEY")
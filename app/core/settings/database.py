@@ -1,42 +1,30 @@
 import logging
-import os
-import ssl
 
-from dotenv import load_dotenv
-from sqlalchemy import Engine, event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-# Load environment variables from .env
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-ssl_context = ssl.create_default_context()
+from app.core.common.utils.statement_stats import get_statement_stats
+from app.core.settings.config import get_config
+from app.core.settings.engine_profile import EngineProfile, instrument_engine
 
 logger = logging.getLogger(__name__)
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,  # false = disable SQLAlchemy's default query logging (handled by event listeners)
-    pool_size=5,  # number of connections maintained in the pool (5 for local development)
-    max_overflow=10,  # additional temporary connections if needed (10 for local development)
-    connect_args={"ssl": ssl_context},
-)
-
-
-@event.listens_for(engine.sync_engine, "connect")
-def on_connect(dbapi_connection, connection_record):
-    logger.info("New DBAPI connection created: %s", dbapi_connection)
-    # Use the sync cursor API to execute a test query
-    cursor = dbapi_connection.cursor()
-    cursor.execute("SELECT 'Connected successfully' AS message")
-    result = cursor.fetchone()[0]
-    logger.info("DB connection test message: %s", result)
+config = get_config()
+engine_profile = EngineProfile.from_config(config)
 
+# pool sizing, pre-ping, recycle and statement timeout all come from the profile;
+# SQLAlchemy's own echo stays off, statements are timed by `instrument_engine`
+engine = create_async_engine(config.DATABASE_URL, **engine_profile.engine_kwargs())
+instrument_engine(
+    engine,
+    stats=get_statement_stats(),
+    slow_statement_ms=engine_profile.slow_statement_ms,
+)
 
-# Attach event listener: log before executing any SQL statement
-@event.listens_for(Engine, "before_execute")
-def before_execute(conn, clauseelement, multiparams, params, execution_options):
-    logger.info("Before execute: %s", clauseelement)
-
+logger.info(
+    f"Database engine created (pool size: {engine_profile.pool_size}, "
+    f"max overflow: {engine_profile.max_overflow}, "
+    f"statement timeout: {engine_profile.statement_timeout_ms}ms)"
+)
 
 # Create the async session factory
 # Note: normal AsyncSession is for a single asynchronous database session
@@ -0,0 +1,119 @@
+import logging
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.common.utils.measurement import send_metric
+from app.core.common.utils.request_profiler import get_current_profile
+from app.core.common.utils.statement_stats import StatementStats, fingerprint_id
+from app.core.enums.measurement_enum import MeasurementMetric, MeasurementTag
+
+logger = logging.getLogger(__name__)
+
+_START_TIMES_KEY = "statement_start_times"
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """Pool and connection settings of the async engine, read from `Config`."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout_seconds: float = 30
+    pool_pre_ping: bool = True
+    pool_recycle_seconds: int = 1800
+    # 0 disables the timeout
+    statement_timeout_ms: int = 0
+    # asyncpg prepared statements kept per connection, 0 behind pgbouncer
+    prepared_statement_cache_size: int = 100
+    use_ssl: bool = True
+    slow_statement_ms: float = 500
+
+    @classmethod
+    def from_config(cls, config) -> "EngineProfile":
+        return cls(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout_seconds=config.DB_POOL_TIMEOUT_SECONDS,
+            pool_pre_ping=config.DB_POOL_PRE_PING,
+            pool_recycle_seconds=config.DB_POOL_RECYCLE_SECONDS,
+            statement_timeout_ms=config.DB_STATEMENT_TIMEOUT_MS,
+            prepared_statement_cache_size=config.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            use_ssl=config.DB_SSL,
+            slow_statement_ms=config.DB_SLOW_STATEMENT_MS,
+        )
+
+    def engine_kwargs(self) -> dict[str, Any]:
+        connect_args: dict[str, Any] = {
+            "prepared_statement_cache_size": self.prepared_statement_cache_size,
+        }
+        if self.use_ssl:
+            connect_args["ssl"] = ssl.create_default_context()
+        if self.statement_timeout_ms:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(self.statement_timeout_ms)
+            }
+
+        return {
+            "echo": False,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout_seconds,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle_seconds,
+            "connect_args": connect_args,
+        }
+
+
+def instrument_engine(
+    engine: AsyncEngine, stats: StatementStats, slow_statement_ms: float
+) -> None:
+    """
+    Time every statement into `stats`. Statements slower than
+    `slow_statement_ms` are also logged and sent as a metric.
+    """
+    sync_engine = engine.sync_engine
+
+    def record(conn, statement: str, rows, error: bool) -> None:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if not start_times:
+            return
+        elapsed = time.perf_counter() - start_times.pop()
+        fingerprint = stats.observe(statement, elapsed, rows=rows, error=error)
+
+        profile = get_current_profile()
+        if profile is not None:
+            profile.record_statement(statement, elapsed, error)
+
+        if elapsed * 1000 >= slow_statement_ms:
+            statement_id = fingerprint_id(fingerprint)
+            logger.warning(
+                f"Slow statement {statement_id} ({elapsed * 1000:.1f}ms, "
+                f"rows: {rows}): {fingerprint[:300]}"
+            )
+            send_metric(
+                metric=MeasurementMetric.db_statement_time,
+                value=elapsed,
+                tags={MeasurementTag.statement: statement_id},
+            )
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        rowcount = getattr(cursor, "rowcount", -1)
+        record(conn, statement, rowcount if rowcount >= 0 else None, error=False)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and exception_context.statement is not None:
+            record(conn, exception_context.statement, None, error=True)
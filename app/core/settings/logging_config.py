@@ -85,6 +85,10 @@ def setup_logging(log_level: str = None):
                 "level": log_level,
             },
         },
+        "loggers": {
+            # one INFO line per outgoing request from the pooled http clients
+            "httpx": {"level": "WARNING"},
+        },
         "root": {
             "handlers": ["console", "file", "forwarder"],
             "level": log_level,
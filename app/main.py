@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 from typing import cast
 
 from fastapi import FastAPI, HTTPException
@@ -6,7 +7,10 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
 from starlette.types import ExceptionHandler
 
+from app.api.internal.services.job_config_service import get_job_config_cache
 from app.api.scheduler_jobs import scheduler_job_routes
+from app.core.clients.http_client_pool import close_http_clients, start_http_clients
+from app.core.clients.market_data_client import shutdown_market_data_client
 from app.core.common.exceptions.custom_exceptions import CustomAPIError
 from app.core.common.exceptions.exception_handlers import (
     custom_api_exception_handler,
@@ -15,6 +19,11 @@ from app.core.common.exceptions.exception_handlers import (
     starlette_http_exception_handler,
 )
 from app.core.common.middleware.logging_middleware import logging_middleware_factory
+from app.core.common.middleware.profiling_middleware import (
+    profiling_middleware_factory,
+)
+from app.core.common.utils.measurement import get_metrics_buffer
+from app.core.dependencies.container import get_container
 from app.core.settings.logging_config import setup_logging
 
 # from app.core.common.middleware.role_auth_middleware import role_auth_middleware_factory
@@ -36,16 +45,31 @@ logger = logging.getLogger(__name__)
 logger.setLevel(config.LOG_LEVEL)
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    start_http_clients()
+    get_container().start()
+    await get_job_config_cache().start_listener()
+    await get_metrics_buffer().start()
+    yield
+    await get_metrics_buffer().stop()
+    await get_job_config_cache().stop_listener()
+    await close_http_clients()
+    shutdown_market_data_client()
+    get_container().clear()
+
+
 app = FastAPI(
     title="Stockie BE API",
     description="API for Stockie backend server",
     version="1.0.0",
     debug=config.DEBUG,
     root_path="/api",
-    # lifespan=lifespan,
+    lifespan=lifespan,
 )
 
 app.add_middleware(logging_middleware_factory())
+app.add_middleware(profiling_middleware_factory())
 # app.add_middleware(role_auth_middleware_factory())
 app.add_middleware(
     CORSMiddleware,
@@ -2,7 +2,9 @@ from .base import Base
 from .industry import Industry
 from .job_config import JobConfig
 from .prediction import Prediction
+from .prediction_evaluation import PredictionEvaluation
 from .stock import Stock
 from .stock_model import StockModel
 from .top_prediction import TopPrediction
 from .trading_data import TradingData
+from .trading_data_window import TradingDataWindow
@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    PrimaryKeyConstraint,
     UniqueConstraint,
     func,
 )
@@ -18,14 +19,17 @@ from app.models.base import Base
 
 class Prediction(Base):
     __tablename__ = "predictions"
+    # monthly range partitions on target_date, see PartitionService
     __table_args__ = (
+        PrimaryKeyConstraint("id", "target_date", name="predictions_pkey"),
         Index("ix_predictions_lookup", "stock_ticker", "target_date", "period"),
         UniqueConstraint(
             "stock_ticker", "model_id", "target_date", "period", name="uq_prediction"
         ),
+        {"postgresql_partition_by": "RANGE (target_date)"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, autoincrement=True)
     model_id: Mapped[int] = mapped_column(
         ForeignKey("stock_models.id", ondelete="CASCADE", name="fk_predictions_model"),
         nullable=False,
@@ -39,14 +43,8 @@ class Prediction(Base):
     period: Mapped[int] = mapped_column(Integer, nullable=False)
 
     closing_price: Mapped[float] = mapped_column(Float, nullable=True)
-    trading_data_id: Mapped[int] = mapped_column(
-        ForeignKey(
-            "trading_data.id",
-            ondelete="CASCADE",
-            name="fk_predictions_trading_data",
-        ),
-        nullable=True,
-    )
+    # no FK: trading_data.id alone is not unique across partitions
+    trading_data_id: Mapped[int] = mapped_column(Integer, nullable=True)
     predicted_price: Mapped[float] = mapped_column(Float, nullable=False)
 
     rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -68,3 +66,5 @@ class Prediction(Base):
     )
 
     stock = relationship("Stock", back_populates="predictions", lazy="select")
+
+    __mapper_args__ = {"primary_key": [id]}
@@ -0,0 +1,71 @@
+from datetime import date, datetime
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.common.utils.datetime_utils import get_now_bangkok_datetime
+from app.models.base import Base
+
+
+class PredictionEvaluation(Base):
+    """
+    Accuracy of one model and period over the predictions made between
+    `start_date` and `end_date`, against the realized close `period` market days
+    after each prediction.
+    """
+
+    __tablename__ = "prediction_evaluations"
+    __table_args__ = (
+        Index("ix_prediction_evaluations_lookup", "stock_ticker", "end_date"),
+        UniqueConstraint(
+            "model_id",
+            "period",
+            "start_date",
+            "end_date",
+            name="uq_prediction_evaluation",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    model_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "stock_models.id",
+            ondelete="CASCADE",
+            name="fk_prediction_evaluations_model",
+        ),
+        nullable=False,
+    )
+    stock_ticker: Mapped[str] = mapped_column(
+        ForeignKey(
+            "stocks.ticker", ondelete="CASCADE", name="fk_prediction_evaluations_stock"
+        ),
+        nullable=False,
+    )
+    industry_code: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    period: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_date: Mapped[date] = mapped_column(Date(), nullable=False)
+    end_date: Mapped[date] = mapped_column(Date(), nullable=False)
+
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    mae: Mapped[float] = mapped_column(Float, nullable=False)
+    mape: Mapped[float] = mapped_column(Float, nullable=False)
+    rmse: Mapped[float] = mapped_column(Float, nullable=False)
+    # share of predictions with the right direction from the close they were made on
+    hit_rate: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    evaluated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=get_now_bangkok_datetime(),
+        server_default=func.now(),
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    PrimaryKeyConstraint,
     UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column
@@ -15,12 +16,16 @@ from app.models import Base
 
 class TradingData(Base):
     __tablename__ = "trading_data"
+    # monthly range partitions on target_date, see PartitionService; the partition
+    # key has to be part of the primary key, rows are still identified by id alone
     __table_args__ = (
+        PrimaryKeyConstraint("id", "target_date", name="trading_data_pkey"),
         Index("ix_trading_data_lookup", "stock_ticker", "target_date"),
         UniqueConstraint("stock_ticker", "target_date", name="uq_trading_data"),
+        {"postgresql_partition_by": "RANGE (target_date)"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, autoincrement=True)
     stock_ticker: Mapped[str] = mapped_column(
         ForeignKey("stocks.ticker", ondelete="CASCADE", name="fk_trading_data_stock"),
         nullable=False,
@@ -32,3 +37,5 @@ class TradingData(Base):
     high: Mapped[float] = mapped_column(Float, nullable=False)
     low: Mapped[float] = mapped_column(Float, nullable=False)
     volumes: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __mapper_args__ = {"primary_key": [id]}
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.common.utils.datetime_utils import get_now_bangkok_datetime
+from app.models.base import Base
+
+
+class TradingDataWindow(Base):
+    """
+    The latest `TRADING_DATA_WINDOW_SIZE` trading data rows of one ticker, as
+    parallel arrays in ascending date order. Maintained by
+    `TradingDataWindowService` on every trading data write.
+    """
+
+    __tablename__ = "trading_data_windows"
+
+    stock_ticker: Mapped[str] = mapped_column(
+        ForeignKey(
+            "stocks.ticker", ondelete="CASCADE", name="fk_trading_data_windows_stock"
+        ),
+        primary_key=True,
+    )
+    last_date: Mapped[date] = mapped_column(Date(), nullable=False)
+
+    target_dates: Mapped[list[date]] = mapped_column(ARRAY(Date()), nullable=False)
+    trading_data_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    close: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    open: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    high: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    low: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    volumes: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=get_now_bangkok_datetime(),
+        onupdate=get_now_bangkok_datetime(),
+        server_default=func.now(),
+    )
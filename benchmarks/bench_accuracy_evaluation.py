@@ -0,0 +1,139 @@
+"""
+Compare a per-row accuracy evaluation with `AccuracyEvaluator`, from already
+fetched rows to per (model, period) metrics.
+
+The per-row path gets one row per prediction and close, and looks every realized
+date up in the trading calendar and every close up in a dict. The evaluator gets
+the rows `EvaluationRepository` streams: one per (model, period) or ticker, with
+the values as arrays. Query time is not part of either timing.
+
+    python -m benchmarks.bench_accuracy_evaluation
+    python -m benchmarks.bench_accuracy_evaluation --years 5 --tickers 300
+"""
+
+import argparse
+import math
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.api.internal.services.accuracy_evaluator import AccuracyEvaluator
+from app.core.common.utils.trading_calendar import get_trading_calendar
+
+PERIODS = (1, 5, 15)
+INDUSTRIES = ("AGRI", "BANK", "ENERG", "ICT", "PROP")
+
+
+def make_rows(years: int, tickers: int):
+    calendar = get_trading_calendar()
+    end = date.today()
+    days = calendar.open_days(end - timedelta(days=365 * years), end)
+    rng = np.random.default_rng(0)
+    stock_tickers = [f"T{i:04d}" for i in range(tickers)]
+
+    closes = rng.uniform(10, 100, size=(tickers, len(days))).tolist()
+    close_rows = [
+        (stock_ticker, day, closes[t][d])
+        for t, stock_ticker in enumerate(stock_tickers)
+        for d, day in enumerate(days)
+    ]
+    noise = rng.normal(1, 0.05, size=(tickers, len(days), len(PERIODS))).tolist()
+    prediction_rows = [
+        (
+            t,
+            stock_ticker,
+            INDUSTRIES[t % len(INDUSTRIES)],
+            day,
+            period,
+            closes[t][d] * noise[t][d][p],
+            closes[t][d],
+        )
+        for t, stock_ticker in enumerate(stock_tickers)
+        for d, day in enumerate(days)
+        for p, period in enumerate(PERIODS)
+    ]
+
+    ordinals = [day.toordinal() for day in days]
+    grouped_predictions = [
+        (
+            t,
+            stock_ticker,
+            INDUSTRIES[t % len(INDUSTRIES)],
+            period,
+            ordinals,
+            [closes[t][d] * noise[t][d][p] for d in range(len(days))],
+            closes[t],
+        )
+        for t, stock_ticker in enumerate(stock_tickers)
+        for p, period in enumerate(PERIODS)
+    ]
+    grouped_closes = [
+        (stock_ticker, ordinals, closes[t]) for t, stock_ticker in enumerate(stock_tickers)
+    ]
+    return (
+        calendar,
+        days[0],
+        days[-1],
+        (prediction_rows, close_rows),
+        (grouped_predictions, grouped_closes),
+    )
+
+
+def run_per_row(calendar, prediction_rows, close_rows) -> int:
+    close_lookup = {(ticker, day): close for ticker, day, close in close_rows}
+    sums = defaultdict(lambda: [0, 0.0, 0.0, 0.0, 0])
+    for model_id, ticker, _, day, period, predicted, closing in prediction_rows:
+        actual = close_lookup.get((ticker, calendar.n_open_days_ahead(day, period + 1)))
+        if not actual:
+            continue
+        error = predicted - actual
+        group = sums[(model_id, period)]
+        group[0] += 1
+        group[1] += abs(error)
+        group[2] += abs(error) / abs(actual)
+        group[3] += error * error
+        group[4] += (predicted > closing) == (actual > closing)
+    metrics = [
+        (n, mae / n, mape / n * 100, math.sqrt(sq / n), hits / n)
+        for n, mae, mape, sq, hits in sums.values()
+    ]
+    return len(metrics)
+
+
+def run_evaluator(calendar, start, end, prediction_rows, close_rows) -> int:
+    evaluator = AccuracyEvaluator(calendar=calendar)
+    evaluator.add_predictions(prediction_rows)
+    evaluator.add_closes(close_rows)
+    return len(evaluator.evaluate(start_date=start, end_date=end).by_model_period)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--tickers", type=int, default=100)
+    args = parser.parse_args()
+
+    calendar, start, end, rows, grouped_rows = make_rows(args.years, args.tickers)
+    print(
+        f"{len(rows[0])} predictions, {len(rows[1])} closes "
+        f"({args.years} years, {args.tickers} tickers, periods {PERIODS})"
+    )
+
+    started = time.perf_counter()
+    groups = run_per_row(calendar, *rows)
+    per_row = time.perf_counter() - started
+    print(f"  per row             {per_row:8.2f}s  {groups} groups")
+
+    started = time.perf_counter()
+    groups = run_evaluator(calendar, start, end, *grouped_rows)
+    vectorized = time.perf_counter() - started
+    print(
+        f"  AccuracyEvaluator   {vectorized:8.2f}s  {groups} groups"
+        f"  ({per_row / vectorized:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
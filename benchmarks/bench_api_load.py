@@ -0,0 +1,470 @@
+"""
+Load test the public API and report throughput and latency percentiles per route.
+
+Boots `app.main:app` with uvicorn in a subprocess, seeds the database it uses
+with a universe of stocks, active models and ranked predictions for every
+industry and period, then drives `/info` and `/predict` with `--concurrency`
+concurrent clients sending the client API key. Every client sends its next
+request as soon as the previous one returns, so throughput is what the server
+sustains at that concurrency and latency includes any queueing in it.
+
+The server reads its settings from the environment as usual, Redis included, so
+`/predict` and `/info` are measured with the read-through cache in front of the
+database. Point `DATABASE_URL` at a scratch database migrated with
+`alembic upgrade head`: seeded stocks are prefixed `LT` and `--reseed` deletes
+them, but the top predictions of the seeded dates are shared with real data.
+
+Results are printed and saved as JSON; `--compare` prints the change from an
+earlier result file, to check a performance change before and after.
+
+    python -m benchmarks.bench_api_load
+    python -m benchmarks.bench_api_load --concurrency 64 --duration 60 --workers 2
+    python -m benchmarks.bench_api_load --url https://... --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import date, datetime
+
+import httpx
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.general.repositories.partition_repository import PartitionRepository
+from app.api.general.services.partition_service import PartitionService
+from app.core.common.utils.datetime_utils import (
+    get_last_market_open_date,
+    get_yesterday_bangkok_date,
+    is_market_closed,
+)
+from app.core.common.utils.trading_calendar import get_trading_calendar
+from app.core.enums.industry_code_enum import IndustryCodeEnum
+from app.models import Industry, Prediction, Stock, StockModel, TopPrediction
+
+TICKER_PREFIX = "LT"
+PERIODS = (1, 5, 10, 15)
+TOP_N = 10
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def get_closing_price_date() -> date:
+    # the date `PredictService` serves top predictions for
+    yesterday = get_yesterday_bangkok_date()
+    if is_market_closed(yesterday):
+        return get_last_market_open_date(yesterday)
+    return yesterday
+
+
+async def seed(database_url: str, stocks_per_industry: int, days: int, reseed: bool):
+    engine = create_async_engine(database_url)
+    closing_price_date = get_closing_price_date()
+    target_dates = get_trading_calendar().open_days(
+        get_trading_calendar().n_open_days_behind(closing_price_date, days - 1),
+        closing_price_date,
+    )
+    rng = random.Random(0)
+
+    try:
+        async with AsyncSession(engine) as db:
+            seeded = TICKER_PREFIX + "%"
+            if reseed:
+                await db.execute(delete(Stock).where(Stock.ticker.like(seeded)))
+                await db.commit()
+            existing = await db.scalar(
+                select(func.count()).select_from(Stock).where(Stock.ticker.like(seeded))
+            )
+            if existing:
+                print(f"Found {existing} seeded stocks, skipping the seed")
+                return
+
+            started = time.perf_counter()
+            await db.execute(
+                pg_insert(Industry)
+                .values(
+                    [
+                        {
+                            "industry_code": industry.value,
+                            "name_en": industry.name.title(),
+                            "name_th": industry.name.title(),
+                        }
+                        for industry in IndustryCodeEnum
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+
+            stocks = {
+                industry.value: [
+                    f"{TICKER_PREFIX}{i:02d}{industry.value[:3].upper()}"
+                    for i in range(stocks_per_industry)
+                ]
+                for industry in IndustryCodeEnum
+            }
+            await db.execute(
+                insert(Stock),
+                [
+                    {
+                        "ticker": ticker,
+                        "name": f"Load test {ticker}",
+                        "industry_code": industry_code,
+                    }
+                    for industry_code, tickers in stocks.items()
+                    for ticker in tickers
+                ],
+            )
+            model_rows = await db.execute(
+                insert(StockModel).returning(StockModel.id, StockModel.stock_ticker),
+                [
+                    {
+                        "stock_ticker": ticker,
+                        "version": "load-test",
+                        "model_path": "-",
+                        "scaler_path": "-",
+                        "features_used": ["close"],
+                    }
+                    for tickers in stocks.values()
+                    for ticker in tickers
+                ],
+            )
+            model_ids = {ticker: model_id for model_id, ticker in model_rows}
+
+            partition_service = PartitionService(PartitionRepository(), months_ahead=0)
+            await partition_service.ensure_partitions(
+                db=db,
+                model=Prediction,
+                start_date=target_dates[0],
+                end_date=target_dates[-1],
+            )
+
+            # reuses the top prediction of a (industry, date, period) that exists
+            top_rows = await db.execute(
+                pg_insert(TopPrediction)
+                .values(
+                    [
+                        {
+                            "industry_code": industry_code,
+                            "target_date": target_date,
+                            "period": period,
+                        }
+                        for industry_code in stocks
+                        for target_date in target_dates
+                        for period in PERIODS
+                    ]
+                )
+                .on_conflict_do_update(
+                    constraint="uq_top_prediction",
+                    set_={"created_at": func.now()},
+                )
+                .returning(
+                    TopPrediction.id,
+                    TopPrediction.industry_code,
+                    TopPrediction.target_date,
+                    TopPrediction.period,
+                )
+            )
+
+            predictions = []
+            for top_prediction_id, industry_code, target_date, period in top_rows:
+                tickers = stocks[industry_code]
+                closes = {ticker: rng.uniform(10, 200) for ticker in tickers}
+                predicted = {
+                    ticker: close * rng.uniform(0.9, 1.1)
+                    for ticker, close in closes.items()
+                }
+                ranked = sorted(
+                    closes, key=lambda t: predicted[t] / closes[t], reverse=True
+                )
+                for rank, ticker in enumerate(ranked, start=1):
+                    in_top = rank <= TOP_N
+                    predictions.append(
+                        {
+                            "model_id": model_ids[ticker],
+                            "stock_ticker": ticker,
+                            "target_date": target_date,
+                            "period": period,
+                            "closing_price": closes[ticker],
+                            "predicted_price": predicted[ticker],
+                            "rank": rank if in_top else None,
+                            "top_prediction_id": top_prediction_id if in_top else None,
+                        }
+                    )
+            for i in range(0, len(predictions), 5000):
+                batch = predictions[i : i + 5000]  # noqa: E203
+                await db.execute(insert(Prediction), batch)
+            await db.commit()
+            print(
+                f"Seeded {sum(map(len, stocks.values()))} stocks and "
+                f"{len(predictions)} predictions over {len(target_dates)} market days "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+    finally:
+        await engine.dispose()
+
+
+def start_server(database_url: str, port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--no-access-log",
+            "--log-level",
+            "warning",
+        ],
+        env={**os.environ, "DATABASE_URL": database_url},
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout_seconds: float = 30):
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            await client.get("/info")
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+def make_requests(mix: dict[str, int], rng: random.Random):
+    """Endless `(route, path, params)` requests, with routes drawn by weight."""
+    routes, weights = zip(*mix.items())
+    while True:
+        route = rng.choices(routes, weights)[0]
+        if route == "predict":
+            params = {
+                "industry": rng.choice(list(IndustryCodeEnum)).value,
+                "period": rng.choice(PERIODS),
+            }
+            yield route, "/predict", params
+        else:
+            yield route, "/info", None
+
+
+async def run_load(client: httpx.AsyncClient, args) -> tuple[dict, float]:
+    rng = random.Random(1)
+    requests = make_requests(args.mix, rng)
+    latencies: dict[str, list[float]] = {route: [] for route in args.mix}
+    errors: dict[str, dict[str, int]] = {route: {} for route in args.mix}
+    recording = False
+    stop_at = 0.0
+
+    async def user() -> None:
+        while time.perf_counter() < stop_at:
+            route, path, params = next(requests)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params=params)
+                outcome = None if response.is_success else str(response.status_code)
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            elapsed = time.perf_counter() - started
+            if not recording:
+                continue
+            latencies[route].append(elapsed)
+            if outcome is not None:
+                errors[route][outcome] = errors[route].get(outcome, 0) + 1
+
+    if args.warmup:
+        stop_at = time.perf_counter() + args.warmup
+        await asyncio.gather(*(user() for _ in range(args.concurrency)))
+
+    recording = True
+    started = time.perf_counter()
+    stop_at = started + args.duration
+    await asyncio.gather(*(user() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    report = {
+        route: summarize(latencies[route], errors[route], elapsed)
+        for route in args.mix
+    }
+    report["total"] = summarize(
+        [t for route in args.mix for t in latencies[route]],
+        {
+            outcome: count
+            for route in args.mix
+            for outcome, count in errors[route].items()
+        },
+        elapsed,
+    )
+    return report, elapsed
+
+
+def summarize(latencies: list[float], errors: dict[str, int], elapsed: float) -> dict:
+    if not latencies:
+        return {"requests": 0, "errors": errors}
+    p50, p95, p99 = np.percentile(np.asarray(latencies) * 1000, [50, 95, 99])
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+    }
+
+
+def print_report(report: dict, previous: dict | None) -> None:
+    print(
+        f"\n{'route':<10} {'requests':>9} {'errors':>7} {'req/s':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for route, stats in report.items():
+        if not stats["requests"]:
+            print(f"{route:<10} {0:>9}")
+            continue
+        print(
+            f"{route:<10} {stats['requests']:>9} {sum(stats['errors'].values()):>7} "
+            f"{stats['rps']:>9.1f} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+            f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}"
+        )
+        before = (previous or {}).get(route)
+        if before and before.get("requests"):
+            print(
+                f"{'  vs before':<27} {change(before['rps'], stats['rps']):>9} "
+                + " ".join(
+                    f"{change(before[key], stats[key]):>9}"
+                    for key in ("p50_ms", "p95_ms", "p99_ms", "max_ms")
+                )
+            )
+    for route, stats in report.items():
+        if stats["errors"]:
+            print(f"{route} errors: {stats['errors']}")
+
+
+def change(before: float, after: float) -> str:
+    return f"{(after - before) / before:+.0%}" if before else "n/a"
+
+
+def get_git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main_async(args) -> None:
+    server = None
+    base_url = args.url
+    if base_url is None:
+        await seed(args.database_url, args.stocks_per_industry, args.days, args.reseed)
+        server = start_server(args.database_url, args.port, args.workers)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            headers={"X-API-Key": args.api_key},
+            timeout=args.timeout,
+            limits=httpx.Limits(
+                max_connections=args.concurrency,
+                max_keepalive_connections=args.concurrency,
+            ),
+        ) as client:
+            await wait_until_ready(client)
+            print(
+                f"{base_url}: {args.concurrency} clients for {args.duration}s "
+                f"after {args.warmup}s of warm up, mix {args.mix}"
+            )
+            report, elapsed = await run_load(client, args)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["routes"]
+    print_report(report, previous)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"api_load_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "started_at": datetime.now().isoformat(timespec="seconds"),
+                "git_commit": get_git_commit(),
+                "url": base_url,
+                "workers": None if args.url else args.workers,
+                "concurrency": args.concurrency,
+                "duration_seconds": round(elapsed, 3),
+                "mix": args.mix,
+                "routes": report,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nSaved to {output}")
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        route, _, weight = part.partition("=")
+        if route not in ("info", "predict"):
+            raise argparse.ArgumentTypeError(f"unknown route '{route}'")
+        mix[route] = int(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--url", help="load test a running server instead of booting and seeding one"
+    )
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--api-key", default=os.getenv("CLIENT_API_KEY"))
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--stocks-per-industry", type=int, default=25)
+    parser.add_argument("--days", type=int, default=60, help="market days seeded")
+    parser.add_argument("--reseed", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default="info=1,predict=4",
+        help="route weights, e.g. info=1,predict=4",
+    )
+    parser.add_argument("--output", help=f"result file, in {RESULTS_DIR} by default")
+    parser.add_argument("--compare", help="an earlier result file")
+    args = parser.parse_args()
+    if not args.api_key:
+        parser.error("--api-key or CLIENT_API_KEY is required")
+    if args.url is None and not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required to seed")
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Generate the synthetic dataset of `DummyService.generate_dataset` at a scale
+factor, and with a database also load it.
+
+Without a database only generation is timed, next to the per-row `random.uniform`
+loop `generate_dummy_trading_data` uses, on the same number of rows. With
+`--database-url` the dataset replaces the synthetic `SYN*` stocks of that
+database, which must be migrated with `alembic upgrade head`, and stays there
+for other benchmarks and query plan checks.
+
+    python -m benchmarks.bench_dataset_generation --scale 2
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_dataset_generation --scale 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.dummy.dummy_dataset import DatasetSpec, generate_chunks
+from app.api.dummy.dummy_repository import DummyRepository
+from app.api.dummy.dummy_service import DummyService
+from app.api.general.repositories.partition_repository import PartitionRepository
+from app.api.general.repositories.stock_model_repository import StockModelRepository
+from app.api.general.repositories.stock_repository import StockRepository
+from app.api.general.repositories.trading_data_repository import (
+    TradingDataRepository,
+)
+from app.api.general.repositories.trading_data_window_repository import (
+    TradingDataWindowRepository,
+)
+from app.api.general.services.partition_service import PartitionService
+from app.api.general.services.stock_model_service import StockModelService
+from app.api.general.services.stock_service import StockService
+from app.api.general.services.trading_data_service import TradingDataService
+from app.api.general.services.trading_data_window_service import (
+    TradingDataWindowService,
+)
+from app.core.common.utils.trading_calendar import get_trading_calendar
+
+
+def per_row_loop(stock_count: int, days: int, end_date: date) -> list[dict]:
+    # the loop of `generate_dummy_trading_data`, without the ORM objects
+    rows = []
+    for i in range(stock_count):
+        price = random.uniform(120, 200)
+        for day in range(days):
+            close = price + random.uniform(-5, 5)
+            open_ = close + random.uniform(-2, 2)
+            rows.append(
+                {
+                    "stock_ticker": f"T{i}",
+                    "target_date": end_date - timedelta(days=days - day - 1),
+                    "close": close,
+                    "open": open_,
+                    "high": max(open_, close) + random.uniform(0, 3),
+                    "low": min(open_, close) - random.uniform(0, 3),
+                    "volumes": random.randint(1000, 10000),
+                }
+            )
+    return rows
+
+
+def time_generation(spec: DatasetSpec) -> None:
+    open_days = get_trading_calendar().open_days(spec.start_date, spec.end_date)
+    model_ids = {ticker: i for i, ticker in enumerate(spec.stock_tickers())}
+
+    started = time.perf_counter()
+    trading_data = predictions = 0
+    for chunk in generate_chunks(spec, open_days, model_ids):
+        trading_data += len(chunk.trading_data["close"])
+        predictions += len(chunk.predictions["predicted_price"])
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    per_row = len(per_row_loop(spec.stock_count, len(open_days), spec.end_date))
+    loop = time.perf_counter() - started
+
+    print(
+        f"{spec.stock_count} stocks x {len(open_days)} market days: "
+        f"{trading_data} trading data rows, {predictions} predictions"
+    )
+    print(
+        f"  numpy chunks   {vectorized:7.2f}s  "
+        f"{(trading_data + predictions) / vectorized:12,.0f} rows/s"
+    )
+    print(f"  per-row loop   {loop:7.2f}s  {per_row / loop:12,.0f} rows/s")
+
+
+async def load(
+    database_url: str, scale: float, end_date: date, seed: int, window_size: int
+) -> None:
+    engine = create_async_engine(database_url)
+    service = DummyService(
+        stock_service=StockService(stock_repository=StockRepository()),
+        stock_model_service=StockModelService(
+            stock_model_repository=StockModelRepository()
+        ),
+        trading_data_service=TradingDataService(
+            trading_data_repository=TradingDataRepository(),
+            partition_service=PartitionService(
+                partition_repository=PartitionRepository(), months_ahead=0
+            ),
+            trading_data_window_service=TradingDataWindowService(
+                trading_data_window_repository=TradingDataWindowRepository(),
+                window_size=window_size,
+            ),
+        ),
+        dummy_repository=DummyRepository(),
+    )
+    try:
+        async with AsyncSession(engine) as db:
+            summary = await service.generate_dataset(
+                db=db, scale=scale, end_date=end_date, seed=seed
+            )
+    finally:
+        await engine.dispose()
+
+    rows = summary["trading_data"] + summary["predictions"]
+    print(
+        f"Loaded {summary['trading_data']} trading data rows and "
+        f"{summary['predictions']} predictions in {summary['load_seconds']}s "
+        f"({rows / summary['load_seconds']:,.0f} rows/s), "
+        f"{summary['total_seconds']}s with windows and ANALYZE"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--window-size", type=int, default=120)
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(
+            load(
+                args.database_url,
+                args.scale,
+                args.end_date,
+                args.seed,
+                args.window_size,
+            )
+        )
+    else:
+        time_generation(
+            DatasetSpec.from_scale(args.scale, end_date=args.end_date, seed=args.seed)
+        )
+
+
+if __name__ == "__main__":
+    main()
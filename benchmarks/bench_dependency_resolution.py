@@ -0,0 +1,102 @@
+"""
+Per-request cost of resolving a route's controller dependency.
+
+Resolves controllers through FastAPI's own `solve_dependencies`, the way a request
+does, in two ways:
+
+- rebuilt: a sync dependency that builds the whole service graph again, which is
+  what every request paid before the app-scoped container (the sync dependency
+  also runs in FastAPI's thread pool);
+- app-scoped: `Depends(provide(...))`, returning the instance of the container.
+
+Needs the usual app environment variables; nothing is connected to.
+
+    python -m benchmarks.bench_dependency_resolution
+    python -m benchmarks.bench_dependency_resolution --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import AsyncExitStack
+
+from fastapi import Depends
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from starlette.requests import Request
+
+from app.api.internal.controllers.metrics_controller import get_metrics_controller
+from app.api.ml_ops.controllers.inference_controller import get_inference_controller
+from app.api.public.controllers.info_controller import get_info_controller
+from app.api.public.controllers.predict_controller import get_predict_controller
+from app.api.scheduler_jobs.scheduler_job_controller import (
+    get_scheduler_job_controller,
+)
+from app.core.dependencies.container import get_container, provide
+
+FACTORIES = (
+    get_info_controller,
+    get_predict_controller,
+    get_metrics_controller,
+    get_inference_controller,
+    get_scheduler_job_controller,
+)
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/",
+    "headers": [],
+    "query_string": b"",
+}
+
+
+def rebuilt(factory):
+    def dependency():
+        get_container().clear()
+        return factory()
+
+    return dependency
+
+
+def dependant_of(dependency):
+    async def endpoint(controller=Depends(dependency)):
+        return controller
+
+    return get_dependant(path="/", call=endpoint)
+
+
+async def time_resolution(dependency, requests: int) -> float:
+    dependant = dependant_of(dependency)
+    started = time.perf_counter()
+    for _ in range(requests):
+        async with AsyncExitStack() as stack:
+            await solve_dependencies(
+                request=Request(SCOPE),
+                dependant=dependant,
+                async_exit_stack=stack,
+                embed_body_fields=False,
+            )
+    return (time.perf_counter() - started) / requests
+
+
+async def main_async(requests: int) -> None:
+    print(f"{'controller':<30} {'rebuilt us':>11} {'app-scoped us':>14} {'speedup':>8}")
+    for factory in FACTORIES:
+        before = await time_resolution(rebuilt(factory), requests)
+        get_container().clear()
+        after = await time_resolution(provide(factory), requests)
+        print(
+            f"{factory.__name__:<30} {before * 1e6:>11.1f} {after * 1e6:>14.1f} "
+            f"{before / after:>7.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args.requests))
+
+
+if __name__ == "__main__":
+    main()
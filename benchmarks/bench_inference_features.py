@@ -0,0 +1,167 @@
+"""
+Compare the previous `defaultdict` inference payload assembly with
+`InferenceFeatureBuilder`, from already fetched rows to request schemas.
+
+Rows for the previous path are plain objects, so the ORM hydration it also paid
+for is not part of its timing.
+
+    python -m benchmarks.bench_inference_features
+    python -m benchmarks.bench_inference_features --tickers 200 --days-back 60 500
+"""
+
+import argparse
+import asyncio
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.api.ml_ops.schemas.inference_schema import StockToPredictRequestSchema
+from app.api.ml_ops.services.inference_feature_builder import InferenceFeatureBuilder
+from app.core.enums.trading_data_enum import TradingDataEnum
+
+FEATURES_USED = [TradingDataEnum.CLOSE.value, TradingDataEnum.VOLUMES.value]
+
+
+def make_data(tickers: int, days_back: int):
+    rng = np.random.default_rng(0)
+    stock_tickers = [f"T{i:04d}" for i in range(tickers)]
+    models = [
+        SimpleNamespace(
+            id=i,
+            stock_ticker=stock_ticker,
+            features_used=FEATURES_USED,
+            model_path="model.keras",
+            scaler_path="scaler.pkl",
+        )
+        for i, stock_ticker in enumerate(stock_tickers)
+    ]
+    orm_rows, column_rows = [], []
+    for stock_ticker in stock_tickers:
+        prices = rng.uniform(10, 100, size=(days_back, 4)).tolist()
+        volumes = rng.integers(1_000, 100_000, size=days_back).tolist()
+        for day in range(days_back):
+            close, open_, high, low = prices[day]
+            row_id = len(orm_rows) + 1
+            orm_rows.append(
+                SimpleNamespace(
+                    id=row_id,
+                    stock_ticker=stock_ticker,
+                    close=close,
+                    open=open_,
+                    high=high,
+                    low=low,
+                    volumes=volumes[day],
+                )
+            )
+            column_rows.append((stock_ticker, row_id, close, volumes[day]))
+    return stock_tickers, models, orm_rows, column_rows
+
+
+def run_previous(models, trading_data_list, days_back: int):
+    """Replica of the previous `get_inference_data_by_stock_tickers` body."""
+    trading_data_map = defaultdict(
+        lambda: {
+            "trading_data_id": [],
+            TradingDataEnum.CLOSE: [],
+            TradingDataEnum.VOLUMES: [],
+            TradingDataEnum.HIGH: [],
+            TradingDataEnum.LOW: [],
+            TradingDataEnum.OPEN: [],
+        }
+    )
+    for trading_data in trading_data_list:
+        data = trading_data_map[trading_data.stock_ticker]
+        data["trading_data_id"].append(trading_data.id)
+        data[TradingDataEnum.CLOSE].append(trading_data.close)
+        data[TradingDataEnum.VOLUMES].append(trading_data.volumes)
+        data[TradingDataEnum.HIGH].append(trading_data.high)
+        data[TradingDataEnum.LOW].append(trading_data.low)
+        data[TradingDataEnum.OPEN].append(trading_data.open)
+
+    return [
+        StockToPredictRequestSchema(
+            stock_ticker=model.stock_ticker,
+            trading_data_id=(
+                trading_data_map[model.stock_ticker]["trading_data_id"][-1]
+                if len(trading_data_map[model.stock_ticker]["trading_data_id"]) > 1
+                else None
+            ),
+            **{
+                feature.value: (
+                    trading_data_map[model.stock_ticker][feature][:days_back]
+                    if feature in model.features_used
+                    else []
+                )
+                for feature in TradingDataEnum
+            },
+            model_id=model.id,
+            model_path=model.model_path,
+            scaler_path=model.scaler_path,
+        )
+        for model in models
+    ]
+
+
+async def run_builder(stock_tickers, models, rows, days_back: int, batch_size: int):
+    async def stream():
+        for i in range(0, len(rows), batch_size):
+            yield rows[i : i + batch_size]  # noqa: E203
+
+    builder = InferenceFeatureBuilder(
+        stock_tickers=stock_tickers,
+        days_back=days_back,
+        features=[TradingDataEnum(feature) for feature in FEATURES_USED],
+    )
+    await builder.consume(stream())
+    builder.validate()
+    return builder.to_request_schemas(models)
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--days-back", type=int, nargs="+", default=[60, 500])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'days_back':>9} {'rows':>8} {'previous (s)':>13} {'builder (s)':>12}")
+    for days_back in args.days_back:
+        stock_tickers, models, orm_rows, column_rows = make_data(
+            args.tickers, days_back
+        )
+
+        def build():
+            return asyncio.run(
+                run_builder(
+                    stock_tickers, models, column_rows, days_back, args.batch_size
+                )
+            )
+
+        previous = run_previous(models, orm_rows, days_back)
+        built = build()
+        assert [p.model_dump() for p in previous] == [b.model_dump() for b in built]
+
+        previous_elapsed = best_of(
+            args.repeat, lambda: run_previous(models, orm_rows, days_back)
+        )
+        builder_elapsed = best_of(args.repeat, build)
+        print(
+            f"{days_back:>9} {len(orm_rows):>8} {previous_elapsed:>13.4f} "
+            f"{builder_elapsed:>12.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
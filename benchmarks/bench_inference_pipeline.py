@@ -0,0 +1,248 @@
+"""
+Run `scheduled_infer_and_save` end to end against the fake ML server and report
+the time of every stage.
+
+The services are the ones the scheduler job uses, on the database and Redis of
+the usual app environment, except that the inference dispatcher and Discord talk
+to `benchmarks.fake_ml_server` served in process (or at `--ml-server-url`). Each
+run deletes today's predictions first, so the incremental job infers every
+active stock again; use a scratch database, optionally seeded with
+`--seed-scale` through `DummyService.generate_dataset`.
+
+Stage timings come from the metrics the pipeline already sends (`get_data`,
+`ml`, `save`, `total_predict`), with SQL statements and ML server calls
+recorded by the request profiler. Results are printed and saved as JSON.
+
+    python -m benchmarks.bench_inference_pipeline --seed-scale 1
+    python -m benchmarks.bench_inference_pipeline --runs 3 --stock-failure-rate 0.02
+    python -m benchmarks.bench_inference_pipeline --stock-latency lognormal:40:0.8 \\
+        --max-concurrency 2 --chunk-size 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+import httpx
+from benchmarks.fake_ml_server import (
+    add_profile_arguments,
+    create_fake_ml_server,
+    profile_from_args,
+)
+from sqlalchemy import delete, func, select
+
+from app.api.dummy.dummy_service import get_dummy_service
+from app.api.ml_ops.services.inference_dispatcher import InferenceDispatcher
+from app.api.scheduler_jobs.scheduler_job_service import get_scheduler_job_service
+from app.core.clients.discord_client import DiscordClient, DiscordOperations
+from app.core.clients.http_client_pool import PooledHttpClient
+from app.core.clients.ml_server_client import MLServerClient
+from app.core.clients.ml_server_operations import MLServerOperations
+from app.core.common.utils.datetime_utils import get_today_bangkok_date
+from app.core.common.utils.request_profiler import (
+    RequestProfile,
+    reset_current_profile,
+    set_current_profile,
+)
+from app.core.enums.job_enum import JobConfigEnum
+from app.core.settings.config import get_config
+from app.core.settings.database import AsyncSessionLocal
+from app.models import Prediction
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+STAGES = ("get_data", "ml", "save", "total_predict")
+
+
+def wire_fake_ml_server(scheduler, args, transport: Optional[httpx.AsyncBaseTransport]):
+    """Point the scheduler's inference dispatcher and Discord at the fake server."""
+    config = get_config()
+    ml_http = PooledHttpClient(
+        name="ml_server",
+        base_url=args.ml_server_url or "http://fake-ml-server",
+        headers={"X-API-Key": config.ML_SERVER_API_KEY},
+        timeout=config.ML_SERVER_TIMEOUT_SECONDS,
+        max_connections=config.ML_SERVER_MAX_CONNECTIONS,
+        max_keepalive_connections=config.ML_SERVER_MAX_KEEPALIVE_CONNECTIONS,
+        transport=None if args.ml_server_url else transport,
+    )
+    # webhooks always go to the in-process fake, never to Discord
+    discord = DiscordOperations(
+        DiscordClient(http_client=PooledHttpClient(name="discord", transport=transport))
+    )
+
+    inference_service = scheduler.inference_service
+    inference_service.inference_dispatcher = InferenceDispatcher(
+        ml_operations=MLServerOperations(MLServerClient(http_client=ml_http)),
+        chunk_size=args.chunk_size or config.ML_INFERENCE_CHUNK_SIZE,
+        max_concurrency=args.dispatch_concurrency
+        or config.ML_INFERENCE_MAX_CONCURRENCY,
+        max_retries=config.ML_INFERENCE_MAX_RETRIES,
+        retry_backoff_seconds=config.ML_INFERENCE_RETRY_BACKOFF_SECONDS,
+    )
+    inference_service.discord = discord
+    scheduler.discord = discord
+    scheduler.job_config_service.discord = discord
+    return ml_http
+
+
+async def prepare_job_configs(scheduler, args) -> None:
+    values = {
+        JobConfigEnum.RUN_INFERENCE_CIRCUIT_BREAKER: "false",
+        JobConfigEnum.LAST_SUCCESS_PULL_TRADING_DATA: "true",
+        JobConfigEnum.RUN_INFERENCE_DAYS_BACK: str(args.days_back),
+        JobConfigEnum.RUN_INFERENCE_DAYS_FORWARD: str(args.days_forward),
+        JobConfigEnum.SAVE_INFERENCE_PERIODS: args.periods,
+    }
+    async with AsyncSessionLocal() as db:
+        for key, value in values.items():
+            await scheduler.job_config_service.set_job_config(
+                db=db, key=key, value=value, notify=False
+            )
+
+
+async def run_once(scheduler, fake_stats) -> dict:
+    today = get_today_bangkok_date()
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Prediction).where(Prediction.target_date == today))
+        await db.commit()
+
+    before = fake_stats.to_dict() if fake_stats else None
+    profile = RequestProfile(
+        method="JOB", path="scheduled_infer_and_save", sample_interval_seconds=0
+    )
+    token = set_current_profile(profile)
+    error = None
+    started = time.perf_counter()
+    try:
+        async with AsyncSessionLocal() as db:
+            await scheduler.scheduled_infer_and_save(db=db)
+    except Exception as e:
+        error = str(e)
+    finally:
+        elapsed = time.perf_counter() - started
+        reset_current_profile(token)
+
+    async with AsyncSessionLocal() as db:
+        saved = await db.scalar(
+            select(func.count())
+            .select_from(Prediction)
+            .where(Prediction.target_date == today)
+        )
+
+    report = profile.to_dict(top_stacks=0)
+    fake = None
+    if fake_stats:
+        after = fake_stats.to_dict()
+        fake = {
+            key: after[key] - before[key]
+            for key in ("requests", "failed_requests", "stocks", "failed_stocks")
+        }
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "error": error,
+        "saved_predictions": saved,
+        "stages": {stage: report["timers"].get(stage) for stage in STAGES},
+        "sql": {
+            "statements": sum(s["count"] for s in report["statements"]),
+            "total_ms": round(sum(s["total_ms"] for s in report["statements"]), 3),
+            "slowest": report["statements"][:5],
+        },
+        "clients": report["clients"],
+        "fake_ml_server": fake,
+    }
+
+
+def print_run(index: int, run: dict) -> None:
+    status = f"failed: {run['error']}" if run["error"] else "ok"
+    print(
+        f"\nrun {index}: {run['elapsed_seconds']:.2f}s, "
+        f"{run['saved_predictions']} predictions saved, {status}"
+    )
+    print(f"  {'stage':<14} {'calls':>6} {'total ms':>10} {'max ms':>10}")
+    for stage, stats in run["stages"].items():
+        if stats:
+            print(
+                f"  {stage:<14} {stats['count']:>6} {stats['total_ms']:>10.1f} "
+                f"{stats['max_ms']:>10.1f}"
+            )
+    sql = run["sql"]
+    print(f"  {'sql':<14} {sql['statements']:>6} {sql['total_ms']:>10.1f}")
+    for name, stats in run["clients"].items():
+        print(
+            f"  {name:<14} {stats['count']:>6} {stats['total_ms']:>10.1f} "
+            f"{stats['max_ms']:>10.1f}  ({stats['failed']} failed)"
+        )
+    if run["fake_ml_server"]:
+        print(f"  fake ML server: {run['fake_ml_server']}")
+
+
+async def main_async(args) -> None:
+    if args.seed_scale:
+        async with AsyncSessionLocal() as db:
+            summary = await get_dummy_service().generate_dataset(
+                db=db, scale=args.seed_scale, end_date=get_today_bangkok_date()
+            )
+        print(f"Seeded: {summary}")
+
+    fake_app = create_fake_ml_server(profile_from_args(args))
+    transport = httpx.ASGITransport(app=fake_app)
+    fake_stats = None if args.ml_server_url else fake_app.state.stats
+
+    scheduler = get_scheduler_job_service()
+    ml_http = wire_fake_ml_server(scheduler, args, transport)
+    await prepare_job_configs(scheduler, args)
+
+    runs = []
+    try:
+        for index in range(1, args.runs + 1):
+            run = await run_once(scheduler, fake_stats)
+            print_run(index, run)
+            runs.append(run)
+    finally:
+        await ml_http.aclose()
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"inference_pipeline_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "started_at": datetime.now().isoformat(timespec="seconds"),
+                "ml_server_url": args.ml_server_url,
+                "args": {key: str(value) for key, value in vars(args).items()},
+                "runs": runs,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nSaved to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--seed-scale", type=float, help="replace the synthetic dataset first"
+    )
+    parser.add_argument(
+        "--ml-server-url", help="a fake or real ML server instead of the in-process one"
+    )
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument("--dispatch-concurrency", type=int)
+    parser.add_argument("--days-back", type=int, default=60)
+    parser.add_argument("--days-forward", type=int, default=15)
+    parser.add_argument("--periods", default="1,5,10,15")
+    parser.add_argument("--output", help=f"result file, in {RESULTS_DIR} by default")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
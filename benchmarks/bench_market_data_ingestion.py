@@ -0,0 +1,105 @@
+"""
+Compare the old serial per-ticker `yf.download` loop with `MarketDataClient`.
+
+Uses a local fake downloader that sleeps like a network round trip, so no
+internet access is needed.
+
+    python -m benchmarks.bench_market_data_ingestion
+    python -m benchmarks.bench_market_data_ingestion --latency 0.05 --sizes 50 200
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from app.core.clients.market_data_client import TICKER_SUFFIX, MarketDataClient
+
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def make_fake_downloader(request_latency: float, per_ticker_latency: float):
+    def fake_download(
+        tickers, start=None, end=None, threads=False, **kwargs
+    ) -> pd.DataFrame:
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        # yfinance spreads the tickers of a download over its own threads
+        parallel = max(min(int(threads), len(tickers)), 1)
+        time.sleep(request_latency + per_ticker_latency * len(tickers) / parallel)
+
+        index = pd.date_range(start=start, end=end - timedelta(days=1), freq="D")
+        values = np.random.uniform(10, 100, size=(len(index), len(tickers) * 5))
+        columns = pd.MultiIndex.from_product([tickers, FIELDS])
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    return fake_download
+
+
+def run_serial(downloader, stock_tickers: list[str], target_date: date) -> int:
+    """Replica of the previous `pull_trading_data` loop: one request per ticker."""
+    rows = 0
+    for stock_ticker in stock_tickers:
+        data = downloader(
+            stock_ticker + TICKER_SUFFIX,
+            start=target_date,
+            end=target_date + timedelta(days=1),
+            auto_adjust=True,
+        )
+        if not data.empty:
+            rows += 1
+    return rows
+
+
+async def run_engine(client: MarketDataClient, stock_tickers, target_date) -> int:
+    result = await client.fetch(
+        stock_tickers=stock_tickers,
+        start_date=target_date,
+        end_date=target_date + timedelta(days=1),
+    )
+    assert not result.failed_tickers, result.failed_tickers
+    return len(result.rows)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--per-ticker-latency", type=float, default=0.0005)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    downloader = make_fake_downloader(args.latency, args.per_ticker_latency)
+    client = MarketDataClient(
+        downloader=downloader,
+        batch_size=args.batch_size,
+        threads=args.threads,
+    )
+    target_date = date(2025, 6, 2)
+
+    print(f"{'tickers':>8} {'serial (s)':>12} {'engine (s)':>12} {'speedup':>9}")
+    for size in args.sizes:
+        stock_tickers = [f"T{i:04d}" for i in range(size)]
+
+        start = time.perf_counter()
+        serial_rows = run_serial(downloader, stock_tickers, target_date)
+        serial_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine_rows = asyncio.run(run_engine(client, stock_tickers, target_date))
+        engine_elapsed = time.perf_counter() - start
+
+        assert serial_rows == engine_rows == size
+        print(
+            f"{size:>8} {serial_elapsed:>12.3f} {engine_elapsed:>12.3f} "
+            f"{serial_elapsed / engine_elapsed:>8.1f}x"
+        )
+
+    client.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Compare the hot `target_date` queries on plain tables and on monthly partitions.
+
+Needs a Postgres database. Two scratch schemas, `bench_plain` and
+`bench_partitioned`, are filled with the same generated multi-year data and
+dropped again at the end. The repository methods run unchanged against each
+schema through `schema_translate_map`; for every query the plan is read back with
+`EXPLAIN ANALYZE` to show how many partitions were actually scanned.
+
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_partition_pruning
+    python -m benchmarks.bench_partition_pruning --years 8 --tickers 200 --repeat 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.general.repositories.prediction_repository import PredictionRepository
+from app.api.general.repositories.trading_data_repository import (
+    TradingDataRepository,
+)
+
+SCHEMAS = ("bench_plain", "bench_partitioned")
+INDUSTRIES = ("AGRI", "BANK", "ENERG", "ICT", "PROP")
+PERIODS = (1, 5, 15)
+
+TABLES_DDL = """
+CREATE TABLE {schema}.stocks (
+    ticker VARCHAR(20) PRIMARY KEY,
+    industry_code VARCHAR(32) NOT NULL
+);
+CREATE TABLE {schema}.trading_data (
+    id SERIAL,
+    stock_ticker VARCHAR(20) NOT NULL,
+    target_date DATE NOT NULL,
+    close FLOAT NOT NULL,
+    open FLOAT NOT NULL,
+    high FLOAT NOT NULL,
+    low FLOAT NOT NULL,
+    volumes INTEGER NOT NULL,
+    PRIMARY KEY ({trading_data_key}),
+    UNIQUE (stock_ticker, target_date)
+) {partition_by};
+CREATE INDEX ON {schema}.trading_data (stock_ticker, target_date);
+CREATE TABLE {schema}.predictions (
+    id SERIAL,
+    model_id INTEGER NOT NULL,
+    stock_ticker VARCHAR(20) NOT NULL,
+    target_date DATE NOT NULL,
+    period INTEGER NOT NULL,
+    closing_price FLOAT,
+    trading_data_id INTEGER,
+    predicted_price FLOAT NOT NULL,
+    rank INTEGER,
+    top_prediction_id INTEGER,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    modified_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY ({predictions_key}),
+    UNIQUE (stock_ticker, model_id, target_date, period)
+) {partition_by};
+CREATE INDEX ON {schema}.predictions (stock_ticker, target_date, period);
+"""
+
+DATA_SQL = """
+INSERT INTO {schema}.stocks (ticker, industry_code)
+SELECT 'T' || lpad(t::text, 4, '0'), (ARRAY[{industries}])[1 + t % {industry_count}]
+FROM generate_series(1, {tickers}) t;
+
+INSERT INTO {schema}.trading_data
+    (stock_ticker, target_date, close, open, high, low, volumes)
+SELECT ticker, d::date, 100 + random() * 50, 100 + random() * 50,
+       150 + random() * 10, 90 + random() * 10, (random() * 10000)::int
+FROM {schema}.stocks, generate_series('{start}'::date, '{end}'::date, '1 day') d
+WHERE extract(isodow FROM d) < 6;
+
+INSERT INTO {schema}.predictions
+    (model_id, stock_ticker, target_date, period, predicted_price)
+SELECT 1, ticker, d::date, p, 100 + random() * 50
+FROM {schema}.stocks,
+     generate_series('{start}'::date, '{end}'::date, '1 day') d,
+     unnest(ARRAY[{periods}]) p
+WHERE extract(isodow FROM d) < 6;
+"""
+
+
+def month_starts(start: date, end: date) -> list[date]:
+    months, month = [], start.replace(day=1)
+    while month <= end:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+    return months
+
+
+async def create_schema(
+    engine, schema: str, start: date, end: date, tickers: int
+) -> int:
+    partitioned = schema == "bench_partitioned"
+    ddl = TABLES_DDL.format(
+        schema=schema,
+        trading_data_key="id, target_date" if partitioned else "id",
+        predictions_key="id, target_date" if partitioned else "id",
+        partition_by="PARTITION BY RANGE (target_date)" if partitioned else "",
+    )
+    months = month_starts(start, end) if partitioned else []
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+        for statement in filter(str.strip, ddl.split(";")):
+            await conn.execute(text(statement))
+        for table in ("trading_data", "predictions"):
+            for month in months:
+                next_month = (month + timedelta(days=32)).replace(day=1)
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE {schema}.{table}_p{month:%Y_%m} "
+                        f"PARTITION OF {schema}.{table} "
+                        f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+                    )
+                )
+        data_sql = DATA_SQL.format(
+            schema=schema,
+            industries=", ".join(f"'{code}'" for code in INDUSTRIES),
+            industry_count=len(INDUSTRIES),
+            tickers=tickers,
+            start=start,
+            end=end,
+            periods=", ".join(str(period) for period in PERIODS),
+        )
+        for statement in filter(str.strip, data_sql.split(";")):
+            await conn.execute(text(statement))
+        await conn.execute(text(f"ANALYZE {schema}.trading_data"))
+        await conn.execute(text(f"ANALYZE {schema}.predictions"))
+        await conn.execute(text(f"ANALYZE {schema}.stocks"))
+    return len(months)
+
+
+def scanned_relations(plan: dict) -> set[str]:
+    relations = set()
+    if "Relation Name" in plan:
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        relations |= scanned_relations(child)
+    return relations
+
+
+async def explain_last_statement(session: AsyncSession, captured: list) -> set[str]:
+    statement, parameters = captured[-1]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return scanned_relations(plan[0]["Plan"])
+
+
+async def run_query(engine, schema: str, name: str, query, repeat: int):
+    translated = engine.execution_options(schema_translate_map={None: schema})
+    captured: list = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        timings = []
+        async with AsyncSession(translated) as session:
+            rows = 0
+            for _ in range(repeat):
+                started = time.perf_counter()
+                rows = len(await query(session))
+                timings.append(time.perf_counter() - started)
+            relations = await explain_last_statement(session, captured)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    partitions = [r for r in relations if re.search(r"_p\d{4}_\d{2}$", r)]
+    scanned = f"{len(partitions)} partitions" if partitions else "whole table"
+    print(
+        f"  {name:<45} {schema:<18} median {statistics.median(timings) * 1000:8.2f}ms"
+        f"  rows {rows:<6} scanned: {scanned}"
+    )
+
+
+async def main_async(args) -> None:
+    engine = create_async_engine(args.database_url)
+    end = date.today()
+    start = end - timedelta(days=365 * args.years)
+    tickers = [f"T{i:04d}" for i in range(1, args.tickers + 1)]
+    rng = random.Random(0)
+
+    try:
+        for schema in SCHEMAS:
+            started = time.perf_counter()
+            months = await create_schema(engine, schema, start, end, args.tickers)
+            print(
+                f"{schema}: {args.years} years, {args.tickers} tickers, "
+                f"{months} monthly partitions per table, "
+                f"loaded in {time.perf_counter() - started:.1f}s"
+            )
+
+        last_date = end - timedelta(days=rng.randint(0, 30))
+        while last_date.weekday() >= 5:
+            last_date -= timedelta(days=1)
+        query_tickers = rng.sample(tickers, min(args.tickers_per_query, len(tickers)))
+
+        async def trading_data_query(session):
+            return await TradingDataRepository.fetch_by_stock_tickers_and_date_range(
+                db=session,
+                stock_tickers=query_tickers,
+                last_date=last_date,
+                days_back=args.days_back,
+            )
+
+        async def predictions_query(session):
+            return await PredictionRepository.fetch_by_date_and_period_and_industry_code(
+                db=session,
+                target_date=last_date,
+                period=PERIODS[0],
+                industry_code=INDUSTRIES[0],
+            )
+
+        print(f"\nlast date {last_date}, days back {args.days_back}")
+        for name, query in (
+            ("fetch_by_stock_tickers_and_date_range", trading_data_query),
+            ("fetch_by_date_and_period_and_industry_code", predictions_query),
+        ):
+            for schema in SCHEMAS:
+                await run_query(engine, schema, name, query, args.repeat)
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                for schema in SCHEMAS:
+                    await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--tickers-per-query", type=int, default=20)
+    parser.add_argument("--days-back", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the schemas")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
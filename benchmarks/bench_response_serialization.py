@@ -0,0 +1,76 @@
+"""
+Compare the previous `success_response` (model_dump, a log line with the whole
+payload, stdlib json via JSONResponse) with the current one on a large
+`InferenceResultSummarySchema`.
+
+    python -m benchmarks.bench_response_serialization
+    python -m benchmarks.bench_response_serialization --stocks 500 --days-ahead 16
+"""
+
+import argparse
+import logging
+import time
+
+from fastapi.responses import JSONResponse
+
+from app.api.ml_ops.schemas.inference_schema import (
+    InferenceResultSchema,
+    InferenceResultSummarySchema,
+)
+from app.core.common.utils.response_handlers import success_response
+
+logger = logging.getLogger(__name__)
+
+
+def previous_success_response(data=None, message="Success", status_code=200):
+    data = data.model_dump()
+    # formatted even when INFO is filtered out, as the f-string did
+    logger.info(f"Success | Status: {status_code} | Message: {message} | Data: {data}")
+    return JSONResponse(
+        status_code=status_code,
+        content={"status": "success", "message": message, "data": data},
+    )
+
+
+def make_summary(stocks: int, days_ahead: int) -> InferenceResultSummarySchema:
+    return InferenceResultSummarySchema(
+        success=[
+            InferenceResultSchema(
+                stock_ticker=f"T{i:04d}",
+                predicted_price=[100.0 + i + d / 7 for d in range(days_ahead)],
+                success=True,
+            )
+            for i in range(stocks)
+        ],
+        failed=[],
+    )
+
+
+def timed(func, data, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = func(data=data).body
+    return (time.perf_counter() - started) / repeat, body
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stocks", type=int, default=2000)
+    parser.add_argument("--days-ahead", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    summary = make_summary(args.stocks, args.days_ahead)
+
+    previous_time, previous_body = timed(previous_success_response, summary, args.repeat)
+    current_time, current_body = timed(success_response, summary, args.repeat)
+
+    print(f"payload: {args.stocks} stocks x {args.days_ahead} days")
+    print(f"previous: {previous_time * 1000:.2f}ms ({len(previous_body)} bytes)")
+    print(f"current:  {current_time * 1000:.2f}ms ({len(current_body)} bytes)")
+    print(f"speedup:  {previous_time / current_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
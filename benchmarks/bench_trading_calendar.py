@@ -0,0 +1,72 @@
+"""
+Compare the previous day-by-day market-day loops in `datetime_utils` with
+`TradingCalendar` lookups.
+
+    python -m benchmarks.bench_trading_calendar
+    python -m benchmarks.bench_trading_calendar --calls 20000 --days-ahead 5 16 120
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from app.core.common.utils.trading_calendar import TradingCalendar
+
+CALENDAR = TradingCalendar.from_file()
+
+
+def is_market_closed(d: date) -> bool:
+    return d.weekday() >= 5 or d in CALENDAR.holidays
+
+
+def loop_n_market_days_ahead(start_date: date, n: int) -> date:
+    count = 0
+    next_date = start_date
+    while count < n:
+        next_date += timedelta(days=1)
+        if not is_market_closed(next_date):
+            count += 1
+    return next_date
+
+
+def loop_last_market_open_date(start_date: date) -> date:
+    last_date = start_date - timedelta(days=1)
+    while is_market_closed(last_date):
+        last_date -= timedelta(days=1)
+    return last_date
+
+
+def timed(func, dates, n):
+    started = time.perf_counter()
+    results = [func(d, n) for d in dates]
+    return time.perf_counter() - started, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10000)
+    parser.add_argument("--days-ahead", type=int, nargs="+", default=[1, 16, 120])
+    args = parser.parse_args()
+
+    dates = [date(2025, 1, 1) + timedelta(days=i % 365) for i in range(args.calls)]
+
+    for n in args.days_ahead:
+        loop_time, expected = timed(loop_n_market_days_ahead, dates, n)
+        calendar_time, results = timed(CALENDAR.n_open_days_ahead, dates, n)
+        assert results == expected
+        print(
+            f"n_market_days_ahead n={n:<4} loop: {loop_time:.4f}s  "
+            f"calendar: {calendar_time:.4f}s  ({loop_time / calendar_time:.1f}x)"
+        )
+
+    loop_time, expected = timed(lambda d, _: loop_last_market_open_date(d), dates, 1)
+    calendar_time, results = timed(CALENDAR.n_open_days_behind, dates, 1)
+    assert results == expected
+    print(
+        f"last_market_open_date      loop: {loop_time:.4f}s  "
+        f"calendar: {calendar_time:.4f}s  ({loop_time / calendar_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+A local stand-in for the ML server's `/predict`, for offline pipeline benchmarks.
+
+Speaks the contract of `MLServerOperations.run_inference`: a body of
+`{"stocks": [StockToPredictRequestSchema], "days_ahead": n}` is answered with
+`{"status": "success", "data": [InferenceResultSchema]}`, one predicted price per
+day ahead from a random walk on the last close. Latency, failures and payload
+size are configurable:
+
+- every request waits `--request-latency` plus the latency of each of its
+  stocks, drawn from `--stock-latency` or a `--ticker-latency` override;
+- `--max-concurrency` requests are served at a time, the rest queue like on a
+  saturated model server;
+- `--request-failure-rate` of requests fail with HTTP 500 and
+  `--stock-failure-rate` of stocks come back with `success: false`;
+- `--payload-bytes` of padding are added to every result.
+
+Latencies are `fixed:MS`, `uniform:LOW_MS:HIGH_MS` or `lognormal:MEDIAN_MS:SIGMA`.
+Any other POST path is accepted as a Discord webhook and only counted.
+
+    python -m benchmarks.fake_ml_server --port 8766 --stock-latency lognormal:30:0.5
+    ML_SERVER_URL=http://127.0.0.1:8766 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from app.api.ml_ops.schemas.inference_schema import (
+    InferenceResultSchema,
+    StockToPredictRequestSchema,
+)
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    kind: str = "fixed"
+    # fixed: the latency; uniform: the bounds; lognormal: the median and sigma
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, value: str) -> "LatencyDistribution":
+        kind, *params = value.split(":")
+        numbers = [float(param) for param in params]
+        if kind == "fixed" and len(numbers) == 1:
+            return cls(kind, numbers[0])
+        if kind in ("uniform", "lognormal") and len(numbers) == 2:
+            return cls(kind, *numbers)
+        raise ValueError(f"Invalid latency distribution '{value}'")
+
+    def sample_ms(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(max(self.a, 1e-9)), self.b)
+        return self.a
+
+
+@dataclass
+class FakeMLServerProfile:
+    request_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    stock_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    ticker_latencies: dict[str, LatencyDistribution] = field(default_factory=dict)
+    max_concurrency: int = 4
+    request_failure_rate: float = 0.0
+    stock_failure_rate: float = 0.0
+    payload_bytes: int = 0
+    api_key: Optional[str] = None
+    seed: int = 0
+
+
+@dataclass
+class FakeMLServerStats:
+    requests: int = 0
+    failed_requests: int = 0
+    stocks: int = 0
+    failed_stocks: int = 0
+    queued_seconds: float = 0.0
+    latency_seconds: float = 0.0
+    webhook_messages: int = 0
+
+    def to_dict(self) -> dict:
+        served = max(self.requests, 1)
+        return {
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "stocks": self.stocks,
+            "failed_stocks": self.failed_stocks,
+            "mean_queued_ms": round(self.queued_seconds / served * 1000, 2),
+            "mean_latency_ms": round(self.latency_seconds / served * 1000, 2),
+            "webhook_messages": self.webhook_messages,
+        }
+
+
+def predict(
+    stock: StockToPredictRequestSchema, days_ahead: int, rng: random.Random
+) -> list[float]:
+    price = stock.close[-1] if stock.close else 100.0
+    prices = []
+    for _ in range(days_ahead):
+        price *= math.exp(rng.gauss(0, 0.015))
+        prices.append(round(price, 4))
+    return prices
+
+
+def create_fake_ml_server(profile: FakeMLServerProfile) -> FastAPI:
+    app = FastAPI(title="Fake ML server")
+    app.state.stats = stats = FakeMLServerStats()
+    rng = random.Random(profile.seed)
+    semaphore = asyncio.Semaphore(max(profile.max_concurrency, 1))
+    padding = "x" * profile.payload_bytes
+
+    @app.post("/predict")
+    async def predict_route(request: Request):
+        if profile.api_key and request.headers.get("x-api-key") != profile.api_key:
+            return JSONResponse({"status": "error", "message": "Invalid API key"}, 401)
+
+        body = await request.json()
+        stocks = [StockToPredictRequestSchema(**stock) for stock in body["stocks"]]
+        days_ahead = int(body["days_ahead"])
+        stats.requests += 1
+        stats.stocks += len(stocks)
+
+        latency_ms = profile.request_latency.sample_ms(rng) + sum(
+            profile.ticker_latencies.get(
+                stock.stock_ticker, profile.stock_latency
+            ).sample_ms(rng)
+            for stock in stocks
+        )
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        async with semaphore:
+            stats.queued_seconds += loop.time() - queued_at
+            stats.latency_seconds += latency_ms / 1000
+            await asyncio.sleep(latency_ms / 1000)
+
+        if rng.random() < profile.request_failure_rate:
+            stats.failed_requests += 1
+            return JSONResponse(
+                {"status": "error", "message": "Injected request failure"}, 500
+            )
+
+        results = []
+        for stock in stocks:
+            if rng.random() < profile.stock_failure_rate:
+                stats.failed_stocks += 1
+                result = InferenceResultSchema(
+                    stock_ticker=stock.stock_ticker,
+                    success=False,
+                    error_message="Injected stock failure",
+                )
+            else:
+                result = InferenceResultSchema(
+                    stock_ticker=stock.stock_ticker,
+                    predicted_price=predict(stock, days_ahead, rng),
+                    success=True,
+                )
+            payload = result.model_dump()
+            if padding:
+                # unknown fields are ignored by `InferenceResultSchema`
+                payload["padding"] = padding
+            results.append(payload)
+        return {"status": "success", "data": results}
+
+    @app.get("/stats")
+    async def stats_route():
+        return stats.to_dict()
+
+    @app.post("/{path:path}")
+    async def webhook_route(path: str):
+        stats.webhook_messages += 1
+        return Response(status_code=204)
+
+    return app
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--request-latency", type=LatencyDistribution.parse, default="fixed:20"
+    )
+    parser.add_argument(
+        "--stock-latency", type=LatencyDistribution.parse, default="lognormal:15:0.4"
+    )
+    parser.add_argument(
+        "--ticker-latency",
+        action="append",
+        default=[],
+        metavar="TICKER=DISTRIBUTION",
+        help="latency of one ticker, e.g. PTT=fixed:500",
+    )
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--request-failure-rate", type=float, default=0.0)
+    parser.add_argument("--stock-failure-rate", type=float, default=0.0)
+    parser.add_argument("--payload-bytes", type=int, default=0)
+    parser.add_argument("--fake-seed", type=int, default=0)
+
+
+def profile_from_args(args, api_key: Optional[str] = None) -> FakeMLServerProfile:
+    ticker_latencies = {}
+    for value in args.ticker_latency:
+        ticker, _, distribution = value.partition("=")
+        ticker_latencies[ticker.upper()] = LatencyDistribution.parse(distribution)
+    return FakeMLServerProfile(
+        request_latency=args.request_latency,
+        stock_latency=args.stock_latency,
+        ticker_latencies=ticker_latencies,
+        max_concurrency=args.max_concurrency,
+        request_failure_rate=args.request_failure_rate,
+        stock_failure_rate=args.stock_failure_rate,
+        payload_bytes=args.payload_bytes,
+        api_key=api_key,
+        seed=args.fake_seed,
+    )
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--api-key", help="require this X-API-Key, like the ML server")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    app = create_fake_ml_server(profile_from_args(args, api_key=args.api_key))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,20 @@
-resource "google_cloud_scheduler_job" "pull_trading_data" {
-  name        = "pull-trading-data-job"
-  description = "Trigger daily trading data pull"
-  schedule    = "0 18 * * *" # 6 PM every day
-  time_zone   = "Asia/Bangkok"
+resource "google_cloud_scheduler_job" "nightly_pipeline" {
+  name             = "nightly-pipeline-job"
+  description      = "Pull trading data, run inference and rank predictions"
+  schedule         = "0 18 * * *" # 6 PM every day
+  time_zone        = "Asia/Bangkok"
+  attempt_deadline = "1800s"
 
-  http_target {
-    http_method = "POST"
-    uri         = "https://${var.backend_domain}/api/jobs/pull-trading-data"
-    oidc_token {
-      service_account_email = var.scheduler_service_account
-    }
-    headers = {
-      "Content-Type" = "application/json"
-      "X-API-Key"    = var.backend_api_key
-    }
+  # a retry resumes the stages that did not succeed
+  retry_config {
+    retry_count          = 2
+    min_backoff_duration = "300s"
+    max_backoff_duration = "900s"
   }
-}
-
-resource "google_cloud_scheduler_job" "infer_and_save" {
-  name        = "infer-and-save-job"
-  description = "Run and save inference predictions"
-  schedule    = "0 20 * * *" # 8 PM every day
-  time_zone   = "Asia/Bangkok"
-
-  http_target {
-    http_method = "POST"
-    uri         = "https://${var.backend_domain}/api/jobs/trigger-infer-and-save"
-    oidc_token {
-      service_account_email = var.scheduler_service_account
-    }
-    headers = {
-      "Content-Type" = "application/json"
-      "X-API-Key"    = var.backend_api_key
-    }
-  }
-}
-
-resource "google_cloud_scheduler_job" "rank_predictions" {
-  name        = "rank-predictions-job"
-  description = "Rank stock predictions"
-  schedule    = "0 22 * * *" # 10 PM every day
-  time_zone   = "Asia/Bangkok"
 
   http_target {
     http_method = "POST"
-    uri         = "https://${var.backend_domain}/api/jobs/rank-predictions"
+    uri         = "https://${var.backend_domain}/api/jobs/nightly-pipeline"
     oidc_token {
       service_account_email = var.scheduler_service_account
     }
@@ -0,0 +1,36 @@
+import httpx
+import pytest
+
+from app.core.clients.http_client_pool import PooledHttpClient
+
+
+@pytest.mark.asyncio
+async def test_request_counts_stats_and_applies_timeout():
+    seen_timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_timeouts.append(request.extensions["timeout"]["read"])
+        if request.url.path == "/fail":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"status": "success"})
+
+    client = PooledHttpClient(
+        name="test",
+        base_url="http://ml.test",
+        timeout=30,
+        max_connections=1,
+        transport=httpx.MockTransport(handler),
+    )
+
+    await client.request("POST", "/predict", timeout=5)
+    await client.request("GET", "/health")
+    with pytest.raises(httpx.ConnectError):
+        await client.request("GET", "/fail")
+    await client.aclose()
+
+    stats = client.get_stats()
+    assert seen_timeouts == [5, 30, 30]
+    assert stats["requests"] == 3
+    assert stats["failed_requests"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["max_connections"] == 1
@@ -0,0 +1,79 @@
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.clients.market_data_client import MarketDataClient
+
+TARGET_DATE = date(2025, 6, 2)
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def fake_download(tickers, start=None, end=None, **kwargs):
+    assert kwargs["threads"] == 2
+    if "BOOM.BK" in tickers:
+        raise RuntimeError("batch failed")
+
+    index = pd.date_range(start=start, end=end - timedelta(days=1), freq="D")
+    columns = pd.MultiIndex.from_product([tickers, FIELDS])
+    data = pd.DataFrame(
+        np.full((len(index), len(columns)), 10.0), index=index, columns=columns
+    )
+    if "EMPTY.BK" in tickers:
+        data["EMPTY.BK"] = np.nan
+    return data
+
+
+@pytest.mark.asyncio
+async def test_fetch_returns_rows_per_ticker():
+    client = MarketDataClient(downloader=fake_download, batch_size=2, threads=2)
+    result = await client.fetch(
+        stock_tickers=["AAA", "BBB", "CCC"],
+        start_date=TARGET_DATE,
+        end_date=TARGET_DATE + timedelta(days=1),
+    )
+    client.shutdown()
+
+    assert result.failed_tickers == []
+    assert sorted(row["stock_ticker"] for row in result.rows) == ["AAA", "BBB", "CCC"]
+    assert result.rows[0]["target_date"] == TARGET_DATE
+    assert result.rows[0]["volumes"] == 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_reports_failed_tickers():
+    client = MarketDataClient(downloader=fake_download, batch_size=2, threads=2)
+    result = await client.fetch(
+        stock_tickers=["AAA", "EMPTY", "BOOM", "DDD"],
+        start_date=TARGET_DATE,
+        end_date=TARGET_DATE + timedelta(days=1),
+    )
+    client.shutdown()
+
+    assert [row["stock_ticker"] for row in result.rows] == ["AAA"]
+    assert sorted(result.failed_tickers) == ["BOOM", "DDD", "EMPTY"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_never_downloads_two_batches_at_once():
+    running, overlaps = [], []
+
+    def exclusive_download(tickers, **kwargs):
+        overlaps.append(bool(running))
+        running.append(tickers)
+        time.sleep(0.01)
+        running.remove(tickers)
+        return fake_download(tickers, **kwargs)
+
+    client = MarketDataClient(downloader=exclusive_download, batch_size=1, threads=2)
+    result = await client.fetch(
+        stock_tickers=["AAA", "BBB", "CCC", "DDD"],
+        start_date=TARGET_DATE,
+        end_date=TARGET_DATE + timedelta(days=1),
+    )
+    client.shutdown()
+
+    assert len(result.rows) == 4
+    assert overlaps == [False] * 4
@@ -0,0 +1,53 @@
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from app.core.common.middleware.logging_middleware import LoggingMiddleware
+from app.core.common.utils.latency_histogram import LatencyHistogram
+
+
+def make_app(histogram: LatencyHistogram, body_sample_rate: float) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        LoggingMiddleware,
+        body_sample_rate=body_sample_rate,
+        max_body_bytes=8,
+        histogram=histogram,
+    )
+
+    @app.post("/items/{item_id}")
+    async def echo(item_id: int, request: Request):
+        return {"item_id": item_id, "size": len(await request.body())}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_body_reaches_the_app_and_only_a_prefix_is_logged(caplog):
+    histogram = LatencyHistogram()
+    transport = httpx.ASGITransport(app=make_app(histogram, body_sample_rate=1.0))
+
+    with caplog.at_level(logging.INFO):
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            response = await c.post("/items/1", content=b"0123456789abcdef")
+
+    assert response.json() == {"item_id": 1, "size": 16}
+    assert "Body (16 bytes): 01234567..." in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_latency_is_recorded_per_route_template():
+    histogram = LatencyHistogram()
+    transport = httpx.ASGITransport(app=make_app(histogram, body_sample_rate=0.0))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        await c.post("/items/1")
+        await c.post("/items/2")
+        await c.get("/missing")
+
+    snapshot = {(row["method"], row["route"]): row for row in histogram.snapshot()}
+    assert snapshot[("POST", "/items/{item_id}")]["count"] == 2
+    assert snapshot[("POST", "/items/{item_id}")]["statuses"] == {"2xx": 2}
+    assert snapshot[("GET", "<unmatched>")]["statuses"] == {"4xx": 1}
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from app.core.common.utils.measurement import (
+    InMemoryMetricSink,
+    MetricsBuffer,
+    MetricSink,
+)
+
+
+class FailingSink(InMemoryMetricSink):
+    def write(self, series):
+        raise RuntimeError("monitoring down")
+
+
+@pytest.mark.asyncio
+async def test_points_are_aggregated_per_series():
+    sink = InMemoryMetricSink()
+    buffer = MetricsBuffer(sink=sink)
+
+    for value in (1.0, 3.0):
+        buffer.record("ml", value, {"env": "local", "batch_size": "20"})
+    buffer.record("ml", 5.0, {"env": "local", "batch_size": "40"})
+    await buffer.flush()
+
+    by_batch = {s.labels["batch_size"]: s for s in sink.series}
+    assert by_batch["20"].count == 2
+    assert by_batch["20"].mean == 2.0
+    assert (by_batch["20"].min, by_batch["20"].max) == (1.0, 3.0)
+    assert by_batch["40"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_threshold_flushes_before_the_interval():
+    sink = InMemoryMetricSink()
+    buffer = MetricsBuffer(sink=sink, flush_interval_seconds=60, flush_threshold=2)
+    await buffer.start()
+
+    buffer.record("ml", 1.0, {"batch_size": "1"})
+    buffer.record("ml", 1.0, {"batch_size": "2"})
+    for _ in range(50):
+        if sink.series:
+            break
+        await asyncio.sleep(0.01)
+    await buffer.stop()
+
+    assert len(sink.series) == 2
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_and_failed_sink_drop_points():
+    buffer = MetricsBuffer(sink=FailingSink(), max_series=1)
+
+    buffer.record("ml", 1.0, {"batch_size": "1"})
+    buffer.record("ml", 1.0, {"batch_size": "1"})
+    buffer.record("ml", 1.0, {"batch_size": "2"})
+    assert buffer.dropped_points == 1
+
+    await buffer.flush()
+
+    stats = buffer.get_stats()
+    assert stats["dropped_points"] == 3
+    assert stats["failed_flushes"] == 1
+    assert stats["buffered_series"] == 0
+
+
+def test_sink_without_write_fails_when_created():
+    class NoWriteSink(MetricSink):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWriteSink()
@@ -0,0 +1,92 @@
+import asyncio
+import fnmatch
+
+import pytest
+
+from app.core.common.utils.read_through_cache import ReadThroughCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("redis is down")
+
+    async def get(self, key):
+        self._check()
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self._check()
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def scan_iter(self, match="*"):
+        self._check()
+        for key in list(self.store):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    redis = FakeRedis()
+    cache = ReadThroughCache(redis_client=redis, namespace="test")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return '{"value": 1}'
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("predict:ENERG:1:2025-06-02", loader) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert set(results) == {'{"value": 1}'}
+    assert redis.store["test:predict:ENERG:1:2025-06-02"] == '{"value": 1}'
+
+    await cache.invalidate_prefix("predict:")
+    assert redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_cache_when_redis_is_down():
+    redis = FakeRedis()
+    redis.down = True
+    cache = ReadThroughCache(redis_client=redis, namespace="test")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return "cached"
+
+    assert await cache.get_or_load("info:all", loader) == "cached"
+    assert await cache.get_or_load("info:all", loader) == "cached"
+    assert calls == 1
+
+    await cache.invalidate("info:all")
+    await cache.get_or_load("info:all", loader)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached():
+    cache = ReadThroughCache(redis_client=FakeRedis(), namespace="test")
+
+    async def failing_loader():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("info:all", failing_loader)
+    assert await cache.get("info:all") is None
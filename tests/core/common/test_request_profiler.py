@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.common.middleware.profiling_middleware import ProfilingMiddleware
+from app.core.common.utils.request_profiler import (
+    ProfileStore,
+    RequestProfile,
+    get_current_profile,
+    record_client_call,
+)
+
+
+def make_app(store: ProfileStore) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        ProfilingMiddleware,
+        backend_api_key="backend-key",
+        sample_interval_seconds=0.001,
+        store=store,
+    )
+
+    @app.get("/work")
+    async def work():
+        profile = get_current_profile()
+        if profile is not None:
+            profile.record_statement("SELECT * FROM stocks WHERE ticker = $1", 0.01)
+            profile.record_statement("SELECT * FROM stocks WHERE ticker = $1", 0.02)
+        record_client_call("ml_server", 0.5)
+        await asyncio.sleep(0.02)
+        return {"profiled": profile is not None}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_only_backend_requests_with_the_header_are_profiled():
+    store = ProfileStore(max_profiles=5)
+    transport = httpx.ASGITransport(app=make_app(store))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        plain = await c.get("/work", headers={"X-API-Key": "backend-key"})
+        client_key = await c.get(
+            "/work", headers={"X-Profile": "1", "X-API-Key": "client-key"}
+        )
+        profiled = await c.get(
+            "/work", headers={"X-Profile": "1", "X-API-Key": "backend-key"}
+        )
+
+    assert plain.json() == {"profiled": False}
+    assert client_key.json() == {"profiled": False}
+    assert "x-profile-id" not in client_key.headers
+    assert profiled.json() == {"profiled": True}
+
+    profile = store.get(profiled.headers["x-profile-id"])
+    report = profile.to_dict()
+    assert report["status_code"] == 200
+    assert report["samples"] > 0
+    (statement,) = report["statements"]
+    assert statement["count"] == 2
+    assert report["clients"]["ml_server"]["count"] == 1
+    assert len(store.list()) == 1
+
+
+def test_record_client_call_is_a_no_op_outside_a_profile():
+    record_client_call("ml_server", 1.0)
+    assert get_current_profile() is None
+
+
+def test_profile_store_keeps_the_newest_profiles():
+    store = ProfileStore(max_profiles=2)
+    profiles = [RequestProfile("GET", f"/{i}", 0.005) for i in range(3)]
+    for profile in profiles:
+        store.add(profile)
+
+    assert store.get(profiles[0].id) is None
+    assert [row["path"] for row in store.list()] == ["/2", "/1"]
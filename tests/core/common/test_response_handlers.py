@@ -0,0 +1,35 @@
+import json
+from datetime import date
+
+from pydantic import BaseModel
+
+from app.core.common.utils.response_handlers import (
+    success_json_response,
+    success_response,
+)
+
+
+class Item(BaseModel):
+    stock_ticker: str
+    target_date: date
+
+
+def test_success_response_serializes_models_once_to_json():
+    response = success_response(
+        data=[Item(stock_ticker="AAA", target_date=date(2025, 6, 2))]
+    )
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {
+        "status": "success",
+        "message": "Success",
+        "data": [{"stock_ticker": "AAA", "target_date": "2025-06-02"}],
+    }
+
+
+def test_pre_serialized_payload_is_embedded_as_is():
+    item = Item(stock_ticker="AAA", target_date=date(2025, 6, 2))
+
+    response = success_json_response(data_json=item.model_dump_json())
+
+    assert response.body == success_response(data=item).body
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.common.utils.statement_stats import StatementStats
+from app.core.settings.engine_profile import EngineProfile, instrument_engine
+
+
+def test_statements_differing_in_parameters_share_a_fingerprint():
+    stats = StatementStats()
+
+    stats.observe("SELECT * FROM t WHERE id IN ($1, $2)", 0.01, rows=2)
+    stats.observe("SELECT *\n FROM t WHERE id IN ($1, $2, $3)", 0.03, rows=3)
+
+    (row,) = stats.snapshot()
+    assert row["statement"] == "SELECT * FROM t WHERE id IN (...)"
+    assert row["count"] == 2
+    assert row["rows"] == 5
+    assert row["statuses"] == {"ok": 2}
+
+
+def test_instrumented_engine_times_statements_and_errors():
+    stats = StatementStats()
+    engine = create_engine("sqlite://")
+    instrument_engine(
+        SimpleNamespace(sync_engine=engine), stats=stats, slow_statement_ms=10_000
+    )
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing"))
+
+    by_statement = {row["statement"]: row for row in stats.snapshot()}
+    assert by_statement["SELECT 1"]["count"] == 2
+    assert by_statement["SELECT * FROM missing"]["statuses"] == {"error": 1}
+
+
+def test_engine_profile_builds_engine_arguments():
+    kwargs = EngineProfile(
+        pool_size=3, statement_timeout_ms=5000, use_ssl=False
+    ).engine_kwargs()
+
+    assert kwargs["pool_size"] == 3
+    assert kwargs["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+    assert "ssl" not in kwargs["connect_args"]
@@ -0,0 +1,56 @@
+from datetime import date, timedelta
+
+from app.core.common.utils.trading_calendar import TradingCalendar
+
+HOLIDAYS = {date(2025, 4, 14), date(2025, 4, 15), date(2025, 5, 1)}
+
+
+def is_closed(d: date) -> bool:
+    return d.weekday() >= 5 or d in HOLIDAYS
+
+
+def walk(d: date, n: int, step: int) -> date:
+    count = 0
+    while count < n:
+        d += timedelta(days=step)
+        if not is_closed(d):
+            count += 1
+    return d
+
+
+def test_matches_day_by_day_walk():
+    calendar = TradingCalendar(HOLIDAYS, start=date(2025, 1, 1), end=date(2025, 12, 31))
+
+    for offset in range(-5, 60):
+        d = date(2025, 4, 1) + timedelta(days=offset)
+        assert calendar.is_open(d) == (not is_closed(d))
+        for n in (1, 5, 16):
+            assert calendar.n_open_days_ahead(d, n) == walk(d, n, 1)
+            assert calendar.n_open_days_behind(d, n) == walk(d, n, -1)
+            assert calendar.open_days_between(d, walk(d, n, 1)) == n
+
+
+def test_grows_past_its_range():
+    calendar = TradingCalendar(HOLIDAYS, start=date(2025, 1, 1), end=date(2025, 12, 31))
+
+    assert calendar.n_open_days_ahead(date(2025, 12, 30), 600) == walk(
+        date(2025, 12, 30), 600, 1
+    )
+    assert calendar.n_open_days_behind(date(2025, 1, 2), 600) == walk(
+        date(2025, 1, 2), 600, -1
+    )
+    assert calendar.open_days(date(2031, 1, 1), date(2031, 1, 5)) == [
+        date(2031, 1, 1),
+        date(2031, 1, 2),
+        date(2031, 1, 3),
+    ]
+
+
+def test_loads_holiday_file(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("# comment\n2026-01-01  # New Year\n\n")
+
+    calendar = TradingCalendar.from_file(path, today=date(2026, 1, 1))
+
+    assert not calendar.is_open(date(2026, 1, 1))
+    assert calendar.is_open(date(2026, 1, 2))
@@ -0,0 +1,66 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.dependencies.container import (
+    AppContainer,
+    app_scoped,
+    get_container,
+    provide,
+)
+
+
+class Service:
+    pass
+
+
+class Controller:
+    def __init__(self, service: Service):
+        self.service = service
+
+
+@app_scoped
+def get_service() -> Service:
+    return Service()
+
+
+@app_scoped
+def get_controller() -> Controller:
+    return Controller(service=get_service())
+
+
+def test_app_scoped_factories_build_once_until_cleared():
+    controller = get_controller()
+
+    assert get_controller() is controller
+    assert controller.service is get_service()
+
+    get_container().clear()
+    assert get_controller() is not controller
+
+
+def test_start_builds_every_registered_factory():
+    container = AppContainer()
+    built = []
+    container.register(lambda: built.append("a"))
+    container.register(lambda: built.append("b"))
+
+    container.start()
+    container.start()
+
+    assert built == ["a", "b"]
+
+
+def test_provide_shares_the_instance_between_requests():
+    app = FastAPI()
+
+    @app.get("/")
+    async def route(controller: Controller = Depends(provide(get_controller))):
+        return id(controller)
+
+    client = TestClient(app)
+    assert client.get("/").json() == client.get("/").json() == id(get_controller())
+
+    # overrides are keyed on the provider, which is the same for every call
+    override = Controller(service=Service())
+    app.dependency_overrides[provide(get_controller)] = lambda: override
+    assert client.get("/").json() == id(override)
@@ -0,0 +1,48 @@
+from datetime import date
+
+import numpy as np
+
+from app.api.dummy.dummy_dataset import DatasetSpec, generate_chunks
+from app.core.common.utils.trading_calendar import get_trading_calendar
+
+
+def make_chunks(spec: DatasetSpec):
+    open_days = get_trading_calendar().open_days(spec.start_date, spec.end_date)
+    model_ids = {ticker: i for i, ticker in enumerate(spec.stock_tickers())}
+    return open_days, list(generate_chunks(spec, open_days, model_ids))
+
+
+def test_chunks_cover_every_ticker_and_market_day():
+    spec = DatasetSpec(stock_count=5, end_date=date(2025, 6, 30), years=1, chunk_size=2)
+    open_days, chunks = make_chunks(spec)
+
+    assert [len(chunk.stock_tickers) for chunk in chunks] == [2, 2, 1]
+    trading_data = chunks[0].trading_data
+    assert len(trading_data["close"]) == 2 * len(open_days)
+    assert trading_data["target_date"][: len(open_days)] == open_days
+    assert trading_data["stock_ticker"][len(open_days)] == "SYN00001"
+
+    predictions = chunks[-1].predictions
+    assert len(predictions["predicted_price"]) == 60 * len(spec.periods)
+    assert predictions["target_date"][-1] == open_days[-1]
+    assert predictions["period"][: len(spec.periods)] == list(spec.periods)
+    assert set(predictions["model_id"]) == {4}
+
+
+def test_prices_are_consistent_and_reproducible():
+    spec = DatasetSpec(stock_count=3, end_date=date(2025, 6, 30), years=2)
+    _, (chunk,) = make_chunks(spec)
+    _, (again,) = make_chunks(spec)
+
+    close, open_, high, low = (
+        np.asarray(chunk.trading_data[field])
+        for field in ("close", "open", "high", "low")
+    )
+    assert (close > 0).all()
+    assert (high >= np.maximum(open_, close)).all()
+    assert (low <= np.minimum(open_, close)).all()
+    assert chunk.trading_data["close"] == again.trading_data["close"]
+
+    # the closing price of a prediction is the close of its target date
+    last_close = chunk.trading_data["close"][-1]
+    assert chunk.predictions["closing_price"][-1] == last_close
@@ -0,0 +1,121 @@
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.general.services.partition_service import (
+    PartitionService,
+    months_between,
+    parse_partition_month,
+)
+from app.core.common.exceptions.custom_exceptions import DBError
+from app.models import Prediction, TradingData
+
+
+@pytest.fixture
+def partition_repository():
+    repository = AsyncMock()
+    repository.fetch_partition_names.return_value = [
+        "trading_data_p2025_01",
+        "trading_data_p2025_02",
+        "trading_data_default",
+    ]
+    repository.count_rows.return_value = 10
+    return repository
+
+
+def test_months_between_spans_years():
+    assert months_between(date(2024, 11, 15), date(2025, 2, 1)) == [
+        date(2024, 11, 1),
+        date(2024, 12, 1),
+        date(2025, 1, 1),
+        date(2025, 2, 1),
+    ]
+    assert parse_partition_month("trading_data", "trading_data_p2025_02") == date(
+        2025, 2, 1
+    )
+    assert parse_partition_month("trading_data", "trading_data_default") is None
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_missing_months_once(partition_repository):
+    service = PartitionService(partition_repository, months_ahead=3)
+
+    created = await service.ensure_partitions_for_rows(
+        db=None,
+        model=TradingData,
+        rows=[
+            {"target_date": date(2025, 2, 20)},
+            {"target_date": date(2025, 3, 3)},
+        ],
+    )
+    assert created == ["trading_data_p2025_03"]
+    kwargs = partition_repository.create_partition.await_args.kwargs
+    assert (kwargs["start_date"], kwargs["end_date"]) == (
+        date(2025, 3, 1),
+        date(2025, 4, 1),
+    )
+
+    # served from the cached months afterwards
+    assert (
+        await service.ensure_partitions(
+            db=None,
+            model=TradingData,
+            start_date=date(2025, 1, 2),
+            end_date=date(2025, 3, 31),
+        )
+        == []
+    )
+    assert partition_repository.fetch_partition_names.await_count == 1
+    assert partition_repository.create_partition.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_drop_partitions_before_only_drops_whole_months(partition_repository):
+    service = PartitionService(partition_repository, months_ahead=3)
+
+    dropped, rows = await service.drop_partitions_before(
+        db=None, model=TradingData, cutoff_date=date(2025, 2, 15)
+    )
+
+    assert (dropped, rows) == (["trading_data_p2025_01"], 10)
+    partition_repository.drop_partition.assert_awaited_once_with(
+        db=None, table_name="trading_data", partition_name="trading_data_p2025_01"
+    )
+    assert date(2025, 1, 1) not in await service.get_partition_months(
+        db=None, model=TradingData
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_future_partitions_covers_every_partitioned_table(
+    partition_repository,
+):
+    partition_repository.fetch_partition_names.return_value = []
+    service = PartitionService(partition_repository, months_ahead=2)
+
+    created = await service.ensure_future_partitions(db=None, today=date(2025, 12, 5))
+
+    assert created == [
+        f"{model.__tablename__}_p{month}"
+        for model in (TradingData, Prediction)
+        for month in ("2025_12", "2026_01", "2026_02")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_reloads_months_dropped_by_another_instance(partition_repository):
+    service = PartitionService(partition_repository, months_ahead=3)
+    rows = [{"target_date": date(2025, 1, 10)}]
+    await service.ensure_partitions_for_rows(db=None, model=TradingData, rows=rows)
+
+    # another instance dropped January, this one still has it cached
+    partition_repository.fetch_partition_names.return_value = ["trading_data_p2025_02"]
+    error = DBError("Failed to upsert trading data")
+    error.__cause__ = Exception('no partition of relation "trading_data" found for row')
+    write = AsyncMock(side_effect=[error, 3])
+
+    assert await service.write_with_partitions(None, TradingData, rows, write) == 3
+    assert write.await_count == 2
+    created = partition_repository.create_partition.await_args.kwargs
+    assert created["partition_name"] == "trading_data_p2025_01"
@@ -0,0 +1,137 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.general.services.trading_data_window_service import (
+    TradingDataWindowService,
+)
+
+FIRST_DATE = date(2025, 6, 2)
+
+
+def make_window(stock_ticker: str, days: int, start_id: int = 1):
+    target_dates = [FIRST_DATE + timedelta(days=i) for i in range(days)]
+    return SimpleNamespace(
+        stock_ticker=stock_ticker,
+        last_date=target_dates[-1],
+        target_dates=target_dates,
+        trading_data_ids=list(range(start_id, start_id + days)),
+        close=[float(i) for i in range(days)],
+        open=[float(i) for i in range(days)],
+        high=[float(i) for i in range(days)],
+        low=[float(i) for i in range(days)],
+        volumes=list(range(days)),
+    )
+
+
+def make_row(stock_ticker: str, target_date: date, row_id: int, close: float):
+    return {
+        "id": row_id,
+        "stock_ticker": stock_ticker,
+        "target_date": target_date,
+        "close": close,
+        "open": close,
+        "high": close,
+        "low": close,
+        "volumes": 1,
+    }
+
+
+@pytest.fixture
+def window_repository():
+    repository = AsyncMock()
+    repository.fetch_by_stock_tickers.return_value = [make_window("AAA", 5)]
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_get_window_rows_falls_back_for_missing_and_short_windows(
+    window_repository,
+):
+    window_repository.fetch_by_stock_tickers.return_value = [
+        make_window("AAA", 5),
+        make_window("BBB", 2),
+    ]
+    service = TradingDataWindowService(window_repository, window_size=5)
+
+    rows, fallback = await service.get_window_rows(
+        db=MagicMock(),
+        stock_tickers=["aaa", "bbb", "ccc"],
+        last_date=FIRST_DATE + timedelta(days=3),
+        days_back=3,
+        columns=["close"],
+    )
+
+    assert rows == [("AAA", 2, 1.0), ("AAA", 3, 2.0), ("AAA", 4, 3.0)]
+    assert fallback == ["BBB", "CCC"]
+
+
+@pytest.mark.asyncio
+async def test_apply_rows_merges_trims_and_rebuilds_new_tickers(window_repository):
+    service = TradingDataWindowService(window_repository, window_size=5)
+    db = MagicMock()
+
+    await service.apply_rows(
+        db=db,
+        rows=[
+            # replaces the last day and appends one
+            make_row("AAA", FIRST_DATE + timedelta(days=4), 50, 40.0),
+            make_row("AAA", FIRST_DATE + timedelta(days=5), 51, 50.0),
+            make_row("BBB", FIRST_DATE, 60, 1.0),
+        ],
+    )
+
+    (merged,) = window_repository.upsert_many.call_args.kwargs["windows"]
+    assert merged["last_date"] == FIRST_DATE + timedelta(days=5)
+    assert merged["target_dates"][0] == FIRST_DATE + timedelta(days=1)
+    assert merged["trading_data_ids"] == [2, 3, 4, 50, 51]
+    assert merged["close"] == [1.0, 2.0, 3.0, 40.0, 50.0]
+    rebuild_kwargs = window_repository.rebuild_by_stock_tickers.call_args.kwargs
+    assert rebuild_kwargs["stock_tickers"] == ["BBB"]
+
+
+@pytest.mark.asyncio
+async def test_apply_rows_invalidates_windows_when_the_update_fails(
+    window_repository,
+):
+    window_repository.upsert_many.side_effect = RuntimeError("boom")
+    service = TradingDataWindowService(window_repository, window_size=5)
+    db = AsyncMock()
+
+    await service.apply_rows(db=db, rows=[make_row("AAA", FIRST_DATE, 1, 1.0)])
+
+    window_repository.delete_by_stock_tickers.assert_awaited_once_with(
+        db=db, stock_tickers=["AAA"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_consistency_reports_and_repairs(window_repository):
+    window_repository.fetch_by_stock_tickers.return_value = [
+        make_window("AAA", 5),
+        make_window("BBB", 5),
+        make_window("DDD", 5),
+    ]
+    stale = make_window("BBB", 5)
+    stale.close = [9.0] * 5
+    window_repository.fetch_from_trading_data.return_value = [
+        make_window("AAA", 5),
+        stale,
+        make_window("CCC", 5),
+    ]
+    service = TradingDataWindowService(window_repository, window_size=5)
+
+    report = await service.check_consistency(
+        db=MagicMock(), stock_tickers=["AAA", "BBB", "CCC", "DDD"], repair=True
+    )
+
+    assert report["missing"] == ["CCC"]
+    assert report["mismatched"] == ["BBB"]
+    assert report["orphaned"] == ["DDD"]
+    assert report["repaired"] is True
+    rebuild_kwargs = window_repository.rebuild_by_stock_tickers.call_args.kwargs
+    assert rebuild_kwargs["stock_tickers"] == ["CCC", "BBB"]
+    delete_kwargs = window_repository.delete_by_stock_tickers.call_args.kwargs
+    assert delete_kwargs["stock_tickers"] == ["DDD"]
@@ -0,0 +1,91 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Insert, Select, Update
+
+from app.api.internal.repositories.process_data_repository import (
+    ProcessDataRepository,
+)
+
+TARGET_DATE = date(2025, 6, 2)
+TOP_PREDICTION_ID = 7
+
+
+class FakeSession:
+    """Applies the rank updates of the repository to in-memory predictions."""
+
+    def __init__(self, prediction_ids: list[int]):
+        self.predictions = {
+            prediction_id: {"rank": None, "top_prediction_id": None}
+            for prediction_id in prediction_ids
+        }
+        self.ranked_rows = []
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def connection(self):
+        return self
+
+    async def execute(self, stmt, params=None):
+        result = MagicMock()
+        if isinstance(stmt, Select):
+            result.all.return_value = self.ranked_rows
+        elif isinstance(stmt, Insert):
+            result.all.return_value = [
+                SimpleNamespace(
+                    id=TOP_PREDICTION_ID,
+                    industry_code="BANK",
+                    period=1,
+                    target_date=TARGET_DATE,
+                )
+            ]
+        elif isinstance(stmt, Update) and params:
+            for row in params:
+                assert row["key_target_date"] == TARGET_DATE
+                self.predictions[row["key_id"]].update(
+                    rank=row["set_rank"], top_prediction_id=row["set_top_prediction_id"]
+                )
+        elif isinstance(stmt, Update):
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            top_prediction_ids = next(
+                value
+                for key, value in compiled.params.items()
+                if key.startswith("top_prediction_id_")
+            )
+            for prediction in self.predictions.values():
+                if prediction["top_prediction_id"] in top_prediction_ids:
+                    prediction.update(rank=None, top_prediction_id=None)
+        return result
+
+
+def ranked(prediction_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        prediction_id=prediction_id,
+        industry_code="BANK",
+        period=1,
+        target_date=TARGET_DATE,
+        rank=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reranking_a_group_unranks_its_previous_top():
+    db = FakeSession(prediction_ids=[1, 2])
+
+    for winner in (1, 2):
+        db.ranked_rows = [ranked(winner)]
+        await ProcessDataRepository.rank_and_save_top_predictions(
+            db=db,
+            industry_codes=["BANK"],
+            periods=[1],
+            target_dates=[TARGET_DATE],
+            top_n=1,
+        )
+
+    assert db.predictions == {
+        1: {"rank": None, "top_prediction_id": None},
+        2: {"rank": 1, "top_prediction_id": TOP_PREDICTION_ID},
+    }
@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+
+from app.api.internal.services.accuracy_evaluator import AccuracyEvaluator
+from app.core.common.utils.trading_calendar import TradingCalendar
+
+# Friday 6 June 2025 is a holiday, so a period 1 prediction made on Wednesday is
+# realized on Monday, period + 1 market days later
+CALENDAR = TradingCalendar(
+    [date(2025, 6, 6)], start=date(2025, 1, 1), end=date(2025, 12, 31)
+)
+
+
+def ordinals(*days: int) -> list[int]:
+    return [date(2025, 6, day).toordinal() for day in days]
+
+
+def make_evaluator() -> AccuracyEvaluator:
+    evaluator = AccuracyEvaluator(calendar=CALENDAR)
+    evaluator.add_predictions(
+        [
+            # model, ticker, industry, period, target dates, predicted, closing
+            (1, "AAA", "BANK", 1, ordinals(4, 3), [110.0, 90.0], [100.0, 100.0]),
+            (2, "BBB", "BANK", 1, ordinals(4), [48.0], [None]),
+            # realized after the last close, still pending
+            (2, "BBB", "BANK", 5, ordinals(10), [50.0], [50.0]),
+        ]
+    )
+    return evaluator
+
+
+def test_close_date_range_covers_every_realized_date():
+    assert make_evaluator().get_close_date_range() == (
+        date(2025, 6, 2),
+        date(2025, 6, 18),
+    )
+
+
+def test_evaluate_aligns_with_the_trading_calendar():
+    evaluator = make_evaluator()
+    evaluator.add_closes(
+        [
+            # a close on the holiday is never used
+            ("AAA", ordinals(5, 6, 9), [100.0, 1.0, 120.0]),
+            ("BBB", ordinals(4, 9), [50.0, 40.0]),
+        ]
+    )
+
+    result = evaluator.evaluate(start_date=date(2025, 6, 2), end_date=date(2025, 6, 10))
+
+    assert (result.predictions, result.scored, result.pending) == (4, 3, 1)
+    aaa, bbb = result.by_model_period
+    assert aaa["model_id"] == 1 and aaa["sample_count"] == 2
+    assert aaa["mae"] == pytest.approx(10.0)
+    assert aaa["mape"] == pytest.approx(100 * (10 / 120 + 10 / 100) / 2)
+    # predicted down from 100 while the close stayed flat
+    assert aaa["hit_rate"] == 0.5
+    # the missing closing price falls back to the close on the target date
+    assert bbb["rmse"] == pytest.approx(8.0)
+    assert bbb["hit_rate"] == 1.0
+    (industry,) = result.by_industry_period
+    assert industry["industry_code"] == "BANK" and industry["sample_count"] == 3
+    assert industry["mae"] == pytest.approx(28 / 3)
+    assert [row["model_id"] for row in result.by_model] == [1, 2]
+
+
+def test_evaluate_without_predictions_returns_an_empty_result():
+    result = AccuracyEvaluator(calendar=CALENDAR).evaluate(
+        start_date=date(2025, 6, 2), end_date=date(2025, 6, 10)
+    )
+    assert result.predictions == 0 and result.by_model_period == []
@@ -0,0 +1,107 @@
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.internal.services.cleanup_data_service import CleanupDataService
+
+
+@pytest.fixture
+def retention_repository():
+    repository = AsyncMock()
+    ids = list(range(1, 8))
+
+    async def fetch_ids_older_than(db, model, cutoff_date, after_id, batch_size):
+        remaining = [i for i in ids if i > after_id]
+        return remaining[:batch_size]
+
+    repository.fetch_ids_older_than.side_effect = fetch_ids_older_than
+    repository.delete_predictions_by_ids.side_effect = lambda db, ids: len(ids)
+    repository.delete_top_predictions_by_ids.side_effect = lambda db, ids: len(ids)
+    repository.delete_trading_data_by_ids.side_effect = lambda db, ids: len(ids)
+    repository.count_older_than.return_value = 42
+    return repository
+
+
+@pytest.fixture
+def partition_service():
+    service = AsyncMock()
+    service.drop_partitions_before.return_value = ([], 0)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_clean_predictions_deletes_in_keyset_batches(
+    retention_repository, partition_service
+):
+    service = CleanupDataService(
+        retention_repository=retention_repository,
+        partition_service=partition_service,
+        batch_size=3,
+        batch_sleep_seconds=0,
+    )
+
+    result = await service.clean_predictions(
+        db=None, target_date=date(2025, 5, 31), days_back=30
+    )
+
+    assert result.cutoff_date == date(2025, 5, 1)
+    assert (result.rows, result.batches) == (7, 3)
+    after_ids = [
+        call.kwargs["after_id"]
+        for call in retention_repository.fetch_ids_older_than.await_args_list
+    ]
+    assert after_ids == [0, 3, 6]
+
+
+@pytest.mark.asyncio
+async def test_clean_data_respects_fk_order(retention_repository, partition_service):
+    partition_service.drop_partitions_before.side_effect = (
+        lambda db, model, cutoff_date, dry_run: (
+            [f"{model.__tablename__}_p2024_04"],
+            100,
+        )
+    )
+    service = CleanupDataService(
+        retention_repository=retention_repository,
+        partition_service=partition_service,
+        batch_size=10,
+        batch_sleep_seconds=0,
+    )
+
+    results = await service.clean_data(
+        db=None,
+        target_date=date(2025, 5, 31),
+        trading_data_days_back=365,
+        predictions_days_back=30,
+    )
+
+    assert [result.table for result in results] == [
+        "predictions",
+        "top_predictions",
+        "trading_data",
+    ]
+    # whole partitions are dropped before the remaining rows are deleted
+    assert results[0].partitions == ["predictions_p2024_04"]
+    assert results[0].rows == 107
+    # top predictions are not partitioned
+    assert results[1].partitions == []
+    assert partition_service.drop_partitions_before.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_dry_run_only_counts(retention_repository, partition_service):
+    service = CleanupDataService(
+        retention_repository=retention_repository,
+        partition_service=partition_service,
+    )
+
+    result = await service.clean_trading_data(
+        db=None, target_date=date(2025, 5, 31), days_back=365, dry_run=True
+    )
+
+    assert result.rows == 42
+    assert result.batches == 0
+    retention_repository.fetch_ids_older_than.assert_not_awaited()
+    retention_repository.delete_trading_data_by_ids.assert_not_awaited()
+    assert partition_service.drop_partitions_before.await_args.kwargs["dry_run"]
@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.internal.services.job_config_cache import JobConfigCache
+from app.api.internal.services.job_config_service import JobConfigService
+from app.core.enums.job_enum import JobConfigEnum
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        for key, value in self.commands:
+            self.redis.store[key] = value
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.published = []
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def make_config(key: JobConfigEnum, value: str):
+    return SimpleNamespace(key=key.value, value=value)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def repository():
+    repository = AsyncMock()
+    repository.fetch_by_keys.return_value = [
+        make_config(JobConfigEnum.SAVE_INFERENCE_PERIODS, "1,5,10"),
+        make_config(JobConfigEnum.RUN_INFERENCE_DAYS_BACK, "60"),
+    ]
+    return repository
+
+
+@pytest.fixture
+def service(repository, redis):
+    cache = JobConfigCache(redis_client=redis, cast=JobConfigService._smart_cast)
+    return JobConfigService(
+        job_config_repository=repository, discord=AsyncMock(), cache=cache
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_job_configs_queries_only_missing_keys_once(
+    service, repository, redis
+):
+    keys = [JobConfigEnum.SAVE_INFERENCE_PERIODS, JobConfigEnum.RUN_INFERENCE_DAYS_BACK]
+
+    first = await service.get_job_configs(db="fake_db", keys=keys)
+    second = await service.get_job_configs(db="fake_db", keys=keys)
+
+    assert (
+        first
+        == second
+        == {
+            JobConfigEnum.SAVE_INFERENCE_PERIODS: [1, 5, 10],
+            JobConfigEnum.RUN_INFERENCE_DAYS_BACK: 60,
+        }
+    )
+    assert repository.fetch_by_keys.await_count == 1
+    assert redis.store["config:RUN_INFERENCE_DAYS_BACK"] == "60"
+
+
+@pytest.mark.asyncio
+async def test_single_key_returns_dict(service, repository):
+    repository.fetch_by_keys.return_value = [
+        make_config(JobConfigEnum.RUN_INFERENCE_DAYS_BACK, "60")
+    ]
+
+    configs = await service.get_job_configs(
+        db="fake_db", keys=[JobConfigEnum.RUN_INFERENCE_DAYS_BACK]
+    )
+
+    assert configs == {JobConfigEnum.RUN_INFERENCE_DAYS_BACK: 60}
+
+
+@pytest.mark.asyncio
+async def test_set_job_config_writes_through_and_publishes(service, repository, redis):
+    repository.upsert.return_value = make_config(
+        JobConfigEnum.RUN_INFERENCE_DAYS_BACK, "90"
+    )
+
+    await service.set_job_config(
+        db="fake_db",
+        key=JobConfigEnum.RUN_INFERENCE_DAYS_BACK,
+        value="90",
+        notify=False,
+    )
+    value = await service.get_job_config(
+        db="fake_db", key=JobConfigEnum.RUN_INFERENCE_DAYS_BACK
+    )
+
+    assert value == 90
+    repository.fetch_by_key.assert_not_awaited()
+    assert redis.store["config:RUN_INFERENCE_DAYS_BACK"] == "90"
+    assert redis.published[0][0] == "config:invalidate"
+
+
+def test_invalidation_from_other_instance_drops_local_copy(redis):
+    cache = JobConfigCache(redis_client=redis, cast=JobConfigService._smart_cast)
+    cache._set_local("RUN_INFERENCE_DAYS_BACK", "60")
+
+    cache.handle_invalidation(
+        f'{{"instance_id": "{cache.instance_id}", "keys": ["RUN_INFERENCE_DAYS_BACK"]}}'
+    )
+    assert cache._get_local("RUN_INFERENCE_DAYS_BACK") == (True, 60)
+
+    cache.handle_invalidation('{"instance_id": "other", "keys": ["*"]}')
+    assert cache._get_local("RUN_INFERENCE_DAYS_BACK") == (False, None)
@@ -0,0 +1,184 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.internal.services.process_data_service import (
+    BACKFILL_CHECKPOINT_CLEARED,
+    ProcessDataService,
+)
+from app.core.clients.market_data_client import MarketDataResult
+from app.core.common.exceptions.custom_exceptions import ResourceNotFoundError
+from app.core.enums.industry_code_enum import IndustryCodeEnum
+
+
+def make_row(stock_ticker: str, target_date: date) -> dict:
+    return {
+        "stock_ticker": stock_ticker,
+        "target_date": target_date,
+        "close": 10.0,
+        "open": 10.0,
+        "high": 11.0,
+        "low": 9.0,
+        "volumes": 100,
+    }
+
+
+@pytest.fixture
+def trading_data_service():
+    service = AsyncMock()
+    service.get_existing_keys_by_stock_tickers_and_date_range.return_value = set()
+    service.upsert_multiple.side_effect = lambda db, trading_data_dict_list: len(
+        trading_data_dict_list
+    )
+    return service
+
+
+@pytest.fixture
+def job_config_service():
+    service = AsyncMock()
+    service.get_job_config.side_effect = ResourceNotFoundError("config")
+    return service
+
+
+@pytest.fixture
+def market_data_client():
+    client = MagicMock()
+    client.fetch = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def process_data_service(trading_data_service, job_config_service, market_data_client):
+    return ProcessDataService(
+        process_data_repository=MagicMock(),
+        evaluation_repository=MagicMock(),
+        stock_service=AsyncMock(),
+        prediction_service=AsyncMock(),
+        top_prediction_service=AsyncMock(),
+        trading_data_service=trading_data_service,
+        job_config_service=job_config_service,
+        market_data_client=market_data_client,
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_existing_rows(
+    process_data_service, trading_data_service, market_data_client
+):
+    # 2025-06-02 (Mon) and 2025-06-04 (Wed) are open, 2025-06-03 is a holiday
+    trading_data_service.get_existing_keys_by_stock_tickers_and_date_range.return_value = {
+        ("AAA", date(2025, 6, 2)),
+        ("AAA", date(2025, 6, 4)),
+        ("BBB", date(2025, 6, 2)),
+    }
+    market_data_client.fetch.return_value = MarketDataResult(
+        rows=[make_row("BBB", date(2025, 6, 2)), make_row("BBB", date(2025, 6, 4))]
+    )
+
+    result = await process_data_service.backfill_trading_data(
+        db="fake_db",
+        stock_tickers=["aaa", "bbb"],
+        start_date=date(2025, 6, 2),
+        end_date=date(2025, 6, 4),
+    )
+
+    fetch_kwargs = market_data_client.fetch.call_args.kwargs
+    assert fetch_kwargs["stock_tickers"] == ["BBB"]
+    upserted_rows = trading_data_service.upsert_multiple.call_args.kwargs[
+        "trading_data_dict_list"
+    ]
+    assert [row["target_date"] for row in upserted_rows] == [date(2025, 6, 4)]
+    assert result["upserted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_from_checkpoint(
+    process_data_service, job_config_service, market_data_client
+):
+    stock_tickers = ["AAA"]
+    start_date, end_date = date(2025, 6, 1), date(2025, 6, 10)
+    run_key = ProcessDataService._get_backfill_run_key(
+        stock_tickers, start_date, end_date
+    )
+    job_config_service.get_job_config.side_effect = None
+    job_config_service.get_job_config.return_value = f"{run_key}:2025-06-05"
+    market_data_client.fetch.return_value = MarketDataResult()
+
+    result = await process_data_service.backfill_trading_data(
+        db="fake_db",
+        stock_tickers=stock_tickers,
+        start_date=start_date,
+        end_date=end_date,
+        chunk_days=3,
+    )
+
+    assert result["resumed_from"] == date(2025, 6, 6)
+    assert result["chunks"] == 2
+    assert market_data_client.fetch.call_args_list[0].kwargs["start_date"] == date(
+        2025, 6, 6
+    )
+    checkpoints = [
+        call.kwargs["value"]
+        for call in job_config_service.set_job_config.call_args_list
+    ]
+    assert checkpoints == [
+        f"{run_key}:2025-06-08",
+        f"{run_key}:2025-06-10",
+        BACKFILL_CHECKPOINT_CLEARED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_checkpoint_stops_before_failed_chunk(
+    process_data_service, job_config_service, market_data_client
+):
+    stock_tickers = ["AAA"]
+    start_date, end_date = date(2025, 6, 2), date(2025, 6, 10)
+    run_key = ProcessDataService._get_backfill_run_key(
+        stock_tickers, start_date, end_date
+    )
+    market_data_client.fetch.side_effect = [
+        MarketDataResult(),
+        MarketDataResult(failed_tickers=["AAA"]),
+        MarketDataResult(),
+    ]
+
+    result = await process_data_service.backfill_trading_data(
+        db="fake_db",
+        stock_tickers=stock_tickers,
+        start_date=start_date,
+        end_date=end_date,
+        chunk_days=3,
+    )
+
+    assert result["failed_tickers"] == ["AAA"]
+    checkpoints = [
+        call.kwargs["value"]
+        for call in job_config_service.set_job_config.call_args_list
+    ]
+    assert checkpoints == [f"{run_key}:2025-06-04"]
+
+
+@pytest.mark.asyncio
+async def test_set_based_ranking_reports_groups_without_predictions(
+    process_data_service,
+):
+    target_date = date(2025, 6, 4)
+    ranked_row = SimpleNamespace(
+        prediction_id=1, industry_code="agro", period=7, target_date=target_date, rank=1
+    )
+    repository = process_data_service.process_data_repository
+    repository.rank_and_save_top_predictions = AsyncMock(return_value=[ranked_row])
+
+    result = await process_data_service.rank_and_save_top_predictions(
+        db="fake_db",
+        industry_codes=[IndustryCodeEnum.AGRO, IndustryCodeEnum.TECH],
+        periods=[7],
+        target_dates=[target_date],
+    )
+
+    repository.rank_and_save_top_predictions.assert_awaited_once()
+    assert result["succeeded"] == [("agro", 7, "2025-06-04")]
+    assert result["failed"] == [("tech", 7, "2025-06-04", "No predictions to rank")]
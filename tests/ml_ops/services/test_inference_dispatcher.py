@@ -0,0 +1,122 @@
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from benchmarks.fake_ml_server import (
+    FakeMLServerProfile,
+    LatencyDistribution,
+    create_fake_ml_server,
+)
+
+from app.api.ml_ops.schemas.inference_schema import StockToPredictRequestSchema
+from app.api.ml_ops.services.inference_dispatcher import InferenceDispatcher
+
+
+def make_stock(stock_ticker: str) -> StockToPredictRequestSchema:
+    return StockToPredictRequestSchema(
+        stock_ticker=stock_ticker,
+        close=[1.0],
+        model_id=1,
+        model_path="model.keras",
+        scaler_path="scaler.pkl",
+    )
+
+
+def ok(stocks):
+    return [
+        {"stock_ticker": s.stock_ticker, "predicted_price": [1.0], "success": True}
+        for s in stocks
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_retries_only_failed_chunks():
+    calls = []
+
+    async def run_inference(stocks, days_ahead):
+        tickers = [s.stock_ticker for s in stocks]
+        calls.append(tickers)
+        if tickers == ["CCC", "DDD"] and calls.count(tickers) == 1:
+            raise RuntimeError("timeout")
+        return ok(stocks)
+
+    ml = AsyncMock()
+    ml.run_inference.side_effect = run_inference
+    dispatcher = InferenceDispatcher(
+        ml_operations=ml, chunk_size=2, max_retries=1, retry_backoff_seconds=0
+    )
+
+    result = await dispatcher.dispatch(
+        [make_stock(t) for t in ["AAA", "BBB", "CCC", "DDD"]], days_ahead=16
+    )
+
+    assert sorted(r.stock_ticker for r in result.success) == [
+        "AAA",
+        "BBB",
+        "CCC",
+        "DDD",
+    ]
+    assert result.failed == []
+    assert calls.count(["AAA", "BBB"]) == 1
+    assert calls.count(["CCC", "DDD"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_keeps_successes_when_chunk_keeps_failing():
+    async def run_inference(stocks, days_ahead):
+        if stocks[0].stock_ticker == "CCC":
+            raise RuntimeError("timeout")
+        return ok(stocks)[:1]
+
+    ml = AsyncMock()
+    ml.run_inference.side_effect = run_inference
+    dispatcher = InferenceDispatcher(
+        ml_operations=ml, chunk_size=2, max_retries=2, retry_backoff_seconds=0
+    )
+
+    result = await dispatcher.dispatch(
+        [make_stock(t) for t in ["AAA", "BBB", "CCC"]], days_ahead=16
+    )
+
+    assert [r.stock_ticker for r in result.success] == ["AAA"]
+    assert sorted(r.stock_ticker for r in result.failed) == ["BBB", "CCC"]
+    assert ml.run_inference.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_dispatch_against_fake_ml_server():
+    fake = create_fake_ml_server(
+        FakeMLServerProfile(
+            ticker_latencies={"CCC": LatencyDistribution.parse("fixed:50")},
+            max_concurrency=1,
+            stock_failure_rate=0.5,
+            payload_bytes=64,
+            seed=1,
+        )
+    )
+
+    async def run_inference(stocks, days_ahead):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=fake), base_url="http://fake"
+        ) as client:
+            response = await client.post(
+                "/predict",
+                json={
+                    "stocks": [s.model_dump() for s in stocks],
+                    "days_ahead": days_ahead,
+                },
+            )
+        return response.json()["data"]
+
+    ml = AsyncMock()
+    ml.run_inference.side_effect = run_inference
+    dispatcher = InferenceDispatcher(ml_operations=ml, chunk_size=2, max_retries=0)
+
+    tickers = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+    result = await dispatcher.dispatch([make_stock(t) for t in tickers], days_ahead=3)
+
+    stats = fake.state.stats.to_dict()
+    assert stats["requests"] == 3
+    assert len(result.failed) == stats["failed_stocks"] > 0
+    assert sorted(r.stock_ticker for r in result.success + result.failed) == tickers
+    assert all(len(r.predicted_price) == 3 for r in result.success)
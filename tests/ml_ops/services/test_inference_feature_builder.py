@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.ml_ops.services.inference_feature_builder import InferenceFeatureBuilder
+from app.core.common.exceptions.custom_exceptions import ResourceNotFoundError
+from app.core.enums.trading_data_enum import TradingDataEnum
+
+
+async def stream(rows, batch_size: int = 3):
+    for i in range(0, len(rows), batch_size):
+        yield rows[i : i + batch_size]  # noqa: E203
+
+
+def make_model(stock_ticker: str, features_used: list[str]):
+    return SimpleNamespace(
+        id=1,
+        stock_ticker=stock_ticker,
+        features_used=features_used,
+        model_path="model.keras",
+        scaler_path="scaler.pkl",
+    )
+
+
+@pytest.mark.asyncio
+async def test_builds_payloads_from_streamed_rows():
+    rows = [
+        ("AAA", 1, 10.0, 100),
+        ("AAA", 2, 11.0, 200),
+        ("BBB", 3, 20.0, 300),
+        ("BBB", 4, 21.0, 400),
+    ]
+    builder = InferenceFeatureBuilder(
+        stock_tickers=["AAA", "BBB"],
+        days_back=2,
+        features=[TradingDataEnum.CLOSE, TradingDataEnum.VOLUMES],
+    )
+    await builder.consume(stream(rows))
+    builder.validate()
+
+    payloads = builder.to_request_schemas(
+        [make_model("AAA", ["close"]), make_model("BBB", ["close", "volumes"])]
+    )
+
+    assert payloads[0].trading_data_id == 2
+    assert payloads[0].close == [10.0, 11.0]
+    assert payloads[0].volumes == []
+    assert payloads[1].volumes == [300, 400]
+    assert payloads[1].high == []
+
+
+@pytest.mark.asyncio
+async def test_validate_raises_on_missing_rows():
+    builder = InferenceFeatureBuilder(
+        stock_tickers=["AAA", "BBB"],
+        days_back=2,
+        features=[TradingDataEnum.CLOSE],
+    )
+    await builder.consume(stream([("AAA", 1, 10.0), ("AAA", 2, 11.0)]))
+
+    with pytest.raises(ResourceNotFoundError):
+        builder.validate()
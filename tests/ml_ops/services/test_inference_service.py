@@ -0,0 +1,111 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.ml_ops.schemas.inference_schema import (
+    InferenceResultSchema,
+    InferenceResultSummarySchema,
+    StockToPredictRequestSchema,
+)
+from app.api.ml_ops.services.inference_service import InferenceService
+
+TARGET_DATE = date(2025, 6, 4)
+
+
+def make_model(model_id: int, stock_ticker: str):
+    return SimpleNamespace(
+        id=model_id,
+        stock_ticker=stock_ticker,
+        features_used=["close"],
+        model_path="model.keras",
+        scaler_path="scaler.pkl",
+    )
+
+
+@pytest.fixture
+def services():
+    stock_model_service = AsyncMock()
+    stock_model_service.get_active_by_stock_tickers.return_value = [
+        make_model(1, "AAA"),
+        make_model(2, "BBB"),
+    ]
+    prediction_service = AsyncMock()
+    # AAA already has both periods, BBB only one of them
+    prediction_service.get_existing_keys.return_value = {
+        ("AAA", 1, 1),
+        ("AAA", 1, 5),
+        ("BBB", 2, 1),
+    }
+    prediction_service.create_by_list.return_value = []
+    dispatcher = AsyncMock()
+    dispatcher.dispatch.return_value = InferenceResultSummarySchema(
+        success=[
+            InferenceResultSchema(
+                stock_ticker="BBB", predicted_price=[1.0] * 10, success=True
+            )
+        ],
+        failed=[],
+    )
+    service = InferenceService(
+        stock_service=AsyncMock(),
+        stock_model_service=stock_model_service,
+        prediction_service=prediction_service,
+        trading_data_service=AsyncMock(),
+        trading_data_window_service=AsyncMock(),
+        dummy_service=AsyncMock(),
+        inference_dispatcher=dispatcher,
+        discord_operations=AsyncMock(),
+    )
+    service.get_inference_data_by_stock_tickers = AsyncMock(
+        return_value=[
+            StockToPredictRequestSchema(
+                stock_ticker="BBB",
+                close=[10.0],
+                model_id=2,
+                model_path="model.keras",
+                scaler_path="scaler.pkl",
+            )
+        ]
+    )
+    return SimpleNamespace(
+        service=service, prediction_service=prediction_service, dispatcher=dispatcher
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_inference_only_sends_missing_stocks(services):
+    await services.service.run_and_save_inference_by_stock_tickers(
+        db=MagicMock(),
+        stock_tickers=["AAA", "BBB"],
+        target_date=TARGET_DATE,
+        days_back=1,
+        days_forward=10,
+        periods=[1, 5],
+        incremental=True,
+    )
+
+    data_kwargs = services.service.get_inference_data_by_stock_tickers.call_args.kwargs
+    assert data_kwargs["stock_tickers"] == ["BBB"]
+    assert [m.id for m in data_kwargs["active_models"]] == [2]
+    save_kwargs = services.prediction_service.create_by_list.call_args.kwargs
+    assert save_kwargs["skip_existing"] is True
+
+
+@pytest.mark.asyncio
+async def test_incremental_inference_skips_the_ml_server_when_nothing_is_missing(
+    services,
+):
+    result = await services.service.run_and_save_inference_by_stock_tickers(
+        db=MagicMock(),
+        stock_tickers=["AAA"],
+        target_date=TARGET_DATE,
+        days_back=1,
+        days_forward=10,
+        periods=[1],
+        incremental=True,
+    )
+
+    assert result == []
+    services.dispatcher.dispatch.assert_not_called()
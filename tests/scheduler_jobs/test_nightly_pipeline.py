@@ -0,0 +1,109 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.api.scheduler_jobs.nightly_pipeline import (
+    NightlyPipeline,
+    NightlyPipelineState,
+    PipelineStage,
+)
+from app.core.enums.job_enum import PipelineStageStatusEnum
+
+RUN_DATE = date(2025, 5, 2)
+
+
+class StateStore:
+    def __init__(self, value=None):
+        self.value = value
+
+    async def load(self):
+        return self.value
+
+    async def save(self, value):
+        self.value = value
+
+
+def make_stages(calls, fail=()):
+    def step(name):
+        async def run():
+            calls.append(name)
+            if name in fail:
+                raise RuntimeError(f"{name} broke")
+
+        return run
+
+    return [
+        PipelineStage(name="pull", run=step("pull")),
+        PipelineStage(name="infer:A", run=step("infer:A"), depends_on=("pull",)),
+        PipelineStage(name="infer:B", run=step("infer:B"), depends_on=("pull",)),
+        PipelineStage(name="rank:A", run=step("rank:A"), depends_on=("infer:A",)),
+        PipelineStage(name="rank:B", run=step("rank:B"), depends_on=("infer:B",)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_stage_skips_dependents_and_resume_reruns_only_them():
+    store = StateStore()
+    calls = []
+    pipeline = NightlyPipeline(load_state=store.load, save_state=store.save)
+
+    state = await pipeline.run(RUN_DATE, make_stages(calls, fail={"infer:B"}))
+
+    assert state.stages["rank:A"] == PipelineStageStatusEnum.SUCCESS
+    assert state.stages["infer:B"] == PipelineStageStatusEnum.FAILED
+    assert state.stages["rank:B"] == PipelineStageStatusEnum.SKIPPED
+    assert "rank:B" not in calls
+
+    calls.clear()
+    state = await pipeline.run(RUN_DATE, make_stages(calls))
+
+    assert sorted(calls) == ["infer:B", "rank:B"]
+    assert all(state.succeeded(name) for name in state.stages)
+    assert NightlyPipelineState.from_json(store.value).succeeded("rank:B")
+
+
+@pytest.mark.asyncio
+async def test_state_of_another_day_is_ignored():
+    old = NightlyPipelineState(
+        run_date=date(2025, 5, 1),
+        stages={"pull": PipelineStageStatusEnum.SUCCESS},
+    )
+    store = StateStore(old.to_json())
+    calls = []
+
+    await NightlyPipeline(store.load, store.save).run(RUN_DATE, make_stages(calls))
+
+    assert calls[0] == "pull"
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_rank_of_one_industry_overlaps_inference_of_another():
+    store = StateStore()
+    infer_b_release = asyncio.Event()
+    rank_a_done = asyncio.Event()
+
+    async def noop():
+        pass
+
+    async def infer_b():
+        # only finishes once rank:A ran, which deadlocks if stages are serialized
+        await asyncio.wait_for(rank_a_done.wait(), timeout=1)
+        infer_b_release.set()
+
+    async def rank_a():
+        rank_a_done.set()
+
+    stages = [
+        PipelineStage(name="pull", run=noop),
+        PipelineStage(name="infer:A", run=noop, depends_on=("pull",)),
+        PipelineStage(name="infer:B", run=infer_b, depends_on=("pull",)),
+        PipelineStage(name="rank:A", run=rank_a, depends_on=("infer:A",)),
+        PipelineStage(name="rank:B", run=noop, depends_on=("infer:B",)),
+    ]
+
+    state = await NightlyPipeline(store.load, store.save).run(RUN_DATE, stages)
+
+    assert infer_b_release.is_set()
+    assert all(state.succeeded(stage.name) for stage in stages)